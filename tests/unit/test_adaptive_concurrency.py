@@ -0,0 +1,152 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from requests.exceptions import ConnectionError, HTTPError
+
+from ztoq.adaptive_concurrency import AdaptiveExecutor, AIMDConcurrencyLimit
+
+
+def _http_error(status_code):
+    return HTTPError(f"HTTP {status_code}", response=MagicMock(status_code=status_code))
+
+
+@pytest.mark.unit
+class TestAIMDConcurrencyLimit:
+    def test_grows_additively_per_window(self):
+        """Test the limit grows by about one per window of successful calls."""
+        limit = AIMDConcurrencyLimit(initial_limit=4, max_limit=10)
+
+        for _ in range(5):
+            limit.acquire()
+            limit.on_success(0.01)
+
+        assert limit.limit == 5
+        assert limit.stats["peak_limit"] == 5
+
+    def test_backs_off_multiplicatively_once_per_cooldown(self):
+        """Test overload halves the limit and a burst of signals backs off once."""
+        now = [0.0]
+        limit = AIMDConcurrencyLimit(
+            initial_limit=16, max_limit=32, cooldown=1.0, clock=lambda: now[0],
+        )
+
+        for _ in range(3):
+            limit.acquire()
+        for _ in range(3):
+            limit.on_overload()
+
+        assert limit.limit == 8
+        assert limit.stats == {"successes": 0, "overloads": 3, "backoffs": 1, "peak_limit": 16}
+
+        now[0] = 2.0
+        limit.acquire()
+        limit.on_overload()
+        assert limit.limit == 4
+
+    def test_bounds_are_respected(self):
+        """Test the limit stays between min_limit and max_limit."""
+        limit = AIMDConcurrencyLimit(initial_limit=2, min_limit=2, max_limit=3, cooldown=0)
+
+        for _ in range(20):
+            limit.acquire()
+            limit.on_success(0.01)
+        assert limit.limit == 3
+
+        for _ in range(5):
+            limit.acquire()
+            limit.on_overload()
+        assert limit.limit == 2
+
+    def test_latency_spike_counts_as_overload(self):
+        """Test a call far slower than the baseline backs off."""
+        limit = AIMDConcurrencyLimit(
+            initial_limit=10, max_limit=10, latency_tolerance=2.0, min_latency_samples=5,
+        )
+        for _ in range(5):
+            limit.acquire()
+            limit.on_success(0.1)
+
+        limit.acquire()
+        limit.on_success(0.5)
+
+        assert limit.limit == 5
+        assert limit.stats["backoffs"] == 1
+
+    def test_acquire_blocks_at_limit(self):
+        """Test callers wait while the limit is fully used."""
+        limit = AIMDConcurrencyLimit(initial_limit=1, max_limit=1)
+        limit.acquire()
+        acquired = threading.Event()
+
+        def waiter():
+            limit.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        assert not acquired.wait(0.05)
+
+        limit.release()
+        assert acquired.wait(1.0)
+        thread.join()
+
+
+@pytest.mark.unit
+class TestAdaptiveExecutor:
+    def test_concurrency_follows_limit(self):
+        """Test no more tasks run at once than the current limit."""
+        limit = AIMDConcurrencyLimit(initial_limit=3, min_limit=3, max_limit=3)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def task(value):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return value * 2
+
+        with AdaptiveExecutor(limit) as executor:
+            futures = [executor.submit(task, i) for i in range(12)]
+            results = [future.result() for future in futures]
+
+        assert results == [i * 2 for i in range(12)]
+        assert peak == 3
+
+    def test_overload_errors_reduce_limit(self):
+        """Test 429/5xx and network errors back off, other errors do not."""
+        limit = AIMDConcurrencyLimit(initial_limit=8, max_limit=8, cooldown=0)
+
+        def fail(error):
+            raise error
+
+        with AdaptiveExecutor(limit) as executor:
+            with pytest.raises(ValueError):
+                executor.submit(fail, ValueError("invalid record")).result()
+            assert limit.limit == 8
+
+            with pytest.raises(HTTPError):
+                executor.submit(fail, _http_error(400)).result()
+            assert limit.limit == 8
+
+            with pytest.raises(HTTPError):
+                executor.submit(fail, _http_error(429)).result()
+            assert limit.limit == 4
+
+            with pytest.raises(ConnectionError):
+                executor.submit(fail, ConnectionError("reset")).result()
+            assert limit.limit == 2
+
+        assert limit.in_flight == 0
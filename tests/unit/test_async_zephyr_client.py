@@ -0,0 +1,211 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from ztoq.async_zephyr_client import AsyncZephyrClient
+from ztoq.attachment_spool import AttachmentSpool
+from ztoq.models import Case, ZephyrConfig
+from ztoq.rate_limiter import SQLiteBucketStore, TokenBucketRateLimiter
+from ztoq.zephyr_client import CircuitBreaker
+
+
+def _page(start_at, total, page_size=2):
+    return {
+        "totalCount": total,
+        "startAt": start_at,
+        "maxResults": page_size,
+        "isLast": start_at + page_size >= total,
+        "values": [
+            {"id": str(i), "key": f"TEST-TC-{i}", "name": f"Test Case {i}"}
+            for i in range(start_at, min(start_at + page_size, total))
+        ],
+    }
+
+
+@pytest.mark.unit
+class TestAsyncZephyrClient:
+    @pytest.fixture
+    def config(self):
+        """Create a test Zephyr configuration."""
+        return ZephyrConfig(
+            base_url="https://api.zephyrscale.example.com/v2",
+            api_token="test-token",
+            project_key="TEST",
+        )
+
+    @pytest.fixture(autouse=True)
+    def reset_circuits(self):
+        """Start each test with closed circuits."""
+        CircuitBreaker.reset_all_circuits()
+        yield
+        CircuitBreaker.reset_all_circuits()
+
+    def _client(self, config, handler, **kwargs):
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncZephyrClient(config, http_client=http_client, **kwargs)
+
+    def test_make_request_updates_rate_limits(self, config):
+        """Test a request adds the project key and records rate limit headers."""
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            return httpx.Response(
+                200,
+                json={"key": "value"},
+                headers={"X-Rate-Limit-Remaining": "950", "X-Rate-Limit-Reset": "1633046400"},
+            )
+
+        client = self._client(config, handler)
+        result = asyncio.run(client._make_request("GET", "/test-endpoint"))
+
+        assert result == {"key": "value"}
+        assert "projectKey=TEST" in seen["url"]
+        assert client.rate_limit_remaining == 950
+        assert client.rate_limit_reset == 1633046400
+
+    def test_get_test_cases_with_prefetch_preserves_order(self, config):
+        """Test the async iterator yields prefetched pages in offset order."""
+        total = 9
+
+        async def handler(request):
+            start_at = int(request.url.params["startAt"])
+            # Later pages answer first
+            await asyncio.sleep(0.001 * (total - start_at))
+            return httpx.Response(200, json=_page(start_at, total))
+
+        async def collect():
+            client = self._client(config, handler)
+            iterator = client.get_test_cases(prefetch_pages=3)
+            iterator.params["maxResults"] = 2
+            return [case async for case in iterator], iterator
+
+        cases, iterator = asyncio.run(collect())
+
+        assert all(isinstance(case, Case) for case in cases)
+        assert [case.key for case in cases] == [f"TEST-TC-{i}" for i in range(total)]
+        assert iterator.total_count == total
+        assert iterator._pending == []
+
+    def test_retry_on_server_error(self, config):
+        """Test that retryable HTTP errors are retried with the shared retry semantics."""
+        responses = [httpx.Response(503), httpx.Response(200, json={"ok": True})]
+
+        def handler(request):
+            return responses.pop(0)
+
+        client = self._client(config, handler)
+        with patch("ztoq.zephyr_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = asyncio.run(client._make_request("GET", "/retry-endpoint"))
+
+        assert result == {"ok": True}
+        assert mock_sleep.call_count == 1
+
+    def test_circuit_opens_after_repeated_failures(self, config):
+        """Test that the circuit breaker tracks failures of the async client."""
+
+        def handler(request):
+            return httpx.Response(404)
+
+        client = self._client(config, handler)
+
+        async def fail_repeatedly():
+            for _ in range(5):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await client._make_request("GET", "/missing")
+
+        asyncio.run(fail_repeatedly())
+
+        assert CircuitBreaker.get_circuit_status()["/missing"]["state"] == CircuitBreaker.OPEN
+
+    def test_download_attachment(self, config):
+        """Test downloading attachment content."""
+
+        def handler(request):
+            assert request.url.path.endswith("/attachments/attachment-123/content")
+            return httpx.Response(200, content=b"test file content")
+
+        client = self._client(config, handler)
+        content = asyncio.run(client.download_attachment("attachment-123"))
+
+        assert content == b"test file content"
+
+    def test_download_attachment_to_spool(self, config, tmp_path):
+        """Test attachment content is streamed into the spool."""
+
+        def handler(request):
+            return httpx.Response(200, content=b"large screenshot")
+
+        client = self._client(config, handler)
+        spool = AttachmentSpool(tmp_path, chunk_size=4)
+        spooled = asyncio.run(client.download_attachment_to_spool("attachment-123", spool))
+
+        assert spooled.path.read_bytes() == b"large screenshot"
+        assert spool.contains(spooled.checksum)
+        assert list((tmp_path / "tmp").iterdir()) == []
+
+    def test_default_http_client_is_created_per_event_loop(self, config):
+        """Test a second asyncio.run() does not reuse the client of a closed loop."""
+        created = []
+
+        def create_client(base_url):
+            http_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+            )
+            created.append(http_client)
+            return http_client
+
+        pool = MagicMock(client_type="httpx")
+        pool.create_client.side_effect = create_client
+        client = AsyncZephyrClient(config)
+
+        with patch("ztoq.connection_pool.async_connection_pool", pool):
+            asyncio.run(client._make_request("GET", "/first"))
+            asyncio.run(client._make_request("GET", "/second"))
+
+            async def run_and_close():
+                async with client:
+                    await client._make_request("GET", "/third")
+
+            asyncio.run(run_and_close())
+
+        assert len(created) == 3
+        assert created[2].is_closed
+        assert client._http_client is None
+
+    def test_shared_rate_limiter_runs_off_the_event_loop(self, config, tmp_path):
+        """Test a SQLite-backed limiter is not called on the event loop thread."""
+        limiter = TokenBucketRateLimiter(
+            rate=100, capacity=10, store=SQLiteBucketStore(tmp_path / "limits.db"),
+        )
+        threads = []
+        for name in ("try_acquire", "observe_response"):
+            method = getattr(limiter, name)
+
+            def record(*args, _method=method, **kwargs):
+                threads.append(threading.current_thread())
+                return _method(*args, **kwargs)
+
+            setattr(limiter, name, record)
+
+        client = self._client(
+            config, lambda request: httpx.Response(200, json={}), rate_limiter=limiter,
+        )
+
+        async def request():
+            await client._make_request("GET", "/limited")
+            return threading.current_thread()
+
+        loop_thread = asyncio.run(request())
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
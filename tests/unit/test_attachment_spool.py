@@ -0,0 +1,129 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ztoq.attachment_spool import AttachmentDeduplicator, AttachmentSpool
+from ztoq.qtest_models import QTestAttachment
+
+
+@pytest.mark.unit
+class TestAttachmentSpool:
+    @pytest.fixture
+    def spool(self, tmp_path):
+        """Create a spool in a temporary directory."""
+        return AttachmentSpool(tmp_path / "spool", chunk_size=4)
+
+    def test_write_stream_computes_checksum_incrementally(self, spool):
+        """Test streamed content is stored under its MD5 checksum."""
+        chunks = [b"first ", b"", b"second ", b"third"]
+        spooled = spool.write_stream(iter(chunks))
+
+        content = b"".join(chunks)
+        assert spooled.checksum == QTestAttachment.calculate_checksum(content)
+        assert spooled.size == len(content)
+        assert spooled.storage_ref == spooled.checksum
+        assert spooled.path == spool.path_for(spooled.checksum)
+        assert spooled.path.read_bytes() == content
+        assert list(spool._tmp_dir.iterdir()) == []
+
+    def test_identical_content_is_stored_once(self, spool):
+        """Test spooling the same content twice keeps a single blob."""
+        first = spool.write_bytes(b"shared logo")
+        second = spool.write_stream([b"shared ", b"logo"])
+
+        assert first.checksum == second.checksum
+        blobs = [p for p in spool.root.rglob("*") if p.is_file()]
+        assert blobs == [first.path]
+
+    def test_iter_chunks_and_remove(self, spool):
+        """Test reading a blob back in chunks and removing it."""
+        spooled = spool.write_bytes(b"0123456789")
+
+        assert list(spool.iter_chunks(spooled.checksum)) == [b"0123", b"4567", b"89"]
+        assert spool.contains(spooled.checksum)
+        assert spool.remove(spooled.checksum)
+        assert not spool.contains(spooled.checksum)
+        assert not spool.remove(spooled.checksum)
+
+    def test_failed_stream_leaves_no_partial_file(self, spool):
+        """Test an interrupted download does not leave temporary files behind."""
+
+        def broken_stream():
+            yield b"partial"
+            raise ConnectionError("connection dropped")
+
+        with pytest.raises(ConnectionError):
+            spool.write_stream(broken_stream())
+
+        assert list(spool._tmp_dir.iterdir()) == []
+
+
+@pytest.mark.unit
+class TestAttachmentDeduplicator:
+    @pytest.fixture
+    def dedup(self, tmp_path):
+        """Create a deduplicator backed by a temporary spool."""
+        return AttachmentDeduplicator(AttachmentSpool(tmp_path))
+
+    def test_fetch_downloads_each_attachment_once(self, dedup):
+        """Test repeated and concurrent fetches of one attachment share a download."""
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def download():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return dedup.spool.write_bytes(b"shared spec")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(dedup.fetch, "att-1", download)
+            started.wait(timeout=5)
+            others = [executor.submit(dedup.fetch, "att-1", download) for _ in range(3)]
+            release.set()
+            results = [first.result()] + [f.result() for f in others]
+
+        assert len(calls) == 1
+        assert len({r.checksum for r in results}) == 1
+        assert dedup.get_stats()["downloads_skipped"] == 3
+
+    def test_identical_content_from_different_sources(self, dedup):
+        """Test distinct attachments with identical bytes are stored as one blob."""
+        dedup.fetch("att-1", lambda: dedup.spool.write_bytes(b"logo"))
+        dedup.fetch("att-2", lambda: dedup.spool.write_bytes(b"logo"))
+
+        stats = dedup.get_stats()
+        assert stats["downloads"] == 2
+        assert stats["unique_blobs"] == 1
+        assert stats["bytes_skipped"] == 0
+        assert stats["duplicate_bytes_downloaded"] == 4
+
+    def test_failed_download_is_not_cached(self, dedup):
+        """Test a failed download can be retried."""
+
+        def failing():
+            raise ConnectionError("boom")
+
+        with pytest.raises(ConnectionError):
+            dedup.fetch("att-1", failing)
+
+        spooled = dedup.fetch("att-1", lambda: dedup.spool.write_bytes(b"ok"))
+        assert spooled.size == 2
+
+    def test_claim_and_release_upload(self, dedup):
+        """Test a blob is uploaded to an object once per name unless the upload failed."""
+        assert dedup.claim_upload("abc", "test-cases", 1, "logo.png")
+        assert not dedup.claim_upload("abc", "test-cases", 1, "logo.png")
+        assert dedup.claim_upload("abc", "test-cases", 1, "logo-copy.png")
+        assert dedup.claim_upload("abc", "test-runs", 1, "logo.png")
+
+        dedup.release_upload("abc", "test-cases", 1, "logo.png")
+        assert dedup.claim_upload("abc", "test-cases", 1, "logo.png")
@@ -8,6 +8,8 @@ See LICENSE file for details.
 Unit tests for the data_fetcher module.
 """
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -329,3 +331,32 @@ class TestDataFetcher:
 
         # Check fetch_all_project_data was called once
         mock_fetch_all_project_data.assert_called_once()
+
+    @patch("ztoq.data_fetcher.fetch_all_project_data")
+    def test_fetch_all_projects_data_in_parallel(self, mock_fetch_all_project_data, mock_client):
+        """Test projects are fetched concurrently within the global worker budget."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_fetch(client, project_key, progress_callback, max_workers):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {"max_workers": max_workers}
+
+        mock_fetch_all_project_data.side_effect = slow_fetch
+        keys = [f"PROJ{i}" for i in range(6)]
+
+        result = fetch_all_projects_data(
+            mock_client, keys, parallel_projects=3, global_max_workers=6,
+        )
+
+        # Results keep the requested order and each project got its share of the budget
+        assert list(result) == keys
+        assert all(r == {"max_workers": 2} for r in result.values())
+        assert 1 < peak <= 3
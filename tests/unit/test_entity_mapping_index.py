@@ -0,0 +1,106 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ztoq.data_comparison import DataComparisonValidator
+from ztoq.entity_mapping_index import EntityMappingIndex
+
+
+def _mapping_db(mappings):
+    db = MagicMock()
+    db.get_entity_mappings.side_effect = lambda project_key, mapping_type: [
+        {"source_id": source_id, "target_id": target_id}
+        for source_id, target_id in mappings.get(mapping_type, {}).items()
+    ]
+    return db
+
+
+@pytest.mark.unit
+class TestEntityMappingIndex:
+    def test_loads_each_type_once(self):
+        """Test lookups of a mapping type share one query."""
+        db = _mapping_db({"folder_to_module": {"1": "m1", "2": "m2"}})
+        index = EntityMappingIndex(db, "TEST")
+
+        assert index.get("folder_to_module", "1") == "m1"
+        assert index.get("folder_to_module", "2") == "m2"
+        assert index.get("folder_to_module", "3") is None
+        assert index.get("cycle_to_cycle", "1") is None
+
+        assert db.get_entity_mappings.call_count == 2
+        db.get_entity_mappings.assert_any_call("TEST", "folder_to_module")
+        assert index.stats == {"loads": 2, "hits": 2, "misses": 2}
+
+    def test_source_ids_compare_as_strings(self):
+        """Test integer ids find mappings stored as text and vice versa."""
+        index = EntityMappingIndex(_mapping_db({"folder_to_module": {"42": "m42"}}), "TEST")
+        index.put("testcase_to_testcase", 7, "q7")
+
+        assert index.get("folder_to_module", 42) == "m42"
+        assert index.get("testcase_to_testcase", "7") == "q7"
+        assert index.get("testcase_to_testcase", None) is None
+
+    def test_saved_mappings_are_visible_without_reload(self):
+        """Test put and put_many keep the index and its dicts current."""
+        db = _mapping_db({})
+        index = EntityMappingIndex(db, "TEST")
+        view = index.mappings("execution_to_run")
+
+        index.load("execution_to_run")
+        index.put_many(
+            "execution_to_run",
+            [{"source_id": "e1", "target_id": "r1"}, {"source_id": "e2", "target_id": "r2"}],
+        )
+
+        assert index.get("execution_to_run", "e2") == "r2"
+        assert view == {"e1": "r1", "e2": "r2"}
+        db.get_entity_mappings.assert_called_once()
+
+    def test_invalidate_reloads_on_next_lookup(self):
+        """Test invalidated types are queried again, keeping the same dict."""
+        mappings = {"cycle_to_cycle": {"c1": "q1"}}
+        db = _mapping_db(mappings)
+        index = EntityMappingIndex(db, "TEST")
+        view = index.load("cycle_to_cycle")
+
+        mappings["cycle_to_cycle"] = {"c2": "q2"}
+        index.invalidate("cycle_to_cycle")
+
+        assert index.get("cycle_to_cycle", "c1") is None
+        assert index.get("cycle_to_cycle", "c2") == "q2"
+        assert view == {"c2": "q2"}
+        assert db.get_entity_mappings.call_count == 2
+
+
+@pytest.mark.unit
+class TestDataComparisonValidatorMappings:
+    def test_relationship_validation_uses_index(self):
+        """Test relationship checks load mappings once instead of per entity."""
+        db = _mapping_db(
+            {
+                "folder_to_module": {"f1": "m1"},
+                "testcase_to_testcase": {f"tc{i}": f"q{i}" for i in range(50)},
+            },
+        )
+        db.iter_test_cases_with_folders.return_value = iter([
+            {"id": f"tc{i}", "name": f"Case {i}", "folder_id": "f1"} for i in range(50)
+        ])
+        db.get_qtest_module_for_testcase.side_effect = lambda qtest_id: (
+            "m2" if qtest_id == "q3" else "m1"
+        )
+        # Compare in Python rather than with the set-based database check
+        del db.iter_relationship_mismatches
+        validator = DataComparisonValidator(db, "TEST")
+
+        issues = validator._validate_testcase_folder_relationships()
+
+        assert len(issues) == 1
+        assert issues[0].entity_id == "tc3"
+        db.get_mapped_entity_id.assert_not_called()
+        assert db.get_entity_mappings.call_count == 2
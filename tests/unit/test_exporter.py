@@ -4,14 +4,18 @@ This file is part of ZTOQ, licensed under the MIT License.
 See LICENSE file for details.
 """
 
+import json
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from ztoq.exporter import ZephyrExporter, ZephyrExportManager
-from ztoq.models import Attachment, CustomField, Execution, ZephyrConfig
-from ztoq.storage import JSONStorage, SQLiteStorage
+from ztoq.models import Attachment, Case, CustomField, CycleInfo, Execution, ZephyrConfig
+from ztoq.storage import JSONStorage, SQLiteStorage, read_jsonl
 from ztoq.zephyr_client import ZephyrClient
 
 
@@ -93,14 +97,8 @@ class TestZephyrExporter:
     @patch("ztoq.storage.JSONStorage.save_statuses")
     @patch("ztoq.storage.JSONStorage.save_priorities")
     @patch("ztoq.storage.JSONStorage.save_environments")
-    @patch("ztoq.storage.JSONStorage.save_test_cases")
-    @patch("ztoq.storage.JSONStorage.save_test_cycles")
-    @patch("ztoq.storage.JSONStorage.save_test_executions")
     def test_export_all(
         self,
-        mock_save_execs,
-        mock_save_cycles,
-        mock_save_cases,
         mock_save_envs,
         mock_save_priorities,
         mock_save_statuses,
@@ -122,16 +120,17 @@ class TestZephyrExporter:
         client.get_priorities.return_value = [MagicMock()]
         client.get_environments.return_value = [MagicMock()]
 
-        # Mock test cases
-        test_cases = [MagicMock() for _ in range(2)]
-        client.get_test_cases.return_value = test_cases
+        # Test cases and cycles are streamed, so serve them from generators
+        test_cases = [Case(id=str(i), key=f"TEST-T{i}", name=f"Case {i}") for i in range(2)]
+        client.get_test_cases.return_value = (tc for tc in test_cases)
 
-        # Mock test cycles
-        test_cycles = [MagicMock()]
-        client.get_test_cycles.return_value = test_cycles
+        test_cycles = [CycleInfo(id="10", key="TEST-C1", name="Cycle 1", projectKey="TEST")]
+        client.get_test_cycles.return_value = (tc for tc in test_cycles)
 
         # Mock test executions
-        test_executions = [MagicMock()]
+        test_executions = [
+            Execution(id="100", testCaseKey="TEST-T0", cycleId="10", status="Pass"),
+        ]
         json_exporter._fetch_executions_for_cycle = MagicMock(return_value=test_executions)
 
         # Call export_all
@@ -154,6 +153,72 @@ class TestZephyrExporter:
         assert result["test_cases"] == 2
         assert result["test_cycles"] == 1
         assert result["test_executions"] == 1
+        json_exporter._fetch_executions_for_cycle.assert_called_once_with("10")
+
+        # Streamed files are complete JSON arrays
+        output_dir = json_exporter.storage.output_dir
+        saved_cases = json.loads((output_dir / "test_cases.json").read_text())
+        assert [tc["key"] for tc in saved_cases] == ["TEST-T0", "TEST-T1"]
+        saved_executions = json.loads((output_dir / "test_executions.json").read_text())
+        assert saved_executions[0]["id"] == "100"
+
+    def test_export_all_streams_in_batches(self, json_exporter, client):
+        """Test entities are written batch by batch without materializing the project."""
+        project = MagicMock()
+        project.key = "TEST"
+        client.get_projects.return_value = [project]
+        for method in ("get_folders", "get_statuses", "get_priorities", "get_environments"):
+            getattr(client, method).return_value = []
+        client.get_test_cycles.return_value = iter([])
+
+        consumed = []
+
+        def stream_cases():
+            for i in range(5):
+                consumed.append(i)
+                yield Case(id=str(i), key=f"TEST-T{i}", name=f"Case {i}")
+
+        client.get_test_cases.return_value = stream_cases()
+        saved_when_consumed = []
+
+        storage = MagicMock(spec=SQLiteStorage)
+        storage.save_test_cases.side_effect = lambda batch, pk: saved_when_consumed.append(
+            (len(batch), len(consumed)),
+        )
+        json_exporter.storage = storage
+        json_exporter.batch_size = 2
+
+        result = json_exporter.export_all()
+
+        assert result["test_cases"] == 5
+        # Each batch is saved as soon as it is complete, before the next one is read
+        assert saved_when_consumed == [(2, 2), (2, 4), (1, 5)]
+        storage.bulk_load.assert_called()
+
+    def test_export_all_jsonl(self, client, tmp_path):
+        """Test exporting to compressed JSON Lines files."""
+        exporter = ZephyrExporter(
+            client, output_format="jsonl", output_path=tmp_path / "jsonl", compression="gzip",
+        )
+        project = MagicMock()
+        project.key = "TEST"
+        project.name = "Test Project"
+        project.id = "123"
+        project.description = None
+        client.get_projects.return_value = [project]
+        for method in ("get_folders", "get_statuses", "get_priorities", "get_environments"):
+            getattr(client, method).return_value = []
+        client.get_test_cases.return_value = (
+            Case(id=str(i), key=f"TEST-T{i}", name=f"Case {i}") for i in range(3)
+        )
+        client.get_test_cycles.return_value = iter([])
+        exporter.batch_size = 2
+
+        result = exporter.export_all()
+
+        assert result["test_cases"] == 3
+        records = list(read_jsonl(tmp_path / "jsonl" / "test_cases.jsonl.gz"))
+        assert [r["key"] for r in records] == ["TEST-T0", "TEST-T1", "TEST-T2"]
 
     def test_fetch_executions_for_cycle(self, json_exporter, client):
         """Test fetching executions for a cycle."""
@@ -298,3 +363,85 @@ class TestZephyrExportManager:
                 assert result["PROJ1"] == {"test_cases": 10}
                 # Verify progress callback was called appropriately
                 assert progress_callback.call_count >= 3  # At least calls for PROJ1 and PROJ2
+
+    def test_export_all_projects_in_parallel(self, config, tmp_path):
+        """Test projects are exported concurrently with aggregated progress."""
+        manager = ZephyrExportManager(
+            config=config,
+            output_dir=tmp_path / "exports",
+            concurrency=4,
+            parallel_projects=3,
+            global_concurrency=6,
+        )
+        with patch("ztoq.exporter.ZephyrClient") as mock_client_class:
+            projects = []
+            for key in ("PROJ1", "PROJ2", "PROJ3", "PROJ4"):
+                project = MagicMock()
+                project.key = key
+                projects.append(project)
+            mock_client_class.return_value.get_projects.return_value = projects
+
+            started = []
+            all_started = threading.Event()
+
+            def export_project(project_key, progress=None):
+                started.append(project_key)
+                if len(started) >= 3:
+                    all_started.set()
+                # Projects only finish once three of them ran at the same time
+                assert all_started.wait(timeout=5)
+                return {"test_cases": int(project_key[-1])}
+
+            progress = MagicMock()
+            with patch.object(manager, "export_project", side_effect=export_project):
+                result = manager.export_all_projects(progress=progress)
+
+        assert list(result) == ["PROJ1", "PROJ2", "PROJ3", "PROJ4"]
+        assert result["PROJ3"] == {"test_cases": 3}
+        progress.add_task.assert_called_once()
+        assert progress.update.call_count == 4
+
+    def test_global_concurrency_is_one_budget_shared_by_all_clients(self, config, tmp_path):
+        """Test every project client holds a slot of the same semaphore per request."""
+        manager = ZephyrExportManager(
+            config=config, output_dir=tmp_path, concurrency=4, global_concurrency=2,
+        )
+        first = manager._create_client(config)
+        second = manager._create_client(config)
+
+        assert first.request_slots is second.request_slots is manager.request_slots
+
+        in_flight = []
+        peak = []
+        release = threading.Event()
+
+        def request(**kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            release.wait(timeout=5)
+            in_flight.pop()
+            response = MagicMock(status_code=200, headers={})
+            response.json.return_value = {}
+            return response
+
+        session = MagicMock()
+        session.request.side_effect = request
+
+        @contextmanager
+        def get_session(url):
+            yield session
+
+        with patch("ztoq.connection_pool.connection_pool.get_session", side_effect=get_session):
+            threads = [
+                threading.Thread(target=client._make_request, args=("GET", "/testcases"))
+                for client in (first, second, first)
+            ]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.1)
+            release.set()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        assert session.request.call_count == 3
+        assert max(peak) == 2
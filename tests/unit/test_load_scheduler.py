@@ -0,0 +1,139 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ztoq.load_scheduler import DependencyScheduler, group_dependencies
+
+
+@pytest.mark.unit
+class TestDependencyScheduler:
+    @pytest.fixture
+    def executor(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            yield executor
+
+    def test_dependents_receive_results(self, executor):
+        """Test a task runs after its dependencies and gets their results."""
+        scheduler = DependencyScheduler(executor)
+        scheduler.add("parent", lambda results: 10)
+        scheduler.add("child", lambda results: results["parent"] + 1, ["parent"])
+        scheduler.add("grandchild", lambda results: results["child"] * 2, ["child"])
+
+        outcomes = scheduler.run()
+
+        assert outcomes["grandchild"].result == 22
+        assert all(outcome.succeeded for outcome in outcomes.values())
+
+    def test_ready_tasks_do_not_wait_for_slow_siblings(self, executor):
+        """Test a child starts once its own parent is done, not the whole level."""
+        finished = []
+        lock = threading.Lock()
+
+        def task(name, delay):
+            def run(results):
+                time.sleep(delay)
+                with lock:
+                    finished.append(name)
+                return name
+
+            return run
+
+        scheduler = DependencyScheduler(executor)
+        scheduler.add("slow-root", task("slow-root", 0.2))
+        scheduler.add("fast-root", task("fast-root", 0.0))
+        scheduler.add("fast-child", task("fast-child", 0.0), ["fast-root"])
+
+        scheduler.run()
+
+        assert finished.index("fast-child") < finished.index("slow-root")
+
+    def test_failure_skips_dependents_but_not_barriers(self, executor):
+        """Test dependents of a failed task are skipped while barriers still complete."""
+
+        def fail(results):
+            raise ValueError("creation failed")
+
+        scheduler = DependencyScheduler(executor)
+        scheduler.add("bad", fail)
+        scheduler.add("good", lambda results: 1)
+        scheduler.add("child", lambda results: 2, ["bad"])
+        scheduler.add("grandchild", lambda results: 3, ["child"])
+        barrier = group_dependencies(scheduler, "all", ["bad", "good"])
+        scheduler.add("after", lambda results: 4, [barrier])
+
+        completed = []
+        outcomes = scheduler.run(on_complete=lambda outcome: completed.append(outcome.key))
+
+        assert outcomes["bad"].error == "creation failed"
+        assert outcomes["child"].skipped
+        assert outcomes["grandchild"].skipped
+        assert "'bad'" in outcomes["child"].error
+        assert outcomes["after"].result == 4
+        assert sorted(completed) == sorted(outcomes)
+
+    def test_invalid_graphs_are_rejected(self, executor):
+        """Test unknown dependencies, duplicate keys and cycles raise errors."""
+        scheduler = DependencyScheduler(executor)
+        scheduler.add("a", lambda results: 1, ["missing"])
+        with pytest.raises(ValueError, match="unknown task"):
+            scheduler.run()
+
+        scheduler = DependencyScheduler(executor)
+        scheduler.add("a", lambda results: 1)
+        with pytest.raises(ValueError, match="Duplicate"):
+            scheduler.add("a", lambda results: 1)
+
+        scheduler = DependencyScheduler(executor)
+        scheduler.add("a", lambda results: 1, ["b"])
+        scheduler.add("b", lambda results: 1, ["a"])
+        with pytest.raises(ValueError, match="cycle"):
+            scheduler.run()
+
+    def test_barriers_are_not_submitted(self):
+        """Test barriers finish inline so they never reach the executor."""
+        executor = ThreadPoolExecutor(max_workers=2)
+        submitted = []
+        submit = executor.submit
+        executor.submit = lambda fn, *args: submitted.append(fn) or submit(fn, *args)
+        scheduler = DependencyScheduler(executor)
+        scheduler.add("a", lambda results: 1)
+        scheduler.add("b", lambda results: 2)
+        barrier = group_dependencies(scheduler, "all", ["a", "b"])
+        scheduler.add("after", lambda results: 3, [barrier])
+
+        with executor:
+            outcomes = scheduler.run()
+
+        assert len(submitted) == 3
+        assert outcomes["all"].succeeded
+        assert outcomes["after"].result == 3
+
+    def test_callback_errors_do_not_finish_tasks_twice(self, executor):
+        """Test a raising callback sees each outcome once and fails the task."""
+        seen = []
+
+        def on_complete(outcome):
+            seen.append((outcome.key, outcome.succeeded))
+            if outcome.key == "parent":
+                raise RuntimeError("mapping write failed")
+
+        scheduler = DependencyScheduler(executor)
+        scheduler.add("parent", lambda results: 1)
+        scheduler.add("child", lambda results: 2, ["parent"])
+        scheduler.add("other", lambda results: 3)
+
+        outcomes = scheduler.run(on_complete)
+
+        assert sorted(seen) == [("child", False), ("other", True), ("parent", True)]
+        assert "mapping write failed" in outcomes["parent"].error
+        assert outcomes["parent"].result == 1
+        assert outcomes["child"].skipped
+        assert outcomes["other"].succeeded
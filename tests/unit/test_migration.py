@@ -4,13 +4,18 @@ This file is part of ZTOQ, licensed under the MIT License.
 See LICENSE file for details.
 """
 
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 
 from ztoq.migration import EntityBatchTracker, MigrationState, ZephyrToQTestMigration
 from ztoq.models import ZephyrConfig
+from ztoq.qtest_client import BulkCreateResult
 from ztoq.qtest_models import QTestConfig
+from ztoq.write_behind import WriteBehindBuffer
 
 
 @pytest.mark.unit
@@ -225,3 +230,470 @@ class TestZephyrToQTestMigration:
         migration.extract_data.assert_called_once()
         migration.transform_data.assert_called_once()
         migration.load_data.assert_not_called()
+
+    def test_extract_attachment_streams_into_spool(self, migration, db_mock, tmp_path):
+        """Test attachments are spooled to disk and stored by reference."""
+        from ztoq.attachment_spool import AttachmentDeduplicator, AttachmentSpool
+
+        migration.attachment_spool = AttachmentSpool(tmp_path)
+        migration.attachment_dedup = AttachmentDeduplicator(migration.attachment_spool)
+        spooled = migration.attachment_spool.write_bytes(b"large screenshot")
+        migration.zephyr_client_mock.download_attachment_to_spool.return_value = spooled
+
+        attachment = MagicMock(id="att-1", filename="screenshot.png", url="http://x/att-1")
+        test_case = MagicMock(id="tc-001", attachments=[attachment])
+        migration._extract_test_case_attachments(test_case)
+
+        migration.zephyr_client_mock.download_attachment.assert_not_called()
+        db_mock.save_attachment.assert_called_once_with(
+            related_type="TestCase",
+            related_id="tc-001",
+            name="screenshot.png",
+            content=None,
+            url="http://x/att-1",
+            checksum=spooled.checksum,
+            size=spooled.size,
+            storage_ref=spooled.checksum,
+        )
+
+        # Upload reads straight from the spool
+        db_mock.get_attachments.return_value = [
+            {"name": "screenshot.png", "content": None, "storage_ref": spooled.checksum},
+        ]
+        migration._upload_test_case_attachments("tc-001", 42)
+        migration.qtest_client_mock.upload_attachment.assert_called_once_with(
+            object_type="test-cases",
+            object_id=42,
+            file_path=spooled.path,
+            custom_filename="screenshot.png",
+        )
+
+    def test_shared_attachment_is_transferred_once(self, migration, db_mock, tmp_path):
+        """Test a shared attachment is downloaded once and uploaded once per name."""
+        with patch("ztoq.migration.ZephyrClient") as mock_zephyr, patch(
+            "ztoq.migration.QTestClient",
+        ) as mock_qtest:
+            migration_with_spool = ZephyrToQTestMigration(
+                migration.zephyr_config,
+                migration.qtest_config,
+                db_mock,
+                attachment_spool_dir=tmp_path,
+            )
+        zephyr_client = mock_zephyr.return_value
+        qtest_client = mock_qtest.return_value
+        zephyr_client.download_attachment_to_spool.side_effect = (
+            lambda attachment_id, spool: spool.write_bytes(b"company logo")
+        )
+
+        logo = MagicMock(id="att-logo", filename="logo.png", url="http://x/logo")
+        for case_id in ("tc-1", "tc-2", "tc-3"):
+            migration_with_spool._extract_test_case_attachments(
+                MagicMock(id=case_id, attachments=[logo]),
+            )
+
+        assert zephyr_client.download_attachment_to_spool.call_count == 1
+        stats = migration_with_spool.attachment_dedup.get_stats()
+        assert stats["unique_blobs"] == 1
+        assert stats["downloads_skipped"] == 2
+
+        assert stats["bytes_skipped"] == 2 * len(b"company logo")
+
+        # The same blob under the same name is uploaded once, under another name again
+        checksum = db_mock.save_attachment.call_args.kwargs["storage_ref"]
+        db_mock.get_attachments.return_value = [
+            {"name": "logo.png", "content": None, "storage_ref": checksum},
+            {"name": "logo.png", "content": None, "storage_ref": checksum},
+            {"name": "logo-copy.png", "content": None, "storage_ref": checksum},
+        ]
+        migration_with_spool._upload_test_case_attachments("tc-1", 7)
+        uploaded = [
+            call.kwargs["custom_filename"] for call in qtest_client.upload_attachment.call_args_list
+        ]
+        assert uploaded == ["logo.png", "logo-copy.png"]
+
+    def test_extract_test_cycles_streams_batches(self, migration, db_mock):
+        """Test cycles are saved batch by batch with tracker totals from the first page."""
+        consumed = []
+
+        class StreamedCycles:
+            """Stand-in for a PaginatedIterator whose first page reports the total."""
+
+            total_count = None
+
+            def __iter__(self):
+                self.total_count = 120
+                for i in range(120):
+                    consumed.append(i)
+                    yield MagicMock(id=str(i))
+
+        saved_when_consumed = []
+        db_mock.save_test_cycles.side_effect = lambda batch: saved_when_consumed.append(
+            (len(batch), len(consumed)),
+        )
+        migration.zephyr_client.get_test_cycles.return_value = StreamedCycles()
+
+        migration._extract_test_cycles()
+
+        # Each batch is written before the next one is pulled from the API
+        assert saved_when_consumed == [(50, 50), (50, 100), (20, 120)]
+        db_mock.create_entity_batch.assert_has_calls(
+            [
+                call("DEMO", "test_cycles", 0, 3, 50),
+                call("DEMO", "test_cycles", 1, 3, 50),
+                call("DEMO", "test_cycles", 2, 3, 20),
+            ],
+        )
+        assert db_mock.update_entity_batch.call_count == 3
+
+    def test_extract_registers_batches_beyond_reported_total(self, migration, db_mock):
+        """Test batches past the total reported up front are still tracked."""
+        executions = iter([MagicMock(id=str(i), attachments=[]) for i in range(60)])
+        migration.zephyr_client.get_test_executions.return_value = executions
+
+        migration._extract_test_executions()
+
+        # A plain iterator has no total, so every batch is registered as it arrives
+        db_mock.create_entity_batch.assert_has_calls(
+            [
+                call("DEMO", "test_executions", 0, 1, 50),
+                call("DEMO", "test_executions", 1, 2, 10),
+            ],
+        )
+        assert db_mock.save_test_executions.call_count == 2
+
+    def test_transformed_references_drive_pipelined_load(self, migration, db_mock):
+        """Test references emitted by the transform phase order the pipelined load."""
+        store = _TransformedStore()
+        store.attach(db_mock)
+        migration.field_mapper = MagicMock()
+        for mapper in ("map_testcase_fields", "map_testcycle_fields", "map_testrun_fields"):
+            getattr(migration.field_mapper, mapper).return_value = []
+        db_mock.get_folders.return_value = [
+            {"id": "f1", "name": "Root"},
+            {"id": "f2", "name": "Slow root"},
+            {"id": "f3", "name": "Child", "parentId": "f1"},
+        ]
+        db_mock.get_test_cases_with_steps.return_value = [
+            {"id": "tc1", "name": "Case", "folderId": "f3", "steps": []},
+        ]
+        db_mock.get_test_cycles.return_value = [{"id": "cy1", "name": "Cycle", "folderId": "f1"}]
+        db_mock.get_test_executions.return_value = [
+            {"id": "ex1", "testCaseId": "tc1", "testCycleId": "cy1", "status": "PASS"},
+        ]
+        db_mock.get_attachments.return_value = []
+
+        # These models reject what the transform builds (after-validators that read a
+        # dict, upper-case statuses), so stand in plain models for them
+        with patch.multiple(
+            "ztoq.migration",
+            QTestTestCase=_PlainModel,
+            QTestTestCycle=_PlainModel,
+            QTestTestRun=_PlainModel,
+            QTestTestLog=_PlainModel,
+        ):
+            migration._transform_folders_to_modules()
+            migration._transform_test_cases()
+            migration._transform_test_cycles()
+            migration._transform_test_executions()
+
+        order = []
+        lock = threading.Lock()
+
+        def created(name, qtest_id, delay=0.0):
+            time.sleep(delay)
+            with lock:
+                order.append(name)
+            return SimpleNamespace(id=qtest_id)
+
+        def create_execution(source_id, test_run, test_log):
+            assert (test_run["test_case_id"], test_run["test_cycle_id"]) == ("q-tc1", "q-cy1")
+            created(source_id, None)
+            return "q-run1"
+
+        migration.pipelined_load = True
+        with (
+            patch.object(
+                migration,
+                "_create_module_in_qtest",
+                side_effect=lambda source_id, module: created(
+                    source_id, f"m-{source_id}", 0.3 if source_id == "f2" else 0.0,
+                ),
+            ),
+            patch.object(
+                migration,
+                "_create_test_case_in_qtest",
+                side_effect=lambda source_id, case: created(source_id, f"q-{source_id}"),
+            ),
+            patch.object(
+                migration,
+                "_create_test_cycle_in_qtest",
+                side_effect=lambda source_id, cycle: created(source_id, f"q-{source_id}"),
+            ),
+            patch.object(migration, "_create_execution_in_qtest", side_effect=create_execution),
+        ):
+            migration.load_data()
+
+        assert store.references["test_case"]["tc1"] == {"folder_source_id": "f3"}
+        # Without references everything would wait for the slow root module
+        assert order[-1] == "f2"
+        assert order.index("f1") < order.index("f3") < order.index("tc1") < order.index("ex1")
+        assert migration.entity_mappings["test_executions"]["ex1"] == "q-run1"
+
+    def test_transform_resolves_mappings_from_index(self, migration, db_mock):
+        """Test transformation looks mappings up in the index, not per record."""
+        migration.mapping_index.invalidate()
+        db_mock.get_entity_mappings.reset_mock()
+        db_mock.get_entity_mappings.side_effect = lambda project_key, mapping_type: (
+            [{"source_id": "1", "target_id": 101}] if mapping_type == "folder_to_module" else []
+        )
+        migration.field_mapper = MagicMock()
+        cycles = [{"id": "c1", "folderId": 1}, {"id": "c2", "folderId": 2}]
+
+        with patch("ztoq.migration.QTestTestCycle") as cycle_model:
+            migration.transform_test_cycles_batch(cycles)
+            # A mapping saved by the load phase is visible without reloading
+            migration._save_entity_mapping("folder_to_module", 2, 202)
+            migration.transform_test_cycles_batch(cycles)
+
+        parent_ids = [c.kwargs["parent_id"] for c in cycle_model.call_args_list]
+        assert parent_ids == [101, None, 101, 202]
+        db_mock.get_entity_mapping.assert_not_called()
+        db_mock.get_entity_mappings.assert_called_once_with("DEMO", "folder_to_module")
+        db_mock.save_entity_mapping.assert_called_once_with("DEMO", "folder_to_module", 2, 202)
+        assert migration.entity_mappings["folders"] == {"1": 101, "2": 202}
+
+    def test_write_buffer_flushes_before_batch_completes(self, migration, db_mock):
+        """Test buffered mappings are written in bulk before a batch is marked completed."""
+        migration.write_buffer = WriteBehindBuffer(db_mock, "DEMO", max_items=1000)
+        db_mock.get_transformed_test_cycles.return_value = [
+            {"source_id": f"c{i}", "test_cycle": {"name": f"Cycle {i}"}} for i in range(60)
+        ]
+
+        with patch.object(
+            migration,
+            "_create_test_cycle_in_qtest",
+            side_effect=lambda source_id, data: SimpleNamespace(id=f"q-{source_id}"),
+        ):
+            migration._load_test_cycles()
+
+        db_mock.save_entity_mapping.assert_not_called()
+        writes = [
+            c for c in db_mock.mock_calls if c[0] in ("save_entity_mappings", "update_entity_batch")
+        ]
+        assert [c[0] for c in writes] == [
+            "save_entity_mappings",
+            "update_entity_batch",
+            "save_entity_mappings",
+            "update_entity_batch",
+        ]
+        assert len(writes[0][1][2]) == 50
+        assert len(writes[2][1][2]) == 10
+        assert migration.entity_mappings["test_cycles"]["c59"] == "q-c59"
+
+    def test_load_test_cases_in_bulk(self, migration, db_mock):
+        """Test bulk loading saves the mappings of a batch in one call."""
+        migration.bulk_chunk_size = 20
+        db_mock.get_transformed_test_cases.return_value = [
+            {"source_id": f"tc-{i}", "test_case": {"name": f"Case {i}", "module_id": 7}}
+            for i in range(60)
+        ]
+        db_mock.get_attachments.return_value = []
+
+        def bulk_create(test_cases, chunk_size, max_workers):
+            # qTest reports no module for most cases and places "Case 9" in module 8
+            return [
+                BulkCreateResult(index=i, error="invalid")
+                if test_case.name == "Case 7"
+                else BulkCreateResult(
+                    index=i,
+                    test_case=SimpleNamespace(
+                        id=1000 + i, module_id=8 if test_case.name == "Case 9" else None,
+                    ),
+                )
+                for i, test_case in enumerate(test_cases)
+            ]
+
+        migration.qtest_client.bulk_create_test_cases_chunked.side_effect = bulk_create
+
+        with patch.object(
+            migration, "_build_qtest_test_case", side_effect=lambda data: SimpleNamespace(**data),
+        ):
+            migration._load_test_cases()
+
+        # One bulk call and one mapping write per batch of 50
+        assert migration.qtest_client.bulk_create_test_cases_chunked.call_count == 2
+        migration.qtest_client.create_test_case.assert_not_called()
+        assert db_mock.save_entity_mappings.call_count == 2
+        first_mappings = db_mock.save_entity_mappings.call_args_list[0][0][2]
+        assert len(first_mappings) == 49
+        assert {"source_id": "tc-8", "target_id": 1008} in first_mappings
+        assert "tc-7" not in migration.entity_mappings["test_cases"]
+        assert migration.entity_mappings["test_cases"]["tc-55"] == 1005
+
+        # Where each created test case ended up is recorded for the relationship checks
+        project_key, link_type, links = db_mock.save_qtest_links.call_args_list[0][0]
+        assert (project_key, link_type) == (migration.zephyr_config.project_key, "testcase_module")
+        assert len(links) == 49
+        assert {"qtest_id": 1008, "parent_id": 7} in links
+        # qTest placed this one elsewhere than requested
+        assert {"qtest_id": 1009, "parent_id": 8} in links
+
+        # The batch with the rejected record is flagged for review
+        statuses = [c[0][4] for c in db_mock.update_entity_batch.call_args_list]
+        assert statuses == ["failed", "completed"]
+
+    def test_created_runs_record_their_qtest_links(self, migration, db_mock):
+        """Test a created test run records the case and cycle qTest reports at the next flush."""
+        migration.qtest_client.create_test_run.return_value = SimpleNamespace(
+            id=55, test_case_id=None, test_cycle_id=33,
+        )
+        test_run = {"name": "Run", "test_case_id": 11, "test_cycle_id": 22}
+
+        with patch("ztoq.migration.QTestTestRun", _PlainModel):
+            assert migration._create_execution_in_qtest("e1", test_run, None) == 55
+        db_mock.save_qtest_links.assert_not_called()
+        migration._flush_writes()
+
+        project_key = migration.zephyr_config.project_key
+        assert db_mock.save_qtest_links.call_args_list == [
+            call(project_key, "run_testcase", [{"qtest_id": 55, "parent_id": 11}]),
+            call(project_key, "run_cycle", [{"qtest_id": 55, "parent_id": 33}]),
+        ]
+        migration._flush_writes()
+        assert db_mock.save_qtest_links.call_count == 2
+
+    def test_pipelined_load_follows_dependencies(self, migration, db_mock):
+        """Test records load as soon as the records they reference exist."""
+        migration.pipelined_load = True
+        db_mock.get_transformed_modules_by_level.return_value = [
+            [
+                {"source_id": "f1", "module": {"name": "Root"}},
+                {"source_id": "f2", "module": {"name": "Slow root"}},
+            ],
+            [{"source_id": "f3", "parent_source_id": "f1", "module": {"name": "Child"}}],
+        ]
+        db_mock.get_transformed_test_cases.return_value = [
+            {"source_id": "tc1", "folder_source_id": "f3", "test_case": {"name": "Case"}},
+        ]
+        db_mock.get_transformed_test_cycles.return_value = [
+            {"source_id": "cy1", "folder_source_id": "f1", "test_cycle": {"name": "Cycle"}},
+        ]
+        db_mock.get_transformed_executions.return_value = [
+            {
+                "source_id": "ex1",
+                "test_case_source_id": "tc1",
+                "test_cycle_source_id": "cy1",
+                "test_run": {"name": "Run"},
+                "test_log": {"status": "PASSED"},
+            },
+        ]
+        db_mock.get_attachments.return_value = []
+
+        order = []
+        lock = threading.Lock()
+
+        def created(name, qtest_id, delay=0.0):
+            time.sleep(delay)
+            with lock:
+                order.append(name)
+            return SimpleNamespace(id=qtest_id)
+
+        def create_module(source_id, module):
+            return created(source_id, f"m-{source_id}", 0.2 if source_id == "f2" else 0.0)
+
+        def create_test_case(source_id, test_case):
+            assert test_case["module_id"] == "m-f3"
+            return created(source_id, "q-tc1")
+
+        def create_cycle(source_id, cycle):
+            assert cycle["parent_id"] == "m-f1"
+            return created(source_id, "q-cy1")
+
+        def create_execution(source_id, test_run, test_log):
+            assert (test_run["test_case_id"], test_run["test_cycle_id"]) == ("q-tc1", "q-cy1")
+            created(source_id, None)
+            return "q-run1"
+
+        with (
+            patch.object(migration, "_create_module_in_qtest", side_effect=create_module),
+            patch.object(migration, "_create_test_case_in_qtest", side_effect=create_test_case),
+            patch.object(migration, "_create_test_cycle_in_qtest", side_effect=create_cycle),
+            patch.object(migration, "_create_execution_in_qtest", side_effect=create_execution),
+        ):
+            migration.load_data()
+
+        # The whole chain under f1 finished before the slow sibling root
+        assert order[-1] == "f2"
+        assert order.index("f3") < order.index("tc1") < order.index("ex1")
+        assert migration.entity_mappings["test_executions"]["ex1"] == "q-run1"
+        db_mock.save_entity_mapping.assert_any_call("DEMO", "folder_to_module", "f3", "m-f3")
+        assert db_mock.save_entity_mapping.call_count == 6
+        assert migration.state.loading_status == "completed"
+
+
+class _PlainModel:
+    """Model without validation, dumped as the fields it was built with."""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+        self.fields = fields
+
+    def model_dump(self):
+        return dict(self.fields)
+
+
+class _TransformedStore:
+    """In-memory stand-in for the transformed-entity tables of a database manager."""
+
+    def __init__(self):
+        self.records = {"module": {}, "test_case": {}, "test_cycle": {}, "execution": {}}
+        self.references = {kind: {} for kind in self.records}
+
+    def attach(self, db):
+        db.save_transformed_module.side_effect = self._saver("module")
+        db.save_transformed_test_case.side_effect = self._saver("test_case")
+        db.save_transformed_test_cycle.side_effect = self._saver("test_cycle")
+        db.save_transformed_execution.side_effect = self._saver("execution")
+        del db.save_transformed_test_cases
+        db.get_transformed_modules_by_level.side_effect = lambda project_key: self.module_levels()
+        db.get_transformed_test_cases.side_effect = lambda project_key: self.rows(
+            "test_case", "test_case",
+        )
+        db.get_transformed_test_cycles.side_effect = lambda project_key: self.rows(
+            "test_cycle", "test_cycle",
+        )
+        db.get_transformed_executions.side_effect = lambda project_key: [
+            {"source_id": source_id, "test_run": run, "test_log": log, **self.references[
+                "execution"
+            ][source_id]}
+            for source_id, (run, log) in self.records["execution"].items()
+        ]
+
+    def _saver(self, kind):
+        def save(project_key, source_id, *payload, references):
+            dumped = [model.model_dump() for model in payload]
+            self.records[kind][source_id] = dumped[0] if len(dumped) == 1 else tuple(dumped)
+            self.references[kind][source_id] = references
+            return len(self.records[kind])
+
+        return save
+
+    def rows(self, kind, payload_key):
+        return [
+            {"source_id": source_id, payload_key: record, **self.references[kind][source_id]}
+            for source_id, record in self.records[kind].items()
+        ]
+
+    def module_levels(self):
+        levels, placed = [], set()
+        modules = self.rows("module", "module")
+        while len(placed) < len(modules):
+            level = [
+                module
+                for module in modules
+                if module["source_id"] not in placed
+                and module.get("parent_source_id", None) in placed | {None}
+            ]
+            placed.update(module["source_id"] for module in level)
+            levels.append(level)
+        return levels
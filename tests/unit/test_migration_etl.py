@@ -495,6 +495,9 @@ class TestMigrationETLProcess:
         db_mock.save_test_cycles.assert_called_once()
         db_mock.save_test_executions.assert_called_once()
 
+        # The step fetcher's worker threads don't outlive extraction
+        assert migration.step_fetcher._executor is None
+
     def test_transform_data(self, migration, db_mock):
         """Test the transform_data phase of the migration."""
         # First ensure extraction status is completed
@@ -578,12 +581,14 @@ class TestMigrationETLProcess:
         """Test error handling during extraction phase."""
         # Make API calls raise exceptions
         migration.zephyr_client_mock.get_project.side_effect = Exception("API error")
+        migration.step_fetcher.close = MagicMock()
 
         # Run extraction and verify error is caught
         with pytest.raises(Exception) as excinfo:
             migration.extract_data()
 
         assert "API error" in str(excinfo.value)
+        migration.step_fetcher.close.assert_called_once()
         assert migration.state.extraction_status == "failed"
         assert migration.state.error_message is not None
 
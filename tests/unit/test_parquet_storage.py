@@ -0,0 +1,120 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from ztoq.models import Case, CaseStep, CustomField, CycleInfo, Execution
+from ztoq.parquet_storage import PYARROW_AVAILABLE, ParquetStorage
+
+pytestmark = pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+
+
+def _case(number, step_count=2):
+    return Case(
+        id=str(number),
+        key=f"TEST-T{number}",
+        name=f"Case {number}",
+        labels=["smoke"],
+        created_on=datetime(2025, 1, number + 1),
+        steps=[
+            CaseStep(index=i, description=f"Step {i}", expectedResult=f"Result {i}")
+            for i in range(1, step_count + 1)
+        ],
+        customFields=[CustomField(id="cf1", name="Component", type="text", value="API")],
+    )
+
+
+@pytest.mark.unit
+class TestParquetStorage:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        """Create a Parquet storage in a temporary directory."""
+        return ParquetStorage(tmp_path / "parquet", rows_per_file=3)
+
+    def test_test_cases_with_nested_steps(self, storage):
+        """Test cases are written with steps as list<struct> columns."""
+        with storage:
+            storage.save_test_cases([_case(0), _case(1)], "DEMO")
+
+        rows = {row["key"]: row for row in storage.read_table("test_cases").to_pylist()}
+        assert sorted(rows) == ["TEST-T0", "TEST-T1"]
+        row = rows["TEST-T1"]
+        assert [step["description"] for step in row["steps"]] == ["Step 1", "Step 2"]
+        assert row["steps"][1]["expected_result"] == "Result 2"
+        assert row["labels"] == ["smoke"]
+        assert row["created_on"] == datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+        schema = storage.schemas["test_cases"]
+        assert str(schema.field("steps").type).startswith("list<item: struct<")
+
+    def test_partitioned_by_project_and_column_pruned(self, storage):
+        """Test datasets are partitioned by project and can be read selectively."""
+        with storage:
+            storage.save_test_cases([_case(0), _case(1)], "DEMO")
+            storage.save_test_cases([_case(2)], "OTHER")
+
+        partitions = sorted(p.name for p in storage.dataset_path("test_cases").iterdir())
+        assert partitions == ["project_key=DEMO", "project_key=OTHER"]
+
+        table = storage.read_table(
+            "test_cases", columns=["key"], filters=[("project_key", "=", "OTHER")],
+        )
+        assert table.column_names == ["key"]
+        assert table.column("key").to_pylist() == ["TEST-T2"]
+
+    def test_buffer_is_written_when_full(self, storage):
+        """Test rows are flushed once rows_per_file is reached."""
+        storage.save_test_cases([_case(i) for i in range(3)], "DEMO")
+        assert list(storage.dataset_path("test_cases").rglob("*.parquet"))
+
+        storage.save_test_cases([_case(3)], "DEMO")
+        storage.flush()
+        assert storage.read_table("test_cases").num_rows == 4
+
+    def test_custom_fields_and_executions(self, storage):
+        """Test custom field values of all entities share one dataset."""
+        cycle = CycleInfo(
+            id="c1",
+            key="TEST-C1",
+            name="Cycle",
+            projectKey="DEMO",
+            customFields=[CustomField(id="cf2", name="Sprint", type="numeric", value=7)],
+        )
+        execution = Execution(
+            id="e1",
+            testCaseKey="TEST-T0",
+            cycleId="c1",
+            status="Pass",
+            steps=[CaseStep(index=1, description="Step 1", status="Pass")],
+        )
+        with storage:
+            storage.save_test_cases([_case(0)], "DEMO")
+            storage.save_test_cycle(cycle)
+            storage.save_test_executions([execution], "DEMO")
+
+        values = {
+            row["field_id"]: row for row in storage.read_table("custom_field_values").to_pylist()
+        }
+        assert values["cf1"]["entity_type"] == "test_case"
+        assert values["cf2"]["entity_type"] == "test_cycle"
+        assert values["cf2"]["value"] == "7"
+
+        executions = storage.read_table("test_executions").to_pylist()
+        assert executions[0]["steps"][0]["status"] == "Pass"
+
+    def test_rerun_replaces_project_partition(self, tmp_path):
+        """Test a new export replaces the partitions of the projects it writes."""
+        with ParquetStorage(tmp_path) as first:
+            first.save_test_cases([_case(0), _case(1)], "DEMO")
+            first.save_test_cases([_case(2)], "OTHER")
+
+        with ParquetStorage(tmp_path) as second:
+            second.save_test_cases([_case(5)], "DEMO")
+
+        keys = second.read_table("test_cases").column("key").to_pylist()
+        assert sorted(keys) == ["TEST-T2", "TEST-T5"]
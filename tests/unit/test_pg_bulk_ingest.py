@@ -0,0 +1,154 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from ztoq.models import Case, CaseStep, CustomField
+from ztoq.pg_bulk_ingest import (
+    CopyStream,
+    PostgresCopyIngester,
+    TableSpec,
+    derived_id,
+    format_copy_value,
+    ingest_entities,
+)
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def execute(self, sql):
+        self.connection.statements.append(sql)
+        if self.connection.fail_on and self.connection.fail_on in sql:
+            raise RuntimeError("merge failed")
+
+    def copy_expert(self, sql, stream):
+        data = []
+        while chunk := stream.read(7):
+            data.append(chunk)
+        self.connection.statements.append(sql)
+        self.connection.copied[sql.split()[1]] = "".join(data)
+
+
+class FakeConnection:
+    def __init__(self, fail_on=None):
+        self.statements = []
+        self.copied = {}
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_on = fail_on
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.mark.unit
+class TestPostgresCopyIngester:
+    def test_formats_copy_text(self):
+        """Test values are escaped for the COPY text format."""
+        assert format_copy_value(None) == "\\N"
+        assert format_copy_value(True) == "t"
+        assert format_copy_value(datetime(2025, 1, 2, 3, 4)) == "2025-01-02T03:04:00"
+        assert format_copy_value({"a": 1}) == '{"a": 1}'
+        assert format_copy_value("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+        stream = CopyStream([(1, "x"), (2, None)])
+        assert stream.read(3) == "1\tx"
+        assert stream.read() == "\n2\t\\N\n"
+        assert stream.read() == ""
+
+    def test_stages_and_merges_each_chunk(self):
+        """Test each chunk is staged, copied, merged in order and committed."""
+        specs = [
+            TableSpec("parents", "parents", ("id", "name"), ("id",)),
+            TableSpec(
+                "children",
+                "children",
+                ("id", "parent_id"),
+                ("id",),
+                replace_scope=("parent_id", "parents", "id"),
+            ),
+        ]
+        connection = FakeConnection()
+        ingester = PostgresCopyIngester(connection, chunk_size=2)
+
+        counts = ingester.ingest(
+            ["p1", "p2", "p3"],
+            lambda item: {"parents": [(item, item.upper())], "children": [(f"{item}c", item)]},
+            specs,
+        )
+
+        assert counts == {"parents": 3, "children": 3}
+        assert connection.commits == 2
+        first_chunk = connection.statements[:7]
+        assert first_chunk[0].startswith("CREATE TEMP TABLE ztoq_stage_parents (LIKE parents")
+        assert first_chunk[2].startswith("COPY ztoq_stage_parents")
+        assert first_chunk[4].startswith('INSERT INTO parents ("id", "name")')
+        assert 'ON CONFLICT ("id") DO UPDATE SET "name" = EXCLUDED."name"' in first_chunk[4]
+        assert first_chunk[5].startswith('DELETE FROM children WHERE "parent_id" IN')
+        assert first_chunk[6].startswith("INSERT INTO children")
+        assert connection.copied["ztoq_stage_parents"] == "p3\tP3\n"
+
+    def test_rolls_back_failed_chunk(self):
+        """Test a failing merge rolls the chunk back and is raised."""
+        connection = FakeConnection(fail_on="INSERT INTO parents")
+        ingester = PostgresCopyIngester(connection)
+        spec = TableSpec("parents", "parents", ("id",), ("id",))
+
+        with pytest.raises(RuntimeError):
+            ingester.ingest(["p1"], lambda item: {"parents": [(item,)]}, [spec])
+
+        assert connection.rollbacks == 1
+        assert connection.commits == 0
+
+    def test_loads_test_case_relations(self):
+        """Test steps, custom field values and labels are staged with their test case."""
+        test_case = Case(
+            id="tc1",
+            key="TEST-T1",
+            name="Login",
+            labels=["smoke", "smoke", "ui"],
+            steps=[CaseStep(index=1, description="Open page")],
+            customFields=[CustomField(id="cf1", name="Team", type="text", value="QA")],
+        )
+        connection = FakeConnection()
+
+        counts = ingest_entities(connection, "test_cases", [test_case], "TEST")
+
+        assert counts == {
+            "test_cases": 1,
+            "test_case_steps": 1,
+            "custom_field_definitions": 1,
+            "test_case_field_values": 1,
+            "labels": 2,
+            "case_labels": 2,
+        }
+        step_id = derived_id("test_case", "tc1", 1)
+        assert connection.copied["ztoq_stage_test_case_steps"].startswith(f"{step_id}\t1\t")
+        assert "\tTEST_CASE\ttc1\tQA\t" in connection.copied["ztoq_stage_test_case_field_values"]
+        assert any(
+            "entity_type = 'TEST_CASE'" in sql and sql.startswith("DELETE FROM custom_field_values")
+            for sql in connection.statements
+        )
+        assert any(
+            "JOIN labels AS label ON label.name = staged_label.name" in sql
+            for sql in connection.statements
+        )
@@ -0,0 +1,141 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ztoq.data_comparison import DataComparisonValidator
+from ztoq.pg_database_manager import PostgreSQLDatabaseManager
+
+
+def _manager(rows, fetch_size=250):
+    """PostgreSQLDatabaseManager whose session returns the given rows."""
+    manager = PostgreSQLDatabaseManager.__new__(PostgreSQLDatabaseManager)
+    manager.fetch_size = fetch_size
+    session = MagicMock()
+    session.execute.return_value = iter(SimpleNamespace(_mapping=row) for row in rows)
+
+    @contextmanager
+    def get_session():
+        yield session
+
+    manager.get_session = get_session
+    return manager, session
+
+
+@pytest.mark.unit
+class TestStreamingReads:
+    def test_stream_query_uses_server_side_cursor(self):
+        """Test queries are executed with yield_per so rows are fetched in batches."""
+        manager, session = _manager([{"id": "e1"}, {"id": "e2"}])
+
+        rows = manager.iter_test_executions_with_cycles("TEST", fetch_size=50)
+        session.execute.assert_not_called()
+
+        assert list(rows) == [{"id": "e1"}, {"id": "e2"}]
+        statement, params = session.execute.call_args[0]
+        assert statement.get_execution_options()["yield_per"] == 50
+        assert params == {"project_key": "TEST"}
+
+        manager.get_test_executions_with_cycles("TEST")
+        statement = session.execute.call_args[0][0]
+        assert statement.get_execution_options()["yield_per"] == 250
+
+    def test_streamed_rows_are_parsed(self):
+        """Test custom fields and attachments are decoded as rows stream by."""
+        manager, _ = _manager(
+            [
+                {
+                    "id": "tc1",
+                    "custom_fields": '[{"name": "Team", "value": "QA"}]',
+                    "attachments": '[{"filename": "a.png"}]',
+                    "entity_type": "test_cases",
+                },
+            ],
+        )
+
+        test_case = next(manager.iter_test_cases_with_custom_fields("TEST"))
+        assert test_case["custom_fields"] == {"Team": "QA"}
+
+        manager, _ = _manager(
+            [{"id": "tc1", "attachments": "not json", "entity_type": "test_cases"}],
+        )
+        assert manager.get_entities_with_attachments("TEST") == []
+
+    def test_validators_consume_iterators(self):
+        """Test comparison validators stream rows when the manager supports it."""
+        db = MagicMock()
+        db.get_entity_mappings.return_value = []
+        db.iter_test_executions_with_cycles.return_value = iter([{"id": "e1"}])
+        del db.iter_relationship_mismatches
+        validator = DataComparisonValidator(db, "TEST", fetch_size=100)
+
+        assert validator._validate_execution_cycle_relationships() == []
+
+        db.iter_test_executions_with_cycles.assert_called_once_with("TEST", fetch_size=100)
+        db.get_test_executions_with_cycles.assert_not_called()
+
+
+@pytest.mark.unit
+class TestRelationshipMismatches:
+    def test_mismatches_come_from_one_query(self):
+        """Test a relationship type is checked with a single streamed join."""
+        manager, session = _manager(
+            [
+                {
+                    "entity_id": "e1",
+                    "entity_name": None,
+                    "source_parent_id": "c1",
+                    "expected_parent": "q1",
+                    "actual_parent": None,
+                },
+            ],
+        )
+
+        mismatches = list(manager.iter_relationship_mismatches("TEST", "run_cycle"))
+
+        assert [m["entity_id"] for m in mismatches] == ["e1"]
+        session.execute.assert_called_once()
+        statement, params = session.execute.call_args[0]
+        assert "IS DISTINCT FROM parent_map.target_id" in statement.text
+        # Entities without a recorded link are left out rather than reported
+        assert "LEFT JOIN qtest_entity_links" not in statement.text
+        assert params == {
+            "project_key": "TEST",
+            "parent_mapping": "cycle_to_cycle",
+            "child_mapping": "execution_to_run",
+            "link_type": "run_cycle",
+        }
+
+    def test_validator_turns_mismatches_into_issues(self):
+        """Test the validator uses the set-based check instead of per-row lookups."""
+        db = MagicMock()
+        db.iter_relationship_mismatches.return_value = iter(
+            [
+                {
+                    "entity_id": "tc1",
+                    "entity_name": "Login",
+                    "source_parent_id": "f1",
+                    "expected_parent": "m1",
+                    "actual_parent": "m2",
+                },
+            ],
+        )
+        validator = DataComparisonValidator(db, "TEST", fetch_size=500)
+
+        issues = validator._validate_testcase_folder_relationships()
+
+        assert len(issues) == 1
+        assert issues[0].entity_id == "tc1"
+        assert issues[0].details["actual_qtest_module"] == "m2"
+        db.iter_relationship_mismatches.assert_called_once_with(
+            "TEST", "testcase_module", fetch_size=500,
+        )
+        db.get_qtest_module_for_testcase.assert_not_called()
+        db.get_entity_mappings.assert_not_called()
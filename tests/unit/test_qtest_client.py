@@ -4,9 +4,11 @@ This file is part of ZTOQ, licensed under the MIT License.
 See LICENSE file for details.
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from ztoq.qtest_client import QTestClient, QTestPaginatedIterator
 from ztoq.qtest_models import (
@@ -1432,3 +1434,184 @@ class TestQTestClient:
         # Ensure error message isn't lost
         error_str = str(excinfo.value)
         assert error_message in error_str
+
+
+@pytest.mark.unit
+class TestQTestPaginatedIteratorPrefetch:
+    """Tests for prefetching pages in QTestPaginatedIterator."""
+
+    @staticmethod
+    def _client(api_type, total, page_size, remaining=100):
+        """Create a mock client serving ``total`` items under the API's pagination convention."""
+        client = MagicMock()
+        client.api_type = api_type
+        client.rate_limit_remaining = remaining
+
+        def make_request(method, endpoint, params=None, **kwargs):
+            if api_type == "manager":
+                page = params["page"]
+                start = (page - 1) * page_size
+                items = [{"id": i, "name": f"Item {i}"} for i in range(start, min(start + page_size, total))]
+                return {"items": items, "page": page, "pageSize": page_size, "total": total}
+            offset = params["offset"]
+            data = [{"id": i, "name": f"Item {i}"} for i in range(offset, min(offset + page_size, total))]
+            return {"data": data, "offset": offset, "limit": page_size, "total": total}
+
+        client._make_request.side_effect = make_request
+        return client
+
+    @pytest.mark.parametrize("api_type", ["manager", "parameters"])
+    def test_prefetch_yields_all_items_in_order(self, api_type):
+        """Test prefetched pages are yielded in order for both pagination conventions."""
+        client = self._client(api_type, total=23, page_size=5)
+        iterator = QTestPaginatedIterator[QTestParameter](
+            client=client, endpoint="/items", model_class=QTestParameter,
+            page_size=5, prefetch_pages=3,
+        )
+
+        assert [item.id for item in iterator] == list(range(23))
+        # One request per page and none past the reported total
+        assert client._make_request.call_count == 5
+        assert iterator._executor is None
+
+    @pytest.mark.parametrize("api_type", ["manager", "parameters"])
+    def test_sequential_fetch_matches_prefetch(self, api_type):
+        """Test the default sequential mode walks the same pages."""
+        client = self._client(api_type, total=12, page_size=5)
+        iterator = QTestPaginatedIterator[QTestParameter](
+            client=client, endpoint="/items", model_class=QTestParameter, page_size=5,
+        )
+
+        assert [item.id for item in iterator] == list(range(12))
+        assert client._make_request.call_count == 3
+
+    def test_prefetch_respects_rate_limit(self):
+        """Test no more requests are in flight than the remaining rate limit allows."""
+        client = self._client("manager", total=50, page_size=5, remaining=1)
+        iterator = QTestPaginatedIterator[QTestParameter](
+            client=client, endpoint="/items", model_class=QTestParameter,
+            page_size=5, prefetch_pages=4,
+        )
+
+        next(iterator)
+        for _ in range(5):
+            next(iterator)
+        assert len(iterator._pending) <= 1
+        iterator.close()
+
+        # Once the budget is exhausted pages are still fetched, one at a time
+        client = self._client("manager", total=12, page_size=5, remaining=0)
+        iterator = QTestPaginatedIterator[QTestParameter](
+            client=client, endpoint="/items", model_class=QTestParameter,
+            page_size=5, prefetch_pages=4,
+        )
+        assert [item.id for item in iterator] == list(range(12))
+
+
+def _http_error(status_code, message, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return requests.exceptions.HTTPError(message, response=response)
+
+
+@pytest.mark.unit
+class TestBulkCreateTestCasesChunked:
+    """Tests for chunked bulk test case creation."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a client without running the authenticating constructor."""
+        client = QTestClient.__new__(QTestClient)
+        client.requests = []
+
+        def bulk_create(test_cases):
+            client.requests.append([tc.name for tc in test_cases])
+            if any(tc.name.startswith("bad") for tc in test_cases):
+                raise _http_error(422, "Invalid test case in request")
+            return [SimpleNamespace(id=1000 + i, name=tc.name) for i, tc in enumerate(test_cases)]
+
+        client.bulk_create_test_cases = bulk_create
+        return client
+
+    def test_chunks_and_preserves_order(self, client):
+        """Test records are sent in chunks and results follow input order."""
+        test_cases = [SimpleNamespace(name=f"Case {i}") for i in range(25)]
+
+        results = client.bulk_create_test_cases_chunked(test_cases, chunk_size=10, max_workers=3)
+
+        assert sorted(len(request) for request in client.requests) == [5, 10, 10]
+        assert [r.index for r in results] == list(range(25))
+        assert [r.test_case.name for r in results] == [tc.name for tc in test_cases]
+        assert all(r.succeeded for r in results)
+
+    def test_failing_chunk_is_bisected(self, client):
+        """Test a rejected chunk is split until the bad record is isolated."""
+        names = [f"Case {i}" for i in range(8)]
+        names[5] = "bad 5"
+        test_cases = [SimpleNamespace(name=name) for name in names]
+
+        results = client.bulk_create_test_cases_chunked(test_cases, chunk_size=8, max_workers=1)
+
+        assert [r.succeeded for r in results] == [True] * 5 + [False] + [True] * 2
+        assert "Invalid test case" in results[5].error
+        # 8 -> 4 + 4 -> 2 + 2 -> 1 + 1
+        assert len(client.requests) == 7
+
+    @patch("ztoq.qtest_client.time.sleep")
+    def test_transient_errors_are_retried_with_backoff(self, sleep, client):
+        """Test overload and transport errors resend the chunk instead of bisecting it."""
+        create = client.bulk_create_test_cases
+        failures = [
+            _http_error(429, "Too Many Requests", {"Retry-After": "7"}),
+            requests.exceptions.ConnectionError("reset"),
+        ]
+
+        def flaky(test_cases):
+            if failures:
+                client.requests.append([tc.name for tc in test_cases])
+                raise failures.pop(0)
+            return create(test_cases)
+
+        client.bulk_create_test_cases = flaky
+        test_cases = [SimpleNamespace(name=f"Case {i}") for i in range(4)]
+
+        results = client.bulk_create_test_cases_chunked(test_cases, chunk_size=4)
+
+        assert all(r.succeeded for r in results)
+        assert [len(request) for request in client.requests] == [4, 4, 4]
+        assert [call.args[0] for call in sleep.call_args_list] == [7.0, 2.0]
+
+    @pytest.mark.parametrize(
+        ("error", "attempts"),
+        [
+            (_http_error(503, "Service Unavailable"), 3),
+            (requests.exceptions.Timeout("timed out"), 3),
+            (_http_error(403, "Forbidden"), 1),
+        ],
+        ids=["503", "timeout", "403"],
+    )
+    @patch("ztoq.qtest_client.time.sleep")
+    def test_request_errors_are_not_bisected(self, sleep, client, error, attempts):
+        """Test errors that are not about the records fail the chunk without splitting it."""
+        def failing(test_cases):
+            client.requests.append([tc.name for tc in test_cases])
+            raise error
+
+        client.bulk_create_test_cases = failing
+        test_cases = [SimpleNamespace(name=f"Case {i}") for i in range(4)]
+
+        results = client.bulk_create_test_cases_chunked(test_cases, chunk_size=4)
+
+        assert not any(r.succeeded for r in results)
+        assert [len(request) for request in client.requests] == [4] * attempts
+
+    def test_mismatched_response_fails_chunk_without_retry(self, client):
+        """Test a short bulk response is reported rather than resubmitted."""
+        client.bulk_create_test_cases = lambda test_cases: [SimpleNamespace(id=1, name="Case 0")]
+        test_cases = [SimpleNamespace(name=f"Case {i}") for i in range(3)]
+
+        results = client.bulk_create_test_cases_chunked(test_cases, chunk_size=3)
+
+        assert not any(r.succeeded for r in results)
+        assert "1 test cases for 3 submitted" in results[0].error
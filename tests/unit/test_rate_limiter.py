@@ -0,0 +1,184 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+import threading
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ztoq.models import ZephyrConfig
+from ztoq.rate_limiter import (
+    MemoryBucketStore,
+    SQLiteBucketStore,
+    TokenBucketRateLimiter,
+    create_rate_limiter,
+)
+from ztoq.zephyr_client import ZephyrClient
+
+
+class FakeClock:
+    """Manually advanced clock; sleeping advances it."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.unit
+class TestTokenBucketRateLimiter:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def _limiter(self, clock, rate=10.0, capacity=None, store=None, name="default"):
+        return TokenBucketRateLimiter(
+            rate, capacity=capacity, store=store, name=name, clock=clock, sleep=clock.sleep,
+        )
+
+    def test_burst_then_paced(self, clock):
+        """Test a full bucket allows a burst and then paces requests at the rate."""
+        limiter = self._limiter(clock, rate=10.0, capacity=5)
+
+        for _ in range(5):
+            assert limiter.acquire() == 0.0
+        waited = limiter.acquire()
+
+        assert waited == pytest.approx(0.1)
+        assert limiter.try_acquire() == pytest.approx(0.1)
+
+    def test_remaining_quota_caps_tokens_and_pace(self, clock):
+        """Test the remaining quota from the headers narrows the bucket."""
+        limiter = self._limiter(clock, rate=100.0, capacity=100)
+
+        # 10 requests left for the next 10 seconds -> at most one per second
+        limiter.update_from_headers(remaining=10, reset=clock.now + 10)
+        for _ in range(10):
+            limiter.acquire()
+        assert clock.sleeps == []
+
+        assert limiter.acquire() == pytest.approx(1.0)
+
+        # After the window resets the configured rate applies again
+        clock.now += 20
+        limiter.acquire()
+        assert limiter.try_acquire() == 0.0
+
+    def test_exhausted_quota_blocks_until_reset(self, clock):
+        """Test a zero remaining quota blocks the bucket until the reset time."""
+        limiter = self._limiter(clock, rate=10.0)
+
+        limiter.update_from_headers(remaining=0, reset=clock.now + 30)
+
+        assert limiter.acquire() == pytest.approx(30.0)
+
+    def test_observe_response_honours_retry_after(self, clock):
+        """Test a 429 response blocks for the Retry-After interval."""
+        limiter = self._limiter(clock, rate=10.0)
+
+        limiter.observe_response({"Retry-After": "7"}, 429)
+        assert limiter.try_acquire() == pytest.approx(7.0)
+
+        # Malformed headers are ignored
+        limiter.observe_response({"X-RateLimit-Remaining": "n/a"}, 200)
+
+    def test_threads_share_one_bucket(self):
+        """Test threads sharing a limiter never exceed the burst capacity."""
+        clock = FakeClock()
+        lock = threading.Lock()
+        granted = []
+        limiter = TokenBucketRateLimiter(
+            5.0, capacity=5, clock=clock, sleep=lambda seconds: None,
+        )
+
+        def worker():
+            for _ in range(10):
+                if limiter.try_acquire() == 0.0:
+                    with lock:
+                        granted.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # The clock never moves, so only the initial burst is granted
+        assert len(granted) == 5
+
+    def test_sqlite_store_is_shared_between_limiters(self, clock, tmp_path):
+        """Test limiters on the same SQLite file draw from one bucket."""
+        path = tmp_path / "limits.db"
+        first = self._limiter(clock, rate=1.0, capacity=3, store=SQLiteBucketStore(path))
+        second = self._limiter(clock, rate=1.0, capacity=3, store=SQLiteBucketStore(path))
+
+        assert first.try_acquire() == 0.0
+        assert second.try_acquire() == 0.0
+        assert first.try_acquire() == 0.0
+        assert second.try_acquire() == pytest.approx(1.0)
+
+        # Header updates seen by one process apply to the others
+        first.update_from_headers(remaining=0, reset=clock.now + 60)
+        assert second.try_acquire() == pytest.approx(60.0)
+
+    def test_named_buckets_are_independent(self, clock):
+        """Test one store can hold separate buckets per API."""
+        store = MemoryBucketStore()
+        zephyr = self._limiter(clock, rate=1.0, capacity=1, store=store, name="zephyr")
+        qtest = self._limiter(clock, rate=1.0, capacity=1, store=store, name="qtest")
+
+        assert zephyr.try_acquire() == 0.0
+        assert qtest.try_acquire() == 0.0
+        assert zephyr.try_acquire() > 0
+
+    def test_create_rate_limiter(self, tmp_path):
+        """Test the factory selects the store from the shared path."""
+        assert isinstance(create_rate_limiter(5).store, MemoryBucketStore)
+        shared = create_rate_limiter(5, shared_path=tmp_path / "limits.db", name="qtest")
+        assert isinstance(shared.store, SQLiteBucketStore)
+        assert shared.name == "qtest"
+
+        with pytest.raises(ValueError):
+            create_rate_limiter(0)
+
+    def test_zephyr_client_uses_limiter(self):
+        """Test the client takes a token per request and feeds back the headers."""
+        limiter = MagicMock(spec=TokenBucketRateLimiter)
+        client = ZephyrClient(
+            ZephyrConfig(
+                base_url="https://api.zephyrscale.example.com/v2",
+                api_token="test-token",
+                project_key="TEST",
+            ),
+            rate_limiter=limiter,
+        )
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"key": "value"}
+        response.headers = {"X-Rate-Limit-Remaining": "5", "X-Rate-Limit-Reset": "1633046400"}
+        session = MagicMock()
+        session.request.return_value = response
+
+        @contextmanager
+        def get_session(url):
+            yield session
+
+        with patch("ztoq.connection_pool.connection_pool.get_session", side_effect=get_session):
+            assert client._make_request("GET", "/testcases") == {"key": "value"}
+
+        limiter.acquire.assert_called_once_with()
+        limiter.observe_response.assert_called_once_with(
+            response.headers,
+            200,
+            remaining_header="X-Rate-Limit-Remaining",
+            reset_header="X-Rate-Limit-Reset",
+        )
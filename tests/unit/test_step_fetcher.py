@@ -0,0 +1,121 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from ztoq.models import Case, CaseStep
+from ztoq.step_fetcher import BulkStepFetcher
+
+
+def _case(number, version="1.0", steps=None):
+    return Case(
+        id=str(number),
+        key=f"TEST-T{number}",
+        name=f"Case {number}",
+        version=version,
+        steps=steps or [],
+    )
+
+
+def _steps_for(key):
+    return [CaseStep(index=1, description=f"Step for {key}")]
+
+
+@pytest.mark.unit
+class TestBulkStepFetcher:
+    @pytest.fixture
+    def client(self):
+        """Create a mock Zephyr client returning one step per case."""
+        client = MagicMock()
+        client.get_test_steps.side_effect = _steps_for
+        return client
+
+    def test_fetches_batch_concurrently(self, client):
+        """Test that step requests of a batch run in parallel up to max_workers."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_steps(key):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return _steps_for(key)
+
+        client.get_test_steps.side_effect = slow_steps
+        fetcher = BulkStepFetcher(client, max_workers=4)
+        cases = [_case(i) for i in range(8)]
+
+        results = fetcher.fetch_steps(cases)
+        fetcher.close()
+
+        assert set(results) == {case.id for case in cases}
+        assert results["3"][0].description == "Step for TEST-T3"
+        assert 1 < peak <= 4
+
+    def test_caches_by_case_and_version(self, client):
+        """Test steps are cached per test case version."""
+        fetcher = BulkStepFetcher(client)
+
+        fetcher.fetch_steps([_case(1), _case(2)])
+        fetcher.fetch_steps([_case(1), _case(2, version="2.0")])
+
+        assert client.get_test_steps.call_count == 3
+        assert fetcher.stats == {"fetched": 3, "cache_hits": 1, "inline": 0}
+
+    def test_cache_size_is_bounded(self, client):
+        """Test the least recently used step lists are evicted."""
+        fetcher = BulkStepFetcher(client, cache_size=2)
+        fetcher.fetch_steps([_case(1), _case(2), _case(3)])
+
+        assert len(fetcher._cache) == 2
+        fetcher.fetch_steps([_case(1)])
+        assert client.get_test_steps.call_count == 4
+
+    def test_inline_steps_skip_fetch_when_enabled(self, client):
+        """Test cases with inline steps are not fetched when opted in."""
+        inline = [CaseStep(index=1, description="Inline step")]
+        cases = [_case(1, steps=inline), _case(2)]
+
+        fetcher = BulkStepFetcher(client, use_inline_steps=True)
+        results = fetcher.fetch_steps(cases)
+
+        client.get_test_steps.assert_called_once_with("TEST-T2")
+        assert results["1"] == inline
+
+        # Without the opt-in every case is fetched
+        default_fetcher = BulkStepFetcher(client)
+        default_fetcher.fetch_steps([_case(1, steps=inline)])
+        assert client.get_test_steps.call_count == 2
+
+    def test_failure_raised_after_batch_completes(self, client):
+        """Test one failing request does not stop the others and is re-raised."""
+
+        def steps_or_error(key):
+            if key == "TEST-T2":
+                raise ConnectionError("step request failed")
+            return _steps_for(key)
+
+        client.get_test_steps.side_effect = steps_or_error
+        fetcher = BulkStepFetcher(client, max_workers=2)
+
+        with pytest.raises(ConnectionError):
+            fetcher.fetch_steps([_case(1), _case(2), _case(3)])
+
+        assert client.get_test_steps.call_count == 3
+        # Successful results were cached and are reused on retry
+        client.get_test_steps.side_effect = _steps_for
+        results = fetcher.fetch_steps([_case(1), _case(2), _case(3)])
+        assert client.get_test_steps.call_count == 4
+        assert set(results) == {"1", "2", "3"}
@@ -5,12 +5,19 @@ See LICENSE file for details.
 """
 
 import json
+import sqlite3
 from datetime import datetime
 
 import pytest
 
-from ztoq.models import Case, TestCase  # Using compatibility alias
-from ztoq.storage import JSONStorage, SQLiteStorage
+from ztoq.models import Case, CaseStep, CycleInfo, Execution, TestCase  # Using compatibility alias
+from ztoq.storage import (
+    ZSTD_AVAILABLE,
+    JSONLinesStorage,
+    JSONStorage,
+    SQLiteStorage,
+    read_jsonl,
+)
 
 
 @pytest.mark.unit
@@ -126,6 +133,60 @@ class TestSQLiteStorage:
         assert storage._serialize_value(True) is True
         assert storage._serialize_value(None) is None
 
+    def test_save_test_cases_bulk(self, storage):
+        """Test saving a batch of test cases with nested steps in one call."""
+        storage.initialize_database()
+        test_cases = [
+            Case(
+                id=f"tc{i}",
+                key=f"TEST-TC-{i}",
+                name=f"Test Case {i}",
+                labels=["bulk"],
+                steps=[CaseStep(index=1, description=f"Step of case {i}")],
+            )
+            for i in range(3)
+        ]
+
+        storage.save_test_cases(test_cases, "TEST")
+
+        rows = storage.conn.execute("SELECT * FROM test_cases ORDER BY id").fetchall()
+        assert [row["key"] for row in rows] == ["TEST-TC-0", "TEST-TC-1", "TEST-TC-2"]
+        assert json.loads(rows[2]["steps"])[0]["description"] == "Step of case 2"
+        assert json.loads(rows[0]["labels"]) == ["bulk"]
+        # The batch is committed as one transaction
+        assert not storage.conn.in_transaction
+
+    def test_save_test_executions_bulk_rolls_back_batch(self, storage):
+        """Test a failing row rolls back the whole execution batch."""
+        storage.initialize_database()
+        storage.save_test_cases([Case(id="tc1", key="TEST-TC-1", name="Case")], "TEST")
+        storage.save_test_cycle(
+            CycleInfo(id="c1", key="TEST-C1", name="Cycle", projectKey="TEST"),
+        )
+        storage.conn.commit()
+
+        executions = [
+            Execution(id="e1", testCaseKey="TEST-TC-1", cycleId="c1", status="Pass"),
+            Execution(id="e2", testCaseKey="TEST-TC-404", cycleId="c1", status="Fail"),
+        ]
+        with pytest.raises(sqlite3.IntegrityError):
+            storage.save_test_executions(executions, "TEST")
+
+        assert storage.conn.execute("SELECT COUNT(*) FROM test_executions").fetchone()[0] == 0
+
+        storage.save_test_executions(executions[:1], "TEST")
+        assert storage.conn.execute("SELECT COUNT(*) FROM test_executions").fetchone()[0] == 1
+
+    def test_bulk_load_pragmas(self, storage):
+        """Test a bulk-load session enables WAL and restores the synchronous level."""
+        before = storage.conn.execute("PRAGMA synchronous").fetchone()[0]
+
+        with storage.bulk_load():
+            assert storage.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert storage.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+        assert storage.conn.execute("PRAGMA synchronous").fetchone()[0] == before
+
 
 @pytest.mark.unit
 class TestJSONStorage:
@@ -275,3 +336,63 @@ class TestJSONStorage:
         assert isinstance(serialized_dict, dict)
         assert serialized_dict["test_case"]["id"] == "tc1"
         assert serialized_dict["dt"] == "2023-01-01T12:00:00"
+
+
+@pytest.mark.unit
+class TestJSONLinesStorage:
+    @pytest.fixture
+    def output_dir(self, tmp_path):
+        """Create a temporary output directory."""
+        return tmp_path / "output"
+
+    def _cases(self, start, count):
+        return [
+            Case(id=f"tc{i}", key=f"TEST-TC-{i}", name=f"Case {i}", created_on=datetime(2025, 1, 1))
+            for i in range(start, start + count)
+        ]
+
+    @pytest.mark.parametrize(
+        "compression",
+        [
+            None,
+            "gzip",
+            pytest.param(
+                "zstd",
+                marks=pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed"),
+            ),
+        ],
+    )
+    def test_batches_are_appended_and_streamed_back(self, output_dir, compression):
+        """Test batches append to one file that is read back record by record."""
+        storage = JSONLinesStorage(output_dir, compression=compression)
+        storage.save_test_cases(self._cases(0, 2), "TEST")
+        storage.save_test_cases(self._cases(2, 1), "TEST")
+        storage.save_test_case(self._cases(3, 1)[0], "TEST")
+
+        path = storage.path_for("test_cases")
+        suffix = {None: "", "gzip": ".gz", "zstd": ".zst"}[compression]
+        assert path.name == f"test_cases.jsonl{suffix}"
+
+        records = storage.iter_records("test_cases")
+        first = next(records)
+        assert first["key"] == "TEST-TC-0"
+        assert first["created_on"] == "2025-01-01T00:00:00"
+        assert [r["id"] for r in records] == ["tc1", "tc2", "tc3"]
+        assert [r["id"] for r in read_jsonl(path)] == ["tc0", "tc1", "tc2", "tc3"]
+
+    def test_previous_run_is_replaced_unless_appending(self, output_dir):
+        """Test a new storage instance starts fresh files unless append is set."""
+        JSONLinesStorage(output_dir).save_test_cases(self._cases(0, 2), "TEST")
+
+        JSONLinesStorage(output_dir).save_test_cases(self._cases(5, 1), "TEST")
+        assert [r["id"] for r in JSONLinesStorage(output_dir).iter_records("test_cases")] == [
+            "tc5",
+        ]
+
+        JSONLinesStorage(output_dir, append=True).save_test_cases(self._cases(6, 1), "TEST")
+        assert [r["id"] for r in read_jsonl(output_dir / "test_cases.jsonl")] == ["tc5", "tc6"]
+
+    def test_unsupported_compression(self, output_dir):
+        """Test an unknown compression is rejected."""
+        with pytest.raises(ValueError):
+            JSONLinesStorage(output_dir, compression="lz4")
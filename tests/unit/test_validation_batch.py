@@ -0,0 +1,286 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from ztoq.entity_mapping_index import EntityMappingIndex
+from ztoq.validation import ValidationManager, ValidationRuleRegistry
+from ztoq.validation_rules import (
+    PatternMatchRule,
+    ReferentialIntegrityRule,
+    RequiredFieldRule,
+    StringLengthRule,
+    UniqueValueIndex,
+    UniqueValueRule,
+)
+from ztoq.validation_types import (
+    ValidationIssue,
+    ValidationPhase,
+    ValidationRule,
+    ValidationScope,
+)
+
+SCOPE = ValidationScope.TEST_CASE
+PHASE = ValidationPhase.EXTRACTION
+
+ENTITIES = [
+    {"id": "1", "key": "TEST-T1", "name": "Login", "description": "Valid case"},
+    {"id": "2", "key": "bad key", "name": "", "description": None},
+    {"key": "TEST-T3", "name": "x" * 30, "description": 42},
+    {"id": "4", "name": "ab"},
+    SimpleNamespace(id="5", key="TEST-T5", name="Object", description=""),
+]
+
+
+def _rules():
+    return [
+        RequiredFieldRule("required", "Required", "", SCOPE, PHASE, ["name", "description"]),
+        StringLengthRule("length", "Length", "", SCOPE, PHASE, {"name": {"min": 3, "max": 20}}),
+        PatternMatchRule("pattern", "Pattern", "", SCOPE, PHASE, {"key": r"^[A-Z]+-T\d+$"}),
+    ]
+
+
+def _summary(issues):
+    return sorted((i.id.rsplit("_", 1)[0], i.entity_id, i.message, str(i.details)) for i in issues)
+
+
+@pytest.mark.unit
+class TestValidateMany:
+    @pytest.mark.parametrize("rule", _rules(), ids=lambda rule: rule.id)
+    def test_matches_per_entity_validation(self, rule):
+        """Test batch validation reports the same issues as validating one entity at a time."""
+        context = {"entity_type": "test_case"}
+        expected = [issue for entity in ENTITIES for issue in rule.validate(entity, context)]
+
+        assert expected
+        assert _summary(rule.validate_many(ENTITIES, context)) == _summary(expected)
+
+    @pytest.mark.parametrize("rule", _rules(), ids=lambda rule: rule.id)
+    def test_accepts_dataframes(self, rule):
+        """Test a DataFrame batch gives the same issues as the equivalent dicts."""
+        records = [entity for entity in ENTITIES if isinstance(entity, dict)]
+        frame = pd.DataFrame(records)
+
+        assert _summary(rule.validate_many(frame, {})) == _summary(
+            rule.validate_many(records, {}),
+        )
+
+    def test_ignores_values_that_are_not_strings(self):
+        """Test lists and dicts are skipped in batches, as they are per entity."""
+        entities = [
+            {"id": "1", "labels": {"min": 1, "max": 2}},
+            {"id": "2", "labels": ["label"] * 60},
+            {"id": "3", "labels": []},
+            {"id": "4", "labels": "abc"},
+        ]
+        rules = [
+            StringLengthRule(
+                "length", "Length", "", SCOPE, PHASE, {"labels": {"min": 1, "max": 2}},
+            ),
+            PatternMatchRule("pattern", "Pattern", "", SCOPE, PHASE, {"labels": r"^[a-z]{2}$"}),
+        ]
+
+        for rule in rules:
+            expected = [issue for entity in entities for issue in rule.validate(entity, {})]
+            issues = rule.validate_many(entities, {})
+            assert [issue.entity_id for issue in issues] == ["4"]
+            assert _summary(issues) == _summary(expected)
+
+    def test_default_validate_many_loops_over_validate(self):
+        """Test rules without a batch implementation still validate every entity."""
+        rule = ValidationRule("base", "Base", "", SCOPE, PHASE)
+        rule.validate = MagicMock(return_value=[])
+
+        rule.validate_many(pd.DataFrame([{"id": "1"}, {"id": "2"}]), {})
+
+        assert [call.args[0] for call in rule.validate.call_args_list] == [{"id": "1"}, {"id": "2"}]
+
+
+@pytest.mark.unit
+class TestCompiledRuleExecution:
+    def test_registry_indexes_rules_by_scope_and_phase(self):
+        """Test rules are looked up by scope and phase, honouring enabled and overwrites."""
+        registry = ValidationRuleRegistry()
+        required, length, pattern = _rules()
+        other = RequiredFieldRule("other", "Other", "", ValidationScope.FOLDER, PHASE, ["name"])
+        for rule in (required, length, pattern, other):
+            registry.register_rule(rule)
+
+        length.enabled = False
+        assert registry.get_rules(SCOPE, PHASE) == [required, pattern]
+        assert registry.get_rules(SCOPE, ValidationPhase.LOADING) == []
+
+        replacement = PatternMatchRule("pattern", "Pattern", "", SCOPE, PHASE, {"key": ".*"})
+        registry.register_rule(replacement)
+        assert registry.get_rules(SCOPE, PHASE) == [required, replacement]
+        assert pattern not in registry.get_rules_for_scope(SCOPE)
+
+    def test_execute_all_validations_runs_each_rule_once_per_batch(self):
+        """Test each rule sees the whole batch, falling back to one entity at a time."""
+        with patch("ztoq.validation.get_built_in_rules", return_value=[]):
+            manager = ValidationManager(MagicMock(), "TEST")
+        for rule in _rules():
+            manager.registry.register_rule(rule)
+        broken = ValidationRule("broken", "Broken", "", SCOPE, PHASE)
+        broken.validate_many = MagicMock(side_effect=RuntimeError("boom"))
+        broken.validate = MagicMock(return_value=[])
+        manager.registry.register_rule(broken)
+
+        results = manager.execute_all_validations(PHASE, {SCOPE: ENTITIES})
+
+        broken.validate_many.assert_called_once()
+        entities, context = broken.validate_many.call_args[0]
+        assert entities is ENTITIES
+        assert context["phase"] == PHASE.value
+        assert isinstance(context["unique_value_index"], UniqueValueIndex)
+        assert [call.args[0] for call in broken.validate.call_args_list] == ENTITIES
+        assert not [i for i in results[SCOPE] if i.scope == ValidationScope.SYSTEM]
+        assert len(manager.issues) == len(results[SCOPE]) > 0
+
+    def test_entity_that_breaks_a_rule_does_not_stop_the_batch(self):
+        """Test the other entities are still validated and the failing one is reported."""
+
+        class FlakyRule(ValidationRule):
+            def validate(self, entity, context):
+                if entity["id"] == "2":
+                    raise RuntimeError("boom")
+                return [
+                    ValidationIssue(
+                        id=f"flaky_{entity['id']}",
+                        level=self.level,
+                        scope=self.scope,
+                        phase=self.phase,
+                        message="flagged",
+                        entity_id=entity["id"],
+                    ),
+                ]
+
+        with patch("ztoq.validation.get_built_in_rules", return_value=[]):
+            manager = ValidationManager(MagicMock(), "TEST")
+        manager.registry.register_rule(FlakyRule("flaky", "Flaky", "", SCOPE, PHASE))
+        entities = [{"id": str(index)} for index in range(1, 6)]
+
+        results = manager.execute_all_validations(PHASE, {SCOPE: entities})
+
+        flagged = [i.entity_id for i in results[SCOPE] if i.scope == SCOPE]
+        errors = [i for i in results[SCOPE] if i.scope == ValidationScope.SYSTEM]
+        assert flagged == ["1", "3", "4", "5"]
+        assert [(i.entity_id, i.details["rule_id"]) for i in errors] == [("2", "flaky")]
+
+
+@pytest.mark.unit
+class TestSetBasedRules:
+    def test_unique_values_are_grouped_in_one_pass(self):
+        """Test duplicates are found without a database query per entity."""
+        rule = UniqueValueRule("unique", "Unique", "", SCOPE, PHASE, ["key"])
+        database = MagicMock()
+        entities = [
+            {"id": "1", "key": "TEST-T1"},
+            {"id": "2", "key": "TEST-T2"},
+            {"id": "3", "key": "TEST-T1"},
+            {"id": "4", "key": None},
+        ]
+
+        issues = rule.validate_many(entities, {"database": database})
+
+        database.find_duplicates.assert_not_called()
+        assert [(i.entity_id, i.details["duplicate_ids"]) for i in issues] == [
+            ("1", ["3"]),
+            ("3", ["1"]),
+        ]
+        assert issues[0].details["value"] == "TEST-T1"
+
+    def test_unique_value_index_spans_batches(self):
+        """Test later batches of a run are checked against the values seen before."""
+        rule = UniqueValueRule("unique", "Unique", "", SCOPE, PHASE, ["name"])
+        context = {"unique_value_index": UniqueValueIndex()}
+
+        assert rule.validate_many([{"id": "1", "name": "Login"}], context) == []
+        frame = pd.DataFrame([{"id": "2", "name": "Login"}, {"id": "3", "name": "Logout"}])
+        issues = rule.validate_many(frame, context)
+
+        assert [(i.entity_id, i.details["duplicate_ids"]) for i in issues] == [("2", ["1"])]
+        assert issues[0].details["duplicate_count"] == 1
+
+    def test_references_are_checked_against_loaded_mappings(self):
+        """Test one mapping query serves the whole batch."""
+        rule = ReferentialIntegrityRule(
+            "folder_ref", "Folder Reference", "", SCOPE, "folderId", "folder_to_module",
+        )
+        database = MagicMock()
+        database.get_entity_mappings.return_value = [{"source_id": "10", "target_id": "m10"}]
+        entities = [
+            {"id": "1", "folderId": 10},
+            {"id": "2", "folderId": "11"},
+            {"id": "3", "folderId": None},
+            {"id": "4", "folderId": "10"},
+        ]
+
+        issues = rule.validate_many(entities, {"database": database, "project_key": "TEST"})
+
+        database.get_entity_mappings.assert_called_once_with("TEST", "folder_to_module")
+        database.get_mapped_entity_id.assert_not_called()
+        assert [(i.entity_id, i.details["reference_id"]) for i in issues] == [("2", "11")]
+        assert rule.validate_many(entities, {}) == []
+
+        mapping_index = EntityMappingIndex(database, "TEST")
+        mapping_index.put("folder_to_module", "11", "m11")
+        assert rule.validate_many(entities, {"mapping_index": mapping_index}) == []
+
+
+@pytest.mark.unit
+class TestParallelValidation:
+    @pytest.fixture
+    def entities(self):
+        return [
+            {"id": str(index), "key": f"TEST-T{index % 7}" if index % 5 else "bad", "name": ""}
+            for index in range(20)
+        ]
+
+    def _manager(self, **kwargs):
+        with patch("ztoq.validation.get_built_in_rules", return_value=[]):
+            manager = ValidationManager(MagicMock(), "TEST", **kwargs)
+        for rule in [
+            *_rules(),
+            UniqueValueRule("unique", "Unique", "", SCOPE, PHASE, ["key"]),
+        ]:
+            manager.registry.register_rule(rule)
+        return manager
+
+    def test_process_pool_matches_serial_validation(self, entities):
+        """Test sharded validation finds the same issues, including across shards."""
+        serial = self._manager().execute_all_validations(PHASE, {SCOPE: entities})
+        manager = self._manager(parallel_workers=2, shard_size=6)
+
+        parallel = manager.execute_all_validations(PHASE, {SCOPE: entities})
+
+        assert _summary(parallel[SCOPE]) == _summary(serial[SCOPE])
+        assert any(issue.details.get("duplicate_ids") for issue in parallel[SCOPE] if issue.details)
+        assert len(manager.issues) == len(parallel[SCOPE])
+
+    def test_shards_go_to_workers_and_failed_shards_run_here(self, entities):
+        """Test shardable rules are shipped once and a failed shard is validated here."""
+        manager = self._manager(parallel_workers=2, shard_size=6)
+        failed = MagicMock()
+        failed.result.side_effect = RuntimeError("worker died")
+        executor = MagicMock()
+        submit = executor.__enter__.return_value.submit
+        submit.return_value = failed
+
+        with patch("ztoq.validation.ProcessPoolExecutor", return_value=executor) as pool:
+            results = manager.execute_all_validations(PHASE, {SCOPE: entities})
+
+        shipped = pool.call_args.kwargs["initargs"][0]
+        assert [rule.id for rule in shipped] == ["required", "length", "pattern"]
+        assert [len(call.args[2]) for call in submit.call_args_list] == [6, 6, 6, 2]
+        assert submit.call_args.args[1] == ("required", "length", "pattern")
+
+        serial = self._manager().execute_all_validations(PHASE, {SCOPE: entities})
+        assert _summary(results[SCOPE]) == _summary(serial[SCOPE])
@@ -0,0 +1,168 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ztoq.validation import ValidationIssueBuffer, ValidationManager
+from ztoq.validation_integration import EnhancedMigration
+from ztoq.validation_types import (
+    ValidationIssue,
+    ValidationLevel,
+    ValidationPhase,
+    ValidationScope,
+)
+
+
+def _issue(index, level=ValidationLevel.ERROR, entity_type="test_case"):
+    return ValidationIssue(
+        id=f"issue_{index}",
+        level=level,
+        scope=ValidationScope.TEST_CASE,
+        phase=ValidationPhase.EXTRACTION,
+        message=f"Issue {index}",
+        entity_id=str(index),
+        entity_type=entity_type,
+    )
+
+
+@pytest.mark.unit
+class TestValidationIssueBuffer:
+    def test_saves_in_bulk_by_count_and_age(self):
+        """Test issues are saved together once the buffer is full or old enough."""
+        now = [0.0]
+        db = MagicMock()
+        buffer = ValidationIssueBuffer(db, "TEST", max_items=3, max_delay=10, clock=lambda: now[0])
+
+        buffer.add(_issue(1))
+        buffer.add(_issue(2))
+        db.save_validation_issues.assert_not_called()
+        buffer.add(_issue(3))
+        assert [i.id for i in db.save_validation_issues.call_args[0][0]] == [
+            "issue_1",
+            "issue_2",
+            "issue_3",
+        ]
+
+        buffer.add(_issue(4))
+        now[0] = 11.0
+        buffer.add(_issue(5))
+        assert db.save_validation_issues.call_count == 2
+        assert buffer.pending == 0
+        assert buffer.stats == {
+            "buffered": 5,
+            "saved": 5,
+            "flushes": 2,
+            "failed_flushes": 0,
+            "dropped": 0,
+        }
+
+    def test_failed_flush_keeps_issues(self):
+        """Test issues survive a failed bulk save and single-issue fallback works."""
+        now = [0.0]
+        db = MagicMock(spec=["save_validation_issue"])
+        db.save_validation_issue.side_effect = [1, RuntimeError("database locked"), 1]
+        buffer = ValidationIssueBuffer(db, "TEST", clock=lambda: now[0])
+        buffer.add(_issue(1))
+        buffer.add(_issue(2))
+
+        assert buffer.flush() == 1
+        assert buffer.pending == 1
+        now[0] = 5.0
+        assert buffer.flush() == 1
+        assert buffer.pending == 0
+        saved = [call.kwargs["issue"].id for call in db.save_validation_issue.call_args_list]
+        assert saved == ["issue_1", "issue_2", "issue_2"]
+
+
+@pytest.mark.unit
+class TestValidationManagerIssues:
+    @pytest.fixture
+    def manager(self):
+        with patch("ztoq.validation.get_built_in_rules", return_value=[]):
+            return ValidationManager(
+                MagicMock(), "TEST", issue_buffer_size=100, log_sample_size=2, log_every=5,
+            )
+
+    def test_issues_are_saved_on_flush(self, manager):
+        """Test add_issue buffers instead of saving each issue immediately."""
+        for index in range(3):
+            manager.add_issue(_issue(index))
+
+        manager.database.save_validation_issues.assert_not_called()
+        manager.database.save_validation_issue.assert_not_called()
+        assert manager.flush_issues() == 3
+        manager.database.save_validation_issues.assert_called_once()
+        assert manager.get_issue_count(ValidationLevel.ERROR) == 3
+
+    def test_logging_is_sampled_per_kind(self, manager):
+        """Test only a sample of each kind of issue is logged."""
+        with patch("ztoq.validation.logger") as logger:
+            for index in range(10):
+                manager.add_issue(_issue(index))
+            manager.add_issue(_issue(10, level=ValidationLevel.WARNING))
+
+        # Issues 1, 2, 5 and 10 of the error kind and the first warning
+        assert logger.log.call_count == 5
+        assert manager.suppressed_log_count == 6
+        assert manager.issue_kind_counts[
+            (ValidationLevel.ERROR, ValidationScope.TEST_CASE, "test_case")
+        ] == 10
+
+    def test_backs_off_and_caps_issues_while_database_is_down(self):
+        """Test a failed flush is not retried until the delay passes and old issues drop."""
+        now = [0.0]
+        db = MagicMock()
+        db.save_validation_issues.side_effect = RuntimeError("connection refused")
+        buffer = ValidationIssueBuffer(
+            db, "TEST", max_items=2, max_delay=10, clock=lambda: now[0], max_pending=3,
+        )
+
+        for index in range(5):
+            buffer.add(_issue(index))
+        assert db.save_validation_issues.call_count == 1
+        assert buffer.flush() == 0
+        assert db.save_validation_issues.call_count == 1
+        assert buffer.pending == 3
+        assert buffer.stats["dropped"] == 2
+
+        db.save_validation_issues.side_effect = None
+        now[0] = 10.0
+        buffer.add(_issue(5))
+        saved = db.save_validation_issues.call_args[0][0]
+        assert [issue.id for issue in saved] == ["issue_3", "issue_4", "issue_5"]
+        assert buffer.pending == 0
+
+    def test_context_manager_saves_remaining_issues(self):
+        """Test closing the buffer saves what is left, also when the block raised."""
+        db = MagicMock()
+
+        with pytest.raises(RuntimeError), ValidationIssueBuffer(db, "TEST") as buffer:
+            buffer.add(_issue(1))
+            raise RuntimeError("phase failed")
+
+        db.save_validation_issues.assert_called_once()
+        assert buffer.pending == 0
+
+
+@pytest.mark.unit
+class TestIssuesSavedOnFailure:
+    def test_enhanced_migration_flushes_when_a_phase_fails(self):
+        """Test buffered issues are saved when the wrapped migration raises."""
+        enhanced = EnhancedMigration.__new__(EnhancedMigration)
+        enhanced.validator = MagicMock()
+        enhanced.validation_manager = MagicMock()
+        enhanced.migration = MagicMock()
+        enhanced.migration.run_migration.side_effect = RuntimeError("load failed")
+        enhanced.migration.load_data.side_effect = RuntimeError("load failed")
+
+        with pytest.raises(RuntimeError):
+            enhanced.run_migration()
+        with pytest.raises(RuntimeError):
+            enhanced.load_data()
+
+        assert enhanced.validation_manager.flush_issues.call_count == 2
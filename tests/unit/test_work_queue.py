@@ -15,7 +15,9 @@ import time
 import pytest
 
 from ztoq.work_queue import (
+    PriorityQueue,
     WorkerType,
+    WorkIdQueue,
     WorkItem,
     WorkQueue,
     WorkStatus,
@@ -571,3 +573,55 @@ async def test_work_queue_stress():
     finally:
         # Stop queue
         await queue.stop()
+
+
+def test_priority_queue_orders_by_priority_then_fifo():
+    """Test the asyncio priority queue pops highest priority first, FIFO within a priority."""
+    queue = PriorityQueue()
+    for priority, name in [(1, "a"), (5, "b"), (1, "c"), (5, "d"), (3, "e")]:
+        queue.put_nowait((priority, name))
+
+    assert [queue.get_nowait() for _ in range(5)] == [
+        (5, "b"),
+        (5, "d"),
+        (3, "e"),
+        (1, "a"),
+        (1, "c"),
+    ]
+
+
+def test_work_id_queue_push_pop_and_remove():
+    """Test the work ID heap keeps priority and FIFO order across removals."""
+    queue = WorkIdQueue()
+    queue.push_many(["a", "b", "c"], priority=1)
+    queue.push("urgent", priority=10)
+    queue.push("late", priority=1)
+    queue.remove("b")
+    queue.push("c", priority=0)  # Re-queueing replaces the earlier entry
+
+    assert "b" not in queue
+    assert len(queue) == 4
+    assert [queue.pop() for _ in range(4)] == ["urgent", "a", "late", "c"]
+    assert not queue
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_cleanup_evicts_oldest_completed_items():
+    """Test completed items are evicted in completion order once over the limit."""
+    queue = WorkQueue[int, int](worker_type=WorkerType.ASYNCIO)
+    queue.max_completed_items = 3
+    queue.cleanup_interval = 5
+
+    work_ids = []
+    for i in range(5):
+        work_item = WorkItem[int, int](input_data=i)
+        work_item.mark_completed(i)
+        queue.work_items[work_item.id] = work_item
+        queue._mark_completed(work_item.id)
+        work_ids.append(work_item.id)
+
+    assert queue.completed_work_ids == set(work_ids[2:])
+    assert list(queue.completion_order) == work_ids[2:]
+    assert work_ids[0] not in queue.work_items
+    assert work_ids[4] in queue.work_items
@@ -0,0 +1,149 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+import json
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from ztoq.pg_database_manager import PostgreSQLDatabaseManager
+from ztoq.write_behind import WriteBehindBuffer
+
+
+@pytest.mark.unit
+class TestWriteBehindBuffer:
+    def test_flushes_in_bulk_when_full(self):
+        """Test writes are grouped by type and written once the buffer is full."""
+        db = MagicMock(spec=PostgreSQLDatabaseManager)
+        buffer = WriteBehindBuffer(db, "TEST", max_items=4)
+
+        buffer.add_mapping("testcase_to_testcase", "tc1", 101)
+        buffer.add_mapping("cycle_to_cycle", "c1", 201)
+        buffer.add_mapping("testcase_to_testcase", "tc2", 102)
+        db.save_entity_mappings.assert_not_called()
+
+        buffer.add_transformed("test_case", "tc3", "case-3", references={"folder_source_id": "f1"})
+
+        db.save_entity_mappings.assert_any_call(
+            "TEST",
+            "testcase_to_testcase",
+            [{"source_id": "tc1", "target_id": 101}, {"source_id": "tc2", "target_id": 102}],
+        )
+        db.save_entity_mappings.assert_any_call(
+            "TEST", "cycle_to_cycle", [{"source_id": "c1", "target_id": 201}],
+        )
+        db.save_transformed_test_cases.assert_called_once_with(
+            "TEST", [("tc3", "case-3", {"folder_source_id": "f1"})],
+        )
+        assert buffer.pending == 0
+        assert buffer.stats == {"buffered": 4, "written": 4, "flushes": 1, "bulk_calls": 3}
+
+    def test_flushes_when_oldest_write_is_too_old(self):
+        """Test a slow trickle of writes is flushed after max_delay."""
+        now = [0.0]
+        db = MagicMock()
+        buffer = WriteBehindBuffer(db, "TEST", max_items=100, max_delay=2.0, clock=lambda: now[0])
+
+        buffer.add_mapping("folder_to_module", "f1", "m1")
+        now[0] = 1.0
+        buffer.add_mapping("folder_to_module", "f2", "m2")
+        db.save_entity_mappings.assert_not_called()
+
+        now[0] = 2.5
+        buffer.add_mapping("folder_to_module", "f3", "m3")
+        assert db.save_entity_mappings.call_count == 1
+        assert len(db.save_entity_mappings.call_args[0][2]) == 3
+
+    def test_falls_back_to_single_record_writes(self):
+        """Test transformed entities are saved one by one without a bulk method."""
+        db = MagicMock(spec=["save_entity_mappings", "save_transformed_execution"])
+
+        with WriteBehindBuffer(db, "TEST") as buffer:
+            buffer.add_transformed("execution", "e1", "run-1", "log-1")
+            buffer.add_transformed("execution", "e2", "run-2", None)
+
+        assert db.save_transformed_execution.call_args_list == [
+            call("TEST", "e1", "run-1", "log-1", references={}),
+            call("TEST", "e2", "run-2", None, references={}),
+        ]
+
+        with pytest.raises(ValueError):
+            WriteBehindBuffer(db, "TEST").add_transformed("folder", "f1", "module")
+
+    def test_failed_flush_keeps_writes(self):
+        """Test writes survive a failed flush and are retried by the next one."""
+        db = MagicMock()
+        db.save_entity_mappings.side_effect = [RuntimeError("connection lost"), None]
+        buffer = WriteBehindBuffer(db, "TEST")
+        buffer.add_mapping("execution_to_run", "e1", "r1")
+
+        with pytest.raises(RuntimeError):
+            buffer.flush()
+        assert buffer.pending == 1
+
+        assert buffer.flush() == 1
+        assert buffer.pending == 0
+        assert db.save_entity_mappings.call_count == 2
+
+
+@pytest.mark.unit
+class TestPostgreSQLTransformedWrites:
+    @pytest.fixture
+    def manager(self):
+        manager = PostgreSQLDatabaseManager.__new__(PostgreSQLDatabaseManager)
+        manager.sessions = []
+
+        @contextmanager
+        def get_session():
+            session = MagicMock()
+            manager.sessions.append(session)
+            yield session
+            session.commit()
+
+        manager.get_session = get_session
+        return manager
+
+    def test_buffered_executions_are_saved_in_one_statement(self, manager):
+        """Test a flush of transformed entities is one executemany and one commit."""
+        with WriteBehindBuffer(manager, "TEST") as buffer:
+            buffer.add_transformed(
+                "execution", "e1", {"status": "PASS"}, None, references={"test_case_source_id": 1},
+            )
+            buffer.add_transformed("execution", "e2", {"status": "FAIL"}, {"note": "x"})
+
+        [session] = manager.sessions
+        session.commit.assert_called_once()
+        statement, rows = session.execute.call_args[0]
+        assert "ON CONFLICT (project_key, entity_type, source_id)" in statement.text
+        assert [(row["entity_type"], row["source_id"]) for row in rows] == [
+            ("execution", "e1"),
+            ("execution", "e2"),
+        ]
+        assert json.loads(rows[0]["payload"]) == {"test_run": {"status": "PASS"}, "test_log": None}
+        assert json.loads(rows[0]["refs"]) == {"test_case_source_id": 1}
+        assert json.loads(rows[1]["refs"]) == {}
+
+    def test_saved_records_are_read_back_for_loading(self, manager):
+        """Test readers return records in the shape the load phase expects."""
+        manager.save_transformed_test_case(
+            "TEST", "tc1", {"name": "Login"}, references={"folder_source_id": 7},
+        )
+        payload = json.loads(manager.sessions[0].execute.call_args[0][1][0]["payload"])
+
+        @contextmanager
+        def get_session():
+            session = MagicMock()
+            session.execute.return_value = [
+                SimpleNamespace(source_id="tc1", payload=payload, refs={"folder_source_id": 7}),
+            ]
+            yield session
+
+        manager.get_session = get_session
+        assert manager.get_transformed_test_cases("TEST") == [
+            {"source_id": "tc1", "test_case": {"name": "Login"}, "folder_source_id": 7},
+        ]
@@ -148,6 +148,115 @@ class TestZephyrClient:
         assert test_cases[1].key == "TEST-TC-2"
         assert test_cases[2].key == "TEST-TC-3"
 
+    def test_get_test_cases_iterator_with_prefetch(self, client):
+        """Test the test cases iterator prefetching pages concurrently."""
+        total = 7
+
+        def make_page(start_at):
+            values = [
+                {"id": str(i), "key": f"TEST-TC-{i}", "name": f"Test Case {i}"}
+                for i in range(start_at, min(start_at + 2, total))
+            ]
+            return {
+                "totalCount": total,
+                "startAt": start_at,
+                "maxResults": 2,
+                "isLast": start_at + 2 >= total,
+                "values": values,
+            }
+
+        requested_offsets = []
+
+        def fake_request(method, endpoint, params=None, **kwargs):
+            requested_offsets.append(params["startAt"])
+            # Later pages answer faster to check that ordering is preserved
+            time.sleep(0.01 * (total - params["startAt"]) / total)
+            return make_page(params["startAt"])
+
+        client._make_request = MagicMock(side_effect=fake_request)
+
+        iterator = PaginatedIterator(client, "/testcases", Case, page_size=2, prefetch_pages=3)
+        test_cases = list(iterator)
+
+        assert [tc.key for tc in test_cases] == [f"TEST-TC-{i}" for i in range(total)]
+        assert iterator.total_count == total
+        assert sorted(requested_offsets) == [0, 2, 4, 6]
+        assert iterator._executor is None
+
+    def test_prefetch_respects_rate_limit(self, client):
+        """Test that prefetching never has more requests in flight than the rate limit allows."""
+        client.rate_limit_remaining = 1
+        client._make_request = MagicMock(
+            side_effect=lambda method, endpoint, params=None, **kwargs: {
+                "totalCount": 6,
+                "startAt": params["startAt"],
+                "maxResults": 2,
+                "isLast": params["startAt"] + 2 >= 6,
+                "values": [
+                    {"id": str(params["startAt"] + i), "key": f"K-{params['startAt'] + i}",
+                     "name": "Case"}
+                    for i in range(2)
+                ],
+            },
+        )
+
+        iterator = PaginatedIterator(client, "/testcases", Case, page_size=2, prefetch_pages=4)
+        next(iterator)
+        iterator._schedule_prefetch()
+
+        assert len(iterator._pending) == 1
+        assert len(list(iterator)) == 5
+        iterator.close()
+
+    def test_prefetch_reads_rate_limit_under_lock(self, client):
+        """Test the prefetch cap reads the rate limit state the workers update under a lock."""
+        client._make_request = MagicMock()
+        iterator = PaginatedIterator(client, "/testcases", Case, page_size=2, prefetch_pages=4)
+        iterator.total_count = 10
+        iterator._next_start_at = 2
+
+        with patch.object(client, "get_rate_limit_state", return_value=(2, 0)) as state:
+            iterator._schedule_prefetch()
+
+        state.assert_called_once()
+        assert len(iterator._pending) == 2
+        iterator.close()
+
+    def test_get_test_steps(self, client):
+        """Test fetching and parsing the paged test steps of a test case."""
+        pages = {
+            0: {
+                "totalCount": 3,
+                "startAt": 0,
+                "maxResults": 2,
+                "isLast": False,
+                "values": [
+                    {"inline": {"description": "Open", "testData": "url", "expectedResult": "Opened"}},
+                    {"testCase": {"testCaseKey": "TEST-T9"}},
+                ],
+            },
+            2: {
+                "totalCount": 3,
+                "startAt": 2,
+                "maxResults": 2,
+                "isLast": True,
+                "values": [{"inline": {"description": "Close"}}],
+            },
+        }
+        client._make_request = MagicMock(
+            side_effect=lambda method, endpoint, params=None, **kwargs: pages[params["startAt"]],
+        )
+
+        steps = client.get_test_steps("TEST-T1")
+
+        assert client._make_request.call_args[0][1] == "/testcases/TEST-T1/teststeps"
+        assert [step.index for step in steps] == [1, 2, 3]
+        assert steps[0].description == "Open"
+        assert steps[0].data == "url"
+        assert steps[0].expected_result == "Opened"
+        assert steps[1].description == "Call to test TEST-T9"
+        assert steps[2].description == "Close"
+
     def test_get_custom_fields(self, client):
         """Test retrieving custom fields."""
         # Mock response
@@ -789,3 +898,23 @@ class TestZephyrClient:
             == "https://api.zephyrscale.example.com/v2/attachments/attachment-123/content"
         )
         assert "Authorization" in mock_get.call_args[1]["headers"]
+
+    @patch("ztoq.zephyr_client.requests.get")
+    def test_download_attachment_to_spool(self, mock_get, client, tmp_path):
+        """Test streaming an attachment into the attachment spool."""
+        from ztoq.attachment_spool import AttachmentSpool
+
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.return_value = iter([b"test file ", b"content"])
+        mock_get.return_value = mock_response
+
+        spool = AttachmentSpool(tmp_path)
+        spooled = client.download_attachment_to_spool("attachment-123", spool)
+
+        assert spooled.size == len(b"test file content")
+        assert spooled.path.read_bytes() == b"test file content"
+        assert mock_get.call_args[1]["stream"] is True
+        mock_response.iter_content.assert_called_once_with(chunk_size=spool.chunk_size)
+        # The whole body is never read into memory
+        mock_response.content.assert_not_called()
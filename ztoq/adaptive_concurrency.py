@@ -0,0 +1,238 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+Adaptive concurrency control for API workers.
+
+A fixed worker count is either too cautious for a fast server or too aggressive for a
+slow one. AIMDConcurrencyLimit adjusts the number of requests in flight the way TCP
+congestion control does: it grows additively while calls succeed at normal latency
+and shrinks multiplicatively on overload - 429/5xx responses, network errors, or
+latency well above the observed baseline. AdaptiveExecutor runs tasks on one
+long-lived thread pool gated by such a limit.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from ztoq.zephyr_client import is_overload_error
+
+logger = logging.getLogger("ztoq.adaptive_concurrency")
+
+
+class AIMDConcurrencyLimit:
+    """
+    Concurrency limit with additive increase and multiplicative decrease.
+
+    Each successful call at healthy latency grows the limit by
+    ``additive_increase / limit``, i.e. by ``additive_increase`` per full window of
+    calls. An overload signal multiplies the limit by ``backoff_factor``; further
+    signals within ``cooldown`` seconds are absorbed, so one burst of failures from
+    requests already in flight only backs off once.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        additive_increase: float = 1.0,
+        backoff_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+        min_latency_samples: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the concurrency limit.
+
+        Args:
+            initial_limit: Number of concurrent calls allowed at the start
+            min_limit: Lowest limit backoff can reach
+            max_limit: Highest limit growth can reach
+            additive_increase: Growth of the limit per window of successful calls
+            backoff_factor: Factor the limit is multiplied by on overload
+            latency_tolerance: Latency above this multiple of the baseline counts as overload
+            cooldown: Seconds after a backoff during which further overload signals are ignored
+            min_latency_samples: Successful calls needed before latency spikes are judged
+            clock: Monotonic clock function
+
+        """
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1")
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.additive_increase = additive_increase
+        self.backoff_factor = backoff_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.min_latency_samples = min_latency_samples
+        self._clock = clock
+
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self._in_flight = 0
+        self._baseline_latency: float | None = None
+        self._latency_samples = 0
+        self._last_backoff = float("-inf")
+        self._condition = threading.Condition()
+
+        self.stats = {"successes": 0, "overloads": 0, "backoffs": 0, "peak_limit": int(self._limit)}
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Wait for a free slot under the current limit and take it."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """Give a slot back without recording an outcome."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def on_success(self, latency: float) -> None:
+        """
+        Release a slot after a successful call.
+
+        Args:
+            latency: Duration of the call in seconds
+
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if self._is_latency_spike(latency):
+                self._back_off("latency spike")
+            else:
+                self._record_latency(latency)
+                self.stats["successes"] += 1
+                self._limit = min(
+                    float(self.max_limit), self._limit + self.additive_increase / self._limit,
+                )
+                self.stats["peak_limit"] = max(self.stats["peak_limit"], int(self._limit))
+            self._condition.notify_all()
+
+    def on_overload(self, reason: str = "overload") -> None:
+        """
+        Release a slot after a call that signalled overload.
+
+        Args:
+            reason: Description of the signal for logging
+
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._back_off(reason)
+            self._condition.notify()
+
+    def _is_latency_spike(self, latency: float) -> bool:
+        return (
+            self._baseline_latency is not None
+            and self._latency_samples >= self.min_latency_samples
+            and latency > self._baseline_latency * self.latency_tolerance
+        )
+
+    def _record_latency(self, latency: float) -> None:
+        # Exponentially weighted moving average of healthy latencies
+        if self._baseline_latency is None:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency += 0.1 * (latency - self._baseline_latency)
+        self._latency_samples += 1
+
+    def _back_off(self, reason: str) -> None:
+        self.stats["overloads"] += 1
+        now = self._clock()
+        if now - self._last_backoff < self.cooldown:
+            return
+        self._last_backoff = now
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_factor)
+        self.stats["backoffs"] += 1
+        logger.info(f"Concurrency limit reduced from {previous} to {self.limit} ({reason})")
+
+
+class AdaptiveExecutor:
+    """
+    Long-lived thread pool whose effective concurrency follows an AIMD limit.
+
+    The pool has ``limit.max_limit`` threads; each task waits for a slot from the
+    limit before running and reports its latency or failure back to it. Failures are
+    classified with ``is_overload_error``, the same network and 429/5xx signals the
+    client circuit breaker and retry decorator act on. Other errors release their
+    slot without changing the limit.
+    """
+
+    def __init__(
+        self,
+        limit: AIMDConcurrencyLimit,
+        thread_name_prefix: str = "ztoq-adaptive",
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            limit: Concurrency limit gating the tasks
+            thread_name_prefix: Prefix for worker thread names
+
+        """
+        self.limit = limit
+        self._executor = ThreadPoolExecutor(
+            max_workers=limit.max_limit, thread_name_prefix=thread_name_prefix,
+        )
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule a task under the concurrency limit.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            Future for the task's result
+
+        """
+        return self._executor.submit(self._run, fn, args, kwargs)
+
+    def _run(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        self.limit.acquire()
+        start = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if is_overload_error(e):
+                self.limit.on_overload(type(e).__name__)
+            else:
+                self.limit.release()
+            raise
+        self.limit.on_success(time.monotonic() - start)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
@@ -0,0 +1,644 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+Native asyncio client for the Zephyr Scale API.
+
+This module provides an httpx-based counterpart of ZephyrClient. Requests are
+made through an httpx client configured like the shared AsyncConnectionPool, so
+thousands of requests can be in flight from a single event loop without a thread
+per request. The same
+CircuitBreaker and retry decorators used by the synchronous client guard every
+request.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+
+from ztoq.models import (
+    Attachment,
+    Case,
+    CycleInfo,
+    Execution,
+    Folder,
+    PaginatedResponse,
+    Plan,
+    Project,
+    ZephyrConfig,
+)
+from ztoq.rate_limiter import MemoryBucketStore, TokenBucketRateLimiter
+from ztoq.zephyr_client import CircuitBreaker, configure_logging, retry
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from ztoq.attachment_spool import AttachmentSpool, SpooledAttachment
+
+T = TypeVar("T")
+
+# Configure module logger
+logger = logging.getLogger("ztoq.async_zephyr_client")
+
+
+class AsyncPaginatedIterator(Generic[T]):
+    """
+    Async iterator for paginated API responses.
+
+    Mirrors PaginatedIterator: pages are fetched on demand, or, with ``prefetch_pages``
+    greater than zero, the next pages are requested concurrently as asyncio tasks once
+    the first page reveals ``totalCount``. Items are always yielded in offset order.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncZephyrClient",
+        endpoint: str,
+        model_class: type[T],
+        params: dict[str, Any] | None = None,
+        page_size: int = 100,
+        prefetch_pages: int = 0,
+    ):
+        """
+        Initialize the async paginated iterator.
+
+        Args:
+            client: The AsyncZephyrClient instance
+            endpoint: API endpoint path
+            model_class: Model class for response items
+            params: Additional query parameters
+            page_size: Number of items per page
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
+
+        """
+        self.client = client
+        self.endpoint = endpoint
+        self.model_class = model_class
+        self.params = params or {}
+        self.params["maxResults"] = page_size
+        self.current_page: PaginatedResponse | None = None
+        self.item_index = 0
+        self.total_fetched = 0
+        self.total_count: int | None = None
+
+        self.prefetch_pages = max(0, prefetch_pages)
+        self._pending: list[asyncio.Task] = []
+        self._next_start_at = 0
+        self._stride = page_size
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> T:
+        # Fetch first page if needed
+        if not self.current_page:
+            logger.debug(f"Fetching first page for {self.endpoint}")
+            await self._fetch_first_page()
+
+        # Check if we need to fetch the next page (skipping any empty pages)
+        while self.item_index >= len(self.current_page.values):
+            if self.current_page.is_last:
+                logger.debug(
+                    f"Reached last page for {self.endpoint}, total items fetched: {self.total_fetched}",
+                )
+                await self.aclose()
+                raise StopAsyncIteration
+
+            await self._fetch_next_page()
+
+        # Return the next item
+        item = cast("T", self.model_class(**self.current_page.values[self.item_index]))
+        self.item_index += 1
+        self.total_fetched += 1
+        return item
+
+    async def _request_page(self, start_at: int) -> PaginatedResponse:
+        """Request the page starting at the given offset."""
+        params = dict(self.params)
+        params["startAt"] = start_at
+        response = await self.client._make_request("GET", self.endpoint, params=params)
+        return PaginatedResponse(**response)
+
+    async def _fetch_first_page(self):
+        """Fetch the first page and record the totals it reports."""
+        self.current_page = await self._request_page(0)
+        self.item_index = 0
+        self.total_count = self.current_page.total_count
+        if self.current_page.values and not self.current_page.is_last:
+            self._stride = len(self.current_page.values)
+        self._next_start_at = len(self.current_page.values)
+
+    def _schedule_prefetch(self):
+        """Top up the prefetch window with tasks for the next page offsets."""
+        while (
+            len(self._pending) < self.prefetch_pages
+            and self._next_start_at < (self.total_count or 0)
+            and len(self._pending) < self.client.rate_limit_remaining
+        ):
+            self._pending.append(asyncio.create_task(self._request_page(self._next_start_at)))
+            self._next_start_at += self._stride
+
+    async def _fetch_next_page(self):
+        """Replace the current page with the next page in offset order."""
+        if self.prefetch_pages:
+            self._schedule_prefetch()
+
+        if self._pending:
+            try:
+                page = await self._pending.pop(0)
+            except Exception:
+                await self.aclose()
+                raise
+        else:
+            page = await self._request_page(self._next_start_at)
+            self._next_start_at = page.start_at + len(page.values)
+
+        self.current_page = page
+        self.item_index = 0
+
+        logger.debug(
+            f"Received page (startAt={page.start_at}) with {len(page.values)} items, "
+            f"total: {page.total_count}, isLast: {page.is_last}",
+        )
+
+        if page.is_last or not page.values:
+            self.current_page = page.model_copy(update={"is_last": True})
+            await self.aclose()
+        elif self.prefetch_pages:
+            self._schedule_prefetch()
+
+    async def aclose(self):
+        """Cancel any outstanding prefetch tasks."""
+        for task in self._pending:
+            task.cancel()
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        self._pending = []
+
+
+class AsyncZephyrClient:
+    """
+    Asyncio client for interacting with the Zephyr Scale API.
+
+    The surface mirrors ZephyrClient, with coroutines in place of blocking calls and
+    async iterators in place of PaginatedIterator.
+
+    Example::
+
+        async with AsyncZephyrClient(config) as client:
+            async for test_case in client.get_test_cases(prefetch_pages=4):
+                ...
+    """
+
+    def __init__(
+        self,
+        config: ZephyrConfig,
+        log_level=None,
+        max_concurrency: int = 100,
+        http_client: "httpx.AsyncClient | None" = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+    ):
+        """
+        Initialize the async Zephyr client with configuration.
+
+        Args:
+            config: The Zephyr Scale API configuration
+            log_level: Optional logging level to use for this client instance
+            max_concurrency: Maximum number of requests in flight at once
+            http_client: Optional httpx.AsyncClient to use; by default the client creates
+                one per event loop with the AsyncConnectionPool settings and closes it
+                in aclose()
+            rate_limiter: Optional token bucket shared with other clients, threads or
+                processes
+
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError(
+                "httpx is required for AsyncZephyrClient. Install with: pip install httpx",
+            )
+
+        self.config = config
+        self.headers = {
+            "Authorization": f"Bearer {config.api_token}",
+            "Content-Type": "application/json",
+        }
+        self.rate_limit_remaining = 1000  # Default high value
+        self.rate_limit_reset = 0
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        if log_level:
+            configure_logging(log_level)
+
+        logger.debug(
+            f"AsyncZephyrClient initialized for project {config.project_key} "
+            f"with base URL {config.base_url}",
+        )
+
+    async def __aenter__(self) -> "AsyncZephyrClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def _bind_to_running_loop(self) -> None:
+        """
+        Use a semaphore and owned httpx client that belong to the running event loop.
+
+        Both are tied to the loop they are first used on, so a later asyncio.run()
+        in the same process gets fresh ones instead of those of a closed loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        if self._loop is not None and self._owns_http_client and self._http_client is not None:
+            logger.debug("Event loop changed; creating a new httpx client for it")
+            self._http_client = None
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """Get the httpx client, by default one made with the async connection pool settings."""
+        self._bind_to_running_loop()
+        if self._http_client is None:
+            from ztoq.connection_pool import async_connection_pool
+
+            if async_connection_pool is None or async_connection_pool.client_type != "httpx":
+                raise ImportError("The async connection pool is not backed by httpx")
+            self._http_client = async_connection_pool.create_client(self.config.base_url)
+        return self._http_client
+
+    async def _call_rate_limiter(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call a rate limiter method without blocking the event loop.
+
+        Shared stores such as SQLiteBucketStore take a database lock that can wait
+        for seconds, so they are used from a worker thread; the in-memory store is
+        called directly.
+        """
+        if isinstance(getattr(self.rate_limiter, "store", None), MemoryBucketStore):
+            return method(*args, **kwargs)
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def _wait_for_rate_limit(self):
+        """Sleep without blocking the event loop until the rate limit resets."""
+        if self.rate_limiter is not None:
+            while (wait_time := await self._call_rate_limiter(self.rate_limiter.try_acquire)) > 0:
+                await asyncio.sleep(wait_time)
+        elif self.rate_limit_remaining <= 0:
+            wait_time = max(0, self.rate_limit_reset - time.time())
+            if wait_time > 0:
+                logger.info(f"Rate limit reached. Waiting {wait_time:.2f} seconds")
+                await asyncio.sleep(wait_time)
+
+    async def _update_rate_limits(self, response: "httpx.Response"):
+        """Record the rate limit headers of a response."""
+        if "X-Rate-Limit-Remaining" in response.headers:
+            self.rate_limit_remaining = int(response.headers["X-Rate-Limit-Remaining"])
+        if "X-Rate-Limit-Reset" in response.headers:
+            self.rate_limit_reset = int(response.headers["X-Rate-Limit-Reset"])
+        if self.rate_limiter is not None:
+            await self._call_rate_limiter(
+                self.rate_limiter.observe_response,
+                response.headers,
+                response.status_code,
+                remaining_header="X-Rate-Limit-Remaining",
+                reset_header="X-Rate-Limit-Reset",
+            )
+
+    @CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    @retry(max_retries=3, initial_delay=0.5, backoff_factor=2.0, jitter=True)
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: tuple[float, float] = (10.0, 30.0),  # Connect timeout, read timeout
+    ) -> dict[str, Any]:
+        """
+        Make a request to the Zephyr API.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            params: Query parameters
+            json_data: JSON request body
+            files: Files to upload (for multipart/form-data requests)
+            headers: Optional headers to override default headers
+            timeout: Connection and read timeout in seconds (tuple of connect_timeout, read_timeout)
+
+        Returns:
+            API response as dictionary
+
+        """
+        await self._wait_for_rate_limit()
+
+        url = f"{self.config.base_url}{endpoint}"
+
+        # Add project key if not in params
+        if params is None:
+            params = {}
+        if "projectKey" not in params and not endpoint.startswith("/projects"):
+            params["projectKey"] = self.config.project_key
+
+        request_id = f"{method}_{endpoint.replace('/', '_')}_{int(time.time()*1000)}"
+        logger.debug(f"API Request [{request_id}]: {method} {url}")
+        start_time = time.time()
+
+        http_client = self._get_http_client()
+        async with self._semaphore:
+            response = await http_client.request(
+                method,
+                url,
+                headers=headers or self.headers,
+                params=params,
+                json=json_data,
+                files=files,
+                timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+            )
+
+        await self._update_rate_limits(response)
+        logger.debug(
+            f"Response [{request_id}] received in {time.time() - start_time:.2f}s - "
+            f"Status: {response.status_code}",
+        )
+
+        if response.is_error:
+            logger.error(f"HTTP Error [{request_id}]: {response.status_code} {response.text[:500]}")
+        # Raises httpx.HTTPStatusError for 4xx/5xx responses
+        response.raise_for_status()
+
+        try:
+            return response.json()
+        except ValueError as e:
+            logger.error(f"JSON Parsing Error [{request_id}]: {e}")
+            raise ValueError(
+                f"Could not parse JSON response: {e}. "
+                f"Response text: {response.text[:100]}...",
+            ) from e
+
+    async def get_projects(self) -> list[Project]:
+        """
+        Get all projects.
+
+        Returns:
+            List of projects
+
+        """
+        response = await self._make_request("GET", "/projects")
+        projects_data = response if isinstance(response, list) else response.get("values", [])
+        return [Project(**project) for project in projects_data]
+
+    def _paginate(
+        self,
+        endpoint: str,
+        model_class: type[T],
+        params: dict[str, Any],
+        prefetch_pages: int,
+    ) -> AsyncPaginatedIterator[T]:
+        return AsyncPaginatedIterator[T](
+            client=self,
+            endpoint=endpoint,
+            model_class=model_class,
+            params=params,
+            prefetch_pages=prefetch_pages,
+        )
+
+    def get_test_cases(
+        self, project_key: str | None = None, prefetch_pages: int = 0,
+    ) -> AsyncPaginatedIterator[Case]:
+        """
+        Get all test cases for a project.
+
+        Args:
+            project_key: JIRA project key (defaults to config's project_key)
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
+
+        Returns:
+            Async iterator of test cases
+
+        """
+        params = {"projectKey": project_key} if project_key else {}
+        return self._paginate("/testcases", Case, params, prefetch_pages)
+
+    def get_test_cycles(
+        self, project_key: str | None = None, prefetch_pages: int = 0,
+    ) -> AsyncPaginatedIterator[CycleInfo]:
+        """
+        Get all test cycles for a project.
+
+        Args:
+            project_key: JIRA project key (defaults to config's project_key)
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
+
+        Returns:
+            Async iterator of test cycles
+
+        """
+        params = {"projectKey": project_key} if project_key else {}
+        return self._paginate("/testcycles", CycleInfo, params, prefetch_pages)
+
+    def get_test_plans(
+        self, project_key: str | None = None, prefetch_pages: int = 0,
+    ) -> AsyncPaginatedIterator[Plan]:
+        """
+        Get all test plans for a project.
+
+        Args:
+            project_key: JIRA project key (defaults to config's project_key)
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
+
+        Returns:
+            Async iterator of test plans
+
+        """
+        params = {"projectKey": project_key} if project_key else {}
+        return self._paginate("/testplans", Plan, params, prefetch_pages)
+
+    def get_test_executions(
+        self,
+        cycle_id: str | None = None,
+        project_key: str | None = None,
+        prefetch_pages: int = 0,
+    ) -> AsyncPaginatedIterator[Execution]:
+        """
+        Get all test executions, optionally for a single test cycle.
+
+        Args:
+            cycle_id: ID of the test cycle
+            project_key: JIRA project key (defaults to config's project_key)
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
+
+        Returns:
+            Async iterator of test executions
+
+        """
+        params = {}
+        if cycle_id:
+            params["cycleId"] = cycle_id
+        if project_key:
+            params["projectKey"] = project_key
+        return self._paginate("/testexecutions", Execution, params, prefetch_pages)
+
+    async def get_folders(self, project_key: str | None = None) -> list[Folder]:
+        """
+        Get all folders for a project.
+
+        Args:
+            project_key: JIRA project key (defaults to config's project_key)
+
+        Returns:
+            List of folders
+
+        """
+        params = {"projectKey": project_key} if project_key else {}
+        response = await self._make_request("GET", "/folders", params=params)
+        return [Folder(**folder) for folder in response.get("values", [])]
+
+    async def get_attachments(
+        self, entity_type: str, entity_id: str, project_key: str | None = None,
+    ) -> list[Attachment]:
+        """
+        Get attachments for a test case, test step, or test execution.
+
+        Args:
+            entity_type: Type of entity ("testCase", "testStep", "testExecution")
+            entity_id: ID of the entity
+            project_key: JIRA project key (defaults to config's project_key)
+
+        Returns:
+            List of attachments
+
+        """
+        params = {"projectKey": project_key} if project_key else {}
+        endpoint = f"/{entity_type}s/{entity_id}/attachments"
+        response = await self._make_request("GET", endpoint, params=params)
+        return [Attachment(**attachment) for attachment in response.get("values", [])]
+
+    @CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    @retry(max_retries=5, initial_delay=1.0, backoff_factor=2.0, jitter=True)
+    async def download_attachment(
+        self, attachment_id: str, timeout: tuple[float, float] = (10.0, 120.0),
+    ) -> bytes:
+        """
+        Download an attachment by ID.
+
+        The whole body is held in memory; use download_attachment_to_spool for
+        attachments that may be large.
+
+        Args:
+            attachment_id: ID of the attachment
+            timeout: Connection and read timeout in seconds (tuple of connect_timeout, read_timeout)
+
+        Returns:
+            Binary content of the attachment
+
+        Raises:
+            httpx.HTTPStatusError: If the attachment can't be downloaded
+            httpx.TransportError: If the connection fails or times out
+            ValueError: If the attachment ID is invalid
+
+        """
+        if not attachment_id:
+            raise ValueError("Invalid attachment ID: must not be empty")
+
+        url = f"{self.config.base_url}/attachments/{attachment_id}/content"
+        headers = {"Authorization": self.headers["Authorization"]}
+        start_time = time.time()
+
+        http_client = self._get_http_client()
+        async with self._semaphore:
+            async with http_client.stream(
+                "GET", url, headers=headers, timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+            ) as response:
+                response.raise_for_status()
+                content = b"".join([chunk async for chunk in response.aiter_bytes()])
+
+        logger.debug(
+            f"Attachment {attachment_id} downloaded in {time.time() - start_time:.2f}s "
+            f"({len(content) / 1024:.1f} KB)",
+        )
+        return content
+
+    @CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    @retry(max_retries=5, initial_delay=1.0, backoff_factor=2.0, jitter=True)
+    async def download_attachment_to_spool(
+        self,
+        attachment_id: str,
+        spool: "AttachmentSpool",
+        timeout: tuple[float, float] = (10.0, 120.0),
+    ) -> "SpooledAttachment":
+        """
+        Stream an attachment by ID into an attachment spool.
+
+        Like ZephyrClient.download_attachment_to_spool, the content is written to
+        disk chunk by chunk, so memory use does not grow with the attachment size.
+
+        Args:
+            attachment_id: ID of the attachment
+            spool: Content-addressed spool to write the attachment into
+            timeout: Connection and read timeout in seconds (tuple of connect_timeout, read_timeout)
+
+        Returns:
+            SpooledAttachment with the checksum, size and path of the stored content
+
+        Raises:
+            httpx.HTTPStatusError: If the attachment can't be downloaded
+            httpx.TransportError: If the connection fails or times out
+            ValueError: If the attachment ID is invalid
+
+        """
+        if not attachment_id:
+            raise ValueError("Invalid attachment ID: must not be empty")
+
+        url = f"{self.config.base_url}/attachments/{attachment_id}/content"
+        headers = {"Authorization": self.headers["Authorization"]}
+        start_time = time.time()
+
+        http_client = self._get_http_client()
+        async with self._semaphore:
+            async with http_client.stream(
+                "GET", url, headers=headers, timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+            ) as response:
+                response.raise_for_status()
+                with spool.writer() as writer:
+                    async for chunk in response.aiter_bytes(spool.chunk_size):
+                        writer.write(chunk)
+                    spooled = writer.commit()
+
+        logger.debug(
+            f"Attachment {attachment_id} streamed in {time.time() - start_time:.2f}s "
+            f"({spooled.size / 1024:.1f} KB, checksum {spooled.checksum})",
+        )
+        return spooled
+
+    async def aclose(self) -> None:
+        """
+        Release resources held by the client.
+
+        A client supplied through ``http_client`` is left open for its owner; the
+        client created for the current event loop is closed.
+        """
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._loop = None
+        CircuitBreaker.cleanup_idle_circuits()
+        logger.debug("AsyncZephyrClient resources cleaned up")
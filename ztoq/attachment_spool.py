@@ -0,0 +1,324 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+Content-addressed on-disk spool for attachment content.
+
+Attachments are streamed into the spool chunk by chunk while their checksum is
+computed incrementally, so no attachment has to be held in memory as a whole.
+Each blob is stored once under its MD5 checksum (the same digest produced by
+QTestAttachment.calculate_checksum), and callers keep only that checksum as a
+reference to the content. AttachmentDeduplicator builds on the spool so that
+each attachment is downloaded once and each blob is uploaded to a given qTest
+object once.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+logger = logging.getLogger("ztoq.attachment_spool")
+
+# Default chunk size used when streaming attachment content (1 MiB)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SpooledAttachment:
+    """Reference to an attachment blob stored in an AttachmentSpool."""
+
+    checksum: str
+    size: int
+    path: Path
+
+    @property
+    def storage_ref(self) -> str:
+        """Reference to persist in place of the attachment content."""
+        return self.checksum
+
+
+class AttachmentSpool:
+    """
+    Content-addressed attachment store on the local filesystem.
+
+    Blobs live at ``<root>/<first two checksum characters>/<checksum>``. Writes go to a
+    temporary file in ``<root>/tmp`` first and are moved into place atomically, so
+    concurrent workers can spool the same content safely.
+    """
+
+    def __init__(self, root: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the spool.
+
+        Args:
+            root: Directory that holds the spooled blobs
+            chunk_size: Chunk size used when streaming content in and out
+
+        """
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        self._tmp_dir = self.root / "tmp"
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, checksum: str) -> Path:
+        """Get the path of the blob with the given checksum."""
+        return self.root / checksum[:2] / checksum
+
+    def contains(self, checksum: str) -> bool:
+        """Check whether a blob with the given checksum is stored."""
+        return self.path_for(checksum).exists()
+
+    def writer(self) -> "SpoolWriter":
+        """Start writing a blob whose content arrives chunk by chunk."""
+        return SpoolWriter(self)
+
+    def write_stream(self, chunks: Iterable[bytes]) -> SpooledAttachment:
+        """
+        Stream content into the spool.
+
+        Args:
+            chunks: Iterable of byte chunks, e.g. ``response.iter_content(chunk_size)``
+
+        Returns:
+            SpooledAttachment referencing the stored blob
+
+        """
+        with self.writer() as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+            return writer.commit()
+
+    def write_bytes(self, data: bytes) -> SpooledAttachment:
+        """Store in-memory content in the spool."""
+        return self.write_stream([data])
+
+    def open(self, checksum: str) -> BinaryIO:
+        """
+        Open a spooled blob for reading.
+
+        Raises:
+            FileNotFoundError: If no blob with the checksum is stored
+
+        """
+        return self.path_for(checksum).open("rb")
+
+    def iter_chunks(self, checksum: str) -> Iterable[bytes]:
+        """Stream a spooled blob back in chunks."""
+        with self.open(checksum) as blob:
+            while chunk := blob.read(self.chunk_size):
+                yield chunk
+
+    def remove(self, checksum: str) -> bool:
+        """
+        Remove a blob from the spool.
+
+        Returns:
+            True if the blob existed and was removed
+
+        """
+        path = self.path_for(checksum)
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+
+class SpoolWriter:
+    """
+    Writes one blob into an AttachmentSpool as its content arrives.
+
+    Chunks are hashed and written to a temporary file; ``commit`` moves the file
+    into place under its checksum. Leaving the ``with`` block without committing
+    discards the partial file.
+    """
+
+    def __init__(self, spool: AttachmentSpool):
+        """
+        Initialize the writer.
+
+        Args:
+            spool: Spool the blob is written into
+
+        """
+        self.spool = spool
+        self.size = 0
+        self._hasher = hashlib.md5()
+        fd, self._tmp_name = tempfile.mkstemp(dir=spool._tmp_dir, suffix=".part")
+        self._file = os.fdopen(fd, "wb")
+        self._committed = False
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk of content."""
+        if not chunk:
+            return
+        self._hasher.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def commit(self) -> SpooledAttachment:
+        """
+        Store the written content in the spool.
+
+        Returns:
+            SpooledAttachment referencing the stored blob
+
+        """
+        self._file.close()
+        checksum = self._hasher.hexdigest()
+        path = self.spool.path_for(checksum)
+        if path.exists():
+            # Identical content is already spooled
+            os.unlink(self._tmp_name)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp_name, path)
+        self._committed = True
+
+        logger.debug(f"Spooled attachment {checksum} ({self.size} bytes)")
+        return SpooledAttachment(checksum=checksum, size=self.size, path=path)
+
+    def abort(self) -> None:
+        """Discard the written content."""
+        self._file.close()
+        if os.path.exists(self._tmp_name):
+            os.unlink(self._tmp_name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self._committed:
+            self.abort()
+
+
+class AttachmentDeduplicator:
+    """
+    Deduplicates attachment transfers across a migration.
+
+    The same file is often attached to many test cases and executions. The
+    deduplicator downloads each Zephyr attachment once (concurrent requests for the
+    same attachment wait for the first download), relies on the spool to store each
+    unique blob once, and uploads a blob under a given name to a given qTest object
+    at most once. Identical content attached under different names is uploaded
+    once per name.
+    """
+
+    def __init__(self, spool: AttachmentSpool):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            spool: Spool that holds the attachment content
+
+        """
+        self.spool = spool
+        self._lock = threading.Lock()
+        self._by_source_id: dict[str, SpooledAttachment] = {}
+        self._in_flight: dict[str, Future] = {}
+        self._uploaded: set[tuple[str, str, str, str]] = set()
+        self._checksums: set[str] = set()
+        self.stats = {
+            "downloads": 0,
+            "downloads_skipped": 0,
+            "bytes_downloaded": 0,
+            # Bytes of downloads skipped because the attachment was already spooled
+            "bytes_skipped": 0,
+            # Bytes downloaded again for content already in the spool, stored only once
+            "duplicate_bytes_downloaded": 0,
+            "uploads": 0,
+            "uploads_skipped": 0,
+        }
+
+    def fetch(
+        self, attachment_id: str, download: Callable[[], SpooledAttachment],
+    ) -> SpooledAttachment:
+        """
+        Get the spooled content of an attachment, downloading it only once.
+
+        Args:
+            attachment_id: Source (Zephyr) attachment ID
+            download: Callable that streams the attachment into the spool
+
+        Returns:
+            SpooledAttachment for the attachment content
+
+        """
+        with self._lock:
+            spooled = self._by_source_id.get(attachment_id)
+            if spooled is not None:
+                self.stats["downloads_skipped"] += 1
+                self.stats["bytes_skipped"] += spooled.size
+                return spooled
+
+            future = self._in_flight.get(attachment_id)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[attachment_id] = future
+
+        if not owner:
+            # Another worker is downloading the same attachment
+            spooled = future.result()
+            with self._lock:
+                self.stats["downloads_skipped"] += 1
+                self.stats["bytes_skipped"] += spooled.size
+            return spooled
+
+        try:
+            spooled = download()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[attachment_id]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._in_flight[attachment_id]
+            self._by_source_id[attachment_id] = spooled
+            self.stats["downloads"] += 1
+            self.stats["bytes_downloaded"] += spooled.size
+            if spooled.checksum in self._checksums:
+                # Different source attachment, identical content: downloaded, not stored
+                self.stats["duplicate_bytes_downloaded"] += spooled.size
+            self._checksums.add(spooled.checksum)
+        future.set_result(spooled)
+        return spooled
+
+    def claim_upload(self, checksum: str, object_type: str, object_id: Any, name: str) -> bool:
+        """
+        Claim the upload of a blob under a file name to a qTest object.
+
+        Returns:
+            True if the caller should upload the blob, False if it was already uploaded
+
+        """
+        key = (checksum, object_type, str(object_id), name)
+        with self._lock:
+            if key in self._uploaded:
+                self.stats["uploads_skipped"] += 1
+                return False
+            self._uploaded.add(key)
+            self.stats["uploads"] += 1
+            return True
+
+    def release_upload(self, checksum: str, object_type: str, object_id: Any, name: str) -> None:
+        """Release a claimed upload that failed so it can be retried."""
+        with self._lock:
+            self._uploaded.discard((checksum, object_type, str(object_id), name))
+            self.stats["uploads"] -= 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Get transfer statistics, including the number of unique blobs."""
+        with self._lock:
+            return {**self.stats, "unique_blobs": len(self._checksums)}
@@ -91,6 +91,7 @@ from ztoq.openapi_parser import (
     load_openapi_spec,
     validate_zephyr_spec,
 )
+from ztoq.rate_limiter import create_rate_limiter
 from ztoq.workflow_cli import workflow_app
 from ztoq.zephyr_client import ZephyrClient
 
@@ -153,6 +154,8 @@ logger = logging.getLogger("ztoq")
 
 class OutputFormat(str, Enum):
     JSON = "json"
+    JSONL = "jsonl"
+    PARQUET = "parquet"
     SQLITE = "sqlite"
     SQL = "sql"  # New format for SQLAlchemy
 
@@ -393,9 +396,13 @@ def export_project(
     output_dir: Path = typer.Option(..., help="Output directory for all test data"),
     format: OutputFormat = typer.Option(
         OutputFormat.JSON,
-        help="Output format (json, sqlite, sql)",
+        help="Output format (json, jsonl, parquet, sqlite, sql)",
     ),
     concurrency: int = typer.Option(2, help="Number of concurrent API requests"),
+    compression: str | None = typer.Option(
+        None,
+        help="Compression for jsonl output (gzip or zstd)",
+    ),
     # Added database options for SQL format
     db_type: DatabaseType = typer.Option(
         DatabaseType.SQLITE,
@@ -484,13 +491,14 @@ def export_project(
             # Apply migrations
             alembic_command.upgrade(alembic_cfg, "head")
 
-        # For legacy formats (JSON, SQLite)
+        # For file-based formats (JSON, JSON Lines, Parquet, SQLite)
         export_manager = ZephyrExportManager(
             config=config,
             output_format=format.value,
             output_dir=output_dir,
             spec_path=spec_path,
             concurrency=concurrency,
+            compression=compression,
         )
 
         stats = {}
@@ -644,12 +652,32 @@ def export_all(
     base_url: str = typer.Option(..., help="Zephyr Scale API base URL"),
     api_token: str = typer.Option(..., help="Zephyr Scale API token"),
     output_dir: Path = typer.Option(..., help="Output directory for all test data"),
-    format: OutputFormat = typer.Option(OutputFormat.JSON, help="Output format (json or sqlite)"),
-    concurrency: int = typer.Option(2, help="Number of concurrent API requests"),
+    format: OutputFormat = typer.Option(
+        OutputFormat.JSON,
+        help="Output format (json, jsonl, parquet or sqlite)",
+    ),
+    concurrency: int = typer.Option(2, help="Number of concurrent API requests per project"),
+    compression: str | None = typer.Option(
+        None,
+        help="Compression for jsonl output (gzip or zstd)",
+    ),
     projects: list[str] | None = typer.Option(
         None,
         help="Specific projects to export (comma-separated)",
     ),
+    parallel_projects: int = typer.Option(1, help="Number of projects to export at the same time"),
+    global_concurrency: int | None = typer.Option(
+        None,
+        help="Maximum number of API requests in flight across all projects (one shared budget)",
+    ),
+    rate_limit: float | None = typer.Option(
+        None,
+        help="Maximum API requests per second across all projects",
+    ),
+    rate_limit_store: Path | None = typer.Option(
+        None,
+        help="SQLite file for sharing the rate limit with other export processes",
+    ),
 ):
     """
     Export test data for all accessible projects.
@@ -686,8 +714,49 @@ def export_all(
             output_dir=output_dir,
             spec_path=spec_path,
             concurrency=concurrency,
+            parallel_projects=parallel_projects,
+            global_concurrency=global_concurrency,
+            compression=compression,
+            rate_limiter=(
+                create_rate_limiter(rate_limit, shared_path=rate_limit_store, name="zephyr")
+                if rate_limit
+                else None
+            ),
         )
 
+        if export_manager.parallel_projects > 1:
+            # Export projects concurrently into one aggregated progress display
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                all_stats = export_manager.export_all_projects(
+                    projects_to_export=project_list, progress=progress,
+                )
+
+            table = Table(title="Export Summary")
+            table.add_column("Project")
+            table.add_column("Test Cases")
+            table.add_column("Test Cycles")
+            table.add_column("Test Executions")
+            for project_key, stats in all_stats.items():
+                table.add_row(
+                    project_key,
+                    str(stats.get("test_cases", 0)),
+                    str(stats.get("test_cycles", 0)),
+                    str(stats.get("test_executions", 0)),
+                )
+            console.print(table)
+
+            failed = [p for p in project_list if p not in all_stats]
+            for project_key in failed:
+                console.print(f"❌ Error exporting {project_key} (see log)", style="red")
+            console.print(f"\n✅ All projects exported to {output_dir}", style="green")
+            return
+
         # Process each project
         for idx, project_key in enumerate(project_list, 1):
             console.print(f"\n[{idx}/{len(project_list)}] Exporting {project_key}...")
@@ -1221,6 +1290,38 @@ def run_migration(
         None,
         help="Optional directory for storing attachments",
     ),
+    bulk_chunk_size: int | None = typer.Option(
+        None,
+        help="Load test cases through qTest bulk requests of this many records",
+    ),
+    zephyr_rate_limit: float | None = typer.Option(
+        None,
+        help="Maximum Zephyr requests per second",
+    ),
+    qtest_rate_limit: float | None = typer.Option(
+        None,
+        help="Maximum qTest requests per second",
+    ),
+    rate_limit_store: Path | None = typer.Option(
+        None,
+        help="SQLite file for sharing rate limits with other migration processes",
+    ),
+    adaptive_concurrency: bool = typer.Option(
+        False,
+        help="Adjust the number of concurrent load requests to the server's health",
+    ),
+    max_concurrency: int | None = typer.Option(
+        None,
+        help="Upper bound for adaptive concurrency (defaults to 4x max-workers)",
+    ),
+    pipelined_load: bool = typer.Option(
+        False,
+        help="Load each entity as soon as the entities it depends on exist in qTest",
+    ),
+    write_buffer_size: int | None = typer.Option(
+        None,
+        help="Buffer this many mappings and transformed entities and write them in bulk",
+    ),
 ):
     """
     Run migration from Zephyr Scale to qTest.
@@ -1302,6 +1403,21 @@ def run_migration(
             batch_size=batch_size,
             max_workers=max_workers,
             attachments_dir=attachments_dir,
+            bulk_chunk_size=bulk_chunk_size,
+            zephyr_rate_limiter=(
+                create_rate_limiter(zephyr_rate_limit, shared_path=rate_limit_store, name="zephyr")
+                if zephyr_rate_limit
+                else None
+            ),
+            qtest_rate_limiter=(
+                create_rate_limiter(qtest_rate_limit, shared_path=rate_limit_store, name="qtest")
+                if qtest_rate_limit
+                else None
+            ),
+            adaptive_concurrency=adaptive_concurrency,
+            max_concurrency=max_concurrency,
+            pipelined_load=pipelined_load,
+            write_buffer_size=write_buffer_size,
         )
 
         # Determine phases to run
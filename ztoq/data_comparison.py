@@ -13,8 +13,10 @@ that the migration was successful and data integrity was maintained.
 
 import logging
 import time
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
+from ztoq.entity_mapping_index import EntityMappingIndex
 from ztoq.validation_types import (
     ValidationIssue,
     ValidationLevel,
@@ -29,17 +31,21 @@ logger = logging.getLogger("ztoq.data_comparison")
 class DataComparisonValidator:
     """Validates migration by comparing source and target data for consistency."""
 
-    def __init__(self, database_manager, project_key: str):
+    def __init__(self, database_manager, project_key: str, fetch_size: int | None = None):
         """
         Initialize the data comparison validator.
 
         Args:
             database_manager: The database manager instance
             project_key: The Zephyr project key
+            fetch_size: Rows fetched per round trip when streaming entities
 
         """
         self.db = database_manager
         self.project_key = project_key
+        self.fetch_size = fetch_size
+        # Mappings are loaded once per type instead of queried per entity
+        self.mapping_index = EntityMappingIndex(database_manager, project_key)
 
     def validate_entity_counts(self) -> list[ValidationIssue]:
         """
@@ -154,6 +160,72 @@ class DataComparisonValidator:
 
         return issues
 
+    def _relationship_mismatches(
+        self, link_type: str, find_in_python: Callable[[], Iterator[dict[str, Any]]],
+    ) -> Iterable[dict[str, Any]]:
+        """
+        Mismatched relationships of one type, found by the database when it can.
+
+        Args:
+            link_type: The qTest link type, e.g. ``run_cycle``
+            find_in_python: Fallback comparing entities one by one
+
+        Returns:
+            Mismatches with entity_id, entity_name, source_parent_id, expected_parent
+            and actual_parent
+
+        """
+        find_mismatches = getattr(self.db, "iter_relationship_mismatches", None)
+        if find_mismatches is not None:
+            return find_mismatches(self.project_key, link_type, fetch_size=self.fetch_size)
+        return find_in_python()
+
+    def _find_relationship_mismatches(
+        self,
+        name: str,
+        id_field: str,
+        name_field: str | None,
+        parent_field: str,
+        parent_mapping: str,
+        child_mapping: str,
+        get_actual_parent: Callable[[Any], Any],
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Compare relationships entity by entity, for managers without set-based checks.
+
+        Args:
+            name: Name of the comparison query, see ``_stream``
+            id_field: Field holding the entity id
+            name_field: Field holding the entity name, if any
+            parent_field: Field holding the source parent id
+            parent_mapping: Mapping type of the parent
+            child_mapping: Mapping type of the entity
+            get_actual_parent: Returns the qTest parent of a qTest entity
+
+        Yields:
+            Mismatches in the shape of ``_relationship_mismatches``
+
+        """
+        for entity in self._stream(name):
+            source_parent_id = entity.get(parent_field)
+            if not source_parent_id:
+                continue
+            expected_parent = self.mapping_index.get(parent_mapping, source_parent_id)
+            if not expected_parent:
+                continue
+            qtest_id = self.mapping_index.get(child_mapping, entity[id_field])
+            if not qtest_id:
+                continue
+            actual_parent = get_actual_parent(qtest_id)
+            if actual_parent != expected_parent:
+                yield {
+                    "entity_id": entity[id_field],
+                    "entity_name": entity.get(name_field) if name_field else None,
+                    "source_parent_id": source_parent_id,
+                    "expected_parent": expected_parent,
+                    "actual_parent": actual_parent,
+                }
+
     def _validate_testcase_folder_relationships(self) -> list[ValidationIssue]:
         """
         Validate test case to folder relationships.
@@ -165,50 +237,38 @@ class DataComparisonValidator:
         issues = []
 
         try:
-            # Get test cases with their folder information
-            test_cases = self.db.get_test_cases_with_folders(self.project_key)
-
-            for test_case in test_cases:
-                zephyr_folder_id = test_case.get("folder_id")
-                if not zephyr_folder_id:
-                    continue
-
-                # Get the mapped qTest module ID
-                qtest_module_id = self.db.get_mapped_entity_id(
-                    self.project_key, "folder_to_module", zephyr_folder_id,
-                )
-
-                if not qtest_module_id:
-                    continue
+            mismatches = self._relationship_mismatches(
+                "testcase_module",
+                lambda: self._find_relationship_mismatches(
+                    "test_cases_with_folders",
+                    "id",
+                    "name",
+                    "folder_id",
+                    "folder_to_module",
+                    "testcase_to_testcase",
+                    self.db.get_qtest_module_for_testcase,
+                ),
+            )
 
-                # Get the mapped qTest test case ID
-                qtest_testcase_id = self.db.get_mapped_entity_id(
-                    self.project_key, "testcase_to_testcase", test_case["id"],
+            for mismatch in mismatches:
+                issue = ValidationIssue(
+                    id=f"testcase_module_mismatch_{mismatch['entity_id']}_{int(time.time())}",
+                    level=ValidationLevel.ERROR,
+                    scope=ValidationScope.RELATIONSHIP,
+                    phase=ValidationPhase.POST_MIGRATION,
+                    message=(
+                        f"Test case '{mismatch['entity_name']}' is not in the correct qTest module"
+                    ),
+                    entity_id=mismatch["entity_id"],
+                    entity_type="test_case",
+                    details={
+                        "test_case_name": mismatch["entity_name"],
+                        "zephyr_folder_id": mismatch["source_parent_id"],
+                        "expected_qtest_module": mismatch["expected_parent"],
+                        "actual_qtest_module": mismatch["actual_parent"],
+                    },
                 )
-
-                if not qtest_testcase_id:
-                    continue
-
-                # Check if the qTest test case is in the correct module
-                qtest_module_for_testcase = self.db.get_qtest_module_for_testcase(qtest_testcase_id)
-
-                if qtest_module_for_testcase != qtest_module_id:
-                    issue = ValidationIssue(
-                        id=f"testcase_module_mismatch_{test_case['id']}_{int(time.time())}",
-                        level=ValidationLevel.ERROR,
-                        scope=ValidationScope.RELATIONSHIP,
-                        phase=ValidationPhase.POST_MIGRATION,
-                        message=f"Test case '{test_case['name']}' is not in the correct qTest module",
-                        entity_id=test_case["id"],
-                        entity_type="test_case",
-                        details={
-                            "test_case_name": test_case["name"],
-                            "zephyr_folder_id": zephyr_folder_id,
-                            "expected_qtest_module": qtest_module_id,
-                            "actual_qtest_module": qtest_module_for_testcase,
-                        },
-                    )
-                    issues.append(issue)
+                issues.append(issue)
         except Exception as e:
             logger.error(f"Error validating test case folder relationships: {e!s}")
             issue = ValidationIssue(
@@ -234,49 +294,35 @@ class DataComparisonValidator:
         issues = []
 
         try:
-            # Get test executions with their test case information
-            executions = self.db.get_test_executions_with_testcases(self.project_key)
-
-            for execution in executions:
-                zephyr_testcase_id = execution.get("test_case_id")
-                if not zephyr_testcase_id:
-                    continue
-
-                # Get the mapped qTest test case ID
-                qtest_testcase_id = self.db.get_mapped_entity_id(
-                    self.project_key, "testcase_to_testcase", zephyr_testcase_id,
-                )
-
-                if not qtest_testcase_id:
-                    continue
+            mismatches = self._relationship_mismatches(
+                "run_testcase",
+                lambda: self._find_relationship_mismatches(
+                    "test_executions_with_testcases",
+                    "id",
+                    None,
+                    "test_case_id",
+                    "testcase_to_testcase",
+                    "execution_to_run",
+                    self.db.get_qtest_testcase_for_run,
+                ),
+            )
 
-                # Get the mapped qTest test run ID
-                qtest_run_id = self.db.get_mapped_entity_id(
-                    self.project_key, "execution_to_run", execution["id"],
+            for mismatch in mismatches:
+                issue = ValidationIssue(
+                    id=f"execution_testcase_mismatch_{mismatch['entity_id']}_{int(time.time())}",
+                    level=ValidationLevel.ERROR,
+                    scope=ValidationScope.RELATIONSHIP,
+                    phase=ValidationPhase.POST_MIGRATION,
+                    message="Test execution is not linked to the correct qTest test case",
+                    entity_id=mismatch["entity_id"],
+                    entity_type="test_execution",
+                    details={
+                        "zephyr_test_case_id": mismatch["source_parent_id"],
+                        "expected_qtest_testcase": mismatch["expected_parent"],
+                        "actual_qtest_testcase": mismatch["actual_parent"],
+                    },
                 )
-
-                if not qtest_run_id:
-                    continue
-
-                # Check if the qTest test run is linked to the correct test case
-                qtest_testcase_for_run = self.db.get_qtest_testcase_for_run(qtest_run_id)
-
-                if qtest_testcase_for_run != qtest_testcase_id:
-                    issue = ValidationIssue(
-                        id=f"execution_testcase_mismatch_{execution['id']}_{int(time.time())}",
-                        level=ValidationLevel.ERROR,
-                        scope=ValidationScope.RELATIONSHIP,
-                        phase=ValidationPhase.POST_MIGRATION,
-                        message="Test execution is not linked to the correct qTest test case",
-                        entity_id=execution["id"],
-                        entity_type="test_execution",
-                        details={
-                            "zephyr_test_case_id": zephyr_testcase_id,
-                            "expected_qtest_testcase": qtest_testcase_id,
-                            "actual_qtest_testcase": qtest_testcase_for_run,
-                        },
-                    )
-                    issues.append(issue)
+                issues.append(issue)
         except Exception as e:
             logger.error(f"Error validating test execution test case relationships: {e!s}")
             issue = ValidationIssue(
@@ -302,49 +348,35 @@ class DataComparisonValidator:
         issues = []
 
         try:
-            # Get test executions with their cycle information
-            executions = self.db.get_test_executions_with_cycles(self.project_key)
-
-            for execution in executions:
-                zephyr_cycle_id = execution.get("cycle_id")
-                if not zephyr_cycle_id:
-                    continue
-
-                # Get the mapped qTest test cycle ID
-                qtest_cycle_id = self.db.get_mapped_entity_id(
-                    self.project_key, "cycle_to_cycle", zephyr_cycle_id,
-                )
-
-                if not qtest_cycle_id:
-                    continue
+            mismatches = self._relationship_mismatches(
+                "run_cycle",
+                lambda: self._find_relationship_mismatches(
+                    "test_executions_with_cycles",
+                    "id",
+                    None,
+                    "cycle_id",
+                    "cycle_to_cycle",
+                    "execution_to_run",
+                    self.db.get_qtest_cycle_for_run,
+                ),
+            )
 
-                # Get the mapped qTest test run ID
-                qtest_run_id = self.db.get_mapped_entity_id(
-                    self.project_key, "execution_to_run", execution["id"],
+            for mismatch in mismatches:
+                issue = ValidationIssue(
+                    id=f"execution_cycle_mismatch_{mismatch['entity_id']}_{int(time.time())}",
+                    level=ValidationLevel.ERROR,
+                    scope=ValidationScope.RELATIONSHIP,
+                    phase=ValidationPhase.POST_MIGRATION,
+                    message="Test execution is not linked to the correct qTest test cycle",
+                    entity_id=mismatch["entity_id"],
+                    entity_type="test_execution",
+                    details={
+                        "zephyr_cycle_id": mismatch["source_parent_id"],
+                        "expected_qtest_cycle": mismatch["expected_parent"],
+                        "actual_qtest_cycle": mismatch["actual_parent"],
+                    },
                 )
-
-                if not qtest_run_id:
-                    continue
-
-                # Check if the qTest test run is in the correct test cycle
-                qtest_cycle_for_run = self.db.get_qtest_cycle_for_run(qtest_run_id)
-
-                if qtest_cycle_for_run != qtest_cycle_id:
-                    issue = ValidationIssue(
-                        id=f"execution_cycle_mismatch_{execution['id']}_{int(time.time())}",
-                        level=ValidationLevel.ERROR,
-                        scope=ValidationScope.RELATIONSHIP,
-                        phase=ValidationPhase.POST_MIGRATION,
-                        message="Test execution is not linked to the correct qTest test cycle",
-                        entity_id=execution["id"],
-                        entity_type="test_execution",
-                        details={
-                            "zephyr_cycle_id": zephyr_cycle_id,
-                            "expected_qtest_cycle": qtest_cycle_id,
-                            "actual_qtest_cycle": qtest_cycle_for_run,
-                        },
-                    )
-                    issues.append(issue)
+                issues.append(issue)
         except Exception as e:
             logger.error(f"Error validating test execution cycle relationships: {e!s}")
             issue = ValidationIssue(
@@ -371,7 +403,7 @@ class DataComparisonValidator:
 
         try:
             # Get test cases with custom fields
-            test_cases = self.db.get_test_cases_with_custom_fields(self.project_key)
+            test_cases = self._stream("test_cases_with_custom_fields")
 
             for test_case in test_cases:
                 zephyr_custom_fields = test_case.get("custom_fields", {})
@@ -379,9 +411,7 @@ class DataComparisonValidator:
                     continue
 
                 # Get the mapped qTest test case ID
-                qtest_testcase_id = self.db.get_mapped_entity_id(
-                    self.project_key, "testcase_to_testcase", test_case["id"],
-                )
+                qtest_testcase_id = self.mapping_index.get("testcase_to_testcase", test_case["id"])
 
                 if not qtest_testcase_id:
                     continue
@@ -463,7 +493,7 @@ class DataComparisonValidator:
 
         try:
             # Get entities with attachments
-            entities_with_attachments = self.db.get_entities_with_attachments(self.project_key)
+            entities_with_attachments = self._stream("entities_with_attachments")
 
             for entity in entities_with_attachments:
                 entity_type = entity["entity_type"]
@@ -472,9 +502,7 @@ class DataComparisonValidator:
 
                 # Get the mapped qTest entity ID
                 mapping_type = self._get_mapping_type_for_entity(entity_type)
-                qtest_entity_id = self.db.get_mapped_entity_id(
-                    self.project_key, mapping_type, entity_id,
-                )
+                qtest_entity_id = self.mapping_index.get(mapping_type, entity_id)
 
                 if not qtest_entity_id:
                     continue
@@ -514,6 +542,22 @@ class DataComparisonValidator:
 
         return issues
 
+    def _stream(self, name: str) -> Iterable[dict[str, Any]]:
+        """
+        Rows of a comparison query, streamed when the database manager supports it.
+
+        Args:
+            name: Query name, e.g. ``test_executions_with_testcases``
+
+        Returns:
+            The ``iter_<name>`` iterator, or the ``get_<name>`` list as a fallback
+
+        """
+        iterate = getattr(self.db, f"iter_{name}", None)
+        if iterate is not None:
+            return iterate(self.project_key, fetch_size=self.fetch_size)
+        return getattr(self.db, f"get_{name}")(self.project_key)
+
     def _get_zephyr_entity_counts(self) -> dict[str, int]:
         """
         Get counts of entities from Zephyr.
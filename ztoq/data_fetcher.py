@@ -262,6 +262,7 @@ def fetch_all_project_data(
     client: ZephyrClient,
     project_key: str,
     progress_callback: Callable[[str, str, bool], None] | None = None,
+    max_workers: int = 5,
 ) -> dict[str, FetchResult]:
     """
     Retrieves all test data for a specific project using parallel processing.
@@ -274,6 +275,7 @@ def fetch_all_project_data(
         client: The authenticated Zephyr client
         project_key: The project key to fetch data for
         progress_callback: Optional callback to report progress
+        max_workers: Maximum number of entity types fetched concurrently
 
     Returns:
         Dictionary mapping entity types to their fetch results
@@ -292,7 +294,7 @@ def fetch_all_project_data(
     results: dict[str, FetchResult] = {}
 
     # Execute all fetch operations in parallel
-    with ThreadPoolExecutor(max_workers=5) as executor:
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
         # Start all fetch tasks
         future_to_entity = {
             executor.submit(fetch_func): entity_type
@@ -318,17 +320,25 @@ def fetch_all_projects_data(
     client: ZephyrClient,
     project_keys: list[str] | None = None,
     progress_callback: Callable[[str, str, bool], None] | None = None,
+    parallel_projects: int = 1,
+    max_workers_per_project: int = 5,
+    global_max_workers: int | None = None,
 ) -> dict[str, dict[str, FetchResult]]:
     """
     Retrieves all test data for multiple projects.
 
     When project_keys is None, it fetches projects first and then retrieves
-    data for all available projects.
+    data for all available projects. Projects can be fetched concurrently; the
+    per-project worker budget is reduced when needed so that all running
+    projects together stay within global_max_workers.
 
     Args:
         client: The authenticated Zephyr client
         project_keys: Optional list of project keys to fetch data for
         progress_callback: Optional callback to report progress
+        parallel_projects: Number of projects fetched at the same time
+        max_workers_per_project: Maximum concurrent fetches within one project
+        global_max_workers: Optional cap on concurrent fetches across all projects
 
     Returns:
         Dictionary mapping project keys to their respective data results
@@ -339,16 +349,22 @@ def fetch_all_projects_data(
         projects = fetch_projects(client)
         project_keys = [project.key for project in projects]
 
-    results: dict[str, dict[str, FetchResult]] = {}
+    parallel_projects = max(1, parallel_projects)
+    workers_per_project = max(1, max_workers_per_project)
+    if global_max_workers is not None:
+        parallel_projects = min(parallel_projects, max(1, global_max_workers))
+        workers_per_project = max(
+            1, min(workers_per_project, global_max_workers // parallel_projects),
+        )
 
-    for project_key in project_keys:
+    def fetch_project(project_key: str) -> dict[str, FetchResult]:
         logger.info(f"Fetching all data for project {project_key}")
         if progress_callback:
             progress_callback("project_start", project_key, True)
 
-        project_results = fetch_all_project_data(client, project_key, progress_callback)
-
-        results[project_key] = project_results
+        project_results = fetch_all_project_data(
+            client, project_key, progress_callback, max_workers=workers_per_project,
+        )
 
         if progress_callback:
             # Count successful entities
@@ -356,5 +372,19 @@ def fetch_all_projects_data(
             progress_callback(
                 "project_complete", project_key, success_count == len(project_results),
             )
+        return project_results
 
-    return results
+    if parallel_projects == 1:
+        return {project_key: fetch_project(project_key) for project_key in project_keys}
+
+    results: dict[str, dict[str, FetchResult]] = {}
+    with ThreadPoolExecutor(max_workers=parallel_projects) as executor:
+        future_to_project = {
+            executor.submit(fetch_project, project_key): project_key
+            for project_key in project_keys
+        }
+        for future in as_completed(future_to_project):
+            results[future_to_project[future]] = future.result()
+
+    # Keep the requested project order regardless of completion order
+    return {project_key: results[project_key] for project_key in project_keys}
@@ -0,0 +1,152 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+In-memory index of entity mappings.
+
+Transforming and validating a project looks up the qTest id of a Zephyr entity once
+or more per record, and each ``get_entity_mapping`` call is a database round trip.
+EntityMappingIndex loads all mappings of a type with a single
+``get_entity_mappings`` query the first time the type is needed and answers every
+later lookup from a dict. Mappings saved during the load phase are added to the
+index as they are written, so it never has to be reloaded.
+"""
+
+import logging
+import threading
+from collections.abc import Hashable, Iterable, Mapping
+from typing import Any
+
+logger = logging.getLogger("ztoq.entity_mapping_index")
+
+MAPPING_TYPES = ("folder_to_module", "testcase_to_testcase", "cycle_to_cycle", "execution_to_run")
+
+
+class EntityMappingIndex:
+    """
+    Source to target id lookups for one project, loaded once per mapping type.
+
+    Source ids are compared as strings, so a folder id read from the API as an
+    integer finds the mapping stored for it as text. Each mapping type is held in
+    a plain dict, which callers may read directly through ``mappings``.
+    """
+
+    def __init__(self, db: Any, project_key: str):
+        """
+        Initialize the index.
+
+        Args:
+            db: Database manager providing ``get_entity_mappings``
+            project_key: Project whose mappings are indexed
+
+        """
+        self.db = db
+        self.project_key = project_key
+        self._mappings: dict[str, dict[str, Any]] = {}
+        self._loaded: set[str] = set()
+        self._lock = threading.RLock()
+        self.stats = {"loads": 0, "hits": 0, "misses": 0}
+
+    @staticmethod
+    def _key(source_id: Hashable) -> str:
+        return str(source_id)
+
+    def mappings(self, mapping_type: str) -> dict[str, Any]:
+        """
+        Get the dict backing a mapping type without loading it.
+
+        Args:
+            mapping_type: The mapping type, e.g. ``folder_to_module``
+
+        Returns:
+            The live source id to target id dict of the mapping type
+
+        """
+        with self._lock:
+            return self._mappings.setdefault(mapping_type, {})
+
+    def load(self, mapping_type: str, reload: bool = False) -> dict[str, Any]:
+        """
+        Load all mappings of a type with one query.
+
+        Args:
+            mapping_type: The mapping type to load
+            reload: Query the database even if the type was loaded before
+
+        Returns:
+            The source id to target id dict of the mapping type
+
+        """
+        with self._lock:
+            mappings = self.mappings(mapping_type)
+            if mapping_type in self._loaded and not reload:
+                return mappings
+            rows = self.db.get_entity_mappings(self.project_key, mapping_type) or []
+            for row in rows:
+                mappings[self._key(row["source_id"])] = row["target_id"]
+            self._loaded.add(mapping_type)
+            self.stats["loads"] += 1
+            logger.debug(f"Indexed {len(mappings)} {mapping_type} mappings for {self.project_key}")
+            return mappings
+
+    def get(self, mapping_type: str, source_id: Hashable | None) -> Any | None:
+        """
+        Get the target id mapped to a source id.
+
+        Args:
+            mapping_type: The mapping type
+            source_id: The source entity id
+
+        Returns:
+            Target entity id or None if the entity is not mapped
+
+        """
+        if source_id is None:
+            return None
+        target_id = self.load(mapping_type).get(self._key(source_id))
+        self.stats["hits" if target_id is not None else "misses"] += 1
+        return target_id
+
+    def put(self, mapping_type: str, source_id: Hashable, target_id: Any) -> None:
+        """
+        Record a mapping that was just saved to the database.
+
+        Args:
+            mapping_type: The mapping type
+            source_id: The source entity id
+            target_id: The target entity id
+
+        """
+        with self._lock:
+            self.mappings(mapping_type)[self._key(source_id)] = target_id
+
+    def put_many(self, mapping_type: str, mappings: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Record several mappings with ``source_id`` and ``target_id`` keys.
+
+        Args:
+            mapping_type: The mapping type
+            mappings: The mappings that were saved
+
+        """
+        with self._lock:
+            index = self.mappings(mapping_type)
+            for mapping in mappings:
+                index[self._key(mapping["source_id"])] = mapping["target_id"]
+
+    def invalidate(self, mapping_type: str | None = None) -> None:
+        """
+        Drop indexed mappings so the next lookup queries the database again.
+
+        Args:
+            mapping_type: Mapping type to drop, or None for all of them
+
+        """
+        with self._lock:
+            types = [mapping_type] if mapping_type else list(self._mappings)
+            for name in types:
+                self._mappings.get(name, {}).clear()
+                self._loaded.discard(name)
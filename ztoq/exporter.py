@@ -5,18 +5,24 @@ See LICENSE file for details.
 """
 
 import logging
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
+from typing import Any, TypeVar
 
 from rich.progress import Progress
 
 from ztoq.models import TestExecution, ZephyrConfig
-from ztoq.storage import JSONStorage, SQLiteStorage
-from ztoq.zephyr_client import ZephyrClient
+from ztoq.parquet_storage import ParquetStorage
+from ztoq.rate_limiter import TokenBucketRateLimiter
+from ztoq.storage import JSONLinesStorage, JSONStorage, SQLiteStorage
+from ztoq.zephyr_client import ZephyrClient, iter_batches
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ZephyrExporter:
     """Exporter for downloading and storing Zephyr Scale test data."""
@@ -27,24 +33,36 @@ class ZephyrExporter:
         output_format: str = "json",
         output_path: Path | None = None,
         concurrency: int = 2,
+        batch_size: int = 100,
+        compression: str | None = None,
     ):
         """
         Initialize the Zephyr exporter.
 
         Args:
             client: ZephyrClient instance
-            output_format: Output format - "json" or "sqlite"
-            output_path: Output path for data (directory for JSON, file for SQLite)
+            output_format: Output format - "json", "jsonl", "parquet" or "sqlite"
+            output_path: Output path for data (directory for JSON/JSON Lines/Parquet,
+                file for SQLite)
             concurrency: Number of concurrent requests for bulk operations
+            batch_size: Number of entities written to storage per batch
+            compression: Compression for JSON Lines files - None, "gzip" or "zstd"
 
         """
         self.client = client
         self.output_format = output_format.lower()
         self.output_path = output_path or Path(f"zephyr_export_{self.client.config.project_key}")
         self.concurrency = concurrency
+        self.batch_size = batch_size
 
         if self.output_format == "json":
-            self.storage: JSONStorage | SQLiteStorage = JSONStorage(self.output_path)
+            self.storage: JSONStorage | JSONLinesStorage | ParquetStorage | SQLiteStorage = (
+                JSONStorage(self.output_path)
+            )
+        elif self.output_format == "jsonl":
+            self.storage = JSONLinesStorage(self.output_path, compression=compression)
+        elif self.output_format == "parquet":
+            self.storage = ParquetStorage(self.output_path)
         elif self.output_format == "sqlite":
             self.storage = SQLiteStorage(self.output_path)
             # Initialize SQLite database
@@ -104,102 +122,171 @@ class ZephyrExporter:
         if progress:
             progress.update(task, advance=1, description="[cyan]Exported metadata")
 
-        # Export test cases in batches
-        test_cases = list(self.client.get_test_cases())
-        counts["test_cases"] = len(test_cases)
+        # Stream test cases to storage in batches
+        counts["test_cases"] = self._save_stream(
+            self.client.get_test_cases(),
+            "test_cases.json",
+            lambda batch: self.storage.save_test_cases(batch, project_key),
+        )
 
         if progress:
             progress.update(
-                task, advance=1, description=f"[cyan]Exported {len(test_cases)} test cases",
+                task, advance=1, description=f"[cyan]Exported {counts['test_cases']} test cases",
             )
 
-        # Save test cases
-        with self.storage:
-            if isinstance(self.storage, JSONStorage):
-                self.storage.save_test_cases(test_cases, project_key)
-            else:
-                for tc in test_cases:
-                    self.storage.save_test_case(tc, project_key)
+        # Stream test cycles to storage, keeping only what is needed to fetch executions
+        cycle_refs: list[tuple[str, str]] = []
 
-        # Export test cycles
-        test_cycles = list(self.client.get_test_cycles())
-        counts["test_cycles"] = len(test_cycles)
+        def remember_cycles(cycles):
+            for cycle in cycles:
+                cycle_refs.append((cycle.id, cycle.name))
+                yield cycle
+
+        counts["test_cycles"] = self._save_stream(
+            remember_cycles(self.client.get_test_cycles()),
+            "test_cycles.json",
+            lambda batch: self.storage.save_test_cycles(batch, project_key),
+        )
 
         if progress:
             progress.update(
-                task, advance=1, description=f"[cyan]Exported {len(test_cycles)} test cycles",
+                task, advance=1, description=f"[cyan]Exported {counts['test_cycles']} test cycles",
             )
 
-        # Save test cycles
-        with self.storage:
-            if isinstance(self.storage, JSONStorage):
-                self.storage.save_test_cycles(test_cycles, project_key)
-            else:
-                for tc in test_cycles:
-                    self.storage.save_test_cycle(tc)
-
-        # Export test executions in parallel
-        all_executions = []
-
+        # Export test executions in parallel, writing them as each cycle completes
+        exec_task = None
         if progress:
             exec_task = progress.add_task(
-                f"[yellow]Fetching executions for {len(test_cycles)} test cycles...",
-                total=len(test_cycles),
+                f"[yellow]Fetching executions for {len(cycle_refs)} test cycles...",
+                total=len(cycle_refs),
             )
 
-        if len(test_cycles) > 0:
-            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-                # Submit all tasks
-                future_to_cycle = {
-                    executor.submit(self._fetch_executions_for_cycle, cycle.id): cycle
-                    for cycle in test_cycles
-                }
-
-                # Process results as they complete
-                for future in as_completed(future_to_cycle):
-                    cycle = future_to_cycle[future]
-                    try:
-                        executions = future.result()
-                        all_executions.extend(executions)
-                        if progress:
-                            progress.update(
-                                exec_task,
-                                advance=1,
-                                description=(
-                                    f"[yellow]{len(executions)} executions for cycle {cycle.name}"
-                                ),
-                            )
-                    except Exception as e:
-                        logger.error(f"Error fetching executions for cycle {cycle.id}: {e}")
-                        if progress:
-                            progress.update(
-                                exec_task,
-                                advance=1,
-                                description=f"[red]Error with cycle {cycle.name}",
-                            )
-
-        counts["test_executions"] = len(all_executions)
+        counts["test_executions"] = self._save_stream(
+            self._iter_cycle_executions(cycle_refs, progress, exec_task),
+            "test_executions.json",
+            lambda batch: self.storage.save_test_executions(batch, project_key),
+        )
 
         if progress:
             progress.update(
-                task, advance=1, description=f"[cyan]Exported {len(all_executions)} test executions",
+                task,
+                advance=1,
+                description=f"[cyan]Exported {counts['test_executions']} test executions",
             )
-
-        # Save test executions
-        with self.storage:
-            if isinstance(self.storage, JSONStorage):
-                self.storage.save_test_executions(all_executions, project_key)
-            else:
-                for te in all_executions:
-                    self.storage.save_test_execution(te, project_key)
-
-        if progress:
             progress.update(
                 task, advance=1, description=f"[green]Completed export for {project_key}",
             )
 
         return counts
 
+    def _save_stream(
+        self, entities: Iterable[T], filename: str, save_batch: Callable[[list[T]], None],
+    ) -> int:
+        """
+        Write a stream of entities to storage batch by batch.
+
+        Only one batch of entities is held in memory at a time: JSON output is
+        appended to the array file as batches arrive, SQLite output is inserted with
+        one bulk statement per batch in a bulk-load session, and other storages
+        receive each batch through ``save_batch``.
+
+        Args:
+            entities: Entities to save, typically a PaginatedIterator
+            filename: JSON file name used with JSON storage
+            save_batch: Function saving a batch of entities with other storages
+
+        Returns:
+            Number of entities saved
+
+        """
+        saved = 0
+        if isinstance(self.storage, JSONStorage):
+            with self.storage.open_array_writer(filename) as writer:
+                for batch in iter_batches(entities, self.batch_size):
+                    saved += writer.write_many(batch)
+            return saved
+
+        if isinstance(self.storage, SQLiteStorage):
+            with self.storage, self.storage.bulk_load():
+                for batch in iter_batches(entities, self.batch_size):
+                    save_batch(batch)
+                    saved += len(batch)
+            return saved
+
+        with self.storage:
+            for batch in iter_batches(entities, self.batch_size):
+                save_batch(batch)
+                saved += len(batch)
+        return saved
+
+    def _iter_cycle_executions(
+        self,
+        cycle_refs: list[tuple[str, str]],
+        progress: Progress | None = None,
+        exec_task: Any = None,
+    ) -> Iterator[TestExecution]:
+        """
+        Fetch the executions of test cycles concurrently and yield them as cycles complete.
+
+        At most twice ``concurrency`` cycles are in flight, so fetched executions do
+        not pile up faster than they are written.
+
+        Args:
+            cycle_refs: (cycle ID, cycle name) pairs
+            progress: Optional Progress instance for progress reporting
+            exec_task: Progress task for execution fetching
+
+        Yields:
+            Test executions
+
+        """
+        if not cycle_refs:
+            return
+
+        remaining = iter(cycle_refs)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            future_to_cycle = {}
+
+            def submit_next() -> bool:
+                cycle = next(remaining, None)
+                if cycle is None:
+                    return False
+                future_to_cycle[executor.submit(self._fetch_executions_for_cycle, cycle[0])] = (
+                    cycle
+                )
+                return True
+
+            for _ in range(max(1, self.concurrency) * 2):
+                if not submit_next():
+                    break
+
+            while future_to_cycle:
+                done, _ = wait(future_to_cycle, return_when=FIRST_COMPLETED)
+                for future in done:
+                    cycle_id, cycle_name = future_to_cycle.pop(future)
+                    submit_next()
+                    try:
+                        executions = future.result()
+                    except Exception as e:
+                        logger.error(f"Error fetching executions for cycle {cycle_id}: {e}")
+                        if progress:
+                            progress.update(
+                                exec_task,
+                                advance=1,
+                                description=f"[red]Error with cycle {cycle_name}",
+                            )
+                        continue
+
+                    if progress:
+                        progress.update(
+                            exec_task,
+                            advance=1,
+                            description=(
+                                f"[yellow]{len(executions)} executions for cycle {cycle_name}"
+                            ),
+                        )
+                    yield from executions
+
     def _fetch_executions_for_cycle(self, cycle_id: str) -> list[TestExecution]:
         """
         Fetch all executions for a test cycle.
@@ -215,7 +302,18 @@ class ZephyrExporter:
 
 
 class ZephyrExportManager:
-    """Manager for handling exports from multiple projects."""
+    """
+    Manager for handling exports from multiple projects.
+
+    Projects can be exported concurrently. ``parallel_projects`` sets how many
+    projects run at once and ``concurrency`` how many requests each of them may
+    have in flight; ``global_concurrency`` caps the requests of all running
+    projects together through one semaphore shared by their clients, so a project
+    that finishes early leaves its slots to the others. Every project writes to
+    its own storage target (``<output_dir>/<key>`` or ``<output_dir>/<key>.db``).
+    A ``rate_limiter`` is shared by the clients of all projects, so concurrent
+    exports stay within one request budget instead of competing for it.
+    """
 
     def __init__(
         self,
@@ -224,16 +322,26 @@ class ZephyrExportManager:
         output_dir: Path | None = None,
         spec_path: Path | None = None,
         concurrency: int = 2,
+        parallel_projects: int = 1,
+        global_concurrency: int | None = None,
+        compression: str | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
     ):
         """
         Initialize the export manager.
 
         Args:
             config: ZephyrConfig object
-            output_format: Output format - "json" or "sqlite"
+            output_format: Output format - "json", "jsonl", "parquet" or "sqlite"
             output_dir: Base output directory
             spec_path: Path to OpenAPI spec file
-            concurrency: Number of concurrent requests for bulk operations
+            concurrency: Number of concurrent requests for bulk operations of one project
+            parallel_projects: Number of projects exported at the same time
+            global_concurrency: Maximum number of requests in flight across all
+                projects, shared as one budget (None for no limit beyond the
+                per-project budget)
+            compression: Compression for JSON Lines output - None, "gzip" or "zstd"
+            rate_limiter: Optional token bucket shared by the clients of all projects
 
         """
         self.config = config
@@ -241,6 +349,27 @@ class ZephyrExportManager:
         self.output_dir = output_dir or Path("zephyr_exports")
         self.spec_path = spec_path
         self.concurrency = concurrency
+        self.parallel_projects = max(1, parallel_projects)
+        self.global_concurrency = global_concurrency
+        self.compression = compression
+        self.rate_limiter = rate_limiter
+
+        self.request_slots: threading.BoundedSemaphore | None = None
+        if global_concurrency is not None:
+            self.request_slots = threading.BoundedSemaphore(max(1, global_concurrency))
+            # More projects than requests would leave projects waiting without any budget
+            self.parallel_projects = min(self.parallel_projects, max(1, global_concurrency))
+
+    def _create_client(self, config: ZephyrConfig) -> ZephyrClient:
+        """Create a client for a project, sharing the manager's rate limiter and request slots."""
+        if self.spec_path:
+            client = ZephyrClient.from_openapi_spec(self.spec_path, config)
+            client.rate_limiter = self.rate_limiter
+            client.request_slots = self.request_slots
+            return client
+        return ZephyrClient(
+            config, rate_limiter=self.rate_limiter, request_slots=self.request_slots,
+        )
 
     def export_project(
         self, project_key: str | None = None, progress: Progress | None = None,
@@ -264,10 +393,7 @@ class ZephyrExportManager:
         )
 
         # Create client
-        if self.spec_path:
-            client = ZephyrClient.from_openapi_spec(self.spec_path, config)
-        else:
-            client = ZephyrClient(config)
+        client = self._create_client(config)
 
         # Configure output path
         output_path = self.output_dir / pk
@@ -280,6 +406,7 @@ class ZephyrExportManager:
             output_format=self.output_format,
             output_path=output_path,
             concurrency=self.concurrency,
+            compression=self.compression,
         )
 
         # Run the export
@@ -289,24 +416,27 @@ class ZephyrExportManager:
         self,
         projects_to_export: list[str] | None = None,
         progress_callback: Callable[[str, str, int, int], None] | None = None,
+        progress: Progress | None = None,
     ) -> dict[str, dict[str, int]]:
         """
         Export data for multiple projects.
 
+        Up to ``parallel_projects`` projects are exported at the same time. With a
+        Progress instance, an overall task tracks finished projects and each running
+        project adds its own tasks to the same display.
+
         Args:
             projects_to_export: List of project keys to export (defaults to all projects)
             progress_callback: Optional callback for progress reporting
                 Args: project_key, status, current, total
+            progress: Optional Progress instance shared by all project exports
 
         Returns:
             Dictionary mapping project keys to export statistics
 
         """
         # Create client to get projects list
-        if self.spec_path:
-            client = ZephyrClient.from_openapi_spec(self.spec_path, self.config)
-        else:
-            client = ZephyrClient(self.config)
+        client = self._create_client(self.config)
 
         # Get projects
         projects = client.get_projects()
@@ -318,20 +448,51 @@ class ZephyrExportManager:
         results = {}
         total_projects = len(projects)
 
-        for i, project in enumerate(projects, 1):
+        overall_task = None
+        if progress:
+            overall_task = progress.add_task(
+                f"[magenta]Exporting {total_projects} projects...", total=total_projects,
+            )
+
+        def export_one(index: int, project_key: str) -> dict[str, int] | None:
             if progress_callback:
-                progress_callback(project.key, "starting", i, total_projects)
+                progress_callback(project_key, "starting", index, total_projects)
 
             try:
-                logger.info(f"Exporting project {project.key} ({i}/{total_projects})")
-                stats = self.export_project(project.key)
-                results[project.key] = stats
+                logger.info(f"Exporting project {project_key} ({index}/{total_projects})")
+                stats = self.export_project(project_key, progress=progress)
 
                 if progress_callback:
-                    progress_callback(project.key, "completed", i, total_projects)
+                    progress_callback(project_key, "completed", index, total_projects)
+                return stats
             except Exception as e:
-                logger.error(f"Error exporting project {project.key}: {e}")
+                logger.error(f"Error exporting project {project_key}: {e}")
                 if progress_callback:
-                    progress_callback(project.key, f"error: {e!s}", i, total_projects)
-
-        return results
+                    progress_callback(project_key, f"error: {e!s}", index, total_projects)
+                return None
+            finally:
+                if progress:
+                    progress.update(overall_task, advance=1)
+
+        if self.parallel_projects == 1:
+            for i, project in enumerate(projects, 1):
+                stats = export_one(i, project.key)
+                if stats is not None:
+                    results[project.key] = stats
+            return results
+
+        with ThreadPoolExecutor(
+            max_workers=self.parallel_projects, thread_name_prefix="ztoq-export",
+        ) as executor:
+            future_to_key = {
+                executor.submit(export_one, i, project.key): project.key
+                for i, project in enumerate(projects, 1)
+            }
+            for future in as_completed(future_to_key):
+                stats = future.result()
+                if stats is not None:
+                    results[future_to_key[future]] = stats
+
+        # Report projects in the order they were requested, not completion order
+        order = [project.key for project in projects]
+        return {key: results[key] for key in order if key in results}
@@ -0,0 +1,228 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+Dependency-aware task scheduling for the load phase.
+
+Loading entity type by entity type, or hierarchy level by level, makes every entity
+wait for the slowest request of the stage before it. DependencyScheduler instead
+runs each task as soon as the tasks it depends on have finished, so a child module
+is created as soon as its own parent exists and test runs stream in behind the test
+cases and cycles they reference.
+"""
+
+import logging
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger("ztoq.load_scheduler")
+
+
+@dataclass
+class TaskOutcome:
+    """Outcome of one scheduled task."""
+
+    key: Hashable
+    result: Any = None
+    error: str | None = None
+    skipped: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the task ran and returned without raising."""
+        return self.error is None and not self.skipped
+
+
+@dataclass
+class _Task:
+    # None for barriers, which finish in the scheduler without running anything
+    fn: Callable[[dict[Hashable, Any]], Any] | None
+    depends_on: tuple[Hashable, ...]
+    allow_failed_dependencies: bool
+    dependents: list[Hashable] = field(default_factory=list)
+    waiting_on: int = 0
+    failed_dependency: Hashable | None = None
+
+
+class DependencyScheduler:
+    """
+    Run tasks on an executor in dependency order, each as soon as it is ready.
+
+    A task receives the results of its dependencies as a dict keyed by dependency
+    key. When a dependency fails, its dependents are skipped unless they were added
+    with ``allow_failed_dependencies``. Barriers only mark the end of a group and
+    finish as soon as their members have, without being submitted to the executor.
+    ``on_complete`` is called once for every outcome in the thread that called
+    ``run``, so it can safely write to a database connection. If it raises, the error
+    is logged and the task is recorded as failed, so its dependents are skipped.
+    """
+
+    def __init__(self, executor: Any):
+        """
+        Initialize the scheduler.
+
+        Args:
+            executor: Executor with a ``submit`` method that runs the tasks
+
+        """
+        self.executor = executor
+        self._tasks: dict[Hashable, _Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tasks
+
+    def add(
+        self,
+        key: Hashable,
+        fn: Callable[[dict[Hashable, Any]], Any],
+        depends_on: Iterable[Hashable] = (),
+        allow_failed_dependencies: bool = False,
+    ) -> None:
+        """
+        Add a task.
+
+        Args:
+            key: Unique key of the task
+            fn: Callable taking the dependency results and returning the task result
+            depends_on: Keys of tasks that must finish first
+            allow_failed_dependencies: Run the task even if a dependency failed
+
+        """
+        if key in self._tasks:
+            raise ValueError(f"Duplicate task key: {key!r}")
+        self._tasks[key] = _Task(
+            fn=fn,
+            depends_on=tuple(dict.fromkeys(depends_on)),
+            allow_failed_dependencies=allow_failed_dependencies,
+        )
+
+    def add_barrier(self, key: Hashable, members: Iterable[Hashable]) -> None:
+        """
+        Add a barrier that finishes once every member has finished, failed or not.
+
+        Args:
+            key: Unique key of the barrier
+            members: Keys of the tasks in the group
+
+        """
+        if key in self._tasks:
+            raise ValueError(f"Duplicate task key: {key!r}")
+        self._tasks[key] = _Task(
+            fn=None, depends_on=tuple(dict.fromkeys(members)), allow_failed_dependencies=True,
+        )
+
+    def run(
+        self, on_complete: Callable[[TaskOutcome], None] | None = None,
+    ) -> dict[Hashable, TaskOutcome]:
+        """
+        Run all tasks and wait for them to finish.
+
+        Args:
+            on_complete: Optional callback receiving each outcome as it becomes known
+
+        Returns:
+            Outcomes keyed by task key
+
+        """
+        for key, task in self._tasks.items():
+            for dependency in task.depends_on:
+                if dependency not in self._tasks:
+                    raise ValueError(f"Task {key!r} depends on unknown task {dependency!r}")
+                self._tasks[dependency].dependents.append(key)
+            task.waiting_on = len(task.depends_on)
+
+        outcomes: dict[Hashable, TaskOutcome] = {}
+        pending: dict[Future, Hashable] = {}
+        ready = [key for key, task in self._tasks.items() if task.waiting_on == 0]
+
+        def finish(outcome: TaskOutcome):
+            if on_complete:
+                try:
+                    on_complete(outcome)
+                except Exception as e:
+                    logger.error(f"Completion callback failed for task {outcome.key!r}: {e!s}")
+                    if outcome.succeeded:
+                        outcome = TaskOutcome(
+                            outcome.key,
+                            result=outcome.result,
+                            error=f"Completion callback failed: {e!s}",
+                        )
+            outcomes[outcome.key] = outcome
+            for dependent_key in self._tasks[outcome.key].dependents:
+                dependent = self._tasks[dependent_key]
+                if not outcome.succeeded and dependent.failed_dependency is None:
+                    dependent.failed_dependency = outcome.key
+                dependent.waiting_on -= 1
+                if dependent.waiting_on == 0:
+                    ready.append(dependent_key)
+
+        while ready or pending:
+            while ready:
+                key = ready.pop()
+                task = self._tasks[key]
+                if task.failed_dependency is not None and not task.allow_failed_dependencies:
+                    finish(
+                        TaskOutcome(
+                            key,
+                            error=f"Dependency {task.failed_dependency!r} did not complete",
+                            skipped=True,
+                        ),
+                    )
+                    continue
+                if task.fn is None:
+                    finish(TaskOutcome(key))
+                    continue
+                results = {
+                    dependency: outcomes[dependency].result for dependency in task.depends_on
+                }
+                pending[self.executor.submit(task.fn, results)] = key
+
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                try:
+                    outcome = TaskOutcome(key, result=future.result())
+                except Exception as e:
+                    outcome = TaskOutcome(key, error=str(e))
+                finish(outcome)
+
+        if len(outcomes) != len(self._tasks):
+            stuck = [key for key in self._tasks if key not in outcomes]
+            raise ValueError(f"Dependency cycle between tasks: {stuck[:5]!r}")
+
+        failed = sum(1 for outcome in outcomes.values() if not outcome.succeeded)
+        logger.debug(f"Scheduled {len(outcomes)} tasks, {failed} failed or skipped")
+        return outcomes
+
+
+def group_dependencies(
+    scheduler: DependencyScheduler, key: Hashable, members: Iterable[Hashable],
+) -> Hashable:
+    """
+    Add a barrier task that finishes once every member has finished.
+
+    Depending on the barrier instead of on each member keeps the graph linear in
+    size when many tasks wait for a whole group. Failed members do not fail the
+    barrier, and the barrier never occupies a worker of the executor.
+
+    Args:
+        scheduler: Scheduler to add the barrier to
+        key: Key of the barrier task
+        members: Keys of the tasks in the group
+
+    Returns:
+        The barrier key
+
+    """
+    scheduler.add_barrier(key, members)
+    return key
@@ -14,13 +14,19 @@ test data between the two systems, as described in ADR-013.
 import json
 import logging
 import os
+import shutil
 import tempfile
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from ztoq.adaptive_concurrency import AdaptiveExecutor, AIMDConcurrencyLimit
+from ztoq.attachment_spool import AttachmentDeduplicator, AttachmentSpool
 from ztoq.custom_field_mapping import get_default_field_mapper
+from ztoq.entity_mapping_index import MAPPING_TYPES, EntityMappingIndex
+from ztoq.load_scheduler import DependencyScheduler, TaskOutcome, group_dependencies
 from ztoq.models import ZephyrConfig
 from ztoq.qtest_client import QTestClient
 from ztoq.qtest_models import (
@@ -33,8 +39,11 @@ from ztoq.qtest_models import (
     QTestTestLog,
     QTestTestRun,
 )
+from ztoq.rate_limiter import TokenBucketRateLimiter
+from ztoq.step_fetcher import BulkStepFetcher
 from ztoq.validation_integration import get_enhanced_migration
-from ztoq.zephyr_client import ZephyrClient
+from ztoq.write_behind import TRANSFORMED_WRITERS, WriteBehindBuffer
+from ztoq.zephyr_client import ZephyrClient, expected_item_count, iter_batches
 
 logger = logging.getLogger("ztoq.migration")
 
@@ -258,6 +267,22 @@ class EntityBatchTracker:
                 self.project_key, self.entity_type, batch_num, total_batches, items_count,
             )
 
+    def add_batch(self, batch_num: int, items_count: int):
+        """
+        Register a batch that was not known when the batches were initialized.
+
+        Used when entities are streamed and the source produces more items than it
+        reported up front (or reported no total at all).
+
+        Args:
+            batch_num: The batch number
+            items_count: Number of items in the batch
+
+        """
+        self.db.create_entity_batch(
+            self.project_key, self.entity_type, batch_num, batch_num + 1, items_count,
+        )
+
     def update_batch_status(
         self, batch_num: int, processed_count: int, status: str, error: str | None = None,
     ):
@@ -304,6 +329,15 @@ class ZephyrToQTestMigration:
         max_workers: int = 5,
         attachments_dir: Path | None = None,
         enable_validation: bool = True,
+        attachment_spool_dir: Path | None = None,
+        use_inline_steps: bool = False,
+        bulk_chunk_size: int | None = None,
+        zephyr_rate_limiter: TokenBucketRateLimiter | None = None,
+        qtest_rate_limiter: TokenBucketRateLimiter | None = None,
+        adaptive_concurrency: bool = False,
+        max_concurrency: int | None = None,
+        pipelined_load: bool = False,
+        write_buffer_size: int | None = None,
     ):
         """
         Initialize the migration manager.
@@ -316,6 +350,24 @@ class ZephyrToQTestMigration:
             max_workers: Maximum number of concurrent workers
             attachments_dir: Optional directory for attachment storage
             enable_validation: Whether to enable enhanced validation (default: True)
+            attachment_spool_dir: Optional directory for a content-addressed attachment spool.
+                When set, attachments are streamed to disk and only a reference to the
+                spooled content is stored in the database.
+            use_inline_steps: Whether to skip the step request for test cases whose
+                steps were already returned inline in the test case payload
+            bulk_chunk_size: When set, test cases are loaded through qTest bulk requests
+                of this many records instead of one request per test case
+            zephyr_rate_limiter: Optional token bucket pacing Zephyr requests, shared
+                with other migrations or processes using the same bucket
+            qtest_rate_limiter: Optional token bucket pacing qTest requests
+            adaptive_concurrency: Whether the load phase adjusts the number of requests in
+                flight (AIMD) instead of always running max_workers at once
+            max_concurrency: Upper bound for adaptive concurrency (defaults to 4x max_workers)
+            pipelined_load: Whether to load all entity types as one dependency graph
+                instead of type by type and level by level
+            write_buffer_size: When set, entity mappings and transformed entities are
+                buffered and written in bulk once this many have gathered, and always
+                before a batch is marked completed
 
         """
         self.zephyr_config = zephyr_config
@@ -323,12 +375,51 @@ class ZephyrToQTestMigration:
         self.db = database_manager
         self.batch_size = batch_size
         self.max_workers = max_workers
+        self.bulk_chunk_size = bulk_chunk_size
+        self.pipelined_load = pipelined_load
+        self.write_buffer = (
+            WriteBehindBuffer(database_manager, zephyr_config.project_key, write_buffer_size)
+            if write_buffer_size
+            else None
+        )
+
+        # qTest parents of created entities by link type, recorded for the relationship
+        # checks of the validation and written with the other buffered writes
+        self._qtest_links: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._qtest_links_lock = threading.Lock()
+
+        # One worker pool serves every load batch. With adaptive concurrency the number
+        # of requests in flight starts at max_workers and follows the server's health;
+        # otherwise the limit is pinned to max_workers.
+        if adaptive_concurrency:
+            self.load_concurrency = AIMDConcurrencyLimit(
+                initial_limit=max_workers,
+                min_limit=1,
+                max_limit=max_concurrency or max_workers * 4,
+            )
+        else:
+            self.load_concurrency = AIMDConcurrencyLimit(
+                initial_limit=max_workers, min_limit=max_workers, max_limit=max_workers,
+            )
+        self._load_executor: AdaptiveExecutor | None = None
         self.attachments_dir = attachments_dir
         self.enable_validation = enable_validation
+        self.attachment_spool = (
+            AttachmentSpool(attachment_spool_dir) if attachment_spool_dir else None
+        )
+        # Deduplicates downloads and uploads of identical attachment content
+        self.attachment_dedup = (
+            AttachmentDeduplicator(self.attachment_spool) if self.attachment_spool else None
+        )
 
         # Initialize API clients
-        self.zephyr_client = ZephyrClient(zephyr_config)
-        self.qtest_client = QTestClient(qtest_config)
+        self.zephyr_client = ZephyrClient(zephyr_config, rate_limiter=zephyr_rate_limiter)
+        self.qtest_client = QTestClient(qtest_config, rate_limiter=qtest_rate_limiter)
+
+        # Fetches test steps for a whole batch of test cases concurrently
+        self.step_fetcher = BulkStepFetcher(
+            self.zephyr_client, max_workers=max_workers, use_inline_steps=use_inline_steps,
+        )
 
         # Initialize state tracker
         self.state = MigrationState(zephyr_config.project_key, self.db)
@@ -336,12 +427,16 @@ class ZephyrToQTestMigration:
         # Initialize field mapper
         self.field_mapper = get_default_field_mapper()
 
-        # Initialize mapping tables for created entities
+        # Index of entity mappings, loaded with one query per mapping type and kept
+        # current as mappings are saved, so lookups do not hit the database
+        self.mapping_index = EntityMappingIndex(self.db, zephyr_config.project_key)
+
+        # Mapping tables for created entities, backed by the index
         self.entity_mappings = {
-            "folders": {},  # Zephyr folder ID -> qTest module ID
-            "test_cases": {},  # Zephyr test case ID -> qTest test case ID
-            "test_cycles": {},  # Zephyr test cycle ID -> qTest test cycle ID
-            "test_executions": {},  # Zephyr execution ID -> qTest test run ID
+            "folders": self.mapping_index.mappings("folder_to_module"),
+            "test_cases": self.mapping_index.mappings("testcase_to_testcase"),
+            "test_cycles": self.mapping_index.mappings("cycle_to_cycle"),
+            "test_executions": self.mapping_index.mappings("execution_to_run"),
         }
 
         # Load existing mappings from database if available
@@ -349,33 +444,66 @@ class ZephyrToQTestMigration:
 
     def _load_entity_mappings(self):
         """Load existing entity mappings from the database."""
-        # Load folder mappings
-        folder_mappings = self.db.get_entity_mappings(
-            self.zephyr_config.project_key, "folder_to_module",
+        for mapping_type in MAPPING_TYPES:
+            self.mapping_index.load(mapping_type)
+
+    def _save_entity_mapping(self, mapping_type, source_id, target_id):
+        """Save a mapping to the database and add it to the mapping index."""
+        self.mapping_index.put(mapping_type, source_id, target_id)
+        if self.write_buffer:
+            self.write_buffer.add_mapping(mapping_type, source_id, target_id)
+            return
+        self.db.save_entity_mapping(
+            self.zephyr_config.project_key, mapping_type, source_id, target_id,
         )
-        for mapping in folder_mappings:
-            self.entity_mappings["folders"][mapping["source_id"]] = mapping["target_id"]
 
-        # Load test case mappings
-        testcase_mappings = self.db.get_entity_mappings(
-            self.zephyr_config.project_key, "testcase_to_testcase",
-        )
-        for mapping in testcase_mappings:
-            self.entity_mappings["test_cases"][mapping["source_id"]] = mapping["target_id"]
+    def _save_transformed(self, entity_type, source_id, *payload, **references):
+        """
+        Save a transformed test case, test cycle or execution (run and log).
 
-        # Load test cycle mappings
-        cycle_mappings = self.db.get_entity_mappings(
-            self.zephyr_config.project_key, "cycle_to_cycle",
-        )
-        for mapping in cycle_mappings:
-            self.entity_mappings["test_cycles"][mapping["source_id"]] = mapping["target_id"]
+        The keyword arguments name the source entities the record depends on, such as
+        ``folder_source_id``; the pipelined load uses them to order its requests.
+        """
+        references = {name: ref for name, ref in references.items() if ref is not None}
+        if self.write_buffer:
+            self.write_buffer.add_transformed(
+                entity_type, source_id, *payload, references=references,
+            )
+            return
+        save = getattr(self.db, TRANSFORMED_WRITERS[entity_type][1])
+        save(self.zephyr_config.project_key, source_id, *payload, references=references)
 
-        # Load test execution mappings
-        execution_mappings = self.db.get_entity_mappings(
-            self.zephyr_config.project_key, "execution_to_run",
-        )
-        for mapping in execution_mappings:
-            self.entity_mappings["test_executions"][mapping["source_id"]] = mapping["target_id"]
+    def _record_qtest_link(self, link_type, qtest_id, parent_id, requested_parent_id=None):
+        """
+        Remember the qTest parent a created entity was linked to.
+
+        ``parent_id`` is taken from the entity qTest returned, so the post-migration
+        checks see where qTest actually put it; ``requested_parent_id`` is used only
+        when the response does not say.
+        """
+        if not hasattr(self.db, "save_qtest_links"):
+            return
+        if parent_id is None:
+            parent_id = requested_parent_id
+        with self._qtest_links_lock:
+            self._qtest_links[link_type].append({"qtest_id": qtest_id, "parent_id": parent_id})
+
+    def _flush_writes(self):
+        """Write buffered mappings, transformed entities and qTest links to the database."""
+        if self.write_buffer:
+            self.write_buffer.flush()
+        with self._qtest_links_lock:
+            while self._qtest_links:
+                link_type, links = next(iter(self._qtest_links.items()))
+                self.db.save_qtest_links(self.zephyr_config.project_key, link_type, links)
+                del self._qtest_links[link_type]
+
+    def _flush_writes_on_exit(self):
+        """Flush buffered writes at the end of a phase without masking its outcome."""
+        try:
+            self._flush_writes()
+        except Exception as e:
+            logger.error(f"Failed to flush buffered writes: {e!s}")
 
     def run_migration(self, phases: list[str] | None = None):
         """
@@ -436,11 +564,15 @@ class ZephyrToQTestMigration:
 
             self.state.update_extraction_status("completed")
             logger.info(f"Extraction completed for project {self.zephyr_config.project_key}")
+            if self.attachment_dedup:
+                logger.info(f"Attachment transfer statistics: {self.attachment_dedup.get_stats()}")
 
         except Exception as e:
             self.state.update_extraction_status("failed", str(e))
             logger.error(f"Extraction failed: {e!s}", exc_info=True)
             raise
+        finally:
+            self.step_fetcher.close()
 
     def _extract_folders(self):
         """Extract folder data from Zephyr."""
@@ -466,30 +598,53 @@ class ZephyrToQTestMigration:
 
         logger.info(f"Extracted {len(folders)} folders")
 
+    def _iter_tracked_batches(self, entities, tracker: EntityBatchTracker):
+        """
+        Stream entities in batches of ``batch_size`` and register them with a tracker.
+
+        Entities are pulled from the source only as each batch is needed, so memory use
+        is bounded by the batch size rather than the size of the project. The tracker
+        is initialized from the total reported by the first page; batches beyond that
+        total are registered as they appear.
+
+        Args:
+            entities: Entity source, typically a PaginatedIterator
+            tracker: Batch tracker for the entity type
+
+        Yields:
+            Tuples of (batch_idx, batch)
+
+        """
+        known_batches = 0
+        for batch_idx, batch in enumerate(iter_batches(entities, self.batch_size)):
+            if batch_idx == 0:
+                # The first page has been fetched by now, so its total is available
+                total_items = expected_item_count(entities)
+                if total_items:
+                    tracker.initialize_batches(total_items, self.batch_size)
+                    known_batches = (total_items + self.batch_size - 1) // self.batch_size
+            if batch_idx >= known_batches:
+                tracker.add_batch(batch_idx, len(batch))
+            yield batch_idx, batch
+
     def _extract_test_cases(self):
         """Extract test case data from Zephyr."""
         logger.info("Extracting test cases")
 
-        # Get test cases for the project
-        test_cases = list(self.zephyr_client.get_test_cases())
-
-        # Initialize batch tracking
         test_case_tracker = EntityBatchTracker(
             self.zephyr_config.project_key, "test_cases", self.db,
         )
-        test_case_tracker.initialize_batches(len(test_cases), self.batch_size)
-
-        # Process test cases in batches
-        for batch_idx, batch_start in enumerate(range(0, len(test_cases), self.batch_size)):
-            batch_end = min(batch_start + self.batch_size, len(test_cases))
-            batch = test_cases[batch_start:batch_end]
+        extracted_count = 0
 
+        # Stream test cases page by page and process them in batches
+        for batch_idx, batch in self._iter_tracked_batches(
+            self.zephyr_client.get_test_cases(), test_case_tracker,
+        ):
             try:
-                # For each test case, fetch test steps
+                # Fetch the test steps for the whole batch concurrently
+                steps_by_case = self.step_fetcher.fetch_steps(batch)
                 for test_case in batch:
-                    # Get and save test steps for each test case
-                    test_steps = self.zephyr_client.get_test_steps(test_case.id)
-                    test_case.steps = list(test_steps)
+                    test_case.steps = steps_by_case.get(test_case.id, [])
 
                     # Handle attachments if they exist
                     self._extract_test_case_attachments(test_case)
@@ -500,8 +655,9 @@ class ZephyrToQTestMigration:
             except Exception as e:
                 test_case_tracker.update_batch_status(batch_idx, 0, "failed", str(e))
                 logger.error(f"Failed to save test case batch {batch_idx}: {e!s}")
+            extracted_count += len(batch)
 
-        logger.info(f"Extracted {len(test_cases)} test cases")
+        logger.info(f"Extracted {extracted_count} test cases")
 
     def _extract_test_case_attachments(self, test_case):
         """Extract attachments for a test case."""
@@ -510,49 +666,79 @@ class ZephyrToQTestMigration:
 
         for attachment in test_case.attachments:
             try:
-                # Download attachment
-                attachment_data = self.zephyr_client.download_attachment(attachment.id)
-
-                # Store in database
-                self.db.save_attachment(
-                    related_type="TestCase",
-                    related_id=test_case.id,
-                    name=attachment.filename,
-                    content=attachment_data,
-                    url=attachment.url,
-                )
-
-                # Optionally save to filesystem if attachments_dir is provided
-                if self.attachments_dir:
-                    attachment_path = (
-                        self.attachments_dir / f"tc_{test_case.id}_{attachment.filename}"
-                    )
-                    attachment_path.parent.mkdir(parents=True, exist_ok=True)
-                    attachment_path.write_bytes(attachment_data)
-
+                self._extract_attachment("TestCase", test_case.id, attachment, "tc")
             except Exception as e:
                 logger.warning(
                     f"Failed to download attachment {attachment.id} for test case {test_case.id}: {e!s}",
                 )
 
+    def _extract_attachment(self, related_type, related_id, attachment, file_prefix):
+        """
+        Download a single attachment and store it.
+
+        With an attachment spool the content is streamed to disk and the database
+        only receives the checksum reference; otherwise the content is downloaded
+        into memory and stored in the database as before.
+        """
+        attachment_path = None
+        if self.attachments_dir:
+            attachment_path = (
+                self.attachments_dir / f"{file_prefix}_{related_id}_{attachment.filename}"
+            )
+            attachment_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.attachment_spool is None:
+            # Download attachment
+            attachment_data = self.zephyr_client.download_attachment(attachment.id)
+
+            # Store in database
+            self.db.save_attachment(
+                related_type=related_type,
+                related_id=related_id,
+                name=attachment.filename,
+                content=attachment_data,
+                url=attachment.url,
+            )
+
+            # Optionally save to filesystem if attachments_dir is provided
+            if attachment_path:
+                attachment_path.write_bytes(attachment_data)
+            return
+
+        # Stream the attachment into the spool (once per attachment) and store only a reference
+        spooled = self.attachment_dedup.fetch(
+            attachment.id,
+            lambda: self.zephyr_client.download_attachment_to_spool(
+                attachment.id, self.attachment_spool,
+            ),
+        )
+        self.db.save_attachment(
+            related_type=related_type,
+            related_id=related_id,
+            name=attachment.filename,
+            content=None,
+            url=attachment.url,
+            checksum=spooled.checksum,
+            size=spooled.size,
+            storage_ref=spooled.storage_ref,
+        )
+
+        if attachment_path:
+            shutil.copyfile(spooled.path, attachment_path)
+
     def _extract_test_cycles(self):
         """Extract test cycle data from Zephyr."""
         logger.info("Extracting test cycles")
 
-        # Get test cycles for the project
-        test_cycles = list(self.zephyr_client.get_test_cycles())
-
-        # Initialize batch tracking
         test_cycle_tracker = EntityBatchTracker(
             self.zephyr_config.project_key, "test_cycles", self.db,
         )
-        test_cycle_tracker.initialize_batches(len(test_cycles), self.batch_size)
-
-        # Process test cycles in batches
-        for batch_idx, batch_start in enumerate(range(0, len(test_cycles), self.batch_size)):
-            batch_end = min(batch_start + self.batch_size, len(test_cycles))
-            batch = test_cycles[batch_start:batch_end]
+        extracted_count = 0
 
+        # Stream test cycles page by page and process them in batches
+        for batch_idx, batch in self._iter_tracked_batches(
+            self.zephyr_client.get_test_cycles(), test_cycle_tracker,
+        ):
             try:
                 # Save test cycles to database
                 self.db.save_test_cycles(batch)
@@ -560,27 +746,23 @@ class ZephyrToQTestMigration:
             except Exception as e:
                 test_cycle_tracker.update_batch_status(batch_idx, 0, "failed", str(e))
                 logger.error(f"Failed to save test cycle batch {batch_idx}: {e!s}")
+            extracted_count += len(batch)
 
-        logger.info(f"Extracted {len(test_cycles)} test cycles")
+        logger.info(f"Extracted {extracted_count} test cycles")
 
     def _extract_test_executions(self):
         """Extract test execution data from Zephyr."""
         logger.info("Extracting test executions")
 
-        # Get test executions for the project
-        test_executions = list(self.zephyr_client.get_test_executions())
-
-        # Initialize batch tracking
         execution_tracker = EntityBatchTracker(
             self.zephyr_config.project_key, "test_executions", self.db,
         )
-        execution_tracker.initialize_batches(len(test_executions), self.batch_size)
-
-        # Process test executions in batches
-        for batch_idx, batch_start in enumerate(range(0, len(test_executions), self.batch_size)):
-            batch_end = min(batch_start + self.batch_size, len(test_executions))
-            batch = test_executions[batch_start:batch_end]
+        extracted_count = 0
 
+        # Stream test executions page by page and process them in batches
+        for batch_idx, batch in self._iter_tracked_batches(
+            self.zephyr_client.get_test_executions(), execution_tracker,
+        ):
             try:
                 # For each execution, fetch step results if they exist
                 for execution in batch:
@@ -593,8 +775,9 @@ class ZephyrToQTestMigration:
             except Exception as e:
                 execution_tracker.update_batch_status(batch_idx, 0, "failed", str(e))
                 logger.error(f"Failed to save test execution batch {batch_idx}: {e!s}")
+            extracted_count += len(batch)
 
-        logger.info(f"Extracted {len(test_executions)} test executions")
+        logger.info(f"Extracted {extracted_count} test executions")
 
     def _extract_execution_attachments(self, execution):
         """Extract attachments for a test execution."""
@@ -603,26 +786,7 @@ class ZephyrToQTestMigration:
 
         for attachment in execution.attachments:
             try:
-                # Download attachment
-                attachment_data = self.zephyr_client.download_attachment(attachment.id)
-
-                # Store in database
-                self.db.save_attachment(
-                    related_type="TestExecution",
-                    related_id=execution.id,
-                    name=attachment.filename,
-                    content=attachment_data,
-                    url=attachment.url,
-                )
-
-                # Optionally save to filesystem if attachments_dir is provided
-                if self.attachments_dir:
-                    attachment_path = (
-                        self.attachments_dir / f"exec_{execution.id}_{attachment.filename}"
-                    )
-                    attachment_path.parent.mkdir(parents=True, exist_ok=True)
-                    attachment_path.write_bytes(attachment_data)
-
+                self._extract_attachment("TestExecution", execution.id, attachment, "exec")
             except Exception as e:
                 logger.warning(
                     f"Failed to download attachment {attachment.id} for execution {execution.id}: {e!s}",
@@ -649,6 +813,7 @@ class ZephyrToQTestMigration:
             # Transform test executions
             self._transform_test_executions()
 
+            self._flush_writes()
             self.state.update_transformation_status("completed")
             logger.info(f"Transformation completed for project {self.zephyr_config.project_key}")
 
@@ -656,6 +821,8 @@ class ZephyrToQTestMigration:
             self.state.update_transformation_status("failed", str(e))
             logger.error(f"Transformation failed: {e!s}", exc_info=True)
             raise
+        finally:
+            self._flush_writes_on_exit()
 
     def _transform_project(self):
         """Transform project data from Zephyr to qTest format."""
@@ -710,9 +877,15 @@ class ZephyrToQTestMigration:
                 parent_id=parent_module_id,
             )
 
-            # Save transformed module to database
+            # Save transformed module to database, with the parent folder to load it after
+            parent_folder_id = folder.get("parentId")
             module_id = self.db.save_transformed_module(
-                self.zephyr_config.project_key, folder_id, module,
+                self.zephyr_config.project_key,
+                folder_id,
+                module,
+                references=(
+                    {"parent_source_id": parent_folder_id} if parent_folder_id is not None else {}
+                ),
             )
 
             # Process child folders recursively
@@ -753,11 +926,7 @@ class ZephyrToQTestMigration:
                     folder_id = test_case.get("folderId")
 
                     if folder_id:
-                        module_mapping = self.db.get_entity_mapping(
-                            self.zephyr_config.project_key, "folder_to_module", folder_id,
-                        )
-                        if module_mapping:
-                            module_id = module_mapping.get("target_id")
+                        module_id = self.mapping_index.get("folder_to_module", folder_id)
 
                     # Transform test steps
                     qtest_steps = []
@@ -795,12 +964,16 @@ class ZephyrToQTestMigration:
                     )
 
                     # Save transformed test case
-                    self.db.save_transformed_test_case(
-                        self.zephyr_config.project_key, test_case.get("id"), qtest_test_case,
+                    self._save_transformed(
+                        "test_case",
+                        test_case.get("id"),
+                        qtest_test_case,
+                        folder_source_id=folder_id,
                     )
 
                     transformed_batch.append(qtest_test_case)
 
+                self._flush_writes()
                 test_case_tracker.update_batch_status(batch_idx, len(batch), "completed")
             except Exception as e:
                 test_case_tracker.update_batch_status(batch_idx, 0, "failed", str(e))
@@ -854,11 +1027,7 @@ class ZephyrToQTestMigration:
                     folder_id = cycle.get("folderId")
 
                     if folder_id:
-                        folder_mapping = self.db.get_entity_mapping(
-                            self.zephyr_config.project_key, "folder_to_module", folder_id,
-                        )
-                        if folder_mapping:
-                            parent_id = folder_mapping.get("target_id")
+                        parent_id = self.mapping_index.get("folder_to_module", folder_id)
 
                     # Transform custom fields using the field mapper
                     qtest_custom_fields = self.field_mapper.map_testcycle_fields(cycle)
@@ -874,12 +1043,13 @@ class ZephyrToQTestMigration:
                     )
 
                     # Save transformed cycle
-                    self.db.save_transformed_test_cycle(
-                        self.zephyr_config.project_key, cycle.get("id"), qtest_cycle,
+                    self._save_transformed(
+                        "test_cycle", cycle.get("id"), qtest_cycle, folder_source_id=folder_id,
                     )
 
                     transformed_batch.append(qtest_cycle)
 
+                self._flush_writes()
                 cycle_tracker.update_batch_status(batch_idx, len(batch), "completed")
             except Exception as e:
                 cycle_tracker.update_batch_status(batch_idx, 0, "failed", str(e))
@@ -917,18 +1087,14 @@ class ZephyrToQTestMigration:
                     qtest_test_cycle_id = None
 
                     if test_case_id:
-                        case_mapping = self.db.get_entity_mapping(
-                            self.zephyr_config.project_key, "testcase_to_testcase", test_case_id,
+                        qtest_test_case_id = self.mapping_index.get(
+                            "testcase_to_testcase", test_case_id,
                         )
-                        if case_mapping:
-                            qtest_test_case_id = case_mapping.get("target_id")
 
                     if test_cycle_id:
-                        cycle_mapping = self.db.get_entity_mapping(
-                            self.zephyr_config.project_key, "cycle_to_cycle", test_cycle_id,
+                        qtest_test_cycle_id = self.mapping_index.get(
+                            "cycle_to_cycle", test_cycle_id,
                         )
-                        if cycle_mapping:
-                            qtest_test_cycle_id = cycle_mapping.get("target_id")
 
                     # Map the status to qTest format
                     qtest_status = self._map_status(execution.get("status", ""))
@@ -976,12 +1142,18 @@ class ZephyrToQTestMigration:
                     )
 
                     # Save transformed execution
-                    self.db.save_transformed_execution(
-                        self.zephyr_config.project_key, execution.get("id"), qtest_run, qtest_log,
+                    self._save_transformed(
+                        "execution",
+                        execution.get("id"),
+                        qtest_run,
+                        qtest_log,
+                        test_case_source_id=test_case_id,
+                        test_cycle_source_id=test_cycle_id,
                     )
 
                     transformed_batch.append((qtest_run, qtest_log))
 
+                self._flush_writes()
                 execution_tracker.update_batch_status(batch_idx, len(batch), "completed")
             except Exception as e:
                 execution_tracker.update_batch_status(batch_idx, 0, "failed", str(e))
@@ -1018,18 +1190,23 @@ class ZephyrToQTestMigration:
         try:
             # The project should already exist in qTest, so we don't create it
 
-            # Load modules (folders)
-            self._load_modules()
+            if self.pipelined_load:
+                # Load everything as one dependency graph
+                self._load_pipelined()
+            else:
+                # Load modules (folders)
+                self._load_modules()
 
-            # Load test cases
-            self._load_test_cases()
+                # Load test cases
+                self._load_test_cases()
 
-            # Load test cycles
-            self._load_test_cycles()
+                # Load test cycles
+                self._load_test_cycles()
 
-            # Load test runs and logs (executions)
-            self._load_test_executions()
+                # Load test runs and logs (executions)
+                self._load_test_executions()
 
+            self._flush_writes()
             self.state.update_loading_status("completed")
             logger.info(f"Loading completed for project {self.zephyr_config.project_key}")
 
@@ -1037,6 +1214,260 @@ class ZephyrToQTestMigration:
             self.state.update_loading_status("failed", str(e))
             logger.error(f"Loading failed: {e!s}", exc_info=True)
             raise
+        finally:
+            self._shutdown_load_executor()
+            self._flush_writes_on_exit()
+
+    def _get_load_executor(self) -> AdaptiveExecutor:
+        """Get the worker pool shared by all load batches, creating it on first use."""
+        if self._load_executor is None:
+            self._load_executor = AdaptiveExecutor(
+                self.load_concurrency, thread_name_prefix="ztoq-load",
+            )
+        return self._load_executor
+
+    def _shutdown_load_executor(self):
+        """Shut down the load worker pool and log how concurrency evolved."""
+        if self._load_executor is None:
+            return
+        self._load_executor.shutdown()
+        self._load_executor = None
+        stats = self.load_concurrency.stats
+        logger.info(
+            f"Load concurrency: final limit {self.load_concurrency.limit}, "
+            f"peak {stats['peak_limit']}, {stats['backoffs']} backoffs "
+            f"from {stats['overloads']} overload signals",
+        )
+
+    def _load_pipelined(self):
+        """
+        Load modules, test cases, test cycles and executions as one dependency graph.
+
+        Every record is created as soon as the records it depends on exist in qTest,
+        on the shared load pool. Records can name the source entities they depend on:
+        ``parent_source_id`` on modules, ``folder_source_id`` on test cases and cycles,
+        and ``test_case_source_id``/``test_cycle_source_id`` on executions. The qTest
+        ids of those entities are filled in when the record is loaded. Records without
+        references keep the ordering of the phased load - a module waits for the
+        previous level, test cases and cycles for all modules, and executions for all
+        test cases and cycles.
+        """
+        logger.info("Loading transformed data into qTest as a dependency graph")
+        project_key = self.zephyr_config.project_key
+        scheduler = DependencyScheduler(self._get_load_executor())
+
+        # Batch tracking per entity group: key -> (group, batch index)
+        batch_of: dict[tuple, tuple[str, int]] = {}
+        batch_remaining: dict[tuple[str, int], int] = defaultdict(int)
+        batch_created: dict[tuple[str, int], int] = defaultdict(int)
+        trackers: dict[str, EntityBatchTracker] = {}
+
+        def track(group: str, keys: list[tuple]):
+            trackers[group] = EntityBatchTracker(project_key, group, self.db)
+            trackers[group].initialize_batches(len(keys), self.batch_size)
+            for index, key in enumerate(keys):
+                batch = (group, index // self.batch_size)
+                batch_of[key] = batch
+                batch_remaining[batch] += 1
+
+        # Modules, level by level in the graph but not in time
+        module_keys = []
+        previous_level = None
+        for level, modules in enumerate(
+            self.db.get_transformed_modules_by_level(project_key),
+        ):
+            level_keys = []
+            for module_data in modules:
+                key = ("module", module_data.get("source_id"))
+                parent_ref = module_data.get("parent_source_id")
+                if parent_ref is not None:
+                    dependencies = self._scheduled(scheduler, "module", parent_ref)
+                else:
+                    dependencies = [previous_level] if previous_level else []
+                scheduler.add(
+                    key,
+                    self._pipelined_module_task(
+                        module_data.get("source_id"), module_data.get("module"), parent_ref,
+                    ),
+                    dependencies,
+                )
+                level_keys.append(key)
+            track(f"loaded_modules_level_{level}", level_keys)
+            previous_level = group_dependencies(
+                scheduler, ("barrier", "modules", level), level_keys,
+            )
+            module_keys.extend(level_keys)
+        all_modules = group_dependencies(scheduler, ("barrier", "modules", "all"), module_keys)
+
+        # Test cases and cycles wait only for the module they belong to
+        group_keys = {}
+        for kind, records, record_key, group in (
+            (
+                "test_case",
+                self.db.get_transformed_test_cases(project_key),
+                "test_case",
+                "loaded_test_cases",
+            ),
+            (
+                "test_cycle",
+                self.db.get_transformed_test_cycles(project_key),
+                "test_cycle",
+                "loaded_test_cycles",
+            ),
+        ):
+            keys = []
+            for record in records:
+                key = (kind, record.get("source_id"))
+                folder_ref = record.get("folder_source_id")
+                dependencies = (
+                    self._scheduled(scheduler, "module", folder_ref)
+                    if folder_ref is not None
+                    else [all_modules]
+                )
+                scheduler.add(
+                    key,
+                    self._pipelined_record_task(
+                        kind, record.get("source_id"), record.get(record_key), folder_ref,
+                    ),
+                    dependencies,
+                )
+                keys.append(key)
+            track(group, keys)
+            group_keys[kind] = group_dependencies(scheduler, ("barrier", kind), keys)
+
+        # Executions stream in behind the test cases and cycles they reference
+        execution_keys = []
+        for execution_data in self.db.get_transformed_executions(project_key):
+            key = ("execution", execution_data.get("source_id"))
+            case_ref = execution_data.get("test_case_source_id")
+            cycle_ref = execution_data.get("test_cycle_source_id")
+            dependencies = (
+                self._scheduled(scheduler, "test_case", case_ref)
+                if case_ref is not None
+                else [group_keys["test_case"]]
+            ) + (
+                self._scheduled(scheduler, "test_cycle", cycle_ref)
+                if cycle_ref is not None
+                else [group_keys["test_cycle"]]
+            )
+            scheduler.add(
+                key,
+                self._pipelined_execution_task(execution_data, case_ref, cycle_ref),
+                dependencies,
+            )
+            execution_keys.append(key)
+        track("loaded_test_executions", execution_keys)
+
+        mapping_types = {
+            "module": "folder_to_module",
+            "test_case": "testcase_to_testcase",
+            "test_cycle": "cycle_to_cycle",
+            "execution": "execution_to_run",
+        }
+
+        def on_complete(outcome: TaskOutcome):
+            kind, source_id = outcome.key[0], outcome.key[1]
+            if kind == "barrier":
+                return
+
+            batch = batch_of[outcome.key]
+            if outcome.succeeded and outcome.result:
+                self._save_entity_mapping(mapping_types[kind], source_id, outcome.result)
+                batch_created[batch] += 1
+            elif not outcome.succeeded:
+                logger.error(f"Failed to load {kind} {source_id}: {outcome.error}")
+
+            batch_remaining[batch] -= 1
+            if batch_remaining[batch] == 0:
+                group, batch_idx = batch
+                self._flush_writes()
+                trackers[group].update_batch_status(batch_idx, batch_created[batch], "completed")
+
+        outcomes = scheduler.run(on_complete)
+        failed = sum(
+            1 for key, outcome in outcomes.items() if key[0] != "barrier" and not outcome.succeeded
+        )
+        logger.info(f"Pipelined loading completed, {failed} records failed or were skipped")
+
+    @staticmethod
+    def _scheduled(scheduler, kind, source_ref):
+        """Dependency list for a referenced record, empty if it was loaded in an earlier run."""
+        key = (kind, source_ref)
+        return [key] if key in scheduler else []
+
+    def _resolve_reference(self, results, kind, mapping_type, source_ref):
+        """Get the qTest id of a referenced record from this run or an earlier one."""
+        if source_ref is None:
+            return None
+        key = (kind, source_ref)
+        if key in results:
+            return results[key]
+        return self.mapping_index.get(mapping_type, source_ref)
+
+    def _pipelined_module_task(self, source_id, module_data, parent_ref):
+        """Build the task creating one module once its parent exists."""
+
+        def create(results):
+            module = dict(module_data)
+            parent_id = self._resolve_reference(results, "module", "folder_to_module", parent_ref)
+            if parent_id is not None:
+                module["parent_id"] = parent_id
+            qtest_module = self._create_module_in_qtest(source_id, module)
+            if not qtest_module or not qtest_module.id:
+                raise ValueError(f"qTest returned no module for folder {source_id}")
+            return qtest_module.id
+
+        return create
+
+    def _pipelined_record_task(self, kind, source_id, record_data, folder_ref):
+        """Build the task creating one test case or test cycle once its module exists."""
+
+        def create(results):
+            record = dict(record_data)
+            module_id = self._resolve_reference(results, "module", "folder_to_module", folder_ref)
+            if kind == "test_case":
+                if module_id is not None:
+                    record["module_id"] = module_id
+                test_case = self._create_test_case_in_qtest(source_id, record)
+                if not test_case or not test_case.id:
+                    raise ValueError(f"qTest returned no test case for {source_id}")
+                self._upload_test_case_attachments(source_id, test_case.id)
+                return test_case.id
+
+            if module_id is not None:
+                record["parent_id"] = module_id
+            cycle = self._create_test_cycle_in_qtest(source_id, record)
+            if not cycle or not cycle.id:
+                raise ValueError(f"qTest returned no test cycle for {source_id}")
+            return cycle.id
+
+        return create
+
+    def _pipelined_execution_task(self, execution_data, case_ref, cycle_ref):
+        """Build the task creating one test run and log once its case and cycle exist."""
+        source_id = execution_data.get("source_id")
+
+        def create(results):
+            test_run = dict(execution_data.get("test_run") or {})
+            test_case_id = self._resolve_reference(
+                results, "test_case", "testcase_to_testcase", case_ref,
+            )
+            if test_case_id is not None:
+                test_run["test_case_id"] = test_case_id
+            test_cycle_id = self._resolve_reference(
+                results, "test_cycle", "cycle_to_cycle", cycle_ref,
+            )
+            if test_cycle_id is not None:
+                test_run["test_cycle_id"] = test_cycle_id
+
+            run_id = self._create_execution_in_qtest(
+                source_id, test_run, execution_data.get("test_log"),
+            )
+            if run_id:
+                self._upload_execution_attachments(source_id, run_id)
+            return run_id
+
+        return create
 
     def _load_modules(self):
         """Load modules (transformed folders) into qTest."""
@@ -1062,41 +1493,38 @@ class ZephyrToQTestMigration:
 
                 created_count = 0
                 try:
-                    # Use ThreadPoolExecutor for parallel processing
-                    with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                        futures = []
+                    # Submit to the shared load pool
+                    executor = self._get_load_executor()
+                    futures = []
 
-                        for module_data in batch:
-                            source_id = module_data.get("source_id")
-                            module = module_data.get("module")
+                    for module_data in batch:
+                        source_id = module_data.get("source_id")
+                        module = module_data.get("module")
 
-                            # Submit module creation task
-                            future = executor.submit(
-                                self._create_module_in_qtest, source_id, module,
-                            )
-                            futures.append((source_id, future))
-
-                        # Process results
-                        for source_id, future in futures:
-                            try:
-                                # Get result (will raise exception if task failed)
-                                qtest_module = future.result()
-
-                                # Update mapping
-                                if qtest_module and qtest_module.id:
-                                    self.entity_mappings["folders"][source_id] = qtest_module.id
-                                    self.db.save_entity_mapping(
-                                        self.zephyr_config.project_key,
-                                        "folder_to_module",
-                                        source_id,
-                                        qtest_module.id,
-                                    )
-                                    created_count += 1
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to create module for folder {source_id}: {e!s}",
+                        # Submit module creation task
+                        future = executor.submit(
+                            self._create_module_in_qtest, source_id, module,
+                        )
+                        futures.append((source_id, future))
+
+                    # Process results
+                    for source_id, future in futures:
+                        try:
+                            # Get result (will raise exception if task failed)
+                            qtest_module = future.result()
+
+                            # Update mapping
+                            if qtest_module and qtest_module.id:
+                                self._save_entity_mapping(
+                                    "folder_to_module", source_id, qtest_module.id,
                                 )
+                                created_count += 1
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to create module for folder {source_id}: {e!s}",
+                            )
 
+                    self._flush_writes()
                     module_tracker.update_batch_status(batch_idx, created_count, "completed")
                 except Exception as e:
                     module_tracker.update_batch_status(batch_idx, created_count, "failed", str(e))
@@ -1141,44 +1569,45 @@ class ZephyrToQTestMigration:
             batch_end = min(batch_start + self.batch_size, len(test_cases))
             batch = test_cases[batch_start:batch_end]
 
+            if self.bulk_chunk_size:
+                self._load_test_case_batch_in_bulk(batch_idx, batch, test_case_tracker)
+                continue
+
             created_count = 0
             try:
-                # Use ThreadPoolExecutor for parallel processing
-                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                    futures = []
+                # Submit to the shared load pool
+                executor = self._get_load_executor()
+                futures = []
 
-                    for test_case_data in batch:
-                        source_id = test_case_data.get("source_id")
-                        test_case = test_case_data.get("test_case")
+                for test_case_data in batch:
+                    source_id = test_case_data.get("source_id")
+                    test_case = test_case_data.get("test_case")
 
-                        # Submit test case creation task
-                        future = executor.submit(
-                            self._create_test_case_in_qtest, source_id, test_case,
-                        )
-                        futures.append((source_id, future))
+                    # Submit test case creation task
+                    future = executor.submit(
+                        self._create_test_case_in_qtest, source_id, test_case,
+                    )
+                    futures.append((source_id, future))
 
-                    # Process results
-                    for source_id, future in futures:
-                        try:
-                            # Get result (will raise exception if task failed)
-                            qtest_test_case = future.result()
+                # Process results
+                for source_id, future in futures:
+                    try:
+                        # Get result (will raise exception if task failed)
+                        qtest_test_case = future.result()
 
-                            # Update mapping
-                            if qtest_test_case and qtest_test_case.id:
-                                self.entity_mappings["test_cases"][source_id] = qtest_test_case.id
-                                self.db.save_entity_mapping(
-                                    self.zephyr_config.project_key,
-                                    "testcase_to_testcase",
-                                    source_id,
-                                    qtest_test_case.id,
-                                )
-                                created_count += 1
+                        # Update mapping
+                        if qtest_test_case and qtest_test_case.id:
+                            self._save_entity_mapping(
+                                "testcase_to_testcase", source_id, qtest_test_case.id,
+                            )
+                            created_count += 1
 
-                                # Upload attachments if any
-                                self._upload_test_case_attachments(source_id, qtest_test_case.id)
-                        except Exception as e:
-                            logger.error(f"Failed to create test case {source_id}: {e!s}")
+                            # Upload attachments if any
+                            self._upload_test_case_attachments(source_id, qtest_test_case.id)
+                    except Exception as e:
+                        logger.error(f"Failed to create test case {source_id}: {e!s}")
 
+                self._flush_writes()
                 test_case_tracker.update_batch_status(batch_idx, created_count, "completed")
             except Exception as e:
                 test_case_tracker.update_batch_status(batch_idx, created_count, "failed", str(e))
@@ -1186,10 +1615,70 @@ class ZephyrToQTestMigration:
 
         logger.info("Test cases loading completed")
 
-    def _create_test_case_in_qtest(self, source_id, test_case_data):
-        """Create a test case in qTest."""
-        # Create QTestTestCase object from data
-        test_case = QTestTestCase(
+    def _load_test_case_batch_in_bulk(self, batch_idx, batch, tracker):
+        """
+        Load a batch of test cases through chunked qTest bulk requests.
+
+        Chunks are submitted concurrently and failing chunks are bisected by the
+        client, so every record gets its own result. The mappings of all created
+        test cases are then saved in a single database call.
+        """
+        source_ids = [test_case_data.get("source_id") for test_case_data in batch]
+        test_cases = [
+            self._build_qtest_test_case(test_case_data.get("test_case"))
+            for test_case_data in batch
+        ]
+
+        try:
+            results = self.qtest_client.bulk_create_test_cases_chunked(
+                test_cases,
+                chunk_size=self.bulk_chunk_size,
+                max_workers=self.load_concurrency.limit,
+            )
+        except Exception as e:
+            tracker.update_batch_status(batch_idx, 0, "failed", str(e))
+            logger.error(f"Failed to process test case batch {batch_idx}: {e!s}")
+            return
+
+        mappings = []
+        for result in results:
+            source_id = source_ids[result.index]
+            if result.succeeded and result.test_case.id:
+                mappings.append({"source_id": source_id, "target_id": result.test_case.id})
+                self._record_qtest_link(
+                    "testcase_module",
+                    result.test_case.id,
+                    getattr(result.test_case, "module_id", None),
+                    test_cases[result.index].module_id,
+                )
+            else:
+                logger.error(f"Failed to create test case {source_id}: {result.error}")
+
+        if mappings:
+            self.mapping_index.put_many("testcase_to_testcase", mappings)
+            self.db.save_entity_mappings(
+                self.zephyr_config.project_key, "testcase_to_testcase", mappings,
+            )
+            self._flush_writes()
+
+        # Upload attachments once the mappings are durable
+        for mapping in mappings:
+            self._upload_test_case_attachments(mapping["source_id"], mapping["target_id"])
+
+        failed_count = len(batch) - len(mappings)
+        if failed_count:
+            tracker.update_batch_status(
+                batch_idx,
+                len(mappings),
+                "failed",
+                f"{failed_count} of {len(batch)} test cases failed to load",
+            )
+        else:
+            tracker.update_batch_status(batch_idx, len(mappings), "completed")
+
+    def _build_qtest_test_case(self, test_case_data):
+        """Build a QTestTestCase from transformed test case data."""
+        return QTestTestCase(
             name=test_case_data.get("name", ""),
             description=test_case_data.get("description", ""),
             precondition=test_case_data.get("precondition", ""),
@@ -1199,10 +1688,22 @@ class ZephyrToQTestMigration:
             priority_id=test_case_data.get("priority_id"),
         )
 
+    def _create_test_case_in_qtest(self, source_id, test_case_data):
+        """Create a test case in qTest."""
+        # Create QTestTestCase object from data
+        test_case = self._build_qtest_test_case(test_case_data)
+
         # Create in qTest
         try:
             created_test_case = self.qtest_client.create_test_case(test_case)
             logger.debug(f"Created test case {created_test_case.id} for source case {source_id}")
+            if created_test_case and created_test_case.id:
+                self._record_qtest_link(
+                    "testcase_module",
+                    created_test_case.id,
+                    getattr(created_test_case, "module_id", None),
+                    test_case.module_id,
+                )
             return created_test_case
         except Exception as e:
             logger.error(f"Error creating test case for source {source_id}: {e!s}")
@@ -1216,30 +1717,58 @@ class ZephyrToQTestMigration:
 
         for attachment in attachments:
             try:
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=f"_{attachment['name']}",
-                ) as tmp:
-                    tmp.write(attachment["content"])
-                    tmp_path = tmp.name
-
-                # Upload to qTest
-                try:
-                    self.qtest_client.upload_attachment(
-                        object_type="test-cases", object_id=qtest_test_case_id, file_path=tmp_path,
-                    )
-                    logger.debug(
-                        f"Uploaded attachment {attachment['name']} for test case {qtest_test_case_id}",
-                    )
-                finally:
-                    # Clean up temporary file
-                    os.unlink(tmp_path)
-
+                self._upload_attachment("test-cases", qtest_test_case_id, attachment)
+                logger.debug(
+                    f"Uploaded attachment {attachment['name']} for test case {qtest_test_case_id}",
+                )
             except Exception as e:
                 logger.warning(
                     f"Failed to upload attachment {attachment['name']} for test case {qtest_test_case_id}: {e!s}",
                 )
 
+    def _upload_attachment(self, object_type, object_id, attachment):
+        """
+        Upload one stored attachment to a qTest object.
+
+        Spooled attachments are uploaded straight from the spool; attachments whose
+        content is stored in the database are written to a temporary file first.
+        """
+        storage_ref = attachment.get("storage_ref")
+        if storage_ref and self.attachment_spool is not None:
+            name = attachment["name"]
+            if not self.attachment_dedup.claim_upload(storage_ref, object_type, object_id, name):
+                logger.debug(
+                    f"Skipping duplicate upload of {name} to {object_type}/{object_id}",
+                )
+                return
+            try:
+                self.qtest_client.upload_attachment(
+                    object_type=object_type,
+                    object_id=object_id,
+                    file_path=self.attachment_spool.path_for(storage_ref),
+                    custom_filename=name,
+                )
+            except Exception:
+                self.attachment_dedup.release_upload(storage_ref, object_type, object_id, name)
+                raise
+            return
+
+        # Create temporary file
+        with tempfile.NamedTemporaryFile(
+            delete=False, suffix=f"_{attachment['name']}",
+        ) as tmp:
+            tmp.write(attachment["content"])
+            tmp_path = tmp.name
+
+        # Upload to qTest
+        try:
+            self.qtest_client.upload_attachment(
+                object_type=object_type, object_id=object_id, file_path=tmp_path,
+            )
+        finally:
+            # Clean up temporary file
+            os.unlink(tmp_path)
+
     def _load_test_cycles(self):
         """Load test cycles into qTest."""
         logger.info("Loading test cycles into qTest")
@@ -1260,37 +1789,32 @@ class ZephyrToQTestMigration:
 
             created_count = 0
             try:
-                # Use ThreadPoolExecutor for parallel processing
-                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                    futures = []
+                # Submit to the shared load pool
+                executor = self._get_load_executor()
+                futures = []
 
-                    for cycle_data in batch:
-                        source_id = cycle_data.get("source_id")
-                        cycle = cycle_data.get("test_cycle")
+                for cycle_data in batch:
+                    source_id = cycle_data.get("source_id")
+                    cycle = cycle_data.get("test_cycle")
 
-                        # Submit cycle creation task
-                        future = executor.submit(self._create_test_cycle_in_qtest, source_id, cycle)
-                        futures.append((source_id, future))
+                    # Submit cycle creation task
+                    future = executor.submit(self._create_test_cycle_in_qtest, source_id, cycle)
+                    futures.append((source_id, future))
 
-                    # Process results
-                    for source_id, future in futures:
-                        try:
-                            # Get result (will raise exception if task failed)
-                            qtest_cycle = future.result()
+                # Process results
+                for source_id, future in futures:
+                    try:
+                        # Get result (will raise exception if task failed)
+                        qtest_cycle = future.result()
 
-                            # Update mapping
-                            if qtest_cycle and qtest_cycle.id:
-                                self.entity_mappings["test_cycles"][source_id] = qtest_cycle.id
-                                self.db.save_entity_mapping(
-                                    self.zephyr_config.project_key,
-                                    "cycle_to_cycle",
-                                    source_id,
-                                    qtest_cycle.id,
-                                )
-                                created_count += 1
-                        except Exception as e:
-                            logger.error(f"Failed to create test cycle {source_id}: {e!s}")
+                        # Update mapping
+                        if qtest_cycle and qtest_cycle.id:
+                            self._save_entity_mapping("cycle_to_cycle", source_id, qtest_cycle.id)
+                            created_count += 1
+                    except Exception as e:
+                        logger.error(f"Failed to create test cycle {source_id}: {e!s}")
 
+                self._flush_writes()
                 cycle_tracker.update_batch_status(batch_idx, created_count, "completed")
             except Exception as e:
                 cycle_tracker.update_batch_status(batch_idx, created_count, "failed", str(e))
@@ -1341,43 +1865,38 @@ class ZephyrToQTestMigration:
 
             created_count = 0
             try:
-                # Use ThreadPoolExecutor for parallel processing
-                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                    futures = []
-
-                    for execution_data in batch:
-                        source_id = execution_data.get("source_id")
-                        test_run = execution_data.get("test_run")
-                        test_log = execution_data.get("test_log")
+                # Submit to the shared load pool
+                executor = self._get_load_executor()
+                futures = []
+
+                for execution_data in batch:
+                    source_id = execution_data.get("source_id")
+                    test_run = execution_data.get("test_run")
+                    test_log = execution_data.get("test_log")
+
+                    # Submit test run and log creation task
+                    future = executor.submit(
+                        self._create_execution_in_qtest, source_id, test_run, test_log,
+                    )
+                    futures.append((source_id, future))
 
-                        # Submit test run and log creation task
-                        future = executor.submit(
-                            self._create_execution_in_qtest, source_id, test_run, test_log,
-                        )
-                        futures.append((source_id, future))
+                # Process results
+                for source_id, future in futures:
+                    try:
+                        # Get result (will raise exception if task failed)
+                        qtest_run_id = future.result()
 
-                    # Process results
-                    for source_id, future in futures:
-                        try:
-                            # Get result (will raise exception if task failed)
-                            qtest_run_id = future.result()
+                        # Update mapping
+                        if qtest_run_id:
+                            self._save_entity_mapping("execution_to_run", source_id, qtest_run_id)
+                            created_count += 1
 
-                            # Update mapping
-                            if qtest_run_id:
-                                self.entity_mappings["test_executions"][source_id] = qtest_run_id
-                                self.db.save_entity_mapping(
-                                    self.zephyr_config.project_key,
-                                    "execution_to_run",
-                                    source_id,
-                                    qtest_run_id,
-                                )
-                                created_count += 1
-
-                                # Upload attachments if any
-                                self._upload_execution_attachments(source_id, qtest_run_id)
-                        except Exception as e:
-                            logger.error(f"Failed to create test execution {source_id}: {e!s}")
+                            # Upload attachments if any
+                            self._upload_execution_attachments(source_id, qtest_run_id)
+                    except Exception as e:
+                        logger.error(f"Failed to create test execution {source_id}: {e!s}")
 
+                self._flush_writes()
                 execution_tracker.update_batch_status(batch_idx, created_count, "completed")
             except Exception as e:
                 execution_tracker.update_batch_status(batch_idx, created_count, "failed", str(e))
@@ -1404,6 +1923,19 @@ class ZephyrToQTestMigration:
 
             created_run = self.qtest_client.create_test_run(test_run)
             run_id = created_run.id
+            if run_id:
+                self._record_qtest_link(
+                    "run_testcase",
+                    run_id,
+                    getattr(created_run, "test_case_id", None),
+                    test_run.test_case_id,
+                )
+                self._record_qtest_link(
+                    "run_cycle",
+                    run_id,
+                    getattr(created_run, "test_cycle_id", None),
+                    test_run.test_cycle_id,
+                )
 
             # Submit test log
             if test_log_data:
@@ -1430,25 +1962,10 @@ class ZephyrToQTestMigration:
 
         for attachment in attachments:
             try:
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=f"_{attachment['name']}",
-                ) as tmp:
-                    tmp.write(attachment["content"])
-                    tmp_path = tmp.name
-
-                # Upload to qTest
-                try:
-                    self.qtest_client.upload_attachment(
-                        object_type="test-runs", object_id=qtest_run_id, file_path=tmp_path,
-                    )
-                    logger.debug(
-                        f"Uploaded attachment {attachment['name']} for test run {qtest_run_id}",
-                    )
-                finally:
-                    # Clean up temporary file
-                    os.unlink(tmp_path)
-
+                self._upload_attachment("test-runs", qtest_run_id, attachment)
+                logger.debug(
+                    f"Uploaded attachment {attachment['name']} for test run {qtest_run_id}",
+                )
             except Exception as e:
                 logger.warning(
                     f"Failed to upload attachment {attachment['name']} for test run {qtest_run_id}: {e!s}",
@@ -1776,11 +2293,7 @@ class ZephyrToQTestMigration:
             folder_id = test_case.get("folderId")
 
             if folder_id:
-                module_mapping = self.db.get_entity_mapping(
-                    self.zephyr_config.project_key, "folder_to_module", folder_id,
-                )
-                if module_mapping:
-                    module_id = module_mapping.get("target_id")
+                module_id = self.mapping_index.get("folder_to_module", folder_id)
 
             # Transform test steps
             qtest_steps = []
@@ -1820,12 +2333,13 @@ class ZephyrToQTestMigration:
             # Save mapping between source and transformed entity
             source_id = test_case.get("id")
             if source_id:
-                self.db.save_transformed_test_case(
-                    self.zephyr_config.project_key, source_id, qtest_test_case,
+                self._save_transformed(
+                    "test_case", source_id, qtest_test_case, folder_source_id=folder_id,
                 )
 
             transformed_batch.append(qtest_test_case)
 
+        self._flush_writes()
         logger.info(f"Transformed {len(transformed_batch)} test cases")
         return transformed_batch
 
@@ -1849,11 +2363,7 @@ class ZephyrToQTestMigration:
             folder_id = cycle.get("folderId")
 
             if folder_id:
-                folder_mapping = self.db.get_entity_mapping(
-                    self.zephyr_config.project_key, "folder_to_module", folder_id,
-                )
-                if folder_mapping:
-                    parent_id = folder_mapping.get("target_id")
+                parent_id = self.mapping_index.get("folder_to_module", folder_id)
 
             # Transform custom fields using the field mapper
             qtest_custom_fields = self.field_mapper.map_testcycle_fields(cycle)
@@ -1871,12 +2381,13 @@ class ZephyrToQTestMigration:
             # Save mapping between source and transformed entity
             source_id = cycle.get("id")
             if source_id:
-                self.db.save_transformed_test_cycle(
-                    self.zephyr_config.project_key, source_id, qtest_cycle,
+                self._save_transformed(
+                    "test_cycle", source_id, qtest_cycle, folder_source_id=folder_id,
                 )
 
             transformed_batch.append(qtest_cycle)
 
+        self._flush_writes()
         logger.info(f"Transformed {len(transformed_batch)} test cycles")
         return transformed_batch
 
@@ -1903,18 +2414,10 @@ class ZephyrToQTestMigration:
             qtest_test_cycle_id = None
 
             if test_case_id:
-                case_mapping = self.db.get_entity_mapping(
-                    self.zephyr_config.project_key, "testcase_to_testcase", test_case_id,
-                )
-                if case_mapping:
-                    qtest_test_case_id = case_mapping.get("target_id")
+                qtest_test_case_id = self.mapping_index.get("testcase_to_testcase", test_case_id)
 
             if test_cycle_id:
-                cycle_mapping = self.db.get_entity_mapping(
-                    self.zephyr_config.project_key, "cycle_to_cycle", test_cycle_id,
-                )
-                if cycle_mapping:
-                    qtest_test_cycle_id = cycle_mapping.get("target_id")
+                qtest_test_cycle_id = self.mapping_index.get("cycle_to_cycle", test_cycle_id)
 
             # Map the status to qTest format
             qtest_status = self._map_status(execution.get("status", ""))
@@ -1959,12 +2462,18 @@ class ZephyrToQTestMigration:
             # Save mapping between source and transformed entity
             source_id = execution.get("id")
             if source_id:
-                self.db.save_transformed_execution(
-                    self.zephyr_config.project_key, source_id, qtest_run, qtest_log,
+                self._save_transformed(
+                    "execution",
+                    source_id,
+                    qtest_run,
+                    qtest_log,
+                    test_case_source_id=test_case_id,
+                    test_cycle_source_id=test_cycle_id,
                 )
 
             transformed_batch.append((qtest_run, qtest_log))
 
+        self._flush_writes()
         logger.info(f"Transformed {len(transformed_batch)} test executions")
         return transformed_batch
 
@@ -1977,6 +2486,8 @@ def create_migration(
     max_workers: int = 5,
     attachments_dir: Path | None = None,
     enable_validation: bool = True,
+    bulk_chunk_size: int | None = None,
+    write_buffer_size: int | None = None,
 ) -> ZephyrToQTestMigration:
     """
     Factory function to create a migration instance with optional validation enhancement.
@@ -1989,6 +2500,9 @@ def create_migration(
         max_workers: Maximum number of concurrent workers
         attachments_dir: Optional directory for attachment storage
         enable_validation: Whether to enable enhanced validation
+        bulk_chunk_size: Optional number of test cases per qTest bulk request
+        write_buffer_size: Optional number of mappings and transformed entities
+            buffered before they are written in bulk
 
     Returns:
         ZephyrToQTestMigration or EnhancedMigration: A migration instance
@@ -2003,6 +2517,8 @@ def create_migration(
         max_workers=max_workers,
         attachments_dir=attachments_dir,
         enable_validation=enable_validation,
+        bulk_chunk_size=bulk_chunk_size,
+        write_buffer_size=write_buffer_size,
     )
 
     # Enhance with validation if enabled
@@ -45,6 +45,7 @@ from ztoq.models import (
     Folder as FolderModel,
     Project as ProjectModel,
 )
+from ztoq.pg_bulk_ingest import ingest_entities
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -158,6 +159,10 @@ class OptimizedDatabaseManager(SQLDatabaseManager):
         if not test_cases:
             return
 
+        if self._uses_postgresql():
+            self._copy_test_cases(test_cases, project_key)
+            return
+
         # Process in smaller batches to avoid transaction size issues
         batch_size = 100
 
@@ -165,6 +170,27 @@ class OptimizedDatabaseManager(SQLDatabaseManager):
             batch = test_cases[i : i + batch_size]
             self._save_test_case_batch(batch, project_key)
 
+    def _uses_postgresql(self) -> bool:
+        """Whether the engine is PostgreSQL, so COPY ingestion can be used."""
+        dialect = getattr(self.engine, "dialect", None)
+        return getattr(dialect, "name", None) == "postgresql"
+
+    def _copy_test_cases(self, test_cases: list[CaseModel], project_key: str) -> None:
+        """
+        Save test cases and their steps, custom fields and labels with COPY.
+
+        Args:
+            test_cases: Test case models
+            project_key: Project key
+
+        """
+        connection = self.engine.raw_connection()
+        try:
+            counts = ingest_entities(connection, "test_cases", test_cases, project_key)
+        finally:
+            connection.close()
+        logger.debug(f"Copied test cases for {project_key}: {counts}")
+
     def _save_test_case_batch(self, test_cases: list[CaseModel], project_key: str) -> None:
         """
         Save a batch of test cases.
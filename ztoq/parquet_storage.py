@@ -0,0 +1,548 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+Columnar Parquet storage for exported Zephyr Scale data.
+
+ParquetStorage writes test cases, test cycles, test executions and custom field
+values as Parquet datasets partitioned by project key, one directory per entity
+type. Test steps stay nested as list<struct> columns, so analytics jobs can scan
+single columns with pandas or any Arrow-based engine instead of parsing rows out
+of SQLite or JSON.
+"""
+
+import importlib.util
+import json
+import logging
+import threading
+import uuid
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ztoq.models import (
+    Environment,
+    Folder,
+    Priority,
+    Status,
+    TestCase,
+    TestCycleInfo,
+    TestExecution,
+    TestPlan,
+)
+
+# pyarrow is optional; it is only needed for Parquet output and is imported on first
+# use so that importing the exporter does not load it
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+logger = logging.getLogger(__name__)
+
+PARTITION_COLUMN = "project_key"
+
+# Rows buffered per entity type before a file is written; bounds export memory while
+# keeping files large enough for efficient columnar reads
+DEFAULT_ROWS_PER_FILE = 10_000
+
+
+def _build_schemas(pa: Any) -> dict[str, Any]:
+    """Build the Arrow schemas of the entity datasets."""
+    timestamp = pa.timestamp("us", tz="UTC")
+    step = pa.struct(
+        [
+            ("id", pa.string()),
+            ("index", pa.int32()),
+            ("description", pa.string()),
+            ("expected_result", pa.string()),
+            ("data", pa.string()),
+            ("actual_result", pa.string()),
+            ("status", pa.string()),
+        ],
+    )
+    audit_fields = [
+        ("created_on", timestamp),
+        ("created_by", pa.string()),
+        ("updated_on", timestamp),
+        ("updated_by", pa.string()),
+    ]
+
+    return {
+        "test_cases": pa.schema(
+            [
+                ("id", pa.string()),
+                ("key", pa.string()),
+                ("name", pa.string()),
+                ("objective", pa.string()),
+                ("precondition", pa.string()),
+                ("description", pa.string()),
+                ("status", pa.string()),
+                ("priority_id", pa.string()),
+                ("priority_name", pa.string()),
+                ("folder", pa.string()),
+                ("folder_name", pa.string()),
+                ("owner", pa.string()),
+                ("owner_name", pa.string()),
+                ("component", pa.string()),
+                ("component_name", pa.string()),
+                *audit_fields,
+                ("version", pa.string()),
+                ("estimated_time", pa.int64()),
+                ("labels", pa.list_(pa.string())),
+                ("steps", pa.list_(step)),
+                (PARTITION_COLUMN, pa.string()),
+            ],
+        ),
+        "test_cycles": pa.schema(
+            [
+                ("id", pa.string()),
+                ("key", pa.string()),
+                ("name", pa.string()),
+                ("description", pa.string()),
+                ("status", pa.string()),
+                ("status_name", pa.string()),
+                ("folder", pa.string()),
+                ("folder_name", pa.string()),
+                ("owner", pa.string()),
+                ("owner_name", pa.string()),
+                *audit_fields,
+                (PARTITION_COLUMN, pa.string()),
+            ],
+        ),
+        "test_executions": pa.schema(
+            [
+                ("id", pa.string()),
+                ("test_case_key", pa.string()),
+                ("cycle_id", pa.string()),
+                ("cycle_name", pa.string()),
+                ("status", pa.string()),
+                ("status_name", pa.string()),
+                ("environment", pa.string()),
+                ("environment_name", pa.string()),
+                ("executed_by", pa.string()),
+                ("executed_by_name", pa.string()),
+                ("executed_on", timestamp),
+                *audit_fields,
+                ("actual_time", pa.int64()),
+                ("comment", pa.string()),
+                ("steps", pa.list_(step)),
+                (PARTITION_COLUMN, pa.string()),
+            ],
+        ),
+        "custom_field_values": pa.schema(
+            [
+                ("entity_type", pa.string()),
+                ("entity_id", pa.string()),
+                ("field_id", pa.string()),
+                ("field_name", pa.string()),
+                ("field_type", pa.string()),
+                # Values are typed per field, so they are stored JSON-encoded
+                ("value", pa.string()),
+                (PARTITION_COLUMN, pa.string()),
+            ],
+        ),
+    }
+
+
+def _utc(value: datetime | None) -> datetime | None:
+    """Normalize a datetime to UTC (naive values are taken as UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _step_rows(steps: Iterable[Any]) -> list[dict[str, Any]]:
+    """Convert test steps to list<struct> values."""
+    return [
+        {
+            "id": step.id,
+            "index": step.index,
+            "description": step.description,
+            "expected_result": step.expected_result,
+            "data": step.data,
+            "actual_result": step.actual_result,
+            "status": step.status,
+        }
+        for step in steps
+    ]
+
+
+class ParquetStorage:
+    """
+    Storage class for saving Zephyr Scale data as partitioned Parquet datasets.
+
+    Rows are buffered per entity type and written as one Parquet file per project
+    partition when ``rows_per_file`` rows have accumulated, and when the storage
+    context exits. The first write of an entity type replaces the partitions of
+    the projects being written; later writes add files next to them.
+    """
+
+    def __init__(self, output_dir: Path, rows_per_file: int = DEFAULT_ROWS_PER_FILE):
+        """
+        Initialize Parquet storage.
+
+        Args:
+            output_dir: Root directory of the datasets
+            rows_per_file: Number of buffered rows that triggers a write; at most this
+                many rows per entity type are held in memory
+
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet output requires the 'pyarrow' package")
+        import pyarrow
+        import pyarrow.parquet
+
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.output_dir = output_dir
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.rows_per_file = max(1, rows_per_file)
+        self.schemas = _build_schemas(pyarrow)
+        self._buffers: dict[str, list[dict[str, Any]]] = {}
+        self._started: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; writes all buffered rows."""
+        self.flush()
+
+    def initialize_database(self):
+        """No-op for Parquet storage to match SQLite interface."""
+
+    def dataset_path(self, name: str) -> Path:
+        """
+        Get the dataset directory of an entity type.
+
+        Args:
+            name: Entity type, e.g. "test_cases"
+
+        Returns:
+            Path of the dataset directory
+
+        """
+        return self.output_dir / name
+
+    def _append_rows(self, name: str, rows: list[dict[str, Any]]):
+        """Buffer rows and write them once the buffer is full."""
+        if not rows:
+            return
+        with self._lock:
+            buffer = self._buffers.setdefault(name, [])
+            buffer.extend(rows)
+            if len(buffer) >= self.rows_per_file:
+                self._write(name)
+
+    def _write(self, name: str):
+        """Write the buffered rows of one entity type (caller holds the lock)."""
+        rows = self._buffers.pop(name, [])
+        if not rows:
+            return
+
+        schema = self.schemas.get(name)
+        table = self._pa.Table.from_pylist(rows, schema=schema)
+        behavior = "overwrite_or_ignore" if name in self._started else "delete_matching"
+        self._started.add(name)
+
+        self._pq.write_to_dataset(
+            table,
+            root_path=str(self.dataset_path(name)),
+            partition_cols=[PARTITION_COLUMN],
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior=behavior,
+        )
+        logger.debug(f"Wrote {len(rows)} rows to Parquet dataset {name}")
+
+    def flush(self):
+        """Write all buffered rows."""
+        with self._lock:
+            for name in list(self._buffers):
+                self._write(name)
+
+    def read_table(
+        self,
+        name: str,
+        columns: list[str] | None = None,
+        filters: list[tuple] | None = None,
+    ):
+        """
+        Read an entity dataset into a pyarrow Table.
+
+        Only the requested columns and the partitions matching the filters are read.
+
+        Args:
+            name: Entity type, e.g. "test_cases"
+            columns: Columns to read (None for all)
+            filters: pyarrow filters, e.g. [("project_key", "=", "DEMO")]
+
+        Returns:
+            pyarrow Table with the selected data
+
+        """
+        return self._pq.read_table(
+            str(self.dataset_path(name)),
+            columns=columns,
+            filters=filters,
+            partitioning="hive",
+        )
+
+    def read_dataset(
+        self,
+        name: str,
+        columns: list[str] | None = None,
+        filters: list[tuple] | None = None,
+    ):
+        """
+        Read an entity dataset into a pandas DataFrame.
+
+        Args:
+            name: Entity type, e.g. "test_cases"
+            columns: Columns to read (None for all)
+            filters: pyarrow filters, e.g. [("project_key", "=", "DEMO")]
+
+        Returns:
+            pandas DataFrame with the selected data
+
+        """
+        return self.read_table(name, columns=columns, filters=filters).to_pandas()
+
+    def _custom_field_rows(
+        self, entity_type: str, entity_id: str, custom_fields: Iterable[Any], project_key: str,
+    ) -> list[dict[str, Any]]:
+        """Flatten custom field values into rows of the custom_field_values dataset."""
+        return [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "field_id": cf.id,
+                "field_name": cf.name,
+                "field_type": cf.type,
+                "value": json.dumps(cf.value, default=str),
+                PARTITION_COLUMN: project_key,
+            }
+            for cf in custom_fields
+        ]
+
+    def _model_rows(self, items: Iterable[Any], project_key: str) -> list[dict[str, Any]]:
+        """Convert reference data models to rows with inferred columns."""
+        rows = []
+        for item in items:
+            row = item.model_dump(mode="json") if hasattr(item, "model_dump") else dict(item)
+            row[PARTITION_COLUMN] = project_key
+            rows.append(row)
+        return rows
+
+    def save_project(
+        self,
+        project_key: str,
+        project_name: str,
+        project_id: str,
+        description: str | None = None,
+    ):
+        """
+        Save project information.
+
+        Args:
+            project_key: Project key
+            project_name: Project name
+            project_id: Project ID
+            description: Project description
+
+        """
+        self._append_rows(
+            "projects",
+            [
+                {
+                    "id": project_id,
+                    "name": project_name,
+                    "description": description,
+                    PARTITION_COLUMN: project_key,
+                },
+            ],
+        )
+
+    def save_folders(self, folders: list[Folder], project_key: str):
+        """Save folders for a project."""
+        self._append_rows("folders", self._model_rows(folders, project_key))
+
+    def save_statuses(self, statuses: list[Status], project_key: str):
+        """Save statuses for a project."""
+        self._append_rows("statuses", self._model_rows(statuses, project_key))
+
+    def save_priorities(self, priorities: list[Priority], project_key: str):
+        """Save priorities for a project."""
+        self._append_rows("priorities", self._model_rows(priorities, project_key))
+
+    def save_environments(self, environments: list[Environment], project_key: str):
+        """Save environments for a project."""
+        self._append_rows("environments", self._model_rows(environments, project_key))
+
+    def save_test_cases(self, test_cases: Iterable[TestCase], project_key: str):
+        """
+        Save a batch of test cases and their custom field values.
+
+        Args:
+            test_cases: Test cases to save
+            project_key: Project key
+
+        """
+        rows = []
+        custom_field_rows = []
+        for test_case in test_cases:
+            priority_id = None
+            if test_case.priority:
+                if isinstance(test_case.priority, dict):
+                    priority_id = test_case.priority.get("id")
+                else:
+                    priority_id = test_case.priority.id
+
+            rows.append(
+                {
+                    "id": test_case.id,
+                    "key": test_case.key,
+                    "name": test_case.name,
+                    "objective": test_case.objective,
+                    "precondition": test_case.precondition,
+                    "description": test_case.description,
+                    "status": test_case.status,
+                    "priority_id": priority_id,
+                    "priority_name": test_case.priority_name,
+                    "folder": test_case.folder,
+                    "folder_name": test_case.folder_name,
+                    "owner": test_case.owner,
+                    "owner_name": test_case.owner_name,
+                    "component": test_case.component,
+                    "component_name": test_case.component_name,
+                    "created_on": _utc(test_case.created_on),
+                    "created_by": test_case.created_by,
+                    "updated_on": _utc(test_case.updated_on),
+                    "updated_by": test_case.updated_by,
+                    "version": test_case.version,
+                    "estimated_time": test_case.estimated_time,
+                    "labels": list(test_case.labels),
+                    "steps": _step_rows(test_case.steps),
+                    PARTITION_COLUMN: project_key,
+                },
+            )
+            custom_field_rows.extend(
+                self._custom_field_rows(
+                    "test_case", test_case.id, test_case.custom_fields, project_key,
+                ),
+            )
+
+        self._append_rows("test_cases", rows)
+        self._append_rows("custom_field_values", custom_field_rows)
+
+    def save_test_case(self, test_case: TestCase, project_key: str):
+        """Save a test case."""
+        self.save_test_cases([test_case], project_key)
+
+    def save_test_cycles(
+        self, test_cycles: Iterable[TestCycleInfo], project_key: str | None = None,
+    ):
+        """
+        Save a batch of test cycles and their custom field values.
+
+        Args:
+            test_cycles: Test cycles to save
+            project_key: Project key (defaults to the key of each cycle)
+
+        """
+        rows = []
+        custom_field_rows = []
+        for test_cycle in test_cycles:
+            cycle_project = project_key or test_cycle.project_key
+            rows.append(
+                {
+                    "id": test_cycle.id,
+                    "key": test_cycle.key,
+                    "name": test_cycle.name,
+                    "description": test_cycle.description,
+                    "status": test_cycle.status,
+                    "status_name": test_cycle.status_name,
+                    "folder": test_cycle.folder,
+                    "folder_name": test_cycle.folder_name,
+                    "owner": test_cycle.owner,
+                    "owner_name": test_cycle.owner_name,
+                    "created_on": _utc(test_cycle.created_on),
+                    "created_by": test_cycle.created_by,
+                    "updated_on": _utc(test_cycle.updated_on),
+                    "updated_by": test_cycle.updated_by,
+                    PARTITION_COLUMN: cycle_project,
+                },
+            )
+            custom_field_rows.extend(
+                self._custom_field_rows(
+                    "test_cycle", test_cycle.id, test_cycle.custom_fields, cycle_project,
+                ),
+            )
+
+        self._append_rows("test_cycles", rows)
+        self._append_rows("custom_field_values", custom_field_rows)
+
+    def save_test_cycle(self, test_cycle: TestCycleInfo):
+        """Save a test cycle."""
+        self.save_test_cycles([test_cycle])
+
+    def save_test_plans(self, test_plans: Iterable[TestPlan], project_key: str):
+        """Save a batch of test plans."""
+        self._append_rows("test_plans", self._model_rows(test_plans, project_key))
+
+    def save_test_plan(self, test_plan: TestPlan):
+        """Save a test plan."""
+        self.save_test_plans([test_plan], test_plan.project_key)
+
+    def save_test_executions(self, test_executions: Iterable[TestExecution], project_key: str):
+        """
+        Save a batch of test executions and their custom field values.
+
+        Args:
+            test_executions: Test executions to save
+            project_key: Project key
+
+        """
+        rows = []
+        custom_field_rows = []
+        for execution in test_executions:
+            rows.append(
+                {
+                    "id": execution.id,
+                    "test_case_key": execution.test_case_key,
+                    "cycle_id": execution.cycle_id,
+                    "cycle_name": execution.cycle_name,
+                    "status": execution.status,
+                    "status_name": execution.status_name,
+                    "environment": execution.environment,
+                    "environment_name": execution.environment_name,
+                    "executed_by": execution.executed_by,
+                    "executed_by_name": execution.executed_by_name,
+                    "executed_on": _utc(execution.executed_on),
+                    "created_on": _utc(execution.created_on),
+                    "created_by": execution.created_by,
+                    "updated_on": _utc(execution.updated_on),
+                    "updated_by": execution.updated_by,
+                    "actual_time": execution.actual_time,
+                    "comment": execution.comment,
+                    "steps": _step_rows(execution.steps),
+                    PARTITION_COLUMN: project_key,
+                },
+            )
+            custom_field_rows.extend(
+                self._custom_field_rows(
+                    "test_execution", execution.id, execution.custom_fields, project_key,
+                ),
+            )
+
+        self._append_rows("test_executions", rows)
+        self._append_rows("custom_field_values", custom_field_rows)
+
+    def save_test_execution(self, test_execution: TestExecution, project_key: str):
+        """Save a test execution."""
+        self.save_test_executions([test_execution], project_key)
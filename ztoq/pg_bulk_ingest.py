@@ -0,0 +1,661 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+COPY-based bulk ingestion into PostgreSQL.
+
+Inserting extracted entities through the ORM or one INSERT per row costs a round
+trip and a statement per record, and row-by-row upserts of related rows multiply
+that. PostgresCopyIngester instead streams chunks of entities with COPY FROM STDIN
+into temporary staging tables and merges each staging table into its target with
+a single set-based statement. Related rows - steps, custom field values and
+labels - are derived from the same entities and loaded the same way.
+"""
+
+import json
+import logging
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import islice
+from typing import Any
+
+logger = logging.getLogger("ztoq.pg_bulk_ingest")
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Namespace for ids derived from natural keys, e.g. a step's owner and index
+ZTOQ_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://github.com/heymumford/ztoq")
+
+Row = tuple[Any, ...]
+RowBuilder = Callable[[Any], dict[str, list[Row]]]
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    How one kind of row is staged and merged into its target table.
+
+    ``merge`` is ``upsert`` to insert new rows and update existing ones by key, or
+    ``insert_missing`` to only add rows whose key is not present yet. With
+    ``replace_scope`` set to ``(column, parent_spec, parent_column)``, existing rows
+    owned by the parents in the chunk are deleted first, so children removed at
+    the source do not linger; ``replace_where`` narrows that delete further.
+    ``update_columns`` limits an upsert to updating the given columns, and
+    ``source_sql`` replaces the default SELECT from the staging table.
+    """
+
+    name: str
+    table: str
+    columns: tuple[str, ...]
+    key_columns: tuple[str, ...]
+    merge: str = "upsert"
+    replace_scope: tuple[str, str, str] | None = None
+    replace_where: str | None = None
+    update_columns: tuple[str, ...] | None = None
+    source_sql: str | None = None
+
+    @property
+    def staging_table(self) -> str:
+        return f"ztoq_stage_{self.name}"
+
+
+def _quote(identifier: str) -> str:
+    return f'"{identifier}"'
+
+
+def _column_list(columns: Iterable[str], prefix: str = "") -> str:
+    return ", ".join(f"{prefix}{_quote(column)}" for column in columns)
+
+
+def staging_sql(spec: TableSpec) -> str:
+    """SQL creating the staging table of a spec for the current transaction."""
+    return (
+        f"CREATE TEMP TABLE {spec.staging_table} "
+        f"(LIKE {spec.table} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+
+
+def copy_sql(spec: TableSpec) -> str:
+    """SQL streaming rows into the staging table of a spec."""
+    return f"COPY {spec.staging_table} ({_column_list(spec.columns)}) FROM STDIN"
+
+
+def merge_sql(spec: TableSpec, specs_by_name: dict[str, TableSpec]) -> list[str]:
+    """
+    SQL statements merging the staging table of a spec into its target table.
+
+    Args:
+        spec: Spec to merge
+        specs_by_name: All specs of the ingestion, for resolving the replace scope
+
+    Returns:
+        Statements to run in order
+
+    """
+    statements = []
+    if spec.replace_scope:
+        column, parent_name, parent_column = spec.replace_scope
+        parent = specs_by_name[parent_name]
+        delete = (
+            f"DELETE FROM {spec.table} WHERE {_quote(column)} IN "
+            f"(SELECT {_quote(parent_column)} FROM {parent.staging_table})"
+        )
+        if spec.replace_where:
+            delete += f" AND {spec.replace_where}"
+        statements.append(delete)
+
+    columns = _column_list(spec.columns)
+    selected = _column_list(spec.columns, "staged.")
+    keys = _column_list(spec.key_columns)
+    source = spec.source_sql or (
+        f"SELECT DISTINCT ON ({_column_list(spec.key_columns, 'staged.')}) {selected} "
+        f"FROM {spec.staging_table} AS staged"
+    )
+
+    if spec.merge == "upsert":
+        update_columns = spec.update_columns or [
+            column for column in spec.columns if column not in spec.key_columns
+        ]
+        updates = ", ".join(
+            f"{_quote(column)} = EXCLUDED.{_quote(column)}" for column in update_columns
+        )
+        conflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        statements.append(
+            f"INSERT INTO {spec.table} ({columns}) {source} ON CONFLICT ({keys}) {conflict}",
+        )
+    elif spec.merge == "insert_missing":
+        matches = " AND ".join(
+            f"existing.{_quote(column)} = staged.{_quote(column)}" for column in spec.key_columns
+        )
+        statements.append(
+            f"INSERT INTO {spec.table} ({columns}) SELECT {selected} FROM ({source}) AS staged "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {spec.table} AS existing WHERE {matches}) "
+            f"ON CONFLICT DO NOTHING",
+        )
+    else:
+        raise ValueError(f"Unknown merge mode: {spec.merge}")
+    return statements
+
+
+def format_copy_value(value: Any) -> str:
+    """Format a value for the COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime | date):
+        text = value.isoformat()
+    elif isinstance(value, dict | list):
+        text = json.dumps(value, default=str)
+    else:
+        text = str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class CopyStream:
+    """File-like object producing COPY text-format lines from rows on demand."""
+
+    def __init__(self, rows: Iterable[Row]):
+        self._lines = ("\t".join(map(format_copy_value, row)) + "\n" for row in rows)
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    def readline(self, size: int = -1) -> str:
+        return self.read(size) if self._buffer else next(self._lines, "")
+
+
+class PostgresCopyIngester:
+    """
+    Load entities into PostgreSQL with COPY through staging tables.
+
+    Entities are consumed from any iterable, such as an extract generator, in
+    chunks of ``chunk_size``. Each chunk is staged, merged and committed in its own
+    transaction, so memory stays bounded and a failure only rolls back one chunk.
+    """
+
+    def __init__(self, connection: Any, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the ingester.
+
+        Args:
+            connection: psycopg2 connection, not in autocommit mode
+            chunk_size: Number of entities staged and merged per transaction
+
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.connection = connection
+        self.chunk_size = chunk_size
+
+    def ingest(
+        self, items: Iterable[Any], build_rows: RowBuilder, specs: Sequence[TableSpec],
+    ) -> dict[str, int]:
+        """
+        Stage and merge the rows derived from a stream of entities.
+
+        Args:
+            items: Entities to load
+            build_rows: Function returning the rows of an entity keyed by spec name
+            specs: Table specs in merge order, parents before children
+
+        Returns:
+            Number of rows staged per spec name
+
+        """
+        counts: dict[str, int] = defaultdict(int)
+        iterator = iter(items)
+        while chunk := list(islice(iterator, self.chunk_size)):
+            rows: dict[str, list[Row]] = defaultdict(list)
+            for item in chunk:
+                for name, item_rows in build_rows(item).items():
+                    rows[name].extend(item_rows)
+            self._load_chunk(specs, rows)
+            for name, chunk_rows in rows.items():
+                counts[name] += len(chunk_rows)
+        return dict(counts)
+
+    def _load_chunk(self, specs: Sequence[TableSpec], rows: dict[str, list[Row]]) -> None:
+        specs_by_name = {spec.name: spec for spec in specs}
+        unknown = set(rows) - set(specs_by_name)
+        if unknown:
+            raise ValueError(f"Rows for unknown table specs: {sorted(unknown)}")
+        try:
+            with self.connection.cursor() as cursor:
+                for spec in specs:
+                    cursor.execute(staging_sql(spec))
+                for spec in specs:
+                    if rows.get(spec.name):
+                        cursor.copy_expert(copy_sql(spec), CopyStream(rows[spec.name]))
+                for spec in specs:
+                    if rows.get(spec.name) or spec.replace_scope:
+                        for statement in merge_sql(spec, specs_by_name):
+                            cursor.execute(statement)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        logger.debug(
+            "Ingested chunk: "
+            + ", ".join(f"{name}={len(chunk_rows)}" for name, chunk_rows in rows.items()),
+        )
+
+
+# Table specs and row builders for the extracted entity types
+
+TEST_CASE_COLUMNS = (
+    "id", "key", "name", "objective", "precondition", "description", "status",
+    "priority_id", "priority_name", "folder_id", "folder_name", "owner", "owner_name",
+    "component", "component_name", "created_on", "created_by", "updated_on", "updated_by",
+    "version", "estimated_time", "project_key",
+)  # fmt: skip
+TEST_CYCLE_COLUMNS = (
+    "id", "key", "name", "description", "status", "status_name", "folder_id", "folder_name",
+    "owner", "owner_name", "created_on", "created_by", "updated_on", "updated_by",
+    "project_key",
+)  # fmt: skip
+TEST_EXECUTION_COLUMNS = (
+    "id", "test_case_key", "cycle_id", "cycle_name", "status", "status_name",
+    "environment_id", "environment_name", "executed_by", "executed_by_name", "executed_on",
+    "created_on", "created_by", "updated_on", "updated_by", "actual_time", "comment",
+    "project_key",
+)  # fmt: skip
+STEP_COLUMNS = (
+    "id", "index", "description", "expected_result", "data", "actual_result", "status",
+    "test_case_id", "test_execution_id",
+)  # fmt: skip
+CUSTOM_FIELD_VALUE_COLUMNS = (
+    "id", "field_id", "entity_type", "entity_id", "value_text", "value_numeric",
+    "value_boolean", "value_date", "value_json",
+)  # fmt: skip
+
+FIELD_DEFINITION_SPEC = TableSpec(
+    "custom_field_definitions",
+    "custom_field_definitions",
+    ("id", "name", "type", "project_key"),
+    ("id",),
+    merge="insert_missing",
+)
+
+PROJECT_SPECS = (
+    TableSpec(
+        "projects",
+        "projects",
+        ("id", "key", "name", "description"),
+        ("key",),
+        update_columns=("name", "description"),
+    ),
+)
+FOLDER_SPECS = (
+    TableSpec(
+        "folders", "folders", ("id", "name", "folder_type", "parent_id", "project_key"), ("id",),
+    ),
+)
+STATUS_SPECS = (
+    TableSpec(
+        "statuses", "statuses", ("id", "name", "description", "color", "type", "project_key"),
+        ("id",),
+    ),
+)
+PRIORITY_SPECS = (
+    TableSpec(
+        "priorities", "priorities", ("id", "name", "description", "color", "rank", "project_key"),
+        ("id",),
+    ),
+)
+ENVIRONMENT_SPECS = (
+    TableSpec(
+        "environments", "environments", ("id", "name", "description", "project_key"), ("id",),
+    ),
+)
+TEST_CASE_SPECS = (
+    TableSpec("test_cases", "test_cases", TEST_CASE_COLUMNS, ("id",)),
+    TableSpec(
+        "test_case_steps",
+        "test_steps",
+        STEP_COLUMNS,
+        ("id",),
+        replace_scope=("test_case_id", "test_cases", "id"),
+    ),
+    FIELD_DEFINITION_SPEC,
+    TableSpec(
+        "test_case_field_values",
+        "custom_field_values",
+        CUSTOM_FIELD_VALUE_COLUMNS,
+        ("id",),
+        replace_scope=("entity_id", "test_cases", "id"),
+        replace_where="entity_type = 'TEST_CASE'",
+    ),
+    TableSpec("labels", "labels", ("id", "name"), ("name",), merge="insert_missing"),
+    # Labels are unique by name, so associations resolve the id of the stored label
+    TableSpec(
+        "case_labels",
+        "case_label_association",
+        ("test_case_id", "label_id"),
+        ("test_case_id", "label_id"),
+        merge="insert_missing",
+        replace_scope=("test_case_id", "test_cases", "id"),
+        source_sql=(
+            "SELECT DISTINCT staged.test_case_id, label.id AS label_id "
+            "FROM ztoq_stage_case_labels AS staged "
+            "JOIN ztoq_stage_labels AS staged_label ON staged_label.id = staged.label_id "
+            "JOIN labels AS label ON label.name = staged_label.name"
+        ),
+    ),
+)
+TEST_CYCLE_SPECS = (
+    TableSpec("test_cycles", "test_cycles", TEST_CYCLE_COLUMNS, ("id",)),
+    FIELD_DEFINITION_SPEC,
+    TableSpec(
+        "test_cycle_field_values",
+        "custom_field_values",
+        CUSTOM_FIELD_VALUE_COLUMNS,
+        ("id",),
+        replace_scope=("entity_id", "test_cycles", "id"),
+        replace_where="entity_type = 'TEST_CYCLE'",
+    ),
+)
+TEST_EXECUTION_SPECS = (
+    TableSpec("test_executions", "test_executions", TEST_EXECUTION_COLUMNS, ("id",)),
+    TableSpec(
+        "test_execution_steps",
+        "test_steps",
+        STEP_COLUMNS,
+        ("id",),
+        replace_scope=("test_execution_id", "test_executions", "id"),
+    ),
+    FIELD_DEFINITION_SPEC,
+    TableSpec(
+        "test_execution_field_values",
+        "custom_field_values",
+        CUSTOM_FIELD_VALUE_COLUMNS,
+        ("id",),
+        replace_scope=("entity_id", "test_executions", "id"),
+        replace_where="entity_type = 'TEST_EXECUTION'",
+    ),
+)
+
+
+def derived_id(*parts: Any) -> str:
+    """Stable id for a row identified by a natural key rather than a source id."""
+    return str(uuid.uuid5(ZTOQ_NAMESPACE, ":".join(str(part) for part in parts)))
+
+
+def _custom_field_value(value: Any) -> tuple[Any, Any, Any, Any, Any]:
+    """Split a custom field value into the typed value columns."""
+    if isinstance(value, bool):
+        return None, None, value, None, None
+    if isinstance(value, int | float):
+        return None, value, None, None, None
+    if isinstance(value, datetime | date):
+        return None, None, None, value, None
+    if isinstance(value, dict | list):
+        return None, None, None, None, value
+    return (None if value is None else str(value)), None, None, None, None
+
+
+def _custom_field_rows(
+    custom_fields: Iterable[Any], entity_type: str, entity_id: str, project_key: str,
+) -> tuple[list[Row], list[Row]]:
+    definitions, values = [], []
+    for field in custom_fields:
+        definitions.append((field.id, field.name, field.type, project_key))
+        values.append(
+            (
+                derived_id(entity_type, entity_id, field.id),
+                field.id,
+                entity_type,
+                entity_id,
+                *_custom_field_value(field.value),
+            ),
+        )
+    return definitions, values
+
+
+def _step_rows(steps: Iterable[Any], owner: str, owner_id: str) -> list[Row]:
+    return [
+        (
+            derived_id(owner, owner_id, step.index),
+            step.index,
+            step.description,
+            step.expected_result,
+            step.data,
+            step.actual_result,
+            step.status,
+            owner_id if owner == "test_case" else None,
+            owner_id if owner == "test_execution" else None,
+        )
+        for step in steps
+    ]
+
+
+def project_row_builder(project_key: str) -> RowBuilder:
+    """Row builder for Project models."""
+    return lambda project: {
+        "projects": [(project.id, project.key, project.name, project.description)],
+    }
+
+
+def folder_row_builder(project_key: str) -> RowBuilder:
+    """Row builder for Folder models."""
+    return lambda folder: {
+        "folders": [(folder.id, folder.name, folder.folder_type, folder.parent_id, project_key)],
+    }
+
+
+def status_row_builder(project_key: str) -> RowBuilder:
+    """Row builder for Status models."""
+    return lambda status: {
+        "statuses": [
+            (status.id, status.name, status.description, status.color, status.type, project_key),
+        ],
+    }
+
+
+def priority_row_builder(project_key: str) -> RowBuilder:
+    """Row builder for Priority models."""
+    return lambda priority: {
+        "priorities": [
+            (
+                priority.id,
+                priority.name,
+                priority.description,
+                priority.color,
+                priority.rank,
+                project_key,
+            ),
+        ],
+    }
+
+
+def environment_row_builder(project_key: str) -> RowBuilder:
+    """Row builder for Environment models."""
+    return lambda environment: {
+        "environments": [
+            (environment.id, environment.name, environment.description, project_key),
+        ],
+    }
+
+
+def case_row_builder(project_key: str) -> RowBuilder:
+    """Row builder for Case models, including steps, custom fields and labels."""
+
+    def build(test_case: Any) -> dict[str, list[Row]]:
+        priority = test_case.priority
+        if isinstance(priority, dict):
+            priority_id = priority.get("id")
+        else:
+            priority_id = getattr(priority, "id", None)
+        definitions, values = _custom_field_rows(
+            test_case.custom_fields, "TEST_CASE", test_case.id, project_key,
+        )
+        labels = list(dict.fromkeys(test_case.labels or []))
+        return {
+            "test_cases": [
+                (
+                    test_case.id,
+                    test_case.key,
+                    test_case.name,
+                    test_case.objective,
+                    test_case.precondition,
+                    test_case.description,
+                    test_case.status,
+                    priority_id,
+                    test_case.priority_name,
+                    test_case.folder,
+                    test_case.folder_name,
+                    test_case.owner,
+                    test_case.owner_name,
+                    test_case.component,
+                    test_case.component_name,
+                    test_case.created_on,
+                    test_case.created_by,
+                    test_case.updated_on,
+                    test_case.updated_by,
+                    test_case.version,
+                    test_case.estimated_time,
+                    project_key,
+                ),
+            ],
+            "test_case_steps": _step_rows(test_case.steps, "test_case", test_case.id),
+            "custom_field_definitions": definitions,
+            "test_case_field_values": values,
+            "labels": [(derived_id("label", label), label) for label in labels],
+            "case_labels": [(test_case.id, derived_id("label", label)) for label in labels],
+        }
+
+    return build
+
+
+def cycle_row_builder(project_key: str) -> RowBuilder:
+    """Row builder for CycleInfo models, including custom fields."""
+
+    def build(cycle: Any) -> dict[str, list[Row]]:
+        definitions, values = _custom_field_rows(
+            cycle.custom_fields, "TEST_CYCLE", cycle.id, project_key,
+        )
+        return {
+            "test_cycles": [
+                (
+                    cycle.id,
+                    cycle.key,
+                    cycle.name,
+                    cycle.description,
+                    cycle.status,
+                    cycle.status_name,
+                    cycle.folder,
+                    cycle.folder_name,
+                    cycle.owner,
+                    cycle.owner_name,
+                    cycle.created_on,
+                    cycle.created_by,
+                    cycle.updated_on,
+                    cycle.updated_by,
+                    project_key,
+                ),
+            ],
+            "custom_field_definitions": definitions,
+            "test_cycle_field_values": values,
+        }
+
+    return build
+
+
+def execution_row_builder(project_key: str) -> RowBuilder:
+    """Row builder for Execution models, including steps and custom fields."""
+
+    def build(execution: Any) -> dict[str, list[Row]]:
+        definitions, values = _custom_field_rows(
+            execution.custom_fields, "TEST_EXECUTION", execution.id, project_key,
+        )
+        return {
+            "test_executions": [
+                (
+                    execution.id,
+                    execution.test_case_key,
+                    execution.cycle_id,
+                    execution.cycle_name,
+                    execution.status,
+                    execution.status_name,
+                    execution.environment,
+                    execution.environment_name,
+                    execution.executed_by,
+                    execution.executed_by_name,
+                    execution.executed_on,
+                    execution.created_on,
+                    execution.created_by,
+                    execution.updated_on,
+                    execution.updated_by,
+                    execution.actual_time,
+                    execution.comment,
+                    project_key,
+                ),
+            ],
+            "test_execution_steps": _step_rows(execution.steps, "test_execution", execution.id),
+            "custom_field_definitions": definitions,
+            "test_execution_field_values": values,
+        }
+
+    return build
+
+
+# Specs and row builders per entity type, in the order that satisfies foreign keys
+INGESTION_PLANS: dict[str, tuple[tuple[TableSpec, ...], Callable[[str], RowBuilder]]] = {
+    "project": (PROJECT_SPECS, project_row_builder),
+    "folders": (FOLDER_SPECS, folder_row_builder),
+    "statuses": (STATUS_SPECS, status_row_builder),
+    "priorities": (PRIORITY_SPECS, priority_row_builder),
+    "environments": (ENVIRONMENT_SPECS, environment_row_builder),
+    "test_cases": (TEST_CASE_SPECS, case_row_builder),
+    "test_cycles": (TEST_CYCLE_SPECS, cycle_row_builder),
+    "test_executions": (TEST_EXECUTION_SPECS, execution_row_builder),
+}
+
+
+def ingest_entities(
+    connection: Any,
+    entity_type: str,
+    items: Iterable[Any],
+    project_key: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, int]:
+    """
+    Load entities of one type and their related rows with COPY.
+
+    Args:
+        connection: psycopg2 connection
+        entity_type: One of the keys of ``INGESTION_PLANS``
+        items: Entity models, e.g. from an extract generator
+        project_key: Project the entities belong to
+        chunk_size: Number of entities per staged transaction
+
+    Returns:
+        Number of rows loaded per table spec name
+
+    """
+    if entity_type not in INGESTION_PLANS:
+        raise ValueError(f"No COPY ingestion plan for entity type: {entity_type}")
+    specs, builder = INGESTION_PLANS[entity_type]
+    ingester = PostgresCopyIngester(connection, chunk_size=chunk_size)
+    return ingester.ingest(items, builder(project_key), specs)
+
@@ -15,6 +15,7 @@ connection pooling, transaction management, and schema migrations.
 
 import json
 import logging
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
@@ -27,11 +28,54 @@ from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.orm import sessionmaker
 
 from ztoq.core.db_models import Base
+from ztoq.data_fetcher import FetchResult
 from ztoq.database_manager import DatabaseManager as SQLiteDatabaseManager
+from ztoq.models import Project
+from ztoq.pg_bulk_ingest import DEFAULT_CHUNK_SIZE, INGESTION_PLANS, ingest_entities
 from ztoq.validation import ValidationIssue
 
 logger = logging.getLogger(__name__)
 
+# Relationship checks by qTest link type: the source entities with their source
+# parent, the mapping type of the parent and the mapping type of the entity
+RELATIONSHIP_CHECKS = {
+    "testcase_module": (
+        "SELECT tc.id AS entity_id, tc.name AS entity_name, tc.folder_id AS source_parent_id "
+        "FROM test_cases tc WHERE tc.project_key = :project_key",
+        "folder_to_module",
+        "testcase_to_testcase",
+    ),
+    "run_testcase": (
+        "SELECT e.id AS entity_id, NULL AS entity_name, tc.id AS source_parent_id "
+        "FROM test_executions e JOIN test_cases tc ON e.test_case_key = tc.key "
+        "WHERE e.project_key = :project_key",
+        "testcase_to_testcase",
+        "execution_to_run",
+    ),
+    "run_cycle": (
+        "SELECT e.id AS entity_id, NULL AS entity_name, e.cycle_id AS source_parent_id "
+        "FROM test_executions e JOIN test_cycles c ON e.cycle_id = c.id "
+        "WHERE e.project_key = :project_key",
+        "cycle_to_cycle",
+        "execution_to_run",
+    ),
+}
+
+# Payload fields of each kind of transformed entity, as returned by the readers
+TRANSFORMED_PAYLOAD_FIELDS = {
+    "test_case": ("test_case",),
+    "test_cycle": ("test_cycle",),
+    "execution": ("test_run", "test_log"),
+}
+
+VALIDATION_ISSUE_INSERT = """
+    INSERT INTO validation_issues
+    (rule_id, level, message, entity_id, entity_type, scope, phase, context,
+        project_key, created_on, resolved)
+    VALUES (:rule_id, :level, :message, :entity_id, :entity_type, :scope, :phase, :context,
+        :project_key, :created_on, :resolved)
+"""
+
 
 class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
     """
@@ -51,6 +95,7 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
         port: int = 5432,
         min_connections: int = 5,
         max_connections: int = 20,
+        fetch_size: int = 1000,
     ):
         """
         Initialize the PostgreSQL database manager.
@@ -63,6 +108,7 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             port: Database server port (default: 5432)
             min_connections: Minimum number of connections in the pool
             max_connections: Maximum number of connections in the pool
+            fetch_size: Rows fetched per round trip by the streaming iterators
 
         """
         self.connection_params = {
@@ -73,6 +119,8 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             "port": port,
         }
 
+        self.fetch_size = fetch_size
+
         # Create connection URL for SQLAlchemy
         self.db_url = f"postgresql://{user}:{password}@{host}:{port}/{database}"
 
@@ -190,6 +238,8 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
         try:
             # Create all tables based on SQLAlchemy models
             Base.metadata.create_all(self.engine)
+            self._create_transformed_entities_table()
+            self._create_qtest_links_table()
 
             # Create additional indexes for performance
             with self.get_session() as session:
@@ -632,6 +682,309 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             logger.error(f"Error getting mapped entity ID: {e!s}")
             return None
 
+    def get_entity_mappings(self, project_key: str, mapping_type: str) -> list[dict[str, Any]]:
+        """
+        Get all entity mappings of a type for a project in one query.
+
+        Args:
+            project_key: The project key
+            mapping_type: The mapping type
+
+        Returns:
+            List of mappings with source_id and target_id
+
+        """
+        try:
+            with self.get_session() as session:
+                result = session.execute(
+                    text(
+                        """
+                    SELECT source_id, target_id
+                    FROM entity_mappings
+                    WHERE project_key = :project_key
+                    AND mapping_type = :mapping_type
+                    """,
+                    ),
+                    {"project_key": project_key, "mapping_type": mapping_type},
+                )
+                return [
+                    {"source_id": row[0], "target_id": row[1]} for row in result.fetchall()
+                ]
+        except Exception as e:
+            logger.error(f"Error getting {mapping_type} mappings: {e!s}")
+            return []
+
+    def save_entity_mappings(
+        self, project_key: str, mapping_type: str, mappings: list[dict[str, Any]],
+    ) -> None:
+        """
+        Save many entity mappings of a type in one statement and commit.
+
+        Existing mappings for the same source entity are updated.
+
+        Args:
+            project_key: The project key
+            mapping_type: The mapping type
+            mappings: Mappings with source_id and target_id
+
+        """
+        if not mappings:
+            return
+        with self.get_session() as session:
+            session.execute(
+                text(
+                    """
+                INSERT INTO entity_mappings (project_key, mapping_type, source_id, target_id)
+                VALUES (:project_key, :mapping_type, :source_id, :target_id)
+                ON CONFLICT (project_key, mapping_type, source_id)
+                DO UPDATE SET target_id = EXCLUDED.target_id
+                """,
+                ),
+                [
+                    {
+                        "project_key": project_key,
+                        "mapping_type": mapping_type,
+                        "source_id": str(mapping["source_id"]),
+                        "target_id": str(mapping["target_id"]),
+                    }
+                    for mapping in mappings
+                ],
+            )
+
+    def _create_transformed_entities_table(self) -> None:
+        """Create the transformed_entities table if it doesn't exist."""
+        with self.get_session() as session:
+            session.execute(
+                text(
+                    """
+            CREATE TABLE IF NOT EXISTS transformed_entities (
+                id SERIAL PRIMARY KEY,
+                project_key TEXT NOT NULL,
+                entity_type TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                payload JSONB NOT NULL,
+                refs JSONB NOT NULL DEFAULT '{}',
+                UNIQUE(project_key, entity_type, source_id)
+            )
+            """,
+                ),
+            )
+
+    def _save_transformed_entities(
+        self, project_key: str, entity_type: str, entities: list[tuple[Any, ...]],
+    ) -> None:
+        """
+        Save many transformed entities of a type in one statement and commit.
+
+        Existing records for the same source entity are replaced.
+
+        Args:
+            project_key: The project key
+            entity_type: One of the keys of ``TRANSFORMED_PAYLOAD_FIELDS``
+            entities: ``(source_id, *payload, references)`` tuples
+
+        """
+        if not entities:
+            return
+        fields = TRANSFORMED_PAYLOAD_FIELDS[entity_type]
+        with self.get_session() as session:
+            session.execute(
+                text(
+                    """
+                INSERT INTO transformed_entities
+                    (project_key, entity_type, source_id, payload, refs)
+                VALUES (:project_key, :entity_type, :source_id, :payload, :refs)
+                ON CONFLICT (project_key, entity_type, source_id)
+                DO UPDATE SET payload = EXCLUDED.payload, refs = EXCLUDED.refs
+                """,
+                ),
+                [
+                    {
+                        "project_key": project_key,
+                        "entity_type": entity_type,
+                        "source_id": str(source_id),
+                        "payload": json.dumps(
+                            {
+                                field: self._serialize_object(value)
+                                for field, value in zip(fields, payload, strict=True)
+                            },
+                            default=str,
+                        ),
+                        "refs": json.dumps(references or {}, default=str),
+                    }
+                    for source_id, *payload, references in entities
+                ],
+            )
+
+    def _get_transformed_entities(
+        self, project_key: str, entity_type: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Get the transformed entities of a type in the order they were first saved.
+
+        Args:
+            project_key: The project key
+            entity_type: One of the keys of ``TRANSFORMED_PAYLOAD_FIELDS``
+
+        Returns:
+            Records with the source_id, the payload fields and the references
+
+        """
+        with self.get_session() as session:
+            result = session.execute(
+                text(
+                    """
+                SELECT source_id, payload, refs FROM transformed_entities
+                WHERE project_key = :project_key AND entity_type = :entity_type
+                ORDER BY id
+                """,
+                ),
+                {"project_key": project_key, "entity_type": entity_type},
+            )
+            return [{"source_id": row.source_id, **row.payload, **row.refs} for row in result]
+
+    def save_transformed_test_cases(
+        self, project_key: str, entities: list[tuple[Any, Any, dict[str, Any]]],
+    ) -> None:
+        """Save ``(source_id, test_case, references)`` tuples with one commit."""
+        self._save_transformed_entities(project_key, "test_case", entities)
+
+    def save_transformed_test_cycles(
+        self, project_key: str, entities: list[tuple[Any, Any, dict[str, Any]]],
+    ) -> None:
+        """Save ``(source_id, test_cycle, references)`` tuples with one commit."""
+        self._save_transformed_entities(project_key, "test_cycle", entities)
+
+    def save_transformed_executions(
+        self, project_key: str, entities: list[tuple[Any, Any, Any, dict[str, Any]]],
+    ) -> None:
+        """Save ``(source_id, test_run, test_log, references)`` tuples with one commit."""
+        self._save_transformed_entities(project_key, "execution", entities)
+
+    def save_transformed_test_case(
+        self,
+        project_key: str,
+        source_id: Any,
+        test_case: Any,
+        references: dict[str, Any] | None = None,
+    ) -> None:
+        """Save a transformed test case."""
+        self.save_transformed_test_cases(project_key, [(source_id, test_case, references)])
+
+    def save_transformed_test_cycle(
+        self,
+        project_key: str,
+        source_id: Any,
+        test_cycle: Any,
+        references: dict[str, Any] | None = None,
+    ) -> None:
+        """Save a transformed test cycle."""
+        self.save_transformed_test_cycles(project_key, [(source_id, test_cycle, references)])
+
+    def save_transformed_execution(
+        self,
+        project_key: str,
+        source_id: Any,
+        test_run: Any,
+        test_log: Any,
+        references: dict[str, Any] | None = None,
+    ) -> None:
+        """Save a transformed test run and its log."""
+        self.save_transformed_executions(
+            project_key, [(source_id, test_run, test_log, references)],
+        )
+
+    def get_transformed_test_cases(self, project_key: str) -> list[dict[str, Any]]:
+        """Get the transformed test cases with their source_id and folder_source_id."""
+        return self._get_transformed_entities(project_key, "test_case")
+
+    def get_transformed_test_cycles(self, project_key: str) -> list[dict[str, Any]]:
+        """Get the transformed test cycles with their source_id and folder_source_id."""
+        return self._get_transformed_entities(project_key, "test_cycle")
+
+    def get_transformed_executions(self, project_key: str) -> list[dict[str, Any]]:
+        """Get the transformed test runs and logs with the source ids they reference."""
+        return self._get_transformed_entities(project_key, "execution")
+
+    def bulk_ingest(
+        self,
+        entity_type: str,
+        items: Iterable[Any],
+        project_key: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> dict[str, int]:
+        """
+        Load entities and their related rows with COPY FROM STDIN.
+
+        Items are consumed lazily, so an extract generator can be streamed straight
+        into the database. Rows are staged in temporary tables and merged into the
+        target tables chunk by chunk; see ztoq.pg_bulk_ingest.
+
+        Args:
+            entity_type: Entity type, e.g. ``test_cases`` or ``test_executions``
+            items: Entity models to load
+            project_key: The project key
+            chunk_size: Number of entities merged per transaction
+
+        Returns:
+            Number of rows loaded per table
+
+        """
+        with self.get_connection() as conn:
+            return ingest_entities(conn, entity_type, items, project_key, chunk_size)
+
+    def save_project_data(
+        self, project_key: str, fetch_results: dict[str, FetchResult],
+    ) -> dict[str, int]:
+        """
+        Save all fetched data for a project using COPY-based bulk ingestion.
+
+        Entity types are loaded in the order that satisfies foreign keys, like the
+        base implementation, but each type is streamed through staging tables
+        instead of being inserted record by record.
+
+        Args:
+            project_key: The project key
+            fetch_results: Dictionary of fetched data results
+
+        Returns:
+            Dictionary with counts of inserted records by entity type
+
+        """
+        counts = {}
+
+        project_result = fetch_results.get("project")
+        if project_result is None:
+            # Create a minimal project entry to satisfy foreign key constraints
+            projects = [
+                Project(
+                    id=f"placeholder_{project_key}",
+                    key=project_key,
+                    name=f"Project {project_key}",
+                    description=f"Placeholder project for {project_key}",
+                ),
+            ]
+        elif project_result.success and project_result.items:
+            projects = project_result.items[:1]
+        else:
+            projects = []
+        if projects:
+            self.bulk_ingest("project", projects, project_key)
+            counts["project"] = 1
+
+        for entity_type in INGESTION_PLANS:
+            result = fetch_results.get(entity_type)
+            if entity_type == "project" or result is None or not result.success:
+                continue
+            items = result.items
+            if entity_type == "folders":
+                # Sort folders so parents are merged before their children
+                items = sorted(items, key=lambda f: len(f.id))
+            self.bulk_ingest(entity_type, items, project_key)
+            counts[entity_type] = len(items)
+
+        return counts
+
     def get_high_priority_test_cases(self, project_key: str) -> list[dict[str, Any]]:
         """
         Get high-priority test cases for a project.
@@ -663,6 +1016,27 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             logger.error(f"Error getting high-priority test cases: {e!s}")
             return []
 
+    def _validation_issue_params(self, issue: ValidationIssue, project_key: str) -> dict[str, Any]:
+        """Build the insert parameters of a validation issue."""
+        # Create a more detailed context that includes entity type
+        context_data = issue.details or {}
+        if issue.entity_type:
+            context_data["entity_type"] = issue.entity_type
+
+        return {
+            "rule_id": issue.id,
+            "level": issue.level.value,
+            "message": issue.message,
+            "entity_id": issue.entity_id,
+            "entity_type": issue.entity_type,
+            "scope": issue.scope.value,
+            "phase": issue.phase.value,
+            "context": json.dumps(context_data) if context_data else None,
+            "project_key": project_key,
+            "created_on": datetime.now().isoformat(),
+            "resolved": 0,
+        }
+
     def save_validation_issue(self, issue: ValidationIssue, project_key: str) -> int:
         """
         Save a validation issue to the database.
@@ -675,39 +1049,11 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             ID of the saved issue
 
         """
-        # Create a more detailed context that includes entity type
-        context_data = issue.details or {}
-        if issue.entity_type:
-            context_data["entity_type"] = issue.entity_type
-
-        context_json = json.dumps(context_data) if context_data else None
-
         try:
             with self.get_session() as session:
                 result = session.execute(
-                    text(
-                        """
-                    INSERT INTO validation_issues
-                    (rule_id, level, message, entity_id, entity_type, scope, phase, context,
-                        project_key, created_on, resolved)
-                    VALUES (:rule_id, :level, :message, :entity_id, :entity_type, :scope, :phase, :context,
-                        :project_key, :created_on, :resolved)
-                    RETURNING id
-                    """,
-                    ),
-                    {
-                        "rule_id": issue.id,
-                        "level": issue.level.value,
-                        "message": issue.message,
-                        "entity_id": issue.entity_id,
-                        "entity_type": issue.entity_type,
-                        "scope": issue.scope.value,
-                        "phase": issue.phase.value,
-                        "context": context_json,
-                        "project_key": project_key,
-                        "created_on": datetime.now().isoformat(),
-                        "resolved": 0,
-                    },
+                    text(VALIDATION_ISSUE_INSERT + " RETURNING id"),
+                    self._validation_issue_params(issue, project_key),
                 )
                 row = result.fetchone()
                 return row[0] if row else 0
@@ -720,6 +1066,26 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             except:
                 return 0
 
+    def save_validation_issues(self, issues: list[ValidationIssue], project_key: str) -> None:
+        """
+        Save many validation issues in one statement and commit.
+
+        Unlike save_validation_issue, errors are raised so the caller can keep
+        the issues and retry.
+
+        Args:
+            issues: The ValidationIssue objects to save
+            project_key: The project key
+
+        """
+        if not issues:
+            return
+        with self.get_session() as session:
+            session.execute(
+                text(VALIDATION_ISSUE_INSERT),
+                [self._validation_issue_params(issue, project_key) for issue in issues],
+            )
+
     def _create_validation_tables(self) -> None:
         """Create validation-related tables if they don't exist."""
         try:
@@ -846,6 +1212,78 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
         except Exception as e:
             logger.error(f"Error creating validation indexes: {e!s}")
 
+    def _create_qtest_links_table(self) -> None:
+        """Create the qtest_entity_links table if it doesn't exist."""
+        with self.get_session() as session:
+            session.execute(
+                text(
+                    """
+            CREATE TABLE IF NOT EXISTS qtest_entity_links (
+                id SERIAL PRIMARY KEY,
+                project_key TEXT NOT NULL,
+                link_type TEXT NOT NULL,
+                qtest_id TEXT NOT NULL,
+                parent_id TEXT,
+                UNIQUE(project_key, link_type, qtest_id)
+            )
+            """,
+                ),
+            )
+
+    def save_qtest_links(
+        self, project_key: str, link_type: str, links: list[dict[str, Any]],
+    ) -> None:
+        """
+        Record where migrated entities ended up in qTest.
+
+        Args:
+            project_key: The project key
+            link_type: One of the link types of ``RELATIONSHIP_CHECKS``
+            links: Links with the qtest_id of an entity and the parent_id it is linked to
+
+        """
+        if not links:
+            return
+        with self.get_session() as session:
+            session.execute(
+                text(
+                    """
+                INSERT INTO qtest_entity_links (project_key, link_type, qtest_id, parent_id)
+                VALUES (:project_key, :link_type, :qtest_id, :parent_id)
+                ON CONFLICT (project_key, link_type, qtest_id)
+                DO UPDATE SET parent_id = EXCLUDED.parent_id
+                """,
+                ),
+                [
+                    {
+                        "project_key": project_key,
+                        "link_type": link_type,
+                        "qtest_id": str(link["qtest_id"]),
+                        "parent_id": None if link["parent_id"] is None else str(link["parent_id"]),
+                    }
+                    for link in links
+                ],
+            )
+
+    def _get_qtest_parent(self, link_type: str, qtest_id: str) -> str | None:
+        """Get the recorded qTest parent of a migrated entity."""
+        try:
+            with self.get_session() as session:
+                result = session.execute(
+                    text(
+                        """
+                    SELECT parent_id FROM qtest_entity_links
+                    WHERE link_type = :link_type AND qtest_id = :qtest_id
+                    LIMIT 1
+                    """,
+                    ),
+                    {"link_type": link_type, "qtest_id": str(qtest_id)},
+                )
+                return result.scalar()
+        except Exception as e:
+            logger.error(f"Error getting qTest {link_type} link: {e!s}")
+            return None
+
     def get_qtest_module_for_testcase(self, qtest_testcase_id: str) -> str | None:
         """
         Get the qTest module ID for a test case.
@@ -857,9 +1295,7 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             qTest module ID or None if not found
 
         """
-        # This would access the qTest table in a real implementation
-        # For now, just return None as a placeholder
-        return None
+        return self._get_qtest_parent("testcase_module", qtest_testcase_id)
 
     def get_qtest_testcase_for_run(self, qtest_run_id: str) -> str | None:
         """
@@ -872,9 +1308,7 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             qTest test case ID or None if not found
 
         """
-        # This would access the qTest table in a real implementation
-        # For now, just return None as a placeholder
-        return None
+        return self._get_qtest_parent("run_testcase", qtest_run_id)
 
     def get_qtest_cycle_for_run(self, qtest_run_id: str) -> str | None:
         """
@@ -887,9 +1321,107 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             qTest test cycle ID or None if not found
 
         """
-        # This would access the qTest table in a real implementation
-        # For now, just return None as a placeholder
-        return None
+        return self._get_qtest_parent("run_cycle", qtest_run_id)
+
+    def iter_relationship_mismatches(
+        self, project_key: str, link_type: str, fetch_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream migrated entities whose qTest parent differs from the mapped one.
+
+        Each relationship type is checked with a single join of the source
+        entities, their entity mappings and the recorded qTest links, so only the
+        mismatches leave the database. Entities without a recorded link are not
+        checked, since nothing is known about where they ended up.
+
+        Args:
+            project_key: The project key
+            link_type: One of the link types of ``RELATIONSHIP_CHECKS``
+            fetch_size: Rows fetched per round trip
+
+        Yields:
+            Mismatches with entity_id, entity_name, source_parent_id, expected_parent
+            and actual_parent
+
+        """
+        source, parent_mapping, child_mapping = RELATIONSHIP_CHECKS[link_type]
+        yield from self.stream_query(
+            f"""
+            WITH source AS ({source})
+            SELECT source.entity_id, source.entity_name, source.source_parent_id,
+                   parent_map.target_id AS expected_parent, link.parent_id AS actual_parent
+            FROM source
+            JOIN entity_mappings parent_map
+                ON parent_map.project_key = :project_key
+                AND parent_map.mapping_type = :parent_mapping
+                AND parent_map.source_id = source.source_parent_id
+            JOIN entity_mappings child_map
+                ON child_map.project_key = :project_key
+                AND child_map.mapping_type = :child_mapping
+                AND child_map.source_id = source.entity_id
+            JOIN qtest_entity_links link
+                ON link.project_key = :project_key
+                AND link.link_type = :link_type
+                AND link.qtest_id = child_map.target_id
+            WHERE link.parent_id IS DISTINCT FROM parent_map.target_id
+            """,
+            {
+                "project_key": project_key,
+                "parent_mapping": parent_mapping,
+                "child_mapping": child_mapping,
+                "link_type": link_type,
+            },
+            fetch_size,
+        )
+
+    def stream_query(
+        self, sql: str, params: dict[str, Any] | None = None, fetch_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream the rows of a query through a server-side cursor.
+
+        Rows are fetched from the server ``fetch_size`` at a time, so only one batch
+        is held in memory. The session stays open until the iterator is exhausted
+        or closed.
+
+        Args:
+            sql: The SQL query
+            params: Query parameters
+            fetch_size: Rows fetched per round trip (default: the manager's fetch_size)
+
+        Yields:
+            Rows as dictionaries
+
+        """
+        statement = text(sql).execution_options(yield_per=fetch_size or self.fetch_size)
+        with self.get_session() as session:
+            for row in session.execute(statement, params or {}):
+                yield dict(row._mapping)
+
+    def iter_test_cases_with_folders(
+        self, project_key: str, fetch_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream test cases with their folder information.
+
+        Args:
+            project_key: The project key
+            fetch_size: Rows fetched per round trip
+
+        Yields:
+            Test cases with folder information
+
+        """
+        yield from self.stream_query(
+            """
+            SELECT tc.id, tc.key, tc.name, tc.folder_id, f.name as folder_name
+            FROM test_cases tc
+            LEFT JOIN folders f ON tc.folder_id = f.id
+            WHERE tc.project_key = :project_key
+            """,
+            {"project_key": project_key},
+            fetch_size,
+        )
 
     def get_test_cases_with_folders(self, project_key: str) -> list[dict[str, Any]]:
         """
@@ -903,23 +1435,36 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
 
         """
         try:
-            with self.get_session() as session:
-                result = session.execute(
-                    text(
-                        """
-                    SELECT tc.id, tc.key, tc.name, tc.folder_id, f.name as folder_name
-                    FROM test_cases tc
-                    LEFT JOIN folders f ON tc.folder_id = f.id
-                    WHERE tc.project_key = :project_key
-                    """,
-                    ),
-                    {"project_key": project_key},
-                )
-                return [dict(row) for row in result]
+            return list(self.iter_test_cases_with_folders(project_key))
         except Exception as e:
             logger.error(f"Error getting test cases with folders: {e!s}")
             return []
 
+    def iter_test_executions_with_testcases(
+        self, project_key: str, fetch_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream test executions with their test case information.
+
+        Args:
+            project_key: The project key
+            fetch_size: Rows fetched per round trip
+
+        Yields:
+            Test executions with test case information
+
+        """
+        yield from self.stream_query(
+            """
+            SELECT e.id, e.test_case_key, tc.id as test_case_id, tc.name as test_case_name
+            FROM test_executions e
+            JOIN test_cases tc ON e.test_case_key = tc.key
+            WHERE e.project_key = :project_key
+            """,
+            {"project_key": project_key},
+            fetch_size,
+        )
+
     def get_test_executions_with_testcases(self, project_key: str) -> list[dict[str, Any]]:
         """
         Get test executions with their test case information.
@@ -932,23 +1477,36 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
 
         """
         try:
-            with self.get_session() as session:
-                result = session.execute(
-                    text(
-                        """
-                    SELECT e.id, e.test_case_key, tc.id as test_case_id, tc.name as test_case_name
-                    FROM test_executions e
-                    JOIN test_cases tc ON e.test_case_key = tc.key
-                    WHERE e.project_key = :project_key
-                    """,
-                    ),
-                    {"project_key": project_key},
-                )
-                return [dict(row) for row in result]
+            return list(self.iter_test_executions_with_testcases(project_key))
         except Exception as e:
             logger.error(f"Error getting test executions with test cases: {e!s}")
             return []
 
+    def iter_test_executions_with_cycles(
+        self, project_key: str, fetch_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream test executions with their cycle information.
+
+        Args:
+            project_key: The project key
+            fetch_size: Rows fetched per round trip
+
+        Yields:
+            Test executions with cycle information
+
+        """
+        yield from self.stream_query(
+            """
+            SELECT e.id, e.cycle_id, c.name as cycle_name
+            FROM test_executions e
+            JOIN test_cycles c ON e.cycle_id = c.id
+            WHERE e.project_key = :project_key
+            """,
+            {"project_key": project_key},
+            fetch_size,
+        )
+
     def get_test_executions_with_cycles(self, project_key: str) -> list[dict[str, Any]]:
         """
         Get test executions with their cycle information.
@@ -961,23 +1519,54 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
 
         """
         try:
-            with self.get_session() as session:
-                result = session.execute(
-                    text(
-                        """
-                    SELECT e.id, e.cycle_id, c.name as cycle_name
-                    FROM test_executions e
-                    JOIN test_cycles c ON e.cycle_id = c.id
-                    WHERE e.project_key = :project_key
-                    """,
-                    ),
-                    {"project_key": project_key},
-                )
-                return [dict(row) for row in result]
+            return list(self.iter_test_executions_with_cycles(project_key))
         except Exception as e:
             logger.error(f"Error getting test executions with cycles: {e!s}")
             return []
 
+    def iter_test_cases_with_custom_fields(
+        self, project_key: str, fetch_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream test cases with their custom fields.
+
+        Args:
+            project_key: The project key
+            fetch_size: Rows fetched per round trip
+
+        Yields:
+            Test cases with custom fields as a name-value dictionary
+
+        """
+        # Directly use the JSON custom_fields column from test_cases
+        rows = self.stream_query(
+            """
+            SELECT id, key, name, custom_fields
+            FROM test_cases
+            WHERE project_key = :project_key
+            AND custom_fields IS NOT NULL
+            """,
+            {"project_key": project_key},
+            fetch_size,
+        )
+        for test_case in rows:
+            test_case["custom_fields"] = self._parse_custom_fields(test_case["custom_fields"])
+            yield test_case
+
+    def _parse_custom_fields(self, value: Any) -> dict[str, Any]:
+        """Convert a JSON list of custom fields to a name-value dictionary."""
+        if not value:
+            return {}
+        try:
+            custom_fields = json.loads(value) if isinstance(value, str) else value
+            return {
+                cf["name"]: cf["value"]
+                for cf in custom_fields
+                if isinstance(cf, dict) and "name" in cf and "value" in cf
+            }
+        except Exception:
+            return {}
+
     def get_test_cases_with_custom_fields(self, project_key: str) -> list[dict[str, Any]]:
         """
         Get test cases with their custom fields.
@@ -990,42 +1579,7 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
 
         """
         try:
-            with self.get_session() as session:
-                # Directly use the JSON custom_fields column from test_cases
-                result = session.execute(
-                    text(
-                        """
-                    SELECT id, key, name, custom_fields
-                    FROM test_cases
-                    WHERE project_key = :project_key
-                    AND custom_fields IS NOT NULL
-                    """,
-                    ),
-                    {"project_key": project_key},
-                )
-
-                test_cases = []
-                for row in result:
-                    test_case = dict(row)
-
-                    # Parse custom_fields JSON
-                    if test_case["custom_fields"]:
-                        try:
-                            custom_fields = json.loads(test_case["custom_fields"])
-                            # Convert list to dictionary for easier access
-                            custom_fields_dict = {}
-                            for cf in custom_fields:
-                                if isinstance(cf, dict) and "name" in cf and "value" in cf:
-                                    custom_fields_dict[cf["name"]] = cf["value"]
-                            test_case["custom_fields"] = custom_fields_dict
-                        except:
-                            test_case["custom_fields"] = {}
-                    else:
-                        test_case["custom_fields"] = {}
-
-                    test_cases.append(test_case)
-
-                return test_cases
+            return list(self.iter_test_cases_with_custom_fields(project_key))
         except Exception as e:
             logger.error(f"Error getting test cases with custom fields: {e!s}")
             return []
@@ -1045,6 +1599,57 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
         # For now, just return an empty dict as a placeholder
         return {}
 
+    def iter_entities_with_attachments(
+        self, project_key: str, fetch_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream entities with their attachments.
+
+        Test cases, test executions and test cycles are streamed one table after
+        the other.
+
+        Args:
+            project_key: The project key
+            fetch_size: Rows fetched per round trip
+
+        Yields:
+            Entities with entity_type, entity_id and attachments
+
+        """
+        queries = (
+            """
+            SELECT id, key, name, attachments, 'test_cases' as entity_type
+            FROM test_cases
+            WHERE project_key = :project_key
+            AND attachments IS NOT NULL
+            """,
+            """
+            SELECT id, test_case_key, attachments, 'test_executions' as entity_type
+            FROM test_executions
+            WHERE project_key = :project_key
+            AND attachments IS NOT NULL
+            """,
+            """
+            SELECT id, key, name, attachments, 'test_cycles' as entity_type
+            FROM test_cycles
+            WHERE project_key = :project_key
+            AND attachments IS NOT NULL
+            """,
+        )
+        for sql in queries:
+            for entity in self.stream_query(sql, {"project_key": project_key}, fetch_size):
+                if not entity["attachments"]:
+                    continue
+                try:
+                    attachments = json.loads(entity["attachments"])
+                except Exception:
+                    continue
+                yield {
+                    "entity_type": entity["entity_type"],
+                    "entity_id": entity["id"],
+                    "attachments": attachments,
+                }
+
     def get_entities_with_attachments(self, project_key: str) -> list[dict[str, Any]]:
         """
         Get entities with their attachments.
@@ -1056,98 +1661,8 @@ class PostgreSQLDatabaseManager(SQLiteDatabaseManager):
             List of entities with attachment information
 
         """
-        attachments_by_entity = {}
-
         try:
-            with self.get_session() as session:
-                # Get test cases with attachments
-                result = session.execute(
-                    text(
-                        """
-                    SELECT id, key, name, attachments, 'test_cases' as entity_type
-                    FROM test_cases
-                    WHERE project_key = :project_key
-                    AND attachments IS NOT NULL
-                    """,
-                    ),
-                    {"project_key": project_key},
-                )
-
-                for row in result:
-                    entity = dict(row)
-
-                    # Parse attachments JSON
-                    if entity["attachments"]:
-                        try:
-                            attachments = json.loads(entity["attachments"])
-                            entity_key = (entity["entity_type"], entity["id"])
-                            attachments_by_entity[entity_key] = {
-                                "entity_type": entity["entity_type"],
-                                "entity_id": entity["id"],
-                                "attachments": attachments,
-                            }
-                        except:
-                            pass
-
-                # Get test executions with attachments
-                result = session.execute(
-                    text(
-                        """
-                    SELECT id, test_case_key, attachments, 'test_executions' as entity_type
-                    FROM test_executions
-                    WHERE project_key = :project_key
-                    AND attachments IS NOT NULL
-                    """,
-                    ),
-                    {"project_key": project_key},
-                )
-
-                for row in result:
-                    entity = dict(row)
-
-                    # Parse attachments JSON
-                    if entity["attachments"]:
-                        try:
-                            attachments = json.loads(entity["attachments"])
-                            entity_key = (entity["entity_type"], entity["id"])
-                            attachments_by_entity[entity_key] = {
-                                "entity_type": entity["entity_type"],
-                                "entity_id": entity["id"],
-                                "attachments": attachments,
-                            }
-                        except:
-                            pass
-
-                # Get test cycles with attachments
-                result = session.execute(
-                    text(
-                        """
-                    SELECT id, key, name, attachments, 'test_cycles' as entity_type
-                    FROM test_cycles
-                    WHERE project_key = :project_key
-                    AND attachments IS NOT NULL
-                    """,
-                    ),
-                    {"project_key": project_key},
-                )
-
-                for row in result:
-                    entity = dict(row)
-
-                    # Parse attachments JSON
-                    if entity["attachments"]:
-                        try:
-                            attachments = json.loads(entity["attachments"])
-                            entity_key = (entity["entity_type"], entity["id"])
-                            attachments_by_entity[entity_key] = {
-                                "entity_type": entity["entity_type"],
-                                "entity_id": entity["id"],
-                                "attachments": attachments,
-                            }
-                        except:
-                            pass
-
-                return list(attachments_by_entity.values())
+            return list(self.iter_entities_with_attachments(project_key))
         except Exception as e:
             logger.error(f"Error getting entities with attachments: {e!s}")
             return []
@@ -16,7 +16,10 @@ import logging
 import os
 import time
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Generic, TypeVar, cast
 
@@ -40,6 +43,7 @@ from ztoq.qtest_models import (
     QTestTestCycle,
     QTestTestRun,
 )
+from ztoq.rate_limiter import TokenBucketRateLimiter
 
 T = TypeVar("T")
 
@@ -53,6 +57,20 @@ logger = logging.getLogger("ztoq.qtest_client")
 DEFAULT_PAGE_SIZE = 100
 MAX_PAGE_SIZE = 1000
 
+# Number of test cases sent per bulk creation request
+DEFAULT_BULK_CHUNK_SIZE = 100
+
+# Statuses with which qTest rejects the records of a bulk request; only these are
+# worth bisecting, since a smaller request can succeed where the whole one did not
+BULK_RECORD_ERROR_STATUSES = frozenset({400, 422})
+
+# Overloaded and unavailable responses, retried with backoff like transport errors
+BULK_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Attempts and first backoff delay in seconds for transient bulk request failures
+BULK_RETRY_ATTEMPTS = 3
+BULK_RETRY_DELAY = 1.0
+
 class CorrelationIDFilter(logging.Filter):
     """
     Logging filter that adds correlation ID to log records.
@@ -144,8 +162,65 @@ def get_correlation_id() -> str:
 # Initialize logging with default settings
 configure_logging()
 
+def _error_status(error: Exception) -> int | None:
+    """Return the HTTP status of a failed request, if it got a response."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _is_record_error(error: Exception) -> bool:
+    """Whether qTest rejected the records of a request rather than the request."""
+    return (
+        isinstance(error, requests.exceptions.HTTPError)
+        and _error_status(error) in BULK_RECORD_ERROR_STATUSES
+    )
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Whether a failed request is worth sending again after a pause."""
+    if isinstance(error, requests.exceptions.ConnectionError | requests.exceptions.Timeout):
+        return True
+    return (
+        isinstance(error, requests.exceptions.HTTPError)
+        and _error_status(error) in BULK_TRANSIENT_STATUSES
+    )
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Return the delay a 429 or 503 response asked for, in seconds."""
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers["Retry-After"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class BulkCreateResult:
+    """Outcome of creating one record as part of a chunked bulk request."""
+
+    index: int
+    test_case: QTestTestCase | None = None
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the record was created."""
+        return self.test_case is not None
+
+
 class QTestPaginatedIterator(Generic[T]):
-    """Iterator for paginated API responses."""
+    """
+    Iterator for paginated API responses.
+
+    By default pages are fetched one at a time, when the current page runs out.
+    With ``prefetch_pages`` greater than zero the iterator uses the ``total`` reported
+    by the first page to request the remaining pages concurrently on a bounded
+    worker pool - by ``page`` number for the Manager API and by ``offset`` for the
+    other APIs. Pages are always yielded in order, and no more requests are kept in
+    flight than the client's ``rate_limit_remaining`` (from ``X-RateLimit-Remaining``)
+    allows.
+    """
 
     def __init__(
         self,
@@ -154,6 +229,7 @@ class QTestPaginatedIterator(Generic[T]):
         model_class: type[T],
         params: dict[str, Any] | None = None,
         page_size: int = 50,
+        prefetch_pages: int = 0,
     ):
         """
         Initialize the paginated iterator.
@@ -164,6 +240,7 @@ class QTestPaginatedIterator(Generic[T]):
             model_class: Model class for response items
             params: Additional query parameters
             page_size: Number of items per page
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
 
         """
         self.client = client
@@ -182,10 +259,19 @@ class QTestPaginatedIterator(Generic[T]):
         self.current_page: QTestPaginatedResponse | None = None
         self.item_index = 0
         self.total_fetched = 0
+        self.total: int | None = None
+
+        # Prefetching state: the next page number (Manager API) or offset to request
+        self.prefetch_pages = max(0, prefetch_pages)
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: deque[Future] = deque()
+        self._next_position = 0
+        self._stride = 1 if client.api_type == "manager" else page_size
+        self._end_position = 0
 
         logger.debug(
             f"QTestPaginatedIterator initialized for {endpoint} with page size {page_size}, "
-            f"model class {model_class.__name__}",
+            f"model class {model_class.__name__}, prefetch pages {self.prefetch_pages}",
         )
 
     def __iter__(self):
@@ -208,6 +294,7 @@ class QTestPaginatedIterator(Generic[T]):
                 logger.debug(
                     f"Reached last page for {self.endpoint}, total items fetched: {self.total_fetched}",
                 )
+                self.close()
                 raise StopIteration
 
             logger.debug(
@@ -228,6 +315,10 @@ class QTestPaginatedIterator(Generic[T]):
 
     def _fetch_next_page(self):
         """Fetch the next page of results."""
+        if self.prefetch_pages and self.current_page is not None:
+            self._take_prefetched_page()
+            return
+
         page_number = 0
         if self.current_page:
             if self.client.api_type == "manager":
@@ -245,11 +336,24 @@ class QTestPaginatedIterator(Generic[T]):
         logger.debug(f"Fetching page {page_number + 1} from {self.endpoint}")
 
         response = self.client._make_request("GET", self.endpoint, params=self.params)
+        self.current_page = self._parse_page(response)
+        self.item_index = 0
+
+        if self.total is None:
+            self.total = self.current_page.total
+            self._plan_prefetch()
+
+        logger.debug(
+            f"Received page {page_number + 1} with {len(self.current_page.items)} items, "
+            f"total: {self.current_page.total}, isLast: {self.current_page.is_last}",
+        )
 
+    def _parse_page(self, response: Any) -> QTestPaginatedResponse:
+        """Convert a raw API response into a page."""
         # Handle different response formats - either a dict with pagination or a direct list
         if isinstance(response, list):
             # Direct list of items
-            self.current_page = QTestPaginatedResponse(
+            return QTestPaginatedResponse(
                 items=response,
                 page=0,
                 page_size=len(response),
@@ -257,33 +361,109 @@ class QTestPaginatedIterator(Generic[T]):
                 is_last=True,  # Assume this is the only page when the response is a list
             )
         # Handle different pagination formats depending on API type
-        elif self.client.api_type == "manager" and isinstance(response, dict):
-            self.current_page = QTestPaginatedResponse(
+        if self.client.api_type == "manager" and isinstance(response, dict):
+            # Manager API pages are numbered from 1
+            page = response.get("page", 0)
+            return QTestPaginatedResponse(
                 items=response.get("items", []),
-                page=response.get("page", 0),
+                page=page,
                 page_size=response.get("pageSize", 0),
                 total=response.get("total", 0),
-                is_last=response.get("page", 0) * response.get("pageSize", 0)
+                is_last=max(page - 1, 0) * response.get("pageSize", 0)
                 + len(response.get("items", []))
                 >= response.get("total", 0),
             )
+        return QTestPaginatedResponse(
+            items=response.get("data", []),
+            offset=response.get("offset", 0),
+            limit=response.get("limit", 0),
+            total=response.get("total", 0),
+            is_last=response.get("offset", 0) + len(response.get("data", []))
+            >= response.get("total", 0),
+        )
+
+    def _plan_prefetch(self):
+        """Work out the remaining page positions from the first page."""
+        page = self.current_page
+        if not self.prefetch_pages or page is None or page.is_last or not page.items:
+            return
+
+        if self.client.api_type == "manager":
+            # Later pages use the page size the server honoured
+            page_size = page.page_size or len(page.items)
+            self._next_position = (page.page or 1) + 1
+            self._end_position = -(-page.total // page_size) + 1  # last page number + 1
         else:
-            self.current_page = QTestPaginatedResponse(
-                items=response.get("data", []),
-                offset=response.get("offset", 0),
-                limit=response.get("limit", 0),
-                total=response.get("total", 0),
-                is_last=response.get("offset", 0) + len(response.get("data", []))
-                >= response.get("total", 0),
+            self._stride = len(page.items)
+            self._next_position = (page.offset or 0) + len(page.items)
+            self._end_position = page.total
+
+    def _request_page(self, position: int) -> QTestPaginatedResponse:
+        """Request the page at the given page number or offset (runs on the prefetch pool)."""
+        params = dict(self.params)
+        params[self.page_param] = position
+        response = self.client._make_request("GET", self.endpoint, params=params)
+        return self._parse_page(response)
+
+    def _schedule_prefetch(self):
+        """Top up the prefetch window with requests for the next pages."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.prefetch_pages, thread_name_prefix="ztoq-qtest-prefetch",
+            )
+
+        while (
+            len(self._pending) < self.prefetch_pages
+            and self._next_position < self._end_position
+            and len(self._pending) < self.client.rate_limit_remaining
+        ):
+            logger.debug(
+                f"Prefetching page from {self.endpoint} ({self.page_param}={self._next_position})",
             )
+            self._pending.append(self._executor.submit(self._request_page, self._next_position))
+            self._next_position += self._stride
+
+    def _take_prefetched_page(self):
+        """Replace the current page with the next page in order."""
+        self._schedule_prefetch()
 
+        if self._pending:
+            try:
+                page = self._pending.popleft().result()
+            except Exception:
+                self.close()
+                raise
+        else:
+            # Nothing in flight - either the rate limit is exhausted or the reported
+            # total was exceeded, so fall back to a blocking fetch at the next position
+            page = self._request_page(self._next_position)
+            self._next_position += self._stride
+
+        self.current_page = page
         self.item_index = 0
 
         logger.debug(
-            f"Received page {page_number + 1} with {len(self.current_page.items)} items, "
-            f"total: {self.current_page.total}, isLast: {self.current_page.is_last}",
+            f"Received prefetched page with {len(page.items)} items, "
+            f"total: {page.total}, isLast: {page.is_last}",
         )
 
+        if page.is_last or not page.items:
+            # Discard anything fetched past the end of the result set
+            self.current_page = page.model_copy(update={"is_last": True})
+            self.close()
+        else:
+            self._schedule_prefetch()
+
+    def close(self):
+        """Cancel outstanding prefetch requests and release the worker pool."""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
 class QTestClient:
     """Client for interacting with the qTest APIs."""
 
@@ -293,6 +473,7 @@ class QTestClient:
         api_type: str = "manager",
         log_level=None,
         correlation_id: str | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
     ):
         """
         Initialize the qTest client with configuration.
@@ -303,6 +484,9 @@ class QTestClient:
             log_level: Optional logging level to use for this client instance
                       (e.g., "DEBUG", "INFO", "WARNING", "ERROR")
             correlation_id: Optional correlation ID for request tracing
+            rate_limiter: Optional token bucket shared with other clients, threads or
+                processes; requests wait for a token instead of only pausing once
+                the remaining quota reaches zero
 
         """
         # Set correlation ID for this client instance
@@ -314,6 +498,7 @@ class QTestClient:
         self.auth_token = None
         self.rate_limit_remaining = 1000  # Default high value
         self.rate_limit_reset = 0
+        self.rate_limiter = rate_limiter
 
         # Request metrics for logging and monitoring
         self.request_count = 0
@@ -485,7 +670,9 @@ class QTestClient:
         request_number = self.request_count
 
         # Check rate limits - this happens before we even attempt the request
-        if self.rate_limit_remaining <= 0:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        elif self.rate_limit_remaining <= 0:
             wait_time = max(0, self.rate_limit_reset - time.time())
             if wait_time > 0:
                 logger.info(f"Rate limit reached. Waiting {wait_time:.2f} seconds")
@@ -560,6 +747,8 @@ class QTestClient:
                     logger.debug(f"Rate limit remaining: {self.rate_limit_remaining}")
                 if "X-RateLimit-Reset" in response.headers:
                     self.rate_limit_reset = int(response.headers["X-RateLimit-Reset"])
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe_response(response.headers, response.status_code)
 
                 # Extract correlation ID from response if present
                 response_correlation_id = response.headers.get("X-Correlation-ID", "")
@@ -751,12 +940,15 @@ class QTestClient:
 
         return self._make_request("GET", endpoint)
 
-    def get_test_cases(self, module_id: int | None = None) -> QTestPaginatedIterator[QTestTestCase]:
+    def get_test_cases(
+        self, module_id: int | None = None, prefetch_pages: int = 0,
+    ) -> QTestPaginatedIterator[QTestTestCase]:
         """
         Get all test cases for a project or module.
 
         Args:
             module_id: Optional module ID to filter test cases
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
 
         Returns:
             Iterator of test cases
@@ -768,7 +960,11 @@ class QTestClient:
             params["parentId"] = module_id
 
         return QTestPaginatedIterator[QTestTestCase](
-            client=self, endpoint=endpoint, model_class=QTestTestCase, params=params,
+            client=self,
+            endpoint=endpoint,
+            model_class=QTestTestCase,
+            params=params,
+            prefetch_pages=prefetch_pages,
         )
 
     def get_test_case(self, test_case_id: int) -> QTestTestCase:
@@ -1162,6 +1358,120 @@ class QTestClient:
         # Return list of QTestTestCase objects
         return [QTestTestCase(**tc_data) for tc_data in response]
 
+    def bulk_create_test_cases_chunked(
+        self,
+        test_cases: list[QTestTestCase],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_workers: int = 4,
+    ) -> list[BulkCreateResult]:
+        """
+        Create many test cases as concurrent bulk requests, isolating bad records.
+
+        The test cases are split into chunks of at most ``chunk_size`` that are
+        submitted concurrently. When qTest rejects the records of a chunk (400/422) it
+        is bisected and the halves are retried until each failing record has been
+        isolated, so one invalid test case does not fail the records around it.
+        Overload, server and transport errors are retried with backoff instead.
+
+        Args:
+            test_cases: List of test cases to create
+            chunk_size: Maximum number of test cases per bulk request
+            max_workers: Maximum number of chunks in flight at once
+
+        Returns:
+            One result per input test case, in input order
+
+        """
+        if not test_cases:
+            return []
+
+        chunks = [
+            (start, test_cases[start : start + chunk_size])
+            for start in range(0, len(test_cases), max(1, chunk_size))
+        ]
+        logger.info(
+            f"Creating {len(test_cases)} test cases in {len(chunks)} bulk requests "
+            f"of up to {chunk_size}",
+        )
+
+        results: list[BulkCreateResult] = []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(chunks))),
+            thread_name_prefix="ztoq-qtest-bulk",
+        ) as executor:
+            futures = [
+                executor.submit(self._create_chunk_isolating_failures, chunk, start)
+                for start, chunk in chunks
+            ]
+            for future in futures:
+                results.extend(future.result())
+
+        return results
+
+    def _create_chunk_isolating_failures(
+        self, test_cases: list[QTestTestCase], offset: int,
+    ) -> list[BulkCreateResult]:
+        """
+        Create a chunk of test cases, bisecting it on failure to find the bad records.
+
+        Only a rejection of the records themselves (400/422) is bisected. Overload,
+        server and transport errors are retried with backoff, and any other failure
+        fails the chunk as a whole, since splitting it would only multiply the requests.
+        """
+        try:
+            created = self._bulk_create_with_backoff(test_cases)
+        except Exception as e:
+            if not _is_record_error(e):
+                logger.error(f"Bulk request for {len(test_cases)} test cases failed: {e!s}")
+                return [
+                    BulkCreateResult(index=offset + i, error=str(e))
+                    for i in range(len(test_cases))
+                ]
+
+            if len(test_cases) == 1:
+                logger.error(f"Failed to create test case '{test_cases[0].name}': {e!s}")
+                return [BulkCreateResult(index=offset, error=str(e))]
+
+            middle = len(test_cases) // 2
+            logger.warning(
+                f"Bulk request for {len(test_cases)} test cases failed ({e!s}), "
+                "splitting to isolate failing records",
+            )
+            return self._create_chunk_isolating_failures(
+                test_cases[:middle], offset,
+            ) + self._create_chunk_isolating_failures(test_cases[middle:], offset + middle)
+
+        if len(created) != len(test_cases):
+            # Records cannot be matched up, and retrying could create duplicates
+            error = (
+                f"Bulk response contained {len(created)} test cases for "
+                f"{len(test_cases)} submitted"
+            )
+            logger.error(error)
+            return [BulkCreateResult(index=offset + i, error=error) for i in range(len(test_cases))]
+
+        return [
+            BulkCreateResult(index=offset + i, test_case=test_case)
+            for i, test_case in enumerate(created)
+        ]
+
+    def _bulk_create_with_backoff(self, test_cases: list[QTestTestCase]) -> list[QTestTestCase]:
+        """Send a bulk create request, retrying transient failures with backoff."""
+        attempt = 1
+        while True:
+            try:
+                return self.bulk_create_test_cases(test_cases)
+            except Exception as e:
+                if not _is_transient_error(e) or attempt >= BULK_RETRY_ATTEMPTS:
+                    raise
+                delay = _retry_after(e) or BULK_RETRY_DELAY * 2 ** (attempt - 1)
+                logger.warning(
+                    f"Bulk request for {len(test_cases)} test cases failed ({e!s}), "
+                    f"retrying in {delay:.1f}s",
+                )
+                time.sleep(delay)
+                attempt += 1
+
     def get_test_case_links(self, test_case_id: int) -> list[QTestLink]:
         """
         Get all links for a test case.
@@ -1248,10 +1558,13 @@ class QTestClient:
 
         return [QTestTestCase(**tc) for tc in test_cases_data]
 
-    def get_test_cycles(self) -> QTestPaginatedIterator[QTestTestCycle]:
+    def get_test_cycles(self, prefetch_pages: int = 0) -> QTestPaginatedIterator[QTestTestCycle]:
         """
         Get all test cycles for a project.
 
+        Args:
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
+
         Returns:
             Iterator of test cycles
 
@@ -1259,7 +1572,10 @@ class QTestClient:
         endpoint = f"/projects/{self.config.project_id}/test-cycles"
 
         return QTestPaginatedIterator[QTestTestCycle](
-            client=self, endpoint=endpoint, model_class=QTestTestCycle,
+            client=self,
+            endpoint=endpoint,
+            model_class=QTestTestCycle,
+            prefetch_pages=prefetch_pages,
         )
 
     def create_test_cycle(self, test_cycle: QTestTestCycle) -> QTestTestCycle:
@@ -1394,7 +1710,9 @@ class QTestClient:
         request_data = {"testCaseIds": test_case_ids}
         return self._make_request("POST", endpoint, json_data=request_data)
 
-    def search_test_cycles(self, search_criteria: dict[str, Any]) -> list[QTestTestCycle]:
+    def search_test_cycles(
+        self, search_criteria: dict[str, Any], prefetch_pages: int = 4,
+    ) -> list[QTestTestCycle]:
         """
         Search for test cycles with specific criteria.
 
@@ -1407,6 +1725,8 @@ class QTestClient:
                 - properties: List of property objects to match
                 - created_from: ISO-8601 datetime string for creation date range start
                 - created_to: ISO-8601 datetime string for creation date range end
+            prefetch_pages: Number of result pages to fetch ahead concurrently for
+                simple searches (0 fetches pages one at a time)
 
         Returns:
             List of matching test cycles
@@ -1426,15 +1746,16 @@ class QTestClient:
                 else:
                     params[key] = value
 
-            response = self._make_request(
-                "GET", f"/projects/{self.config.project_id}/test-cycles", params=params,
+            # Walk every result page, not just the first one
+            test_cycles_data = list(
+                QTestPaginatedIterator[dict](
+                    client=self,
+                    endpoint=f"/projects/{self.config.project_id}/test-cycles",
+                    model_class=dict,
+                    params=params,
+                    prefetch_pages=prefetch_pages,
+                ),
             )
-
-            # Handle paginated response
-            if isinstance(response, dict) and "items" in response:
-                test_cycles_data = response.get("items", [])
-            else:
-                test_cycles_data = response
         else:
             # For more complex search, use POST with JSON body
             response = self._make_request("POST", endpoint, json_data=search_criteria)
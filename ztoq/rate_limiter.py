@@ -0,0 +1,355 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+Token bucket rate limiting shared by API clients.
+
+Clients that each watch their own ``X-RateLimit-Remaining`` counter do not coordinate:
+every client runs at full speed until the server starts answering with 429s. A
+TokenBucketRateLimiter paces requests to a configured rate instead, and narrows that
+pace using the rate limit headers the server sends back. One limiter can be shared by
+any number of clients and threads; with a SQLiteBucketStore the same bucket is also
+shared by worker processes on the same machine.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeVar
+
+R = TypeVar("R")
+
+logger = logging.getLogger("ztoq.rate_limiter")
+
+
+@dataclass
+class BucketState:
+    """Mutable state of one token bucket."""
+
+    tokens: float
+    updated_at: float
+    blocked_until: float = 0.0
+    server_rate: float | None = None
+    window_reset: float = 0.0
+
+
+class BucketStore(ABC):
+    """Storage for bucket state that applies updates atomically."""
+
+    @abstractmethod
+    def update(
+        self, name: str, initial: BucketState, apply: Callable[[BucketState], R],
+    ) -> R:
+        """
+        Apply a function to the state of a bucket atomically.
+
+        Args:
+            name: Name of the bucket
+            initial: State to start from when the bucket does not exist yet
+            apply: Function that mutates the state in place and returns a result
+
+        Returns:
+            The result of ``apply``
+
+        """
+
+
+class MemoryBucketStore(BucketStore):
+    """Bucket store shared by the threads of one process."""
+
+    def __init__(self):
+        self._states: dict[str, BucketState] = {}
+        self._lock = threading.Lock()
+
+    def update(
+        self, name: str, initial: BucketState, apply: Callable[[BucketState], R],
+    ) -> R:
+        with self._lock:
+            state = self._states.setdefault(name, initial)
+            return apply(state)
+
+
+class SQLiteBucketStore(BucketStore):
+    """
+    Bucket store in a SQLite file, shared by all processes that open the same path.
+
+    Every update runs in an immediate transaction, so concurrent processes take
+    tokens one after another rather than reading the same balance.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0):
+        """
+        Initialize the store.
+
+        Args:
+            path: Path of the SQLite file holding the buckets
+            timeout: Seconds to wait for another process to release the database
+
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS token_buckets (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    blocked_until REAL NOT NULL,
+                    server_rate REAL,
+                    window_reset REAL NOT NULL
+                )
+                """,
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per update keeps the store usable from any thread
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def update(
+        self, name: str, initial: BucketState, apply: Callable[[BucketState], R],
+    ) -> R:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tokens, updated_at, blocked_until, server_rate, window_reset "
+                "FROM token_buckets WHERE name = ?",
+                (name,),
+            ).fetchone()
+            state = BucketState(*row) if row else initial
+            result = apply(state)
+            conn.execute(
+                "INSERT OR REPLACE INTO token_buckets "
+                "(name, tokens, updated_at, blocked_until, server_rate, window_reset) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    name,
+                    state.tokens,
+                    state.updated_at,
+                    state.blocked_until,
+                    state.server_rate,
+                    state.window_reset,
+                ),
+            )
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket limiting the request rate of one or more API clients.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, and each
+    request takes one. Rate limit headers from the server tighten the bucket: the
+    remaining quota caps the balance, the refill pace is spread over the time left
+    until the reset, and an exhausted quota or a ``Retry-After`` blocks the bucket
+    until the server accepts requests again.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        store: BucketStore | None = None,
+        name: str = "default",
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Requests allowed per second
+            capacity: Maximum burst of requests (defaults to one second's worth)
+            store: Store holding the bucket state (defaults to an in-process store)
+            name: Name of the bucket in the store, so one store can hold several APIs
+            clock: Wall clock function, shared by every process using the store
+            sleep: Function used to wait for tokens
+
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.store = store or MemoryBucketStore()
+        self.name = name
+        self._clock = clock
+        self._sleep = sleep
+
+    def _current_rate(self, state: BucketState, now: float) -> float:
+        # The pace derived from the headers only holds until the window resets
+        if state.server_rate is not None and now < state.window_reset:
+            return min(self.rate, state.server_rate)
+        return self.rate
+
+    def _refill(self, state: BucketState, now: float) -> None:
+        rate = self._current_rate(state, now)
+        elapsed = max(0.0, now - state.updated_at)
+        state.tokens = min(self.capacity, state.tokens + elapsed * rate)
+        state.updated_at = now
+
+    def _initial_state(self) -> BucketState:
+        return BucketState(tokens=self.capacity, updated_at=self._clock())
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens if they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            0.0 if the tokens were taken, otherwise the seconds to wait before retrying
+
+        """
+
+        def take(state: BucketState) -> float:
+            now = self._clock()
+            if state.blocked_until > now:
+                return state.blocked_until - now
+            self._refill(state, now)
+            if state.tokens >= tokens:
+                state.tokens -= tokens
+                return 0.0
+            return (tokens - state.tokens) / self._current_rate(state, now)
+
+        return self.store.update(self.name, self._initial_state(), take)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait until tokens are available and take them.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Total seconds spent waiting
+
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                if waited:
+                    logger.debug(f"Rate limiter '{self.name}' delayed request by {waited:.2f}s")
+                return waited
+            self._sleep(wait)
+            waited += wait
+
+    def update_from_headers(
+        self,
+        remaining: int | None = None,
+        reset: float | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        """
+        Adjust the bucket to the quota reported by the server.
+
+        Args:
+            remaining: Requests left in the current window (``X-RateLimit-Remaining``)
+            reset: Epoch seconds at which the window resets (``X-RateLimit-Reset``)
+            retry_after: Seconds the server asked to wait (``Retry-After``)
+
+        """
+        if remaining is None and retry_after is None:
+            return
+
+        def apply(state: BucketState) -> None:
+            now = self._clock()
+            self._refill(state, now)
+            if retry_after is not None:
+                state.blocked_until = max(state.blocked_until, now + retry_after)
+                state.tokens = 0.0
+            if remaining is None:
+                return
+            state.tokens = min(state.tokens, float(remaining))
+            state.server_rate = None
+            if reset is None or reset <= now:
+                return
+            if remaining <= 0:
+                # Quota exhausted - nothing more until the window resets
+                state.blocked_until = max(state.blocked_until, reset)
+            else:
+                # Spread the remaining quota over the rest of the window
+                state.server_rate = remaining / (reset - now)
+                state.window_reset = reset
+
+        self.store.update(self.name, self._initial_state(), apply)
+
+    def observe_response(
+        self,
+        headers: Mapping[str, str],
+        status_code: int | None = None,
+        remaining_header: str = "X-RateLimit-Remaining",
+        reset_header: str = "X-RateLimit-Reset",
+    ) -> None:
+        """
+        Adjust the bucket from the rate limit headers of a response.
+
+        Args:
+            headers: Response headers
+            status_code: Response status code; ``Retry-After`` is honoured on 429
+            remaining_header: Name of the header with the remaining quota
+            reset_header: Name of the header with the reset time in epoch seconds
+
+        """
+        retry_after = None
+        if status_code == 429:
+            # Without a Retry-After, back off for one refill interval
+            retry_after = _header_number(headers, "Retry-After") or 1.0 / self.rate
+        remaining = _header_number(headers, remaining_header)
+        self.update_from_headers(
+            remaining=int(remaining) if remaining is not None else None,
+            reset=_header_number(headers, reset_header),
+            retry_after=retry_after,
+        )
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> float | None:
+    """Read a numeric header, ignoring missing or malformed values."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def create_rate_limiter(
+    rate: float,
+    capacity: float | None = None,
+    shared_path: str | Path | None = None,
+    name: str = "default",
+) -> TokenBucketRateLimiter:
+    """
+    Create a token bucket rate limiter.
+
+    Args:
+        rate: Requests allowed per second
+        capacity: Maximum burst of requests
+        shared_path: Optional SQLite file for sharing the bucket across processes
+        name: Name of the bucket, e.g. the API it limits
+
+    Returns:
+        A configured TokenBucketRateLimiter
+
+    """
+    store = SQLiteBucketStore(shared_path) if shared_path else MemoryBucketStore()
+    return TokenBucketRateLimiter(rate, capacity=capacity, store=store, name=name)
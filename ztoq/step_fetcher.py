@@ -0,0 +1,164 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+Batched test step fetching for test case extraction.
+
+Zephyr Scale only exposes test steps per test case, so extracting a project
+needs one request per case. BulkStepFetcher issues those requests for a whole
+batch of cases concurrently on a bounded, long-lived worker pool and caches the
+results by test case and version, so re-extracting an unchanged case does not
+hit the API again.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from ztoq.models import Case, CaseStep
+
+logger = logging.getLogger("ztoq.step_fetcher")
+
+
+class BulkStepFetcher:
+    """
+    Fetches the test steps for batches of test cases.
+
+    Attributes:
+        client: ZephyrClient used to request the steps
+        max_workers: Maximum number of concurrent step requests
+        use_inline_steps: Skip the request for cases whose steps came back inline
+        cache_size: Maximum number of cached step lists (None for unbounded)
+        stats: Counters for fetched, cached and inline step lists
+
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_workers: int = 8,
+        use_inline_steps: bool = False,
+        cache_size: int | None = 10000,
+    ):
+        """
+        Initialize the step fetcher.
+
+        Args:
+            client: ZephyrClient used to request the steps
+            max_workers: Maximum number of concurrent step requests
+            use_inline_steps: When True, cases whose payload already contains steps are
+                not fetched again
+            cache_size: Maximum number of cached step lists (None for unbounded)
+
+        """
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self.use_inline_steps = use_inline_steps
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str | None], list[CaseStep]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self.stats = {"fetched": 0, "cache_hits": 0, "inline": 0}
+
+    @staticmethod
+    def _cache_key(test_case: Case) -> tuple[str, str | None]:
+        return (test_case.key or test_case.id, test_case.version)
+
+    def _get_cached(self, key: tuple[str, str | None]) -> list[CaseStep] | None:
+        with self._lock:
+            steps = self._cache.get(key)
+            if steps is not None:
+                self._cache.move_to_end(key)
+            return steps
+
+    def _put_cached(self, key: tuple[str, str | None], steps: list[CaseStep]) -> None:
+        with self._lock:
+            self._cache[key] = steps
+            self._cache.move_to_end(key)
+            if self.cache_size is not None:
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+    def fetch_steps(self, test_cases: list[Case]) -> dict[str, list[CaseStep]]:
+        """
+        Get the steps for a batch of test cases.
+
+        Cached and (optionally) inline steps are returned without a request; the
+        remaining cases are fetched concurrently, bounded by ``max_workers``.
+
+        Args:
+            test_cases: Test cases of one extraction batch
+
+        Returns:
+            Dictionary mapping test case ID to its list of steps
+
+        Raises:
+            Exception: The first error raised by a step request, after all requests
+                of the batch have finished
+
+        """
+        results: dict[str, list[CaseStep]] = {}
+        to_fetch: list[Case] = []
+
+        for test_case in test_cases:
+            if self.use_inline_steps and test_case.steps:
+                results[test_case.id] = list(test_case.steps)
+                self.stats["inline"] += 1
+                continue
+
+            cached = self._get_cached(self._cache_key(test_case))
+            if cached is not None:
+                results[test_case.id] = list(cached)
+                self.stats["cache_hits"] += 1
+            else:
+                to_fetch.append(test_case)
+
+        if not to_fetch:
+            return results
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ztoq-steps",
+            )
+
+        futures = [
+            (test_case, self._executor.submit(self.client.get_test_steps, test_case.key))
+            for test_case in to_fetch
+        ]
+
+        first_error = None
+        for test_case, future in futures:
+            try:
+                steps = list(future.result())
+            except Exception as e:
+                logger.error(f"Failed to fetch steps for test case {test_case.key}: {e!s}")
+                first_error = first_error or e
+                continue
+            self._put_cached(self._cache_key(test_case), steps)
+            results[test_case.id] = steps
+            self.stats["fetched"] += 1
+
+        logger.debug(
+            f"Fetched steps for {len(to_fetch)} of {len(test_cases)} test cases "
+            f"({self.stats['cache_hits']} cache hits, {self.stats['inline']} inline so far)",
+        )
+
+        if first_error is not None:
+            raise first_error
+        return results
+
+    def clear_cache(self) -> None:
+        """Drop all cached step lists."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -4,12 +4,17 @@ This file is part of ZTOQ, licensed under the MIT License.
 See LICENSE file for details.
 """
 
+import gzip
+import io
 import json
 import logging
 import sqlite3
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import IO, Any, TypeVar
 
 from ztoq.models import (
     Environment,
@@ -22,6 +27,14 @@ from ztoq.models import (
     TestPlan,
 )
 
+# zstandard is optional; it is only needed for zstd-compressed JSON Lines output
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -77,6 +90,13 @@ class SQLiteStorage:
             return value.isoformat()
         return value
 
+    def _require_connection(self):
+        """Raise if the storage is used without an open connection."""
+        if self.cursor is None:
+            raise ValueError(
+                "Database connection not established. Use context manager or connect().",
+            )
+
     def _create_tables(self):
         """Create database tables if they don't exist."""
         # Projects table
@@ -423,54 +443,24 @@ class SQLiteStorage:
                 (env.id, env.name, env.description, project_key),
             )
 
-    def save_test_case(self, test_case: TestCase, project_key: str):
-        """
-        Save a test case.
-
-        Args:
-            test_case: Test case to save
-            project_key: Project key
-
-        """
-        if self.cursor is None:
-            raise ValueError(
-                "Database connection not established. Use context manager or connect().",
+    _TEST_CASE_INSERT = """
+            INSERT OR REPLACE INTO test_cases (
+                id, key, name, objective, precondition, description, status,
+                        priority, priority_name, folder, folder_name, owner, owner_name,
+                        component, component_name, created_on, created_by, updated_on, updated_by,
+                        version, estimated_time, labels, steps, custom_fields, links, scripts,
+                        test_versions, project_key
+            ) VALUES (
+                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                        ?, ?, ?, ?, ?, ?, ?
             )
-        # Convert lists to JSON, using appropriate serialization method
-        # (supporting both Pydantic v1's .dict() and v2's .model_dump())
-        labels_json = self._serialize_value(test_case.labels)
-        steps_json = self._serialize_value(
-            [
-                step.dict() if hasattr(step, "dict") else step.model_dump()
-                for step in test_case.steps
-            ],
-        )
-        custom_fields_json = self._serialize_value(
-            [
-                cf.dict() if hasattr(cf, "dict") else cf.model_dump()
-                for cf in test_case.custom_fields
-            ],
-        )
-        links_json = self._serialize_value(
-            [
-                link.dict() if hasattr(link, "dict") else link.model_dump()
-                for link in test_case.links
-            ],
-        )
-        scripts_json = self._serialize_value(
-            [
-                script.dict() if hasattr(script, "dict") else script.model_dump()
-                for script in test_case.scripts
-            ],
-        )
-        # Handle both new 'versions' field and legacy 'test_versions' field
-        versions_attr = "versions" if hasattr(test_case, "versions") else "test_versions"
-        versions = getattr(test_case, versions_attr, [])
-        versions_json = self._serialize_value(
-            [
-                version.dict() if hasattr(version, "dict") else version.model_dump()
-                for version in versions
-            ],
+            """
+
+    def _test_case_row(self, test_case: TestCase, project_key: str) -> tuple:
+        """Build the parameters for inserting one test case."""
+        # Dump all nested lists in a single call instead of one call per element
+        nested = test_case.model_dump(
+            mode="json", include={"labels", "steps", "custom_fields", "links", "scripts", "versions"},
         )
 
         # Handle the priority if it's an object
@@ -481,69 +471,63 @@ class SQLiteStorage:
             else:
                 priority_id = test_case.priority.id
 
-        self.cursor.execute(
-            """
-            INSERT OR REPLACE INTO test_cases (
-                id, key, name, objective, precondition, description, status,
-                        priority, priority_name, folder, folder_name, owner, owner_name,
-                        component, component_name, created_on, created_by, updated_on, updated_by,
-                        version, estimated_time, labels, steps, custom_fields, links, scripts,
-                        test_versions, project_key
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                        ?, ?, ?, ?, ?, ?, ?
-            )
-            """,
-            (
-                test_case.id,
-                test_case.key,
-                test_case.name,
-                test_case.objective,
-                test_case.precondition,
-                test_case.description,
-                test_case.status,
-                priority_id,
-                test_case.priority_name,
-                test_case.folder,
-                test_case.folder_name,
-                test_case.owner,
-                test_case.owner_name,
-                test_case.component,
-                test_case.component_name,
-                self._serialize_value(test_case.created_on),
-                test_case.created_by,
-                self._serialize_value(test_case.updated_on),
-                test_case.updated_by,
-                test_case.version,
-                test_case.estimated_time,
-                labels_json,
-                steps_json,
-                custom_fields_json,
-                links_json,
-                scripts_json,
-                versions_json,
-                project_key,
-            ),
+        return (
+            test_case.id,
+            test_case.key,
+            test_case.name,
+            test_case.objective,
+            test_case.precondition,
+            test_case.description,
+            test_case.status,
+            priority_id,
+            test_case.priority_name,
+            test_case.folder,
+            test_case.folder_name,
+            test_case.owner,
+            test_case.owner_name,
+            test_case.component,
+            test_case.component_name,
+            self._serialize_value(test_case.created_on),
+            test_case.created_by,
+            self._serialize_value(test_case.updated_on),
+            test_case.updated_by,
+            test_case.version,
+            test_case.estimated_time,
+            self._serialize_value(nested["labels"]),
+            self._serialize_value(nested["steps"]),
+            self._serialize_value(nested["custom_fields"]),
+            self._serialize_value(nested["links"]),
+            self._serialize_value(nested["scripts"]),
+            self._serialize_value(nested["versions"]),
+            project_key,
         )
 
-    def save_test_cycle(self, test_cycle: TestCycleInfo):
+    def save_test_case(self, test_case: TestCase, project_key: str):
         """
-        Save a test cycle.
+        Save a test case.
 
         Args:
-            test_cycle: Test cycle to save
+            test_case: Test case to save
+            project_key: Project key
 
         """
-        if self.cursor is None:
-            raise ValueError(
-                "Database connection not established. Use context manager or connect().",
-            )
-        # Convert lists to JSON
-        custom_fields_json = self._serialize_value([cf.dict() for cf in test_cycle.custom_fields])
-        links_json = self._serialize_value([link.dict() for link in test_cycle.links])
+        self._require_connection()
+        self.cursor.execute(self._TEST_CASE_INSERT, self._test_case_row(test_case, project_key))
 
-        self.cursor.execute(
-            """
+    def save_test_cases(self, test_cases: list[TestCase], project_key: str):
+        """
+        Save a batch of test cases in one statement and one transaction.
+
+        Args:
+            test_cases: Test cases to save
+            project_key: Project key
+
+        """
+        self._require_connection()
+        rows = [self._test_case_row(test_case, project_key) for test_case in test_cases]
+        self._execute_many(self._TEST_CASE_INSERT, rows)
+
+    _TEST_CYCLE_INSERT = """
             INSERT OR REPLACE INTO test_cycles (
                 id, key, name, description, status, status_name, folder, folder_name,
                         project_key, owner, owner_name, created_on, created_by, updated_on,
@@ -551,28 +535,55 @@ class SQLiteStorage:
             ) VALUES (
                 ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
             )
-            """,
-            (
-                test_cycle.id,
-                test_cycle.key,
-                test_cycle.name,
-                test_cycle.description,
-                test_cycle.status,
-                test_cycle.status_name,
-                test_cycle.folder,
-                test_cycle.folder_name,
-                test_cycle.project_key,
-                test_cycle.owner,
-                test_cycle.owner_name,
-                self._serialize_value(test_cycle.created_on),
-                test_cycle.created_by,
-                self._serialize_value(test_cycle.updated_on),
-                test_cycle.updated_by,
-                custom_fields_json,
-                links_json,
-            ),
+            """
+
+    def _test_cycle_row(self, test_cycle: TestCycleInfo) -> tuple:
+        """Build the parameters for inserting one test cycle."""
+        nested = test_cycle.model_dump(mode="json", include={"custom_fields", "links"})
+        return (
+            test_cycle.id,
+            test_cycle.key,
+            test_cycle.name,
+            test_cycle.description,
+            test_cycle.status,
+            test_cycle.status_name,
+            test_cycle.folder,
+            test_cycle.folder_name,
+            test_cycle.project_key,
+            test_cycle.owner,
+            test_cycle.owner_name,
+            self._serialize_value(test_cycle.created_on),
+            test_cycle.created_by,
+            self._serialize_value(test_cycle.updated_on),
+            test_cycle.updated_by,
+            self._serialize_value(nested["custom_fields"]),
+            self._serialize_value(nested["links"]),
         )
 
+    def save_test_cycle(self, test_cycle: TestCycleInfo):
+        """
+        Save a test cycle.
+
+        Args:
+            test_cycle: Test cycle to save
+
+        """
+        self._require_connection()
+        self.cursor.execute(self._TEST_CYCLE_INSERT, self._test_cycle_row(test_cycle))
+
+    def save_test_cycles(self, test_cycles: list[TestCycleInfo], project_key: str | None = None):
+        """
+        Save a batch of test cycles in one statement and one transaction.
+
+        Args:
+            test_cycles: Test cycles to save
+            project_key: Unused, the project key is part of each cycle
+
+        """
+        self._require_connection()
+        rows = [self._test_cycle_row(test_cycle) for test_cycle in test_cycles]
+        self._execute_many(self._TEST_CYCLE_INSERT, rows)
+
     def save_test_plan(self, test_plan: TestPlan):
         """
         Save a test plan.
@@ -620,6 +631,44 @@ class SQLiteStorage:
             ),
         )
 
+    _TEST_EXECUTION_INSERT = """
+            INSERT OR REPLACE INTO test_executions (
+                id, test_case_key, cycle_id, cycle_name, status, status_name,
+                        environment, environment_name, executed_by, executed_by_name,
+                        executed_on, created_on, created_by, updated_on, updated_by,
+                        actual_time, comment, steps, custom_fields, links, project_key
+            ) VALUES (
+                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+            )
+            """
+
+    def _test_execution_row(self, test_execution: TestExecution, project_key: str) -> tuple:
+        """Build the parameters for inserting one test execution."""
+        nested = test_execution.model_dump(mode="json", include={"steps", "custom_fields", "links"})
+        return (
+            test_execution.id,
+            test_execution.test_case_key,
+            test_execution.cycle_id,
+            test_execution.cycle_name,
+            test_execution.status,
+            test_execution.status_name,
+            test_execution.environment,
+            test_execution.environment_name,
+            test_execution.executed_by,
+            test_execution.executed_by_name,
+            self._serialize_value(test_execution.executed_on),
+            self._serialize_value(test_execution.created_on),
+            test_execution.created_by,
+            self._serialize_value(test_execution.updated_on),
+            test_execution.updated_by,
+            test_execution.actual_time,
+            test_execution.comment,
+            self._serialize_value(nested["steps"]),
+            self._serialize_value(nested["custom_fields"]),
+            self._serialize_value(nested["links"]),
+            project_key,
+        )
+
     def save_test_execution(self, test_execution: TestExecution, project_key: str):
         """
         Save a test execution.
@@ -629,59 +678,138 @@ class SQLiteStorage:
             project_key: Project key
 
         """
-        if self.cursor is None:
-            raise ValueError(
-                "Database connection not established. Use context manager or connect().",
-            )
-        # Convert lists to JSON
-        steps_json = self._serialize_value([step.dict() for step in test_execution.steps])
-        custom_fields_json = self._serialize_value(
-            [cf.dict() for cf in test_execution.custom_fields],
-        )
-        links_json = self._serialize_value([link.dict() for link in test_execution.links])
-
+        self._require_connection()
         self.cursor.execute(
-            """
-            INSERT OR REPLACE INTO test_executions (
-                id, test_case_key, cycle_id, cycle_name, status, status_name,
-                        environment, environment_name, executed_by, executed_by_name,
-                        executed_on, created_on, created_by, updated_on, updated_by,
-                        actual_time, comment, steps, custom_fields, links, project_key
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )
-            """,
-            (
-                test_execution.id,
-                test_execution.test_case_key,
-                test_execution.cycle_id,
-                test_execution.cycle_name,
-                test_execution.status,
-                test_execution.status_name,
-                test_execution.environment,
-                test_execution.environment_name,
-                test_execution.executed_by,
-                test_execution.executed_by_name,
-                self._serialize_value(test_execution.executed_on),
-                self._serialize_value(test_execution.created_on),
-                test_execution.created_by,
-                self._serialize_value(test_execution.updated_on),
-                test_execution.updated_by,
-                test_execution.actual_time,
-                test_execution.comment,
-                steps_json,
-                custom_fields_json,
-                links_json,
-                project_key,
-            ),
+            self._TEST_EXECUTION_INSERT, self._test_execution_row(test_execution, project_key),
         )
 
+    def save_test_executions(self, test_executions: list[TestExecution], project_key: str):
+        """
+        Save a batch of test executions in one statement and one transaction.
+
+        Args:
+            test_executions: Test executions to save
+            project_key: Project key
+
+        """
+        self._require_connection()
+        rows = [
+            self._test_execution_row(test_execution, project_key)
+            for test_execution in test_executions
+        ]
+        self._execute_many(self._TEST_EXECUTION_INSERT, rows)
+
+    def _execute_many(self, sql: str, rows: list[tuple]):
+        """
+        Insert a batch of rows and commit them as one transaction.
+
+        The rows are built before the statement runs, so a serialization error leaves
+        the database untouched; a failing insert rolls the whole batch back.
+        """
+        if not rows:
+            return
+        try:
+            self.cursor.executemany(sql, rows)
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Tune the connection for a bulk-load session.
+
+        Switches the database to write-ahead logging and relaxes fsyncs to
+        ``synchronous=NORMAL`` (durable at checkpoints, safe against corruption in
+        WAL mode) for the duration of the block, then restores the previous
+        synchronous level.
+        """
+        self._require_connection()
+        previous_sync = self.conn.execute("PRAGMA synchronous").fetchone()[0]
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        try:
+            yield self
+        finally:
+            self.conn.execute(f"PRAGMA synchronous = {int(previous_sync)}")
+
     def initialize_database(self):
         """Initialize the database by creating all required tables."""
         self._create_tables()
         self.conn.commit()
 
 
+class JSONArrayWriter:
+    """
+    Incremental writer for a JSON array file.
+
+    Items are serialized and written as they arrive, so exporting a large entity
+    set only keeps the current batch in memory. The file is a regular JSON array
+    once the writer is closed.
+    """
+
+    def __init__(self, path: Path, serializer: Callable[[Any], Any]):
+        """
+        Open a JSON array file for writing.
+
+        Args:
+            path: Path of the JSON file
+            serializer: Function converting an item to JSON-serializable data
+
+        """
+        self.path = path
+        self.serializer = serializer
+        self.count = 0
+        self._file = open(path, "w")
+        self._file.write("[")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def write(self, item: Any):
+        """
+        Append one item to the array.
+
+        Args:
+            item: Item to write
+
+        """
+        data = json.dumps(self.serializer(item), indent=2).replace("\n", "\n  ")
+        self._file.write(("," if self.count else "") + "\n  " + data)
+        self.count += 1
+
+    def write_many(self, items: Iterable[Any]) -> int:
+        """
+        Append a batch of items to the array.
+
+        Args:
+            items: Items to write
+
+        Returns:
+            Number of items written
+
+        """
+        written = 0
+        for item in items:
+            self.write(item)
+            written += 1
+        return written
+
+    def close(self):
+        """Terminate the array and close the file."""
+        if self._file.closed:
+            return
+        self._file.write("\n]\n" if self.count else "]\n")
+        self._file.close()
+
+
 class JSONStorage:
     """Storage class for saving Zephyr Scale data to JSON files."""
 
@@ -761,6 +889,20 @@ class JSONStorage:
         with open(self.output_dir / filename, "w") as f:
             json.dump(serialized_data, f, indent=2)
 
+    def open_array_writer(self, filename: str) -> JSONArrayWriter:
+        """
+        Open a JSON file for writing a list of objects batch by batch.
+
+        Args:
+            filename: Name of the JSON file
+
+        Returns:
+            JSONArrayWriter for the file; close it (or use it as a context manager)
+            to complete the array
+
+        """
+        return JSONArrayWriter(self.output_dir / filename, self._serialize_object)
+
     def save_folders(self, folders: list[Folder], project_key: str):
         """
         Save folders for a project.
@@ -959,3 +1101,238 @@ class JSONStorage:
 
         with open(test_executions_file, "w") as f:
             json.dump(test_executions, f, indent=2)
+
+
+JSONL_COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _open_jsonl(path: Path, mode: str) -> IO[str]:
+    """
+    Open a JSON Lines file as text, transparently handling compression.
+
+    The compression is taken from the file suffix (``.gz`` or ``.zst``). Appending
+    to a compressed file adds a new gzip member or zstd frame, and the reader reads
+    across all of them.
+
+    Args:
+        path: Path of the file
+        mode: "r", "w" or "a"
+
+    Returns:
+        Text file object
+
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if path.suffix == ".zst":
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstd compression requires the 'zstandard' package")
+        raw = open(path, mode + "b")
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(raw)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def read_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """
+    Read the records of a JSON Lines file one at a time.
+
+    Compressed files (``.jsonl.gz``, ``.jsonl.zst``) are decompressed on the fly, so
+    exports of any size can be consumed with constant memory.
+
+    Args:
+        path: Path of the file
+
+    Yields:
+        One decoded record per line
+
+    """
+    with _open_jsonl(Path(path), "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class JSONLinesStorage:
+    """
+    Storage class for saving Zephyr Scale data to JSON Lines files.
+
+    Every entity type goes to its own ``<entity>.jsonl`` file (``.jsonl.gz`` or
+    ``.jsonl.zst`` when compressed) with one record per line. Records are appended
+    as batches arrive, so nothing has to be held in memory to write a file, and
+    files can be read back incrementally with ``read_jsonl``/``iter_records``.
+    Within one storage instance every write appends; a file left over from an
+    earlier run is replaced on the first write unless ``append`` is set.
+    """
+
+    def __init__(self, output_dir: Path, compression: str | None = None, append: bool = False):
+        """
+        Initialize JSON Lines storage.
+
+        Args:
+            output_dir: Directory to store JSON Lines files
+            compression: None, "gzip" or "zstd"
+            append: Append to files of an earlier run instead of replacing them
+
+        """
+        if compression not in JSONL_COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError("zstd compression requires the 'zstandard' package")
+
+        self.output_dir = output_dir
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.compression = compression
+        self.append = append
+        self._started: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+
+    def initialize_database(self):
+        """No-op for JSON Lines storage to match SQLite interface."""
+
+    def path_for(self, name: str) -> Path:
+        """
+        Get the file path for an entity type.
+
+        Args:
+            name: Entity type, e.g. "test_cases"
+
+        Returns:
+            Path of the JSON Lines file
+
+        """
+        return self.output_dir / f"{name}.jsonl{JSONL_COMPRESSION_SUFFIXES[self.compression]}"
+
+    def _serialize_object(self, obj: Any) -> Any:
+        """Serialize a Pydantic object to JSON-compatible data."""
+        if hasattr(obj, "model_dump"):
+            return obj.model_dump(mode="json")
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if isinstance(obj, list):
+            return [self._serialize_object(item) for item in obj]
+        if isinstance(obj, dict):
+            return {k: self._serialize_object(v) for k, v in obj.items()}
+        return obj
+
+    def append_records(self, records: Iterable[Any], name: str) -> int:
+        """
+        Append records to the file of an entity type.
+
+        The whole batch is serialized before the file is opened, so a serialization
+        error does not leave a partial batch behind.
+
+        Args:
+            records: Objects to append
+            name: Entity type, e.g. "test_cases"
+
+        Returns:
+            Number of records written
+
+        """
+        lines = [json.dumps(self._serialize_object(record)) + "\n" for record in records]
+        path = self.path_for(name)
+        with self._lock:
+            mode = "a" if self.append or name in self._started else "w"
+            self._started.add(name)
+            with _open_jsonl(path, mode) as f:
+                f.writelines(lines)
+        return len(lines)
+
+    def iter_records(self, name: str) -> Iterator[dict[str, Any]]:
+        """
+        Read the records of an entity type one at a time.
+
+        Args:
+            name: Entity type, e.g. "test_cases"
+
+        Yields:
+            Decoded records
+
+        """
+        path = self.path_for(name)
+        if path.exists():
+            yield from read_jsonl(path)
+
+    def save_project(
+        self,
+        project_key: str,
+        project_name: str,
+        project_id: str,
+        description: str | None = None,
+    ):
+        """
+        Save project information.
+
+        Args:
+            project_key: Project key
+            project_name: Project name
+            project_id: Project ID
+            description: Project description
+
+        """
+        project_data = {
+            "id": project_id,
+            "key": project_key,
+            "name": project_name,
+            "description": description,
+        }
+        self.append_records([project_data], "project")
+
+    def save_folders(self, folders: list[Folder], project_key: str):
+        """Append folders for a project."""
+        self.append_records(folders, "folders")
+
+    def save_statuses(self, statuses: list[Status], project_key: str):
+        """Append statuses for a project."""
+        self.append_records(statuses, "statuses")
+
+    def save_priorities(self, priorities: list[Priority], project_key: str):
+        """Append priorities for a project."""
+        self.append_records(priorities, "priorities")
+
+    def save_environments(self, environments: list[Environment], project_key: str):
+        """Append environments for a project."""
+        self.append_records(environments, "environments")
+
+    def save_test_cases(self, test_cases: Iterable[TestCase], project_key: str):
+        """Append a batch of test cases."""
+        self.append_records(test_cases, "test_cases")
+
+    def save_test_case(self, test_case: TestCase, project_key: str):
+        """Append a test case."""
+        self.append_records([test_case], "test_cases")
+
+    def save_test_cycles(self, test_cycles: Iterable[TestCycleInfo], project_key: str):
+        """Append a batch of test cycles."""
+        self.append_records(test_cycles, "test_cycles")
+
+    def save_test_cycle(self, test_cycle: TestCycleInfo):
+        """Append a test cycle."""
+        self.append_records([test_cycle], "test_cycles")
+
+    def save_test_plans(self, test_plans: Iterable[TestPlan], project_key: str):
+        """Append a batch of test plans."""
+        self.append_records(test_plans, "test_plans")
+
+    def save_test_plan(self, test_plan: TestPlan):
+        """Append a test plan."""
+        self.append_records([test_plan], "test_plans")
+
+    def save_test_executions(self, test_executions: Iterable[TestExecution], project_key: str):
+        """Append a batch of test executions."""
+        self.append_records(test_executions, "test_executions")
+
+    def save_test_execution(self, test_execution: TestExecution, project_key: str):
+        """Append a test execution."""
+        self.append_records([test_execution], "test_executions")
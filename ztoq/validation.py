@@ -16,14 +16,17 @@ import collections
 import functools
 import json
 import logging
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Any
 
 import httpx
 import requests.exceptions
 
-from ztoq.validation_rules import get_built_in_rules
+from ztoq.validation_rules import UniqueValueIndex, get_built_in_rules
 from ztoq.validation_types import (
     ValidationIssue,
     ValidationLevel,
@@ -34,6 +37,57 @@ from ztoq.validation_types import (
 
 logger = logging.getLogger("ztoq.validation")
 
+# Rules installed in a validation worker process, by rule id
+_worker_rules: dict[str, ValidationRule] = {}
+
+
+def _init_validation_worker(rules: list[ValidationRule]) -> None:
+    """Install the rules shipped to a validation worker process once, at startup."""
+    _worker_rules.clear()
+    _worker_rules.update((rule.id, rule) for rule in rules)
+
+
+def _run_rules(
+    rules: list[ValidationRule], entities: Any, context: dict[str, Any],
+) -> tuple[list[ValidationIssue], list[tuple[str, str]]]:
+    """
+    Run rules over a batch of entities.
+
+    A rule whose batch implementation raises validates the entities one at a
+    time instead, so an unexpected value costs speed rather than coverage.
+
+    Args:
+        rules: The rules to run
+        entities: The entities to validate, or a DataFrame with one row per entity
+        context: Additional context for validation
+
+    Returns:
+        Tuple of the issues found and (rule id, error) pairs for rules that raised
+
+    """
+    issues: list[ValidationIssue] = []
+    failures: list[tuple[str, str]] = []
+    for rule in rules:
+        try:
+            issues.extend(rule.validate_many(entities, context))
+        except Exception as e:
+            logger.warning(
+                f"Batch validation with rule {rule.id} failed, "
+                f"validating entities one at a time: {e!s}",
+            )
+            try:
+                issues.extend(ValidationRule.validate_many(rule, entities, context))
+            except Exception as fallback_error:
+                failures.append((rule.id, str(fallback_error)))
+    return issues, failures
+
+
+def _validate_shard(
+    rule_ids: tuple[str, ...], entities: Any, context: dict[str, Any],
+) -> tuple[list[ValidationIssue], list[tuple[str, str]]]:
+    """Run installed rules over one shard of entities in a worker process."""
+    return _run_rules([_worker_rules[rule_id] for rule_id in rule_ids], entities, context)
+
 
 class ValidationRuleRegistry:
     """Registry for all validation rules."""
@@ -47,6 +101,10 @@ class ValidationRuleRegistry:
         self.rules_by_phase: dict[ValidationPhase, list[ValidationRule]] = {
             phase: [] for phase in ValidationPhase
         }
+        # Compiled lookup so executing rules doesn't filter the whole registry per entity
+        self.rules_by_scope_phase: dict[
+            tuple[ValidationScope, ValidationPhase], list[ValidationRule]
+        ] = {}
 
     def register_rule(self, rule: ValidationRule) -> None:
         """
@@ -58,13 +116,39 @@ class ValidationRuleRegistry:
         """
         if rule.id in self.rules:
             logger.warning(f"Rule with ID {rule.id} already exists, overwriting")
+            self._unindex_rule(self.rules[rule.id])
 
         self.rules[rule.id] = rule
         self.rules_by_scope[rule.scope].append(rule)
         self.rules_by_phase[rule.phase].append(rule)
+        self.rules_by_scope_phase.setdefault((rule.scope, rule.phase), []).append(rule)
 
         logger.debug(f"Registered validation rule: {rule.id} ({rule.name})")
 
+    def _unindex_rule(self, rule: ValidationRule) -> None:
+        """Remove a replaced rule from the scope and phase indexes."""
+        for rules in (
+            self.rules_by_scope[rule.scope],
+            self.rules_by_phase[rule.phase],
+            self.rules_by_scope_phase.get((rule.scope, rule.phase), []),
+        ):
+            if rule in rules:
+                rules.remove(rule)
+
+    def get_rules(self, scope: ValidationScope, phase: ValidationPhase) -> list[ValidationRule]:
+        """
+        Get the enabled rules for a scope and phase from the compiled index.
+
+        Args:
+            scope: The scope of validation
+            phase: The phase of validation
+
+        Returns:
+            List of enabled validation rules, in registration order
+
+        """
+        return [rule for rule in self.rules_by_scope_phase.get((scope, phase), []) if rule.enabled]
+
     def get_rules_for_scope(self, scope: ValidationScope) -> list[ValidationRule]:
         """
         Get all rules for a specific scope.
@@ -116,6 +200,153 @@ class ValidationRuleRegistry:
         return rules
 
 
+class ValidationIssueBuffer:
+    """
+    Buffer of validation issues, saved to the database in bulk.
+
+    Issues are written with ``save_validation_issues(issues, project_key)`` once
+    ``max_items`` have gathered or the oldest has waited ``max_delay`` seconds,
+    or one by one with ``save_validation_issue`` when the database does not
+    provide the bulk method. A failed flush keeps the unsaved issues, and the
+    buffer waits ``max_delay`` seconds before trying again. While the database
+    stays unavailable at most ``max_pending`` issues are kept, dropping the oldest.
+    """
+
+    def __init__(
+        self,
+        database: Any,
+        project_key: str,
+        max_items: int = 500,
+        max_delay: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        max_pending: int = 50_000,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            database: Database manager receiving the issues
+            project_key: The project the issues belong to
+            max_items: Number of buffered issues that triggers a flush
+            max_delay: Seconds the oldest buffered issue may wait before a flush, and
+                seconds to wait after a failed flush before retrying
+            clock: Monotonic clock function
+            max_pending: Most issues kept while they cannot be saved
+
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        if max_pending < max_items:
+            raise ValueError("max_pending must be at least max_items")
+        self.database = database
+        self.project_key = project_key
+        self.max_items = max_items
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self._clock = clock
+        self._pending: list[ValidationIssue] = []
+        self._oldest: float | None = None
+        self._retry_at: float | None = None
+        self._lock = threading.RLock()
+        self.stats = {
+            "buffered": 0,
+            "saved": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "dropped": 0,
+        }
+
+    @property
+    def pending(self) -> int:
+        """Number of issues waiting to be saved."""
+        return len(self._pending)
+
+    def add(self, issue: ValidationIssue) -> None:
+        """
+        Buffer an issue, flushing if the buffer is full or old enough.
+
+        Args:
+            issue: The validation issue to save
+
+        """
+        with self._lock:
+            self._pending.append(issue)
+            self.stats["buffered"] += 1
+            if len(self._pending) > self.max_pending:
+                dropped = len(self._pending) - self.max_pending
+                del self._pending[:dropped]
+                self.stats["dropped"] += dropped
+                if self.stats["dropped"] == dropped:
+                    logger.warning(
+                        f"Validation issues cannot be saved; keeping only the latest "
+                        f"{self.max_pending} until the database is available again",
+                    )
+            now = self._clock()
+            if self._oldest is None:
+                self._oldest = now
+            if len(self._pending) >= self.max_items or now - self._oldest >= self.max_delay:
+                self.flush()
+
+    def flush(self, force: bool = False) -> int:
+        """
+        Save all buffered issues.
+
+        Args:
+            force: Try even if a recent flush failed and the retry delay has not passed
+
+        Returns:
+            Number of issues saved
+
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            now = self._clock()
+            if not force and self._retry_at is not None and now < self._retry_at:
+                return 0
+            issues = self._pending
+            saved = 0
+            try:
+                save_many = getattr(self.database, "save_validation_issues", None)
+                if save_many is not None:
+                    save_many(issues, self.project_key)
+                    saved = len(issues)
+                else:
+                    for issue in issues:
+                        self.database.save_validation_issue(
+                            issue=issue,
+                            project_key=self.project_key,
+                        )
+                        saved += 1
+            except Exception as e:
+                self.stats["failed_flushes"] += 1
+                self._retry_at = now + self.max_delay
+                logger.error(
+                    f"Failed to save {len(issues) - saved} validation issues to database: {e!s}",
+                )
+            else:
+                self._oldest = None
+                self._retry_at = None
+                self.stats["flushes"] += 1
+
+            # Keep only the issues that were not saved, for the next flush
+            self._pending = issues[saved:]
+            self.stats["saved"] += saved
+            return saved
+
+    def close(self) -> None:
+        """Save the remaining issues."""
+        self.flush(force=True)
+        if self._pending:
+            logger.error(f"{len(self._pending)} validation issues could not be saved on close")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class ValidationManager:
     """
     Manager for tracking and reporting validation issues during migration.
@@ -125,13 +356,30 @@ class ValidationManager:
         aggregating, and reporting on validation results.
     """
 
-    def __init__(self, database: Any, project_key: str):
+    def __init__(
+        self,
+        database: Any,
+        project_key: str,
+        issue_buffer_size: int = 500,
+        issue_flush_interval: float = 5.0,
+        log_sample_size: int = 10,
+        log_every: int = 1000,
+        parallel_workers: int = 0,
+        shard_size: int = 10_000,
+    ):
         """
         Initialize the validation manager.
 
         Args:
             database: Database manager instance
             project_key: The Zephyr project key
+            issue_buffer_size: Number of issues saved per bulk insert
+            issue_flush_interval: Seconds an issue may wait before being saved
+            log_sample_size: Issues logged per level, scope and entity type
+            log_every: After the sample, log only every Nth issue of a kind
+            parallel_workers: Worker processes used by execute_all_validations; 0 or 1
+                validates in this process
+            shard_size: Entities per shard sent to a worker process
 
         """
         self.database = database
@@ -139,6 +387,18 @@ class ValidationManager:
         self.registry = ValidationRuleRegistry()
         self.issues: list[ValidationIssue] = []
         self.issue_counts: dict[ValidationLevel, int] = dict.fromkeys(ValidationLevel, 0)
+        self.issue_buffer = ValidationIssueBuffer(
+            database, project_key, max_items=issue_buffer_size, max_delay=issue_flush_interval,
+        )
+
+        # Sampled issue logging: counts per (level, scope, entity type)
+        self.log_sample_size = log_sample_size
+        self.log_every = log_every
+        self.issue_kind_counts: collections.Counter = collections.Counter()
+        self.suppressed_log_count = 0
+
+        self.parallel_workers = parallel_workers
+        self.shard_size = max(1, shard_size)
 
         # Register built-in validation rules
         self._register_built_in_rules()
@@ -164,6 +424,10 @@ class ValidationManager:
         """
         Add a validation issue.
 
+        The issue is logged if it is among the first ``log_sample_size`` of its
+        kind or every ``log_every``-th after that, and saved to the database with
+        the next bulk flush.
+
         Args:
             issue: The validation issue to add
 
@@ -171,7 +435,30 @@ class ValidationManager:
         self.issues.append(issue)
         self.issue_counts[issue.level] += 1
 
-        # Log the issue
+        kind = (issue.level, issue.scope, issue.entity_type)
+        self.issue_kind_counts[kind] += 1
+        if self._should_log(self.issue_kind_counts[kind]):
+            self._log_issue(issue)
+        else:
+            self.suppressed_log_count += 1
+
+        # Save to database
+        self._save_issue(issue)
+
+    def _should_log(self, kind_count: int) -> bool:
+        """Whether the n-th issue of its kind is logged."""
+        if kind_count <= self.log_sample_size:
+            return True
+        return self.log_every > 0 and kind_count % self.log_every == 0
+
+    def _log_issue(self, issue: ValidationIssue) -> None:
+        """
+        Log a validation issue at the logging level matching its severity.
+
+        Args:
+            issue: The validation issue to log
+
+        """
         log_level = logging.INFO
         if issue.level == ValidationLevel.WARNING:
             log_level = logging.WARNING
@@ -180,30 +467,46 @@ class ValidationManager:
         elif issue.level == ValidationLevel.CRITICAL:
             log_level = logging.CRITICAL
 
+        count = self.issue_kind_counts[(issue.level, issue.scope, issue.entity_type)]
+        suffix = f" (#{count} of this kind)" if count > self.log_sample_size else ""
         logger.log(
             log_level,
             f"Validation issue: {issue.level.value.upper()} - {issue.message} "
-            f"[{issue.scope.value}/{issue.entity_type or 'N/A'}/{issue.entity_id or 'N/A'}]",
+            f"[{issue.scope.value}/{issue.entity_type or 'N/A'}/{issue.entity_id or 'N/A'}]"
+            f"{suffix}",
         )
 
-        # Save to database
-        self._save_issue(issue)
-
     def _save_issue(self, issue: ValidationIssue) -> None:
         """
-        Save a validation issue to the database.
+        Buffer a validation issue for saving to the database.
 
         Args:
             issue: The validation issue to save
 
         """
-        try:
-            self.database.save_validation_issue(
-                issue=issue,
-                project_key=self.project_key,
+        self.issue_buffer.add(issue)
+
+    def flush_issues(self) -> int:
+        """
+        Save buffered validation issues and summarize the issues not logged.
+
+        Returns:
+            Number of issues saved
+
+        """
+        saved = self.issue_buffer.flush()
+        if self.suppressed_log_count:
+            logger.info(
+                f"{self.suppressed_log_count} validation issues were not logged individually; "
+                f"counts by kind: "
+                + ", ".join(
+                    f"{level.value}/{scope.value}/{entity_type or 'N/A'}={count}"
+                    for (level, scope, entity_type), count in self.issue_kind_counts.items()
+                    if count > self.log_sample_size
+                ),
             )
-        except Exception as e:
-            logger.error(f"Failed to save validation issue to database: {e!s}")
+            self.suppressed_log_count = 0
+        return saved
 
     def get_issues(
         self,
@@ -304,12 +607,7 @@ class ValidationManager:
         if context is None:
             context = {}
 
-        # Get rules for the scope and phase
-        rules = [
-            rule
-            for rule in self.registry.get_active_rules()
-            if rule.scope == scope and rule.phase == phase
-        ]
+        rules = self.registry.get_rules(scope, phase)
 
         if not rules:
             logger.debug(f"No validation rules found for {scope.value}/{phase.value}")
@@ -339,29 +637,187 @@ class ValidationManager:
 
         return all_issues
 
+    def execute_validation_batch(
+        self,
+        entities: Any,
+        scope: ValidationScope,
+        phase: ValidationPhase,
+        context: dict[str, Any] | None = None,
+    ) -> list[ValidationIssue]:
+        """
+        Execute validation rules for a batch of entities of the same scope.
+
+        Each rule checks the whole batch through ``validate_many``, so rules that
+        work on columns only produce issues for the failing entities.
+
+        Args:
+            entities: The entities to validate, or a DataFrame with one row per entity
+            scope: The scope of validation
+            phase: The phase of validation
+            context: Additional context for validation
+
+        Returns:
+            List of validation issues found
+
+        """
+        if context is None:
+            context = {}
+
+        rules = self.registry.get_rules(scope, phase)
+
+        if not rules:
+            logger.debug(f"No validation rules found for {scope.value}/{phase.value}")
+            return []
+
+        issues, failures = _run_rules(rules, entities, context)
+        return self._record_rule_results(phase, issues, failures)
+
+    def _record_rule_results(
+        self,
+        phase: ValidationPhase,
+        issues: list[ValidationIssue],
+        failures: list[tuple[str, str]],
+    ) -> list[ValidationIssue]:
+        """
+        Add the issues found by a batch of rules, and one issue per rule that raised.
+
+        Args:
+            phase: The phase of validation
+            issues: Issues found by the rules
+            failures: (rule id, error) pairs for rules that raised
+
+        Returns:
+            The issues added
+
+        """
+        for issue in issues:
+            self.add_issue(issue)
+
+        all_issues = list(issues)
+        for rule_id, error in failures:
+            logger.error(f"Error executing validation rule {rule_id}: {error}")
+            # Create a system-level validation issue for the rule failure
+            error_issue = ValidationIssue(
+                id=f"rule_execution_error_{int(time.time())}",
+                level=ValidationLevel.ERROR,
+                scope=ValidationScope.SYSTEM,
+                phase=phase,
+                message=f"Validation rule execution failed: {rule_id}",
+                details={"rule_id": rule_id, "error": error},
+            )
+            self.add_issue(error_issue)
+            all_issues.append(error_issue)
+
+        return all_issues
+
     def execute_all_validations(
         self, phase: ValidationPhase, entities_by_scope: dict[ValidationScope, list[Any]],
     ) -> dict[ValidationScope, list[ValidationIssue]]:
         """
         Execute all validation rules for the given phase.
 
+        With ``parallel_workers`` above one and more than ``shard_size`` entities,
+        the work is spread over a process pool (see ``_execute_in_process_pool``).
+
         Args:
             phase: The phase of validation
-            entities_by_scope: Dictionary mapping scopes to lists of entities
+            entities_by_scope: Dictionary mapping scopes to lists (or DataFrames) of entities
 
         Returns:
             Dictionary mapping scopes to lists of validation issues
 
         """
+        total = sum(len(entities) for entities in entities_by_scope.values())
+        if self.parallel_workers > 1 and total > self.shard_size:
+            return self._execute_in_process_pool(phase, entities_by_scope)
+
         results = {scope: [] for scope in ValidationScope}
+        # Fresh per phase, so entities are not reported as duplicates of themselves
+        # when they are validated again in a later phase
+        unique_value_index = UniqueValueIndex()
 
         for scope, entities in entities_by_scope.items():
-            scope_results = []
-            for entity in entities:
+            context = {
+                "phase": phase.value,
+                "scope": scope.value,
+                "unique_value_index": unique_value_index,
+            }
+            results[scope] = self.execute_validation_batch(entities, scope, phase, context)
+
+        return results
+
+    def _execute_in_process_pool(
+        self, phase: ValidationPhase, entities_by_scope: dict[ValidationScope, list[Any]],
+    ) -> dict[ValidationScope, list[ValidationIssue]]:
+        """
+        Execute all validation rules for a phase across worker processes.
+
+        Shardable rules are shipped to each worker once, and every scope's entities
+        are split into shards of ``shard_size`` that the workers validate with them.
+        Rules that need the whole batch or the database run here meanwhile. Issues
+        are added to this manager as each scope's shards come back, and a shard whose
+        worker fails is validated here instead.
+
+        Args:
+            phase: The phase of validation
+            entities_by_scope: Dictionary mapping scopes to lists (or DataFrames) of entities
+
+        Returns:
+            Dictionary mapping scopes to lists of validation issues
+
+        """
+        results = {scope: [] for scope in ValidationScope}
+        unique_value_index = UniqueValueIndex()
+
+        rules_by_scope = {
+            scope: self.registry.get_rules(scope, phase) for scope in entities_by_scope
+        }
+        shipped = {
+            rule.id: rule for rules in rules_by_scope.values() for rule in rules if rule.shardable
+        }
+
+        with ProcessPoolExecutor(
+            max_workers=self.parallel_workers,
+            initializer=_init_validation_worker,
+            initargs=(list(shipped.values()),),
+        ) as executor:
+            submitted = []
+            for scope, entities in entities_by_scope.items():
                 context = {"phase": phase.value, "scope": scope.value}
-                issues = self.execute_validation(entity, scope, phase, context)
-                scope_results.extend(issues)
-            results[scope] = scope_results
+                sharded = [rule for rule in rules_by_scope[scope] if rule.shardable]
+                rule_ids = tuple(rule.id for rule in sharded)
+                shards = (
+                    [
+                        entities[start : start + self.shard_size]
+                        for start in range(0, len(entities), self.shard_size)
+                    ]
+                    if sharded
+                    else []
+                )
+                futures = [
+                    executor.submit(_validate_shard, rule_ids, shard, context) for shard in shards
+                ]
+                submitted.append((scope, entities, context, sharded, shards, futures))
+
+            for scope, entities, context, sharded, shards, futures in submitted:
+                local = [rule for rule in rules_by_scope[scope] if not rule.shardable]
+                issues, failures = _run_rules(
+                    local, entities, {**context, "unique_value_index": unique_value_index},
+                )
+                scope_issues = self._record_rule_results(phase, issues, failures)
+
+                for shard, future in zip(shards, futures, strict=True):
+                    try:
+                        issues, failures = future.result()
+                    except Exception as e:
+                        logger.warning(
+                            f"Validation worker failed for a {scope.value} shard ({e!s}); "
+                            "validating it in this process",
+                        )
+                        issues, failures = _run_rules(sharded, shard, context)
+                    scope_issues.extend(self._record_rule_results(phase, issues, failures))
+
+                results[scope] = scope_issues
 
         return results
 
@@ -454,6 +910,9 @@ class ValidationManager:
             include_details: Whether to include issue details in the report
 
         """
+        # Make sure every issue is in the database before reporting on them
+        self.flush_issues()
+
         report = self.get_report(include_details=include_details)
 
         # Save to database
@@ -521,6 +980,8 @@ class MigrationValidator:
         self._validate_zephyr_project(zephyr_client, context)
         self._validate_qtest_project(qtest_client, context)
 
+        self.validation_manager.flush_issues()
+
         # Check for critical issues
         if self.validation_manager.has_critical_issues():
             logger.critical(
@@ -674,6 +1135,8 @@ class MigrationValidator:
             ValidationPhase.EXTRACTION, entities_by_scope,
         )
 
+        self.validation_manager.flush_issues()
+
         # Check for critical issues
         if self.validation_manager.has_critical_issues():
             logger.critical("Extraction validation found critical issues")
@@ -707,6 +1170,8 @@ class MigrationValidator:
             ValidationPhase.TRANSFORMATION, entities_by_scope,
         )
 
+        self.validation_manager.flush_issues()
+
         # Check for critical issues
         if self.validation_manager.has_critical_issues():
             logger.critical("Transformation validation found critical issues")
@@ -738,6 +1203,8 @@ class MigrationValidator:
         # Execute validations for all entities
         self.validation_manager.execute_all_validations(ValidationPhase.LOADING, entities_by_scope)
 
+        self.validation_manager.flush_issues()
+
         # Check for critical issues
         if self.validation_manager.has_critical_issues():
             logger.critical("Loading validation found critical issues")
@@ -789,6 +1256,8 @@ class MigrationValidator:
                 None, rule.scope, ValidationPhase.POST_MIGRATION, context,
             )
 
+        self.validation_manager.flush_issues()
+
         # Check for critical issues
         if self.validation_manager.has_critical_issues():
             logger.critical("Post-migration validation found critical issues")
@@ -1058,6 +1527,8 @@ class MigrationValidator:
             if rule.scope == ValidationScope.SYSTEM:
                 self.validation_manager.execute_validation(None, rule.scope, phase, context)
 
+        self.validation_manager.flush_issues()
+
         # Check for critical issues
         if self.validation_manager.has_critical_issues():
             logger.critical(f"Pre-{phase.value} validation found critical issues")
@@ -1091,6 +1562,8 @@ class MigrationValidator:
             if rule.scope == ValidationScope.SYSTEM:
                 self.validation_manager.execute_validation(None, rule.scope, phase, context)
 
+        self.validation_manager.flush_issues()
+
         # Check for critical issues
         if self.validation_manager.has_critical_issues():
             logger.critical(f"Post-{phase.value} validation found critical issues")
@@ -109,6 +109,8 @@ class MigrationValidationDecorators:
                             context={"error": str(e), "exception_type": type(e).__name__},
                         ),
                     )
+                    # The exception may end the run, so save the issue now
+                    self.validation_manager.flush_issues()
                     raise
 
             return wrapper
@@ -171,6 +173,8 @@ class MigrationValidationDecorators:
                             context={"error": str(e), "exception_type": type(e).__name__},
                         ),
                     )
+                    # The exception may end the run, so save the issue now
+                    self.validation_manager.flush_issues()
                     raise
 
             return wrapper
@@ -240,6 +244,8 @@ class MigrationValidationDecorators:
                             context={"error": str(e), "exception_type": type(e).__name__},
                         ),
                     )
+                    # The exception may end the run, so save the issue now
+                    self.validation_manager.flush_issues()
                     raise
 
             return wrapper
@@ -354,61 +360,74 @@ class EnhancedMigration:
         if not phases:
             phases = ["extract", "transform", "load"]
 
-        # Run pre-migration validation
-        self.validator.validate_pre_migration()
+        try:
+            # Run pre-migration validation
+            self.validator.validate_pre_migration()
 
-        # Run the migration
-        result = self.migration.run_migration(phases)
+            # Run the migration
+            result = self.migration.run_migration(phases)
 
-        # Run post-migration validation
-        self.validator.validate_post_migration()
+            # Run post-migration validation
+            self.validator.validate_post_migration()
 
-        # Get validation report
-        validation_report = self.validator.generate_validation_report()
+            # Get validation report
+            validation_report = self.validator.generate_validation_report()
 
-        # Save validation report to database
-        self.db.save_validation_report(self.project_key, validation_report)
+            # Save validation report to database
+            self.db.save_validation_report(self.project_key, validation_report)
 
-        return result
+            return result
+        finally:
+            # Save buffered issues even when a phase fails
+            self.validation_manager.flush_issues()
 
     def extract_data(self):
         """Run extraction with validation."""
-        # Run pre-extraction validation
-        self.validator.validate_pre_phase(ValidationPhase.EXTRACTION)
+        try:
+            # Run pre-extraction validation
+            self.validator.validate_pre_phase(ValidationPhase.EXTRACTION)
 
-        # Run extraction
-        result = self.migration.extract_data()
+            # Run extraction
+            result = self.migration.extract_data()
 
-        # Run post-extraction validation
-        self.validator.validate_post_phase(ValidationPhase.EXTRACTION)
+            # Run post-extraction validation
+            self.validator.validate_post_phase(ValidationPhase.EXTRACTION)
 
-        return result
+            return result
+        finally:
+            self.validation_manager.flush_issues()
 
     def transform_data(self):
         """Run transformation with validation."""
-        # Run pre-transformation validation
-        self.validator.validate_pre_phase(ValidationPhase.TRANSFORMATION)
+        try:
+            # Run pre-transformation validation
+            self.validator.validate_pre_phase(ValidationPhase.TRANSFORMATION)
 
-        # Run transformation
-        result = self.migration.transform_data()
+            # Run transformation
+            result = self.migration.transform_data()
 
-        # Run post-transformation validation
-        self.validator.validate_post_phase(ValidationPhase.TRANSFORMATION)
+            # Run post-transformation validation
+            self.validator.validate_post_phase(ValidationPhase.TRANSFORMATION)
 
-        return result
+            return result
+        finally:
+            self.validation_manager.flush_issues()
 
     def load_data(self):
         """Run loading with validation."""
-        # Run pre-loading validation
-        self.validator.validate_pre_phase(ValidationPhase.LOADING)
+        try:
+            # Run pre-loading validation
+            self.validator.validate_pre_phase(ValidationPhase.LOADING)
 
-        # Run loading
-        result = self.migration.load_data()
+            # Run loading
+            result = self.migration.load_data()
 
-        # Run post-loading validation
-        self.validator.validate_post_phase(ValidationPhase.LOADING)
+            # Run post-loading validation
+            self.validator.validate_post_phase(ValidationPhase.LOADING)
 
-        return result
+            return result
+        finally:
+            self.validation_manager.flush_issues()
 
     def __getattr__(self, name):
         """Delegate attribute access to the underlying migration object."""
@@ -13,12 +13,18 @@ to ensure data quality and integrity.
 
 import re
 import time
+from collections import defaultdict
+from collections.abc import Hashable
+from itertools import chain, islice
 from typing import Any
 
 import jsonschema
+import numpy as np
+import pandas as pd
 
 from ztoq.custom_field_mapping import get_default_field_mapper
 from ztoq.data_comparison import get_data_comparison_rules
+from ztoq.entity_mapping_index import EntityMappingIndex
 from ztoq.validation_types import (
     ValidationIssue,
     ValidationLevel,
@@ -28,9 +34,95 @@ from ztoq.validation_types import (
 )
 
 
+def _entity_id(entity: Any) -> str:
+    """Identifier of an entity as the per-entity validate methods derive it."""
+    if isinstance(entity, dict):
+        return str(entity.get("id") or entity.get("key") or id(entity))
+    return str(getattr(entity, "id", None) or id(entity))
+
+
+class _EntityBatch:
+    """
+    Column view of a batch of entities for the batch validators.
+
+    Columns are extracted once per field, and entity ids are only derived for
+    the rows that fail a check.
+    """
+
+    def __init__(self, entities: Any):
+        """
+        Initialize the batch.
+
+        Args:
+            entities: A DataFrame with one row per entity, or a sequence of dicts or objects
+
+        """
+        self.frame: pd.DataFrame | None = None
+        self.entities: list[Any] = []
+        self._ids: list[str] | None = None
+        if isinstance(entities, pd.DataFrame):
+            self.frame = entities.reset_index(drop=True)
+        else:
+            self.entities = entities if isinstance(entities, list) else list(entities)
+        self._all_dicts = all(isinstance(entity, dict) for entity in self.entities)
+
+    def values(self, field: str) -> list[Any]:
+        """Values of a field, one per entity; missing fields and NaN become None."""
+        if self.frame is not None:
+            if field not in self.frame.columns:
+                return [None] * len(self.frame)
+            column = self.frame[field]
+            missing = column.isna().to_numpy()
+            return [
+                None if miss else value
+                for value, miss in zip(column.tolist(), missing, strict=True)
+            ]
+        if self._all_dicts:
+            return [entity.get(field) for entity in self.entities]
+        return [
+            entity.get(field) if isinstance(entity, dict) else getattr(entity, field, None)
+            for entity in self.entities
+        ]
+
+    def __len__(self) -> int:
+        return len(self.frame) if self.frame is not None else len(self.entities)
+
+    def entity_id(self, row: int) -> str:
+        """Identifier of the entity in a row, as the per-entity validate methods derive it."""
+        if self.frame is None:
+            return _entity_id(self.entities[row])
+        if self._ids is None:
+            ids = self.values("id")
+            keys = self.values("key")
+            self._ids = [
+                str(entity_id or key or index)
+                for index, (entity_id, key) in enumerate(zip(ids, keys, strict=True))
+            ]
+        return self._ids[row]
+
+
+def _string_methods(values: pd.Series) -> Any:
+    """
+    The ``.str`` accessor of a column's ``str`` values, or None when it holds none.
+
+    Lists, dicts and other values become NaN first, as the per-entity validate
+    methods only check ``str`` values and ``.str.len()`` would measure them too.
+    """
+    is_string = values.map(lambda value: isinstance(value, str)).astype(bool)
+    if not is_string.any():
+        return None
+    return values.where(is_string).str
+
+
+def _truncate(value: str) -> str:
+    return value[:50] + "..." if len(value) > 50 else value
+
+
 class RequiredFieldRule(ValidationRule):
     """Rule that validates required fields are present and non-empty."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
@@ -115,10 +207,48 @@ class RequiredFieldRule(ValidationRule):
 
         return issues
 
+    def validate_many(self, entities: Any, context: dict[str, Any]) -> list[ValidationIssue]:
+        """
+        Validate required fields for a whole batch, one column at a time.
+
+        Args:
+            entities: A DataFrame or a sequence of dicts or objects
+            context: Additional context for validation
+
+        Returns:
+            List of validation issues found, for failing rows only
+
+        """
+        batch = _EntityBatch(entities)
+        entity_type = context.get("entity_type", self.scope.value)
+        timestamp = int(time.time())
+
+        issues = []
+        for field in self.required_fields:
+            values = pd.Series(batch.values(field), dtype=object)
+            missing = values.isna().to_numpy() | (values == "").to_numpy()
+            for row in np.flatnonzero(missing):
+                entity_id = batch.entity_id(row)
+                issues.append(
+                    ValidationIssue(
+                        id=f"required_field_{field}_{entity_id}_{timestamp}",
+                        level=self.level,
+                        scope=self.scope,
+                        phase=self.phase,
+                        message=f"Required field '{field}' is missing or empty",
+                        entity_id=entity_id,
+                        entity_type=entity_type,
+                        field_name=field,
+                    ),
+                )
+        return issues
+
 
 class StringLengthRule(ValidationRule):
     """Rule that validates string field lengths."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
@@ -265,10 +395,88 @@ class StringLengthRule(ValidationRule):
 
         return issues
 
+    def validate_many(self, entities: Any, context: dict[str, Any]) -> list[ValidationIssue]:
+        """
+        Validate string field lengths for a whole batch, one column at a time.
+
+        Args:
+            entities: A DataFrame or a sequence of dicts or objects
+            context: Additional context for validation
+
+        Returns:
+            List of validation issues found, for failing rows only
+
+        """
+        batch = _EntityBatch(entities)
+        entity_type = context.get("entity_type", self.scope.value)
+        timestamp = int(time.time())
+
+        issues = []
+        for field, limits in self.field_limits.items():
+            values = batch.values(field)
+            strings = _string_methods(pd.Series(values, dtype=object))
+            if strings is None:
+                continue
+            # Length of str values; NaN for anything else, which never fails a limit
+            lengths = strings.len().to_numpy(dtype=float, na_value=np.nan)
+
+            if "min" in limits:
+                for row in np.flatnonzero(lengths < limits["min"]):
+                    field_len = int(lengths[row])
+                    entity_id = batch.entity_id(row)
+                    issues.append(
+                        ValidationIssue(
+                            id=f"min_length_{field}_{entity_id}_{timestamp}",
+                            level=self.level,
+                            scope=self.scope,
+                            phase=self.phase,
+                            message=(
+                                f"Field '{field}' length ({field_len}) is less than "
+                                f"minimum ({limits['min']})"
+                            ),
+                            entity_id=entity_id,
+                            entity_type=entity_type,
+                            field_name=field,
+                            details={
+                                "value": values[row],
+                                "length": field_len,
+                                "min": limits["min"],
+                            },
+                        ),
+                    )
+
+            if "max" in limits:
+                for row in np.flatnonzero(lengths > limits["max"]):
+                    field_len = int(lengths[row])
+                    entity_id = batch.entity_id(row)
+                    issues.append(
+                        ValidationIssue(
+                            id=f"max_length_{field}_{entity_id}_{timestamp}",
+                            level=self.level,
+                            scope=self.scope,
+                            phase=self.phase,
+                            message=(
+                                f"Field '{field}' length ({field_len}) exceeds "
+                                f"maximum ({limits['max']})"
+                            ),
+                            entity_id=entity_id,
+                            entity_type=entity_type,
+                            field_name=field,
+                            details={
+                                "value": _truncate(values[row]),
+                                "length": field_len,
+                                "max": limits["max"],
+                            },
+                        ),
+                    )
+        return issues
+
 
 class PatternMatchRule(ValidationRule):
     """Rule that validates field values match a regex pattern."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
@@ -373,6 +581,50 @@ class PatternMatchRule(ValidationRule):
 
         return issues
 
+    def validate_many(self, entities: Any, context: dict[str, Any]) -> list[ValidationIssue]:
+        """
+        Validate field patterns for a whole batch, one column at a time.
+
+        Args:
+            entities: A DataFrame or a sequence of dicts or objects
+            context: Additional context for validation
+
+        Returns:
+            List of validation issues found, for failing rows only
+
+        """
+        batch = _EntityBatch(entities)
+        entity_type = context.get("entity_type", self.scope.value)
+        timestamp = int(time.time())
+
+        issues = []
+        for field, pattern in self.field_patterns.items():
+            values = batch.values(field)
+            strings = _string_methods(pd.Series(values, dtype=object))
+            if strings is None:
+                continue
+            # Only string values are matched; anything else yields NaN and never fails
+            matches = strings.match(pattern.pattern, flags=pattern.flags)
+            for row in np.flatnonzero(matches.eq(False).to_numpy()):
+                entity_id = batch.entity_id(row)
+                issues.append(
+                    ValidationIssue(
+                        id=f"pattern_mismatch_{field}_{entity_id}_{timestamp}",
+                        level=self.level,
+                        scope=self.scope,
+                        phase=self.phase,
+                        message=f"Field '{field}' value does not match required pattern",
+                        entity_id=entity_id,
+                        entity_type=entity_type,
+                        field_name=field,
+                        details={
+                            "value": _truncate(values[row]),
+                            "pattern": pattern.pattern,
+                        },
+                    ),
+                )
+        return issues
+
 
 class RelationshipRule(ValidationRule):
     """Rule that validates entity relationships."""
@@ -483,6 +735,39 @@ class RelationshipRule(ValidationRule):
         return issues
 
 
+class UniqueValueIndex:
+    """
+    Values seen for unique fields during one validation run.
+
+    Values are keyed by entity type and field and map to the ids of the entities
+    holding them, so batches validated later in the run are checked against the
+    earlier ones without querying the database.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._seen: dict[tuple[str, str], dict[Hashable, list[str]]] = {}
+
+    @staticmethod
+    def key(value: Any) -> Hashable:
+        """Hashable form of a field value; unhashable values compare by their repr."""
+        return value if isinstance(value, Hashable) else repr(value)
+
+    def values(self, entity_type: str, field: str) -> dict[Hashable, list[str]]:
+        """
+        Get the seen values of a field.
+
+        Args:
+            entity_type: The entity type
+            field: The unique field
+
+        Returns:
+            The live dict of value keys to the ids of entities holding them
+
+        """
+        return self._seen.setdefault((entity_type, field), {})
+
+
 class UniqueValueRule(ValidationRule):
     """Rule that validates field values are unique across entities."""
 
@@ -597,10 +882,72 @@ class UniqueValueRule(ValidationRule):
 
         return issues
 
+    def validate_many(self, entities: Any, context: dict[str, Any]) -> list[ValidationIssue]:
+        """
+        Validate field values are unique across a batch with a hash index.
+
+        Entities are grouped by value in one pass per field. Values are also checked
+        against earlier batches of the run when the context carries a
+        ``unique_value_index``, so no database query is made per entity.
+
+        Args:
+            entities: A DataFrame or a sequence of dicts or objects
+            context: Additional context for validation
+
+        Returns:
+            List of validation issues found, for duplicated values only
+
+        """
+        batch = _EntityBatch(entities)
+        entity_type = context.get("entity_type", self.scope.value)
+        index = context.get("unique_value_index") or UniqueValueIndex()
+        timestamp = int(time.time())
+
+        issues = []
+        for field in self.unique_fields:
+            values = batch.values(field)
+            groups: dict[Hashable, list[int]] = defaultdict(list)
+            for row, value in enumerate(values):
+                if value is not None:
+                    groups[UniqueValueIndex.key(value)].append(row)
+
+            seen = index.values(entity_type, field)
+            for key, rows in groups.items():
+                earlier = seen.setdefault(key, [])
+                ids = [batch.entity_id(row) for row in rows]
+                duplicate_count = len(earlier) + len(rows) - 1
+                if duplicate_count:
+                    for position, (row, entity_id) in enumerate(zip(rows, ids, strict=True)):
+                        others = chain(
+                            earlier, islice(ids, position), islice(ids, position + 1, None),
+                        )
+                        issues.append(
+                            ValidationIssue(
+                                id=f"duplicate_value_{field}_{entity_id}_{timestamp}",
+                                level=self.level,
+                                scope=self.scope,
+                                phase=self.phase,
+                                message=f"Field '{field}' value is not unique",
+                                entity_id=entity_id,
+                                entity_type=entity_type,
+                                field_name=field,
+                                details={
+                                    "value": values[row],
+                                    "duplicate_ids": list(islice(others, 5)),
+                                    "duplicate_count": duplicate_count,
+                                },
+                            ),
+                        )
+                earlier.extend(ids)
+
+        return issues
+
 
 class CustomFieldRule(ValidationRule):
     """Rule that validates custom fields conform to expected types and constraints."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
@@ -750,6 +1097,8 @@ class CustomFieldRule(ValidationRule):
 class AttachmentRule(ValidationRule):
     """Rule that validates attachments."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
@@ -860,6 +1209,8 @@ class AttachmentRule(ValidationRule):
 class JsonSchemaRule(ValidationRule):
     """Rule that validates entities against a JSON schema."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
@@ -972,6 +1323,8 @@ class JsonSchemaRule(ValidationRule):
 class TestStepValidationRule(ValidationRule):
     """Rule that validates test case steps."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
@@ -1088,6 +1441,8 @@ class TestStepValidationRule(ValidationRule):
 class DataIntegrityRule(ValidationRule):
     """Rule that validates data integrity during transformation."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
@@ -1197,6 +1552,8 @@ class DataIntegrityRule(ValidationRule):
 class TestStatusMappingRule(ValidationRule):
     """Rule that validates test status mappings during transformation."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
@@ -1377,6 +1734,63 @@ class ReferentialIntegrityRule(ValidationRule):
 
         return issues
 
+    def validate_many(self, entities: Any, context: dict[str, Any]) -> list[ValidationIssue]:
+        """
+        Validate referential integrity for a batch against all mappings of the type.
+
+        The mappings are loaded with one query through the ``mapping_index`` in the
+        context, or an index built for this batch, instead of one lookup per entity.
+
+        Args:
+            entities: A DataFrame or a sequence of dicts or objects
+            context: Additional context for validation
+
+        Returns:
+            List of validation issues found, for unmapped references only
+
+        """
+        mapping_index = context.get("mapping_index")
+        if mapping_index is None:
+            database = context.get("database")
+            project_key = context.get("project_key")
+            if not database or not project_key:
+                # Cannot validate referential integrity without database access
+                return []
+            mapping_index = EntityMappingIndex(database, project_key)
+
+        mappings = mapping_index.load(self.mapping_type)
+        batch = _EntityBatch(entities)
+        entity_type = context.get("entity_type", self.scope.value)
+        timestamp = int(time.time())
+
+        issues = []
+        for row, reference_id in enumerate(batch.values(self.reference_field)):
+            if not reference_id or mappings.get(str(reference_id)):
+                continue
+            entity_id = batch.entity_id(row)
+            issues.append(
+                ValidationIssue(
+                    id=f"referential_integrity_{self.reference_field}_{entity_id}_{timestamp}",
+                    level=self.level,
+                    scope=self.scope,
+                    phase=ValidationPhase.TRANSFORMATION,
+                    message=(
+                        f"Referential integrity issue: referenced entity '{reference_id}' "
+                        f"in field '{self.reference_field}' has no mapping"
+                    ),
+                    entity_id=entity_id,
+                    entity_type=entity_type,
+                    field_name=self.reference_field,
+                    details={
+                        "reference_field": self.reference_field,
+                        "reference_id": reference_id,
+                        "mapping_type": self.mapping_type,
+                    },
+                ),
+            )
+
+        return issues
+
 
 def get_test_status_mappings() -> dict[str, str]:
     """
@@ -1399,6 +1813,8 @@ def get_test_status_mappings() -> dict[str, str]:
 class CustomFieldTransformationRule(ValidationRule):
     """Rule that validates custom field transformations."""
 
+    shardable = True
+
     def __init__(
         self,
         id: str,
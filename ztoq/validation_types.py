@@ -10,11 +10,15 @@ Validation types and enums for ZTOQ validations.
 This module provides common type definitions used across validation modules.
 """
 
+import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+logger = logging.getLogger("ztoq.validation")
+
 
 class ValidationLevel(Enum):
     """Validation levels for different severity of issues."""
@@ -103,6 +107,10 @@ class ValidationIssue:
 class ValidationRule:
     """Definition of a validation rule to be applied."""
 
+    # Whether the rule checks each entity on its own, without the database or other
+    # entities, so a batch can be split into shards validated in separate processes
+    shardable = False
+
     def __init__(
         self,
         id: str,  # Unique identifier for the rule
@@ -149,3 +157,45 @@ class ValidationRule:
 
         """
         return []
+
+    def validate_many(self, entities: Any, context: dict[str, Any]) -> list[ValidationIssue]:
+        """
+        Execute the validation logic on a batch of entities.
+
+        This base implementation validates the entities one at a time; rules
+        that can check whole columns at once override it. An entity that makes
+        ``validate`` raise gets a system-level issue of its own, and the rest of
+        the batch is still validated.
+
+        Args:
+            entities: The entities to validate, or a DataFrame with one row per entity
+            context: Additional context for validation
+
+        Returns:
+            List of validation issues found
+
+        """
+        if hasattr(entities, "to_dict"):
+            entities = entities.to_dict("records")
+        issues = []
+        for entity in entities:
+            try:
+                issues.extend(self.validate(entity, context))
+            except Exception as e:
+                if isinstance(entity, dict):
+                    entity_id = entity.get("id") or entity.get("key")
+                else:
+                    entity_id = getattr(entity, "id", None)
+                logger.error(f"Error executing validation rule {self.id} on {entity_id}: {e!s}")
+                issues.append(
+                    ValidationIssue(
+                        id=f"rule_execution_error_{int(time.time())}",
+                        level=ValidationLevel.ERROR,
+                        scope=ValidationScope.SYSTEM,
+                        phase=self.phase,
+                        message=f"Validation rule execution failed: {self.id}",
+                        entity_id=None if entity_id is None else str(entity_id),
+                        details={"rule_id": self.id, "error": str(e)},
+                    ),
+                )
+        return issues
@@ -14,10 +14,13 @@ monitoring capabilities.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
 import uuid
 from asyncio import Queue, QueueEmpty
+from collections import deque
 from collections.abc import Callable
 from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
@@ -174,29 +177,101 @@ class PriorityQueue(Queue):
     """
     Priority queue implementation for asyncio.
 
-    Items with higher priority values are processed first.
+    Items with higher priority values are processed first; items of equal
+    priority are processed in the order they were added. Both put and get are
+    O(log n).
     """
 
     def _init(self, maxsize: int) -> None:
-        """Initialize with an empty list."""
-        self._queue: list[tuple[int, Any]] = []
+        """Initialize with an empty heap."""
+        self._queue: list[tuple[int, int, Any]] = []
+        self._counter = itertools.count()
 
     def _put(self, item: tuple[int, T]) -> None:
         """Put an item into the queue with priority."""
-        # Insert item maintaining sort by priority (highest first)
-        # Python's heapq is min-heap but we want max-heap for priorities
-        # So we negate the priority value to get the desired behavior
+        # Python's heapq is a min-heap but we want the highest priority first,
+        # so we negate the priority; the counter keeps equal priorities FIFO
         priority, data = item
-        for i, (p, _) in enumerate(self._queue):
-            if -priority > p:  # Note the negative priority comparison
-                self._queue.insert(i, (-priority, data))
-                break
-        else:
-            self._queue.append((-priority, data))
+        heapq.heappush(self._queue, (-priority, next(self._counter), data))
+
+    def _get(self) -> tuple[int, T]:
+        """Get the next item with highest priority, as it was put."""
+        priority, _, data = heapq.heappop(self._queue)
+        return -priority, data
+
+
+class WorkIdQueue:
+    """
+    Heap of work item IDs ordered by priority for thread/process workers.
+
+    Items with higher priority values are popped first and items of equal
+    priority in insertion order. Removing an item only marks its entry, which is
+    skipped when it reaches the top, so push, pop and remove are all O(log n)
+    amortized, and push_many adds a batch in linear time.
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._heap: list[list[Any]] = []
+        self._entries: dict[str, list[Any]] = {}
+        self._counter = itertools.count()
+
+    def push(self, work_id: str, priority: int = 0) -> None:
+        """
+        Add a work item ID, replacing any queued entry for the same ID.
+
+        Args:
+            work_id: ID of the work item
+            priority: Priority of the work item (higher values have higher priority)
 
-    def _get(self) -> T:
-        """Get the next item with highest priority."""
-        return self._queue.pop(0)[1]
+        """
+        self.remove(work_id)
+        entry = [-priority, next(self._counter), work_id]
+        self._entries[work_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def push_many(self, work_ids: list[str], priority: int = 0) -> None:
+        """
+        Add several work item IDs with the same priority.
+
+        Args:
+            work_ids: IDs of the work items, in the order they should be processed
+            priority: Priority of the work items
+
+        """
+        for work_id in work_ids:
+            self.remove(work_id)
+            entry = [-priority, next(self._counter), work_id]
+            self._entries[work_id] = entry
+            self._heap.append(entry)
+        heapq.heapify(self._heap)
+
+    def pop(self) -> str:
+        """
+        Remove and return the ID with the highest priority.
+
+        Raises:
+            IndexError: If the queue is empty
+
+        """
+        while self._heap:
+            _, _, work_id = heapq.heappop(self._heap)
+            if work_id is not None:
+                del self._entries[work_id]
+                return work_id
+        raise IndexError("pop from an empty queue")
+
+    def remove(self, work_id: str) -> None:
+        """Remove a work item ID if it is queued."""
+        entry = self._entries.pop(work_id, None)
+        if entry is not None:
+            entry[2] = None
+
+    def __contains__(self, work_id: object) -> bool:
+        return work_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class WorkQueue(Generic[T, R]):
@@ -251,14 +326,16 @@ class WorkQueue(Generic[T, R]):
         if worker_type == WorkerType.ASYNCIO:
             self.queue: Queue = PriorityQueue(maxsize=max_queue_size)
         else:
-            # For thread/process workers, we'll use an in-memory list
-            self.queue = []
+            # For thread/process workers, we'll use an in-memory heap of work IDs
+            self.queue = WorkIdQueue()
 
         # Tracking collections
         self.work_items: dict[str, WorkItem[T, R]] = {}
         self.pending_work_ids: set[str] = set()
         self.running_work_ids: set[str] = set()
         self.completed_work_ids: set[str] = set()
+        # Completed work IDs in completion order, oldest first
+        self.completion_order: deque[str] = deque()
         self.failed_work_ids: set[str] = set()
         self.futures: dict[str, Future] = {}
 
@@ -330,33 +407,41 @@ class WorkQueue(Generic[T, R]):
         self.is_running = False
         logger.info("Work queue stopped")
 
-    def _cleanup_old_completed_items(self):
+    def _mark_completed(self, work_id: str) -> None:
         """
-        Clean up old completed items to prevent memory leaks.
-        
-        This method removes the oldest completed work items from memory
-        when the number of completed items exceeds the maximum limit.
+        Record a completed work item and clean up periodically.
+
+        Args:
+            work_id: ID of the completed work item
+
         """
-        # Only clean up if we have more completed items than our maximum
-        if len(self.completed_work_ids) <= self.max_completed_items:
-            return
+        self.completed_work_ids.add(work_id)
+        self.completion_order.append(work_id)
 
-        # Calculate how many items to remove
-        items_to_remove = len(self.completed_work_ids) - self.max_completed_items
+        # Check if we need to clean up completed items
+        if len(self.completed_work_ids) % self.cleanup_interval == 0:
+            self._cleanup_old_completed_items()
 
-        # Sort completed work IDs by completion time and get the oldest ones
-        oldest_items = sorted(
-            [wid for wid in self.completed_work_ids if wid in self.work_items],
-            key=lambda wid: self.work_items[wid].completed_at or 0,
-        )[:items_to_remove]
+    def _cleanup_old_completed_items(self):
+        """
+        Clean up old completed items to prevent memory leaks.
 
-        # Remove the oldest items from tracking collections
-        for work_id in oldest_items:
-            if work_id in self.work_items:
-                del self.work_items[work_id]
+        This method removes the oldest completed work items from memory
+        when the number of completed items exceeds the maximum limit. Items
+        are evicted from the front of the completion order, so each item is
+        evicted at most once and the cost is amortized O(1) per completion.
+        """
+        removed = 0
+        while len(self.completed_work_ids) > self.max_completed_items and self.completion_order:
+            work_id = self.completion_order.popleft()
+            if work_id not in self.completed_work_ids:
+                continue
             self.completed_work_ids.discard(work_id)
+            self.work_items.pop(work_id, None)
+            removed += 1
 
-        logger.debug(f"Cleaned up {len(oldest_items)} old completed work items")
+        if removed:
+            logger.debug(f"Cleaned up {removed} old completed work items")
 
     async def add_work(
         self,
@@ -380,32 +465,41 @@ class WorkQueue(Generic[T, R]):
             ID of the created work item
 
         """
-        # Create work item
-        work_item = WorkItem[T, R](
-            input_data=input_data,
-            priority=priority,
-            dependencies=set(dependencies or []),
-            metadata=metadata or {},
-            max_attempts=max_attempts,
+        work_item = self._create_work_item(
+            input_data, priority, dependencies, metadata, max_attempts,
         )
 
-        # Add to tracking collections
-        self.work_items[work_item.id] = work_item
-        self.pending_work_ids.add(work_item.id)
-
         # Add to queue based on worker type
         if self.worker_type == WorkerType.ASYNCIO:
             # For asyncio, we add the item ID to the queue with priority
             await self.queue.put((priority, work_item.id))
         else:
-            # For thread/process workers, we add the item to our in-memory list
-            self.queue.append(work_item.id)
-            # Sort the queue by priority (highest first)
-            self.queue.sort(key=lambda wid: self.work_items[wid].priority, reverse=True)
+            # For thread/process workers, we add the item to our in-memory heap
+            self.queue.push(work_item.id, priority)
 
         logger.debug(f"Added work item {work_item.id} to queue with priority {priority}")
         return work_item.id
 
+    def _create_work_item(
+        self,
+        input_data: T,
+        priority: int,
+        dependencies: list[str] | None,
+        metadata: dict[str, Any] | None,
+        max_attempts: int,
+    ) -> WorkItem[T, R]:
+        """Create a pending work item and add it to the tracking collections."""
+        work_item = WorkItem[T, R](
+            input_data=input_data,
+            priority=priority,
+            dependencies=set(dependencies or []),
+            metadata=metadata or {},
+            max_attempts=max_attempts,
+        )
+        self.work_items[work_item.id] = work_item
+        self.pending_work_ids.add(work_item.id)
+        return work_item
+
     async def add_batch(
         self,
         batch_items: list[T],
@@ -426,17 +520,19 @@ class WorkQueue(Generic[T, R]):
             List of work item IDs
 
         """
-        work_ids = []
-        for input_data in batch_items:
-            # Create a copy of metadata for each item
-            item_metadata = dict(metadata or {})
-            work_id = await self.add_work(
-                input_data=input_data,
-                priority=priority,
-                metadata=item_metadata,
-                max_attempts=max_attempts,
-            )
-            work_ids.append(work_id)
+        # Create a copy of metadata for each item
+        work_ids = [
+            self._create_work_item(
+                input_data, priority, None, dict(metadata or {}), max_attempts,
+            ).id
+            for input_data in batch_items
+        ]
+
+        if self.worker_type == WorkerType.ASYNCIO:
+            for work_id in work_ids:
+                await self.queue.put((priority, work_id))
+        else:
+            self.queue.push_many(work_ids, priority)
 
         logger.debug(f"Added batch of {len(batch_items)} work items to queue")
         return work_ids
@@ -676,9 +772,7 @@ class WorkQueue(Generic[T, R]):
         if self.worker_type == WorkerType.ASYNCIO:
             await self.queue.put((work_item.priority, work_id))
         else:
-            self.queue.append(work_id)
-            # Sort the queue by priority
-            self.queue.sort(key=lambda wid: self.work_items[wid].priority, reverse=True)
+            self.queue.push(work_id, work_item.priority)
 
         logger.debug(f"Retrying work item {work_id} (attempt {work_item.attempt + 1})")
         return True
@@ -855,11 +949,7 @@ class WorkQueue(Generic[T, R]):
             # Mark as completed
             work_item.mark_completed(result)
             self.running_work_ids.remove(work_id)
-            self.completed_work_ids.add(work_id)
-
-            # Check if we need to clean up completed items
-            if len(self.completed_work_ids) % self.cleanup_interval == 0:
-                self._cleanup_old_completed_items()
+            self._mark_completed(work_id)
 
             # Call completion callback
             if self.on_complete:
@@ -919,7 +1009,7 @@ class WorkQueue(Generic[T, R]):
                     continue
 
                 # Pop the next item from the queue
-                work_id = self.queue.pop(0)
+                work_id = self.queue.pop()
 
                 # Get the work item
                 work_item = self.work_items.get(work_id)
@@ -942,9 +1032,7 @@ class WorkQueue(Generic[T, R]):
 
                     if not deps_completed:
                         # Not all dependencies are completed, put back in queue
-                        self.queue.append(work_id)
-                        # Sort the queue by priority
-                        self.queue.sort(key=lambda wid: self.work_items[wid].priority, reverse=True)
+                        self.queue.push(work_id, work_item.priority)
                         await asyncio.sleep(0.1)  # Avoid tight loop
                         continue
 
@@ -1015,11 +1103,7 @@ class WorkQueue(Generic[T, R]):
 
         if work_item.status == WorkStatus.COMPLETED:
             # Work completed successfully
-            self.completed_work_ids.add(work_id)
-
-            # Check if we need to clean up completed items
-            if len(self.completed_work_ids) % self.cleanup_interval == 0:
-                self._cleanup_old_completed_items()
+            self._mark_completed(work_id)
 
             # Call completion callback
             if self.on_complete:
@@ -1045,9 +1129,7 @@ class WorkQueue(Generic[T, R]):
                 work_item.status = WorkStatus.PENDING
                 self.pending_work_ids.add(work_id)
                 self.failed_work_ids.remove(work_id)
-                self.queue.append(work_id)
-                # Sort the queue by priority
-                self.queue.sort(key=lambda wid: self.work_items[wid].priority, reverse=True)
+                self.queue.push(work_id, work_item.priority)
             else:
                 logger.warning(f"Work item {work_id} failed after {work_item.attempt} attempts")
 
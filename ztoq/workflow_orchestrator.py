@@ -1671,85 +1671,90 @@ class WorkflowOrchestrator:
             "validator": self.validator if hasattr(self, "validator") else None,
         }
 
-        # Execute validation rules
-        results = []
-        for rule in rules:
-            if not rule.enabled:
-                continue
-
-            try:
-                rule_result = rule.validate(None, context)
-                if rule_result:
-                    # Add issues to validation manager
-                    for issue in rule_result:
-                        self.validation_manager.add_issue(issue)
-                    results.append(
-                        {
-                            "rule_id": rule.id,
-                            "rule_name": rule.name,
-                            "issues_count": len(rule_result),
-                        },
-                    )
-            except Exception as e:
-                logger.error(f"Error executing validation rule {rule.id}: {e!s}", exc_info=True)
-                # Create a validation issue for the rule execution error
-                issue = ValidationIssue(
-                    id=f"rule_execution_error_{int(time.time())}",
-                    level=rule.level,
-                    scope=rule.scope,
-                    phase=ValidationPhase.POST_MIGRATION,
-                    message=f"Error executing rule: {e!s}",
-                    details={"rule_id": rule.id, "error": str(e)},
-                )
-                self.validation_manager.add_issue(issue)
-
-        # Check if we need to run enhanced post-migration validation
         try:
-            # Import here to avoid circular imports
-            from ztoq.post_migration_validation import PostMigrationValidator
+            # Execute validation rules
+            results = []
+            for rule in rules:
+                if not rule.enabled:
+                    continue
+
+                try:
+                    rule_result = rule.validate(None, context)
+                    if rule_result:
+                        # Add issues to validation manager
+                        for issue in rule_result:
+                            self.validation_manager.add_issue(issue)
+                        results.append(
+                            {
+                                "rule_id": rule.id,
+                                "rule_name": rule.name,
+                                "issues_count": len(rule_result),
+                            },
+                        )
+                except Exception as e:
+                    logger.error(f"Error executing validation rule {rule.id}: {e!s}", exc_info=True)
+                    # Create a validation issue for the rule execution error
+                    issue = ValidationIssue(
+                        id=f"rule_execution_error_{int(time.time())}",
+                        level=rule.level,
+                        scope=rule.scope,
+                        phase=ValidationPhase.POST_MIGRATION,
+                        message=f"Error executing rule: {e!s}",
+                        details={"rule_id": rule.id, "error": str(e)},
+                    )
+                    self.validation_manager.add_issue(issue)
 
-            # Run enhanced validation if available
-            logger.info("Running enhanced post-migration validation checks")
-            validator = self.validator or MigrationValidator(
-                self.validation_manager, project_key=project_key, db_manager=self.db,
-            )
+            # Check if we need to run enhanced post-migration validation
+            try:
+                # Import here to avoid circular imports
+                from ztoq.post_migration_validation import PostMigrationValidator
 
-            post_validator = PostMigrationValidator(validator)
-            enhanced_results = post_validator.run_post_migration_validation(
-                self.migration.qtest_client if self.migration else None,
-            )
+                # Run enhanced validation if available
+                logger.info("Running enhanced post-migration validation checks")
+                validator = self.validator or MigrationValidator(
+                    self.validation_manager, project_key=project_key, db_manager=self.db,
+                )
 
-            # Include enhanced validation results
-            enhanced_validation_performed = True
+                post_validator = PostMigrationValidator(validator)
+                enhanced_results = post_validator.run_post_migration_validation(
+                    self.migration.qtest_client if self.migration else None,
+                )
 
-            # Try to retrieve validation report ID from database if it wasn't stored in results
-            if "report_id" not in enhanced_results:
-                # Get the most recent validation report for this project
-                reports = self.db.get_post_migration_validation_reports(project_key, limit=1)
-                if reports and len(reports) > 0:
-                    enhanced_results["report_id"] = reports[0]["id"]
+                # Include enhanced validation results
+                enhanced_validation_performed = True
 
-            logger.info(
-                f"Enhanced validation completed with {enhanced_results.get('total_issues', 0)} issues",
-            )
-            logger.info(
-                f"Validation report ID: {enhanced_results.get('report_id', 'Not available')}",
-            )
+                # Try to retrieve validation report ID from database if it wasn't stored in results
+                if "report_id" not in enhanced_results:
+                    # Get the most recent validation report for this project
+                    reports = self.db.get_post_migration_validation_reports(project_key, limit=1)
+                    if reports and len(reports) > 0:
+                        enhanced_results["report_id"] = reports[0]["id"]
 
-            # Log the validation success status
-            if enhanced_results.get("success", False):
-                logger.info("Post-migration validation successful!")
-            elif enhanced_results.get("has_critical_issues", False):
-                logger.error("Post-migration validation FAILED with CRITICAL issues")
-            elif enhanced_results.get("has_error_issues", False):
-                logger.warning("Post-migration validation FAILED with ERROR issues")
-            else:
-                logger.info("Post-migration validation completed with warnings")
+                logger.info(
+                    "Enhanced validation completed with "
+                    f"{enhanced_results.get('total_issues', 0)} issues",
+                )
+                logger.info(
+                    f"Validation report ID: {enhanced_results.get('report_id', 'Not available')}",
+                )
 
-        except (ImportError, Exception) as e:
-            logger.warning(f"Could not run enhanced post-migration validation: {e!s}")
-            enhanced_validation_performed = False
-            enhanced_results = {}
+                # Log the validation success status
+                if enhanced_results.get("success", False):
+                    logger.info("Post-migration validation successful!")
+                elif enhanced_results.get("has_critical_issues", False):
+                    logger.error("Post-migration validation FAILED with CRITICAL issues")
+                elif enhanced_results.get("has_error_issues", False):
+                    logger.warning("Post-migration validation FAILED with ERROR issues")
+                else:
+                    logger.info("Post-migration validation completed with warnings")
+
+            except (ImportError, Exception) as e:
+                logger.warning(f"Could not run enhanced post-migration validation: {e!s}")
+                enhanced_validation_performed = False
+                enhanced_results = {}
+        finally:
+            # Save buffered issues before reading them back from the database
+            self.validation_manager.flush_issues()
 
         # Get validation issues
         issues = self.db.get_validation_issues(project_key, resolved=False)
@@ -0,0 +1,189 @@
+"""
+Copyright (c) 2025 Eric C. Mumford (@heymumford)
+This file is part of ZTOQ, licensed under the MIT License.
+See LICENSE file for details.
+"""
+
+"""
+Write-behind buffering of migration writes.
+
+Saving each entity mapping and each transformed entity on its own costs a session
+and a commit per record, which quickly dominates a large migration. The
+WriteBehindBuffer collects these writes and flushes them as one bulk call per
+mapping or entity type once enough have gathered or the oldest has waited long
+enough. Callers flush explicitly before marking a batch completed, so a batch is
+never recorded as done while its writes are still only in memory.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger("ztoq.write_behind")
+
+# Bulk and single-record database methods for each kind of transformed entity
+TRANSFORMED_WRITERS = {
+    "test_case": ("save_transformed_test_cases", "save_transformed_test_case"),
+    "test_cycle": ("save_transformed_test_cycles", "save_transformed_test_cycle"),
+    "execution": ("save_transformed_executions", "save_transformed_execution"),
+}
+
+
+class WriteBehindBuffer:
+    """
+    Buffer of entity mappings and transformed entities, flushed in bulk.
+
+    Mappings are written with ``save_entity_mappings(project_key, mapping_type,
+    mappings)``. Transformed entities are written with the bulk method named in
+    ``TRANSFORMED_WRITERS``, taking a list of ``(source_id, *payload, references)``
+    tuples, or record by record when the database does not provide it. A failed
+    flush keeps the buffered writes so the next flush retries them.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        project_key: str,
+        max_items: int = 500,
+        max_delay: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            db: Database manager receiving the writes
+            project_key: Project the writes belong to
+            max_items: Number of buffered writes that triggers a flush
+            max_delay: Seconds the oldest buffered write may wait before a flush
+            clock: Monotonic clock function
+
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self.db = db
+        self.project_key = project_key
+        self.max_items = max_items
+        self.max_delay = max_delay
+        self._clock = clock
+
+        self._mappings: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._transformed: dict[str, list[tuple[Any, ...]]] = defaultdict(list)
+        self._pending = 0
+        self._oldest: float | None = None
+        self._lock = threading.RLock()
+
+        self.stats = {"buffered": 0, "written": 0, "flushes": 0, "bulk_calls": 0}
+
+    @property
+    def pending(self) -> int:
+        """Number of writes waiting to be flushed."""
+        return self._pending
+
+    def add_mapping(self, mapping_type: str, source_id: Any, target_id: Any) -> None:
+        """
+        Buffer an entity mapping.
+
+        Args:
+            mapping_type: The mapping type, e.g. ``testcase_to_testcase``
+            source_id: The source entity id
+            target_id: The target entity id
+
+        """
+        with self._lock:
+            self._mappings[mapping_type].append({"source_id": source_id, "target_id": target_id})
+            self._added()
+
+    def add_transformed(
+        self,
+        entity_type: str,
+        source_id: Any,
+        *payload: Any,
+        references: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Buffer a transformed entity.
+
+        Args:
+            entity_type: One of the keys of ``TRANSFORMED_WRITERS``
+            source_id: The source entity id
+            *payload: The transformed entity, or the test run and log of an execution
+            references: Source ids of the entities the record depends on, by name
+
+        """
+        if entity_type not in TRANSFORMED_WRITERS:
+            raise ValueError(f"Unknown transformed entity type: {entity_type}")
+        with self._lock:
+            self._transformed[entity_type].append((source_id, *payload, references or {}))
+            self._added()
+
+    def _added(self) -> None:
+        self._pending += 1
+        self.stats["buffered"] += 1
+        now = self._clock()
+        if self._oldest is None:
+            self._oldest = now
+        if self._pending >= self.max_items or now - self._oldest >= self.max_delay:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all buffered writes to the database.
+
+        Returns:
+            Number of writes flushed
+
+        """
+        with self._lock:
+            flushed = self._pending
+            if not flushed:
+                return 0
+
+            while self._mappings:
+                mapping_type, mappings = next(iter(self._mappings.items()))
+                self.db.save_entity_mappings(self.project_key, mapping_type, mappings)
+                del self._mappings[mapping_type]
+                self._written(len(mappings))
+
+            while self._transformed:
+                entity_type, entities = next(iter(self._transformed.items()))
+                self._write_transformed(entity_type, entities)
+                del self._transformed[entity_type]
+                self._written(len(entities))
+
+            self._oldest = None
+            self.stats["flushes"] += 1
+            logger.debug(f"Flushed {flushed} buffered writes for {self.project_key}")
+            return flushed
+
+    def _written(self, count: int) -> None:
+        self._pending -= count
+        self.stats["written"] += count
+        self.stats["bulk_calls"] += 1
+
+    def _write_transformed(self, entity_type: str, entities: list[tuple[Any, ...]]) -> None:
+        bulk_method, single_method = TRANSFORMED_WRITERS[entity_type]
+        save_many = getattr(self.db, bulk_method, None)
+        if save_many is not None:
+            save_many(self.project_key, entities)
+            return
+        save_one = getattr(self.db, single_method)
+        for *row, references in entities:
+            save_one(self.project_key, *row, references=references)
+
+    def close(self) -> None:
+        """Flush the remaining writes."""
+        self.flush()
+        logger.debug(
+            f"Write buffer closed: {self.stats['written']} writes in "
+            f"{self.stats['bulk_calls']} bulk calls",
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -4,15 +4,22 @@ This file is part of ZTOQ, licensed under the MIT License.
 See LICENSE file for details.
 """
 
+import asyncio
 import functools
+import inspect
 import json
 import logging
 import mimetypes
 import os
 import random
+import threading
 import time
+from collections import deque
+from contextlib import nullcontext
+from collections.abc import Iterable, Iterator, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Generic, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 import requests
 from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
@@ -20,6 +27,7 @@ from requests.exceptions import ConnectionError, HTTPError, RequestException, Ti
 from ztoq.models import (
     Attachment,
     Case,
+    CaseStep,
     CycleInfo,
     Environment,
     Execution,
@@ -32,9 +40,30 @@ from ztoq.models import (
     ZephyrConfig,
 )
 from ztoq.openapi_parser import ZephyrApiSpecWrapper, load_openapi_spec
+from ztoq.rate_limiter import TokenBucketRateLimiter
+
+if TYPE_CHECKING:
+    from ztoq.attachment_spool import AttachmentSpool, SpooledAttachment
+
+# httpx is optional; it is only needed by the asyncio client
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
 
 T = TypeVar("T")
 
+# Exceptions that count against a circuit and that the retry decorator understands,
+# covering both the requests-based and the httpx-based clients
+_NETWORK_ERRORS: tuple[type[Exception], ...] = (ConnectionError, Timeout)
+_HTTP_ERRORS: tuple[type[Exception], ...] = (HTTPError,)
+if HTTPX_AVAILABLE:
+    _NETWORK_ERRORS += (httpx.TransportError,)
+    _HTTP_ERRORS += (httpx.HTTPStatusError,)
+_CIRCUIT_ERRORS = _NETWORK_ERRORS + _HTTP_ERRORS
+
 # Configure module logger
 logger = logging.getLogger("ztoq.zephyr_client")
 
@@ -117,69 +146,89 @@ class CircuitBreaker:
         self.last_failure_time = 0
 
     def __call__(self, func):
-        """Make the class callable as a decorator."""
+        """Make the class callable as a decorator (works for sync and async functions)."""
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                endpoint = self._extract_endpoint(args)
+                circuit = self._before_call(endpoint)
+                try:
+                    result = await func(*args, **kwargs)
+                except _CIRCUIT_ERRORS as e:
+                    self._on_failure(circuit, endpoint, e)
+                    raise
+                self._on_success(circuit, endpoint)
+                return result
+
+            return async_wrapper
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Extract endpoint from args if present (used for tracking different endpoints)
-            endpoint = None
-            if len(args) > 2 and isinstance(args[0], ZephyrClient) and isinstance(args[2], str):
-                # Extract endpoint from _make_request call: (self, method, endpoint, ...)
-                endpoint = args[2]
-
-            # Get or create circuit for this endpoint
-            circuit = self._get_circuit(endpoint)
-
-            # Check circuit state
-            if circuit.state == self.OPEN:
-                # Check if enough time has passed to try again
-                if time.time() - circuit.last_failure_time >= circuit.reset_timeout:
-                    logger.info(f"Circuit for endpoint {endpoint} switching to HALF_OPEN")
-                    circuit.state = self.HALF_OPEN
-                else:
-                    # Circuit is still open, fail fast
-                    error_msg = f"Circuit for endpoint {endpoint} is OPEN - failing fast"
-                    logger.error(error_msg)
-                    raise RequestException(error_msg)
-
+            endpoint = self._extract_endpoint(args)
+            circuit = self._before_call(endpoint)
             try:
                 # Call the wrapped function
                 result = func(*args, **kwargs)
-
-                # Success - reset circuit if it was half-open
-                if circuit.state == self.HALF_OPEN:
-                    logger.info(
-                        f"Circuit for endpoint {endpoint} reset to CLOSED - service recovered",
-                    )
-                    circuit.state = self.CLOSED
-                    circuit.failure_count = 0
-
-                return result
-
-            except (ConnectionError, Timeout, HTTPError) as e:
-                # Network or HTTP error - increment failure counter
-                circuit.failure_count += 1
-                circuit.last_failure_time = time.time()
-
-                # Log the failure
-                logger.warning(
-                    f"Circuit failure for endpoint {endpoint}: {e} "
-                    f"(count: {circuit.failure_count}/{circuit.failure_threshold})",
-                )
-
-                # Check if we need to open the circuit
-                if (
-                    circuit.state == self.CLOSED
-                    and circuit.failure_count >= circuit.failure_threshold
-                ):
-                    logger.error(f"Circuit for endpoint {endpoint} OPEN - too many failures")
-                    circuit.state = self.OPEN
-
-                # Re-raise the exception
+            except _CIRCUIT_ERRORS as e:
+                self._on_failure(circuit, endpoint, e)
                 raise
+            self._on_success(circuit, endpoint)
+            return result
 
         return wrapper
 
+    @staticmethod
+    def _extract_endpoint(args):
+        """Extract the endpoint from _make_request call args: (self, method, endpoint, ...)."""
+        if len(args) > 2 and hasattr(args[0], "_make_request") and isinstance(args[2], str):
+            return args[2]
+        return None
+
+    def _before_call(self, endpoint):
+        """Get the circuit for an endpoint, failing fast if it is open."""
+        # Get or create circuit for this endpoint
+        circuit = self._get_circuit(endpoint)
+
+        # Check circuit state
+        if circuit.state == self.OPEN:
+            # Check if enough time has passed to try again
+            if time.time() - circuit.last_failure_time >= circuit.reset_timeout:
+                logger.info(f"Circuit for endpoint {endpoint} switching to HALF_OPEN")
+                circuit.state = self.HALF_OPEN
+            else:
+                # Circuit is still open, fail fast
+                error_msg = f"Circuit for endpoint {endpoint} is OPEN - failing fast"
+                logger.error(error_msg)
+                raise RequestException(error_msg)
+
+        return circuit
+
+    def _on_success(self, circuit, endpoint):
+        """Reset the circuit if it was half-open."""
+        if circuit.state == self.HALF_OPEN:
+            logger.info(
+                f"Circuit for endpoint {endpoint} reset to CLOSED - service recovered",
+            )
+            circuit.state = self.CLOSED
+            circuit.failure_count = 0
+
+    def _on_failure(self, circuit, endpoint, error):
+        """Record a network or HTTP failure, opening the circuit past the threshold."""
+        circuit.failure_count += 1
+        circuit.last_failure_time = time.time()
+
+        # Log the failure
+        logger.warning(
+            f"Circuit failure for endpoint {endpoint}: {error} "
+            f"(count: {circuit.failure_count}/{circuit.failure_threshold})",
+        )
+
+        # Check if we need to open the circuit
+        if circuit.state == self.CLOSED and circuit.failure_count >= circuit.failure_threshold:
+            logger.error(f"Circuit for endpoint {endpoint} OPEN - too many failures")
+            circuit.state = self.OPEN
+
     @classmethod
     def _get_circuit(cls, endpoint):
         """
@@ -250,6 +299,32 @@ class CircuitBreaker:
         return len(circuits_to_remove)
 
 
+# HTTP status codes that indicate the server is overloaded rather than the request invalid
+OVERLOAD_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """
+    Check whether an error signals server overload.
+
+    Network errors and the HTTP status codes the retry decorator backs off on count
+    as overload; other errors (validation failures, 4xx responses) do not.
+
+    Args:
+        error: Exception raised by an API call
+
+    Returns:
+        True if the error suggests sending fewer requests
+
+    """
+    if isinstance(error, _NETWORK_ERRORS):
+        return True
+    if isinstance(error, _HTTP_ERRORS):
+        response = getattr(error, "response", None)
+        return response is not None and response.status_code in OVERLOAD_STATUS_CODES
+    return False
+
+
 def retry(
     max_retries: int = 3,
     retry_codes: tuple = (429, 500, 502, 503, 504),
@@ -274,7 +349,66 @@ def retry(
 
     """
 
+    def next_delay(error, retries, delay):
+        """Return the backoff before the next attempt, or re-raise if not retryable."""
+        if isinstance(error, _NETWORK_ERRORS):
+            # Always retry network errors
+            if retries > max_retries:
+                logger.error(f"Max retries ({max_retries}) exceeded: {error}")
+                raise error
+            reason = f"Network error: {error}."
+
+        elif isinstance(error, _HTTP_ERRORS):
+            # Only retry on specific HTTP error codes
+            if getattr(error, "response", None) is None:
+                # If response is not available, don't retry
+                logger.error(f"HTTP error without response, not retrying: {error}")
+                raise error
+
+            status_code = error.response.status_code
+            if status_code not in retry_codes:
+                # Don't retry on other HTTP errors
+                logger.error(f"HTTP error {status_code} not eligible for retry: {error}")
+                raise error
+            if retries > max_retries:
+                logger.error(f"Max retries ({max_retries}) exceeded: {error}")
+                raise error
+            reason = f"HTTP error {status_code}:"
+
+        else:
+            # Don't retry other exceptions
+            logger.error(f"Unexpected error, not retrying: {error}")
+            raise error
+
+        # Calculate backoff with optional jitter
+        current_delay = min(delay, max_delay)
+        if jitter:
+            # Add 0-25% random jitter
+            current_delay = current_delay * (1 + random.random() * 0.25)
+
+        logger.warning(
+            f"{reason} Retrying in {current_delay:.2f}s (attempt {retries}/{max_retries})",
+        )
+        return current_delay
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                retries = 0
+                delay = initial_delay
+
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        retries += 1
+                        await asyncio.sleep(next_delay(e, retries, delay))
+                        delay *= backoff_factor
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             retries = 0
@@ -283,69 +417,27 @@ def retry(
             while True:
                 try:
                     return func(*args, **kwargs)
-                except (ConnectionError, Timeout) as e:
-                    # Always retry network errors
+                except Exception as e:
                     retries += 1
-                    if retries > max_retries:
-                        logger.error(f"Max retries ({max_retries}) exceeded: {e}")
-                        raise
-
-                    # Calculate backoff with optional jitter
-                    current_delay = min(delay, max_delay)
-                    if jitter:
-                        # Add 0-25% random jitter
-                        current_delay = current_delay * (1 + random.random() * 0.25)
-
-                    logger.warning(
-                        f"Network error: {e}. Retrying in {current_delay:.2f}s "
-                        f"(attempt {retries}/{max_retries})",
-                    )
-                    time.sleep(current_delay)
+                    time.sleep(next_delay(e, retries, delay))
                     delay *= backoff_factor
 
-                except HTTPError as e:
-                    # Only retry on specific HTTP error codes
-                    if hasattr(e, "response") and e.response is not None:
-                        status_code = e.response.status_code
-
-                        if status_code in retry_codes:
-                            retries += 1
-                            if retries > max_retries:
-                                logger.error(f"Max retries ({max_retries}) exceeded: {e}")
-                                raise
-
-                            # Calculate backoff with optional jitter
-                            current_delay = min(delay, max_delay)
-                            if jitter:
-                                current_delay = current_delay * (1 + random.random() * 0.25)
-
-                            logger.warning(
-                                f"HTTP error {status_code}: Retrying in {current_delay:.2f}s "
-                                f"(attempt {retries}/{max_retries})",
-                            )
-                            time.sleep(current_delay)
-                            delay *= backoff_factor
-                        else:
-                            # Don't retry on other HTTP errors
-                            logger.error(f"HTTP error {status_code} not eligible for retry: {e}")
-                            raise
-                    else:
-                        # If response is not available, don't retry
-                        logger.error(f"HTTP error without response, not retrying: {e}")
-                        raise
-
-                except Exception as e:
-                    # Don't retry other exceptions
-                    logger.error(f"Unexpected error, not retrying: {e}")
-                    raise
-
         return wrapper
 
     return decorator
 
 
 class PaginatedIterator(Generic[T]):
-    """Iterator for paginated API responses."""
+    """
+    Iterator for paginated API responses.
+
+    By default pages are fetched one at a time, when the current page runs out.
+    With ``prefetch_pages`` greater than zero the iterator uses the ``totalCount``
+    reported by the first page to request the next pages by ``startAt`` offset on a
+    bounded worker pool while earlier pages are consumed. Pages are always yielded in
+    offset order, and no more requests are kept in flight than the client's
+    ``rate_limit_remaining`` allows.
+    """
 
     def __init__(
         self,
@@ -354,6 +446,7 @@ class PaginatedIterator(Generic[T]):
         model_class: type[T],
         params: dict[str, Any] | None = None,
         page_size: int = 100,
+        prefetch_pages: int = 0,
     ):
         """
         Initialize the paginated iterator.
@@ -364,6 +457,7 @@ class PaginatedIterator(Generic[T]):
             model_class: Model class for response items
             params: Additional query parameters
             page_size: Number of items per page
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
 
         """
         self.client = client
@@ -374,10 +468,18 @@ class PaginatedIterator(Generic[T]):
         self.current_page: PaginatedResponse | None = None
         self.item_index = 0
         self.total_fetched = 0
+        self.total_count: int | None = None
+
+        # Prefetching state
+        self.prefetch_pages = max(0, prefetch_pages)
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: deque[Future] = deque()
+        self._next_start_at = 0
+        self._stride = page_size
 
         logger.debug(
             f"PaginatedIterator initialized for {endpoint} with page size {page_size}, "
-            f"model class {model_class.__name__}",
+            f"model class {model_class.__name__}, prefetch pages {self.prefetch_pages}",
         )
 
     def __iter__(self):
@@ -394,12 +496,13 @@ class PaginatedIterator(Generic[T]):
             logger.debug(f"No data found for {self.endpoint}")
             raise StopIteration
 
-        # Check if we need to fetch the next page
-        if self.item_index >= len(self.current_page.values):
+        # Check if we need to fetch the next page (skipping any empty pages)
+        while self.item_index >= len(self.current_page.values):
             if self.current_page.is_last:
                 logger.debug(
                     f"Reached last page for {self.endpoint}, total items fetched: {self.total_fetched}",
                 )
+                self.close()
                 raise StopIteration
 
             logger.debug(
@@ -420,6 +523,10 @@ class PaginatedIterator(Generic[T]):
 
     def _fetch_next_page(self):
         """Fetch the next page of results."""
+        if self.prefetch_pages and self.current_page is not None:
+            self._take_prefetched_page()
+            return
+
         page_number = 0
         if self.current_page:
             self.params["startAt"] = self.current_page.start_at + len(self.current_page.values)
@@ -435,16 +542,143 @@ class PaginatedIterator(Generic[T]):
         self.current_page = PaginatedResponse(**response)
         self.item_index = 0
 
+        if self.total_count is None:
+            self.total_count = self.current_page.total_count
+            # Later pages are requested by offset, using the page size the server honoured
+            if self.current_page.values and not self.current_page.is_last:
+                self._stride = len(self.current_page.values)
+            self._next_start_at = self.current_page.start_at + len(self.current_page.values)
+
         logger.debug(
             f"Received page {page_number + 1} with {len(self.current_page.values)} items, "
             f"total: {self.current_page.total_count}, isLast: {self.current_page.is_last}",
         )
 
+    def _request_page(self, start_at: int) -> PaginatedResponse:
+        """Request the page starting at the given offset (runs on the prefetch pool)."""
+        params = dict(self.params)
+        params["startAt"] = start_at
+        response = self.client._make_request("GET", self.endpoint, params=params)
+        return PaginatedResponse(**response)
+
+    def _schedule_prefetch(self):
+        """Top up the prefetch window with requests for the next page offsets."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.prefetch_pages, thread_name_prefix="ztoq-prefetch",
+            )
+
+        remaining, _ = self.client.get_rate_limit_state()
+        while (
+            len(self._pending) < self.prefetch_pages
+            and self._next_start_at < (self.total_count or 0)
+            and len(self._pending) < remaining
+        ):
+            logger.debug(
+                f"Prefetching page from {self.endpoint} (startAt={self._next_start_at})",
+            )
+            self._pending.append(self._executor.submit(self._request_page, self._next_start_at))
+            self._next_start_at += self._stride
+
+    def _take_prefetched_page(self):
+        """Replace the current page with the next page in offset order."""
+        self._schedule_prefetch()
+
+        if self._pending:
+            try:
+                page = self._pending.popleft().result()
+            except Exception:
+                self.close()
+                raise
+        else:
+            # Nothing in flight - either the rate limit is exhausted or the reported
+            # total was exceeded, so fall back to a blocking fetch at the next offset
+            page = self._request_page(self._next_start_at)
+            self._next_start_at = page.start_at + len(page.values)
+
+        self.current_page = page
+        self.item_index = 0
+
+        logger.debug(
+            f"Received prefetched page (startAt={page.start_at}) with {len(page.values)} items, "
+            f"total: {page.total_count}, isLast: {page.is_last}",
+        )
+
+        if page.is_last or not page.values:
+            # Discard anything fetched past the end of the result set
+            self.current_page = page.model_copy(update={"is_last": True})
+            self.close()
+        else:
+            self._schedule_prefetch()
+
+    def close(self):
+        """Cancel outstanding prefetch requests and release the worker pool."""
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def iter_batches(items: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    """
+    Group an iterable of entities into lists of at most ``batch_size`` items.
+
+    The source is consumed lazily, so when it is a PaginatedIterator only the pages
+    needed for the current batch are held in memory.
+
+    Args:
+        items: Entities to group, typically a PaginatedIterator
+        batch_size: Maximum number of entities per batch
+
+    Yields:
+        Lists of consecutive entities
+
+    """
+    batch_size = max(1, batch_size)
+    batch: list[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def expected_item_count(items: Iterable[Any]) -> int | None:
+    """
+    Get the number of entities a source is expected to produce, if known.
+
+    Uses the ``total_count`` reported by the first page of a PaginatedIterator, or the
+    length of a sized collection.
+
+    Args:
+        items: Entity source
+
+    Returns:
+        The expected number of entities, or None when it is not known yet
+
+    """
+    total_count = getattr(items, "total_count", None)
+    if isinstance(total_count, int):
+        return total_count
+    if isinstance(items, Sized):
+        return len(items)
+    return None
+
 
 class ZephyrClient:
     """Client for interacting with the Zephyr Scale API."""
 
-    def __init__(self, config: ZephyrConfig, log_level=None):
+    def __init__(
+        self,
+        config: ZephyrConfig,
+        log_level=None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        request_slots: threading.Semaphore | None = None,
+    ):
         """
         Initialize the Zephyr client with configuration.
 
@@ -452,6 +686,11 @@ class ZephyrClient:
             config: The Zephyr Scale API configuration
             log_level: Optional logging level to use for this client instance
                       (e.g., "DEBUG", "INFO", "WARNING", "ERROR")
+            rate_limiter: Optional token bucket shared with other clients, threads or
+                processes; requests wait for a token instead of only pausing once
+                the remaining quota reaches zero
+            request_slots: Optional semaphore shared with other clients; each request
+                holds a slot while in flight, capping their concurrent requests together
 
         """
         self.config = config
@@ -461,6 +700,10 @@ class ZephyrClient:
         }
         self.rate_limit_remaining = 1000  # Default high value
         self.rate_limit_reset = 0
+        # Prefetch workers share the client, so the rate limit fields are updated under a lock
+        self._rate_limit_lock = threading.Lock()
+        self.rate_limiter = rate_limiter
+        self.request_slots = request_slots
 
         # Configure logging if level specified
         if log_level:
@@ -470,6 +713,19 @@ class ZephyrClient:
             f"ZephyrClient initialized for project {config.project_key} with base URL {config.base_url}",
         )
 
+    def get_rate_limit_state(self) -> tuple[int, int]:
+        """
+        Get the remaining quota and reset time from the last rate limit headers.
+
+        Safe to call while other threads make requests with this client.
+
+        Returns:
+            Tuple of the remaining requests and the reset time in epoch seconds
+
+        """
+        with self._rate_limit_lock:
+            return self.rate_limit_remaining, self.rate_limit_reset
+
     @CircuitBreaker(failure_threshold=5, reset_timeout=60)
     @retry(max_retries=3, initial_delay=0.5, backoff_factor=2.0, jitter=True)
     def _make_request(
@@ -506,11 +762,15 @@ class ZephyrClient:
         from ztoq.connection_pool import connection_pool
 
         # Check rate limits
-        if self.rate_limit_remaining <= 0:
-            wait_time = max(0, self.rate_limit_reset - time.time())
-            if wait_time > 0:
-                logger.info(f"Rate limit reached. Waiting {wait_time:.2f} seconds")
-                time.sleep(wait_time)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        else:
+            remaining, reset = self.get_rate_limit_state()
+            if remaining <= 0:
+                wait_time = max(0, reset - time.time())
+                if wait_time > 0:
+                    logger.info(f"Rate limit reached. Waiting {wait_time:.2f} seconds")
+                    time.sleep(wait_time)
 
         # Construct URL
         url = f"{self.config.base_url}{endpoint}"
@@ -578,26 +838,37 @@ class ZephyrClient:
         try:
             # Use connection pool to get a session and make the request
             with connection_pool.get_session(url) as session:
-                # Make the request with timeout
-                response = session.request(
-                    method=method,
-                    url=url,
-                    headers=request_headers,
-                    params=params,
-                    json=json_data,
-                    files=files,
-                    timeout=timeout,
-                )
+                # Make the request with timeout, holding a shared slot if configured
+                with self.request_slots or nullcontext():
+                    response = session.request(
+                        method=method,
+                        url=url,
+                        headers=request_headers,
+                        params=params,
+                        json=json_data,
+                        files=files,
+                        timeout=timeout,
+                    )
 
                 # Calculate request duration
                 duration = time.time() - start_time
 
                 # Update rate limits
-                if "X-Rate-Limit-Remaining" in response.headers:
-                    self.rate_limit_remaining = int(response.headers["X-Rate-Limit-Remaining"])
-                    logger.debug(f"Rate limit remaining [{request_id}]: {self.rate_limit_remaining}")
-                if "X-Rate-Limit-Reset" in response.headers:
-                    self.rate_limit_reset = int(response.headers["X-Rate-Limit-Reset"])
+                with self._rate_limit_lock:
+                    if "X-Rate-Limit-Remaining" in response.headers:
+                        self.rate_limit_remaining = int(response.headers["X-Rate-Limit-Remaining"])
+                        logger.debug(
+                            f"Rate limit remaining [{request_id}]: {self.rate_limit_remaining}",
+                        )
+                    if "X-Rate-Limit-Reset" in response.headers:
+                        self.rate_limit_reset = int(response.headers["X-Rate-Limit-Reset"])
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe_response(
+                        response.headers,
+                        response.status_code,
+                        remaining_header="X-Rate-Limit-Remaining",
+                        reset_header="X-Rate-Limit-Reset",
+                    )
 
                 # Log response metadata
                 logger.debug(
@@ -737,12 +1008,15 @@ class ZephyrClient:
         projects_data = response if isinstance(response, list) else response.get("values", [])
         return [Project(**project) for project in projects_data]
 
-    def get_test_cases(self, project_key: str | None = None) -> PaginatedIterator[Case]:
+    def get_test_cases(
+        self, project_key: str | None = None, prefetch_pages: int = 0,
+    ) -> PaginatedIterator[Case]:
         """
         Get all test cases for a project.
 
         Args:
             project_key: JIRA project key (defaults to config's project_key)
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
 
         Returns:
             Iterator of test cases
@@ -753,15 +1027,22 @@ class ZephyrClient:
             params["projectKey"] = project_key
 
         return PaginatedIterator[Case](
-            client=self, endpoint="/testcases", model_class=Case, params=params,
+            client=self,
+            endpoint="/testcases",
+            model_class=Case,
+            params=params,
+            prefetch_pages=prefetch_pages,
         )
 
-    def get_test_cycles(self, project_key: str | None = None) -> PaginatedIterator[CycleInfo]:
+    def get_test_cycles(
+        self, project_key: str | None = None, prefetch_pages: int = 0,
+    ) -> PaginatedIterator[CycleInfo]:
         """
         Get all test cycles for a project.
 
         Args:
             project_key: JIRA project key (defaults to config's project_key)
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
 
         Returns:
             Iterator of test cycles
@@ -772,15 +1053,22 @@ class ZephyrClient:
             params["projectKey"] = project_key
 
         return PaginatedIterator[CycleInfo](
-            client=self, endpoint="/testcycles", model_class=CycleInfo, params=params,
+            client=self,
+            endpoint="/testcycles",
+            model_class=CycleInfo,
+            params=params,
+            prefetch_pages=prefetch_pages,
         )
 
-    def get_test_plans(self, project_key: str | None = None) -> PaginatedIterator[Plan]:
+    def get_test_plans(
+        self, project_key: str | None = None, prefetch_pages: int = 0,
+    ) -> PaginatedIterator[Plan]:
         """
         Get all test plans for a project.
 
         Args:
             project_key: JIRA project key (defaults to config's project_key)
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
 
         Returns:
             Iterator of test plans
@@ -791,11 +1079,18 @@ class ZephyrClient:
             params["projectKey"] = project_key
 
         return PaginatedIterator[Plan](
-            client=self, endpoint="/testplans", model_class=Plan, params=params,
+            client=self,
+            endpoint="/testplans",
+            model_class=Plan,
+            params=params,
+            prefetch_pages=prefetch_pages,
         )
 
     def get_test_executions(
-        self, cycle_id: str | None = None, project_key: str | None = None,
+        self,
+        cycle_id: str | None = None,
+        project_key: str | None = None,
+        prefetch_pages: int = 0,
     ) -> PaginatedIterator[Execution]:
         """
         Get all test executions for a test cycle.
@@ -803,6 +1098,7 @@ class ZephyrClient:
         Args:
             cycle_id: ID of the test cycle
             project_key: JIRA project key (defaults to config's project_key)
+            prefetch_pages: Number of pages to fetch ahead concurrently (0 disables prefetching)
 
         Returns:
             Iterator of test executions
@@ -815,7 +1111,11 @@ class ZephyrClient:
             params["projectKey"] = project_key
 
         return PaginatedIterator[Execution](
-            client=self, endpoint="/testexecutions", model_class=Execution, params=params,
+            client=self,
+            endpoint="/testexecutions",
+            model_class=Execution,
+            params=params,
+            prefetch_pages=prefetch_pages,
         )
 
     def get_folders(self, project_key: str | None = None) -> list[Folder]:
@@ -890,6 +1190,47 @@ class ZephyrClient:
         response = self._make_request("GET", "/environments", params=params)
         return [Environment(**env) for env in response.get("values", [])]
 
+    def get_test_steps(self, test_case_key: str, page_size: int = 100) -> list[CaseStep]:
+        """
+        Get the test steps of a test case.
+
+        Args:
+            test_case_key: Key of the test case (e.g. "PROJ-T123")
+            page_size: Number of steps per page
+
+        Returns:
+            List of test steps, in order
+
+        """
+        endpoint = f"/testcases/{test_case_key}/teststeps"
+        params: dict[str, Any] = {"maxResults": page_size, "startAt": 0}
+        steps: list[CaseStep] = []
+
+        while True:
+            page = PaginatedResponse(**self._make_request("GET", endpoint, params=dict(params)))
+            for raw_step in page.values:
+                steps.append(self._parse_test_step(raw_step, len(steps) + 1))
+            if page.is_last or not page.values:
+                return steps
+            params["startAt"] = page.start_at + len(page.values)
+
+    @staticmethod
+    def _parse_test_step(raw_step: dict[str, Any], index: int) -> CaseStep:
+        """Convert an API test step, inline or call-to-test, into a CaseStep."""
+        if "inline" in raw_step or "testCase" in raw_step:
+            inline = raw_step.get("inline") or {}
+            description = inline.get("description")
+            if description is None and raw_step.get("testCase"):
+                called_case = raw_step["testCase"]
+                description = f"Call to test {called_case.get('testCaseKey', called_case.get('self', ''))}"
+            return CaseStep(
+                index=index,
+                description=description or "",
+                expectedResult=inline.get("expectedResult"),
+                data=inline.get("testData"),
+            )
+        return CaseStep(**{"index": index, **raw_step})
+
     def get_custom_fields(
         self, entity_type: str = "testCase", project_key: str | None = None,
     ) -> list[dict[str, Any]]:
@@ -1079,6 +1420,64 @@ class ZephyrClient:
             )
             raise
 
+    @CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    @retry(max_retries=5, initial_delay=1.0, backoff_factor=2.0, jitter=True)
+    def download_attachment_to_spool(
+        self,
+        attachment_id: str,
+        spool: "AttachmentSpool",
+        timeout: tuple[float, float] = (10.0, 120.0),
+    ) -> "SpooledAttachment":
+        """
+        Stream an attachment by ID into an attachment spool.
+
+        Unlike download_attachment, the content is written to disk chunk by chunk
+        and its checksum is computed incrementally, so memory use does not grow
+        with the attachment size.
+
+        Args:
+            attachment_id: ID of the attachment
+            spool: Content-addressed spool to write the attachment into
+            timeout: Connection and read timeout in seconds (tuple of connect_timeout, read_timeout)
+
+        Returns:
+            SpooledAttachment with the checksum, size and path of the stored content
+
+        Raises:
+            HTTPError: If the attachment can't be downloaded
+            ConnectionError: If connection to the server fails
+            Timeout: If the download times out
+            ValueError: If the attachment ID is invalid
+
+        """
+        if not attachment_id:
+            raise ValueError("Invalid attachment ID: must not be empty")
+
+        url = f"{self.config.base_url}/attachments/{attachment_id}/content"
+        headers = {"Authorization": self.headers["Authorization"]}
+        request_id = f"download_{attachment_id}_{int(time.time()*1000)}"
+
+        logger.debug(f"Streaming attachment [{request_id}]: {attachment_id} from {url}")
+        start_time = time.time()
+
+        try:
+            with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                spooled = spool.write_stream(response.iter_content(chunk_size=spool.chunk_size))
+
+            duration = time.time() - start_time
+            logger.debug(
+                f"Attachment streamed [{request_id}] in {duration:.2f}s "
+                f"({spooled.size / 1024:.1f} KB, checksum {spooled.checksum})",
+            )
+            return spooled
+
+        except requests.exceptions.RequestException as e:
+            logger.error(
+                f"Error streaming attachment [{request_id}]: {e.__class__.__name__}: {e}",
+            )
+            raise
+
     def check_api_health(self) -> dict[str, Any]:
         """
         Check the health of the Zephyr API.
@@ -1103,11 +1502,12 @@ class ZephyrClient:
             }
 
         """
+        remaining, reset = self.get_rate_limit_state()
         health_info = {
             "healthy": False,
             "latency_ms": 0,
-            "rate_limit_remaining": self.rate_limit_remaining,
-            "rate_limit_reset": self.rate_limit_reset,
+            "rate_limit_remaining": remaining,
+            "rate_limit_reset": reset,
             "circuits": CircuitBreaker.get_circuit_status(),
             "error": None,
         }
@@ -1123,8 +1523,9 @@ class ZephyrClient:
             # Update health info
             health_info["healthy"] = True
             health_info["latency_ms"] = latency_ms
-            health_info["rate_limit_remaining"] = self.rate_limit_remaining
-            health_info["rate_limit_reset"] = self.rate_limit_reset
+            health_info["rate_limit_remaining"], health_info["rate_limit_reset"] = (
+                self.get_rate_limit_state()
+            )
 
         except Exception as e:
             health_info["healthy"] = False